@@ -7,6 +7,8 @@ from openmdao.main.datatypes.api import Float, Bool, Int, Str, Array, Enum
 from openmdao.lib.drivers.api import COBYLAdriver, CONMINdriver,NEWSUMTdriver,SLSQPdriver,Genetic
 
 from math import pi, cos, sqrt, radians, sin, exp, log10, log, floor, ceil, tan, atan
+from generatorse import DFIG_core, genetic
+from generatorse.constraints import expression
 import numpy as np
 from numpy import sign
 
@@ -94,323 +96,30 @@ class DFIG(Component):
 	cm  =Array(np.array([0.0, 0.0, 0.0]),iotype='out', desc='COM [x,y,z]')
 	I = Array(np.array([0.0, 0.0, 0.0]), iotype='out', desc=' moments of Inertia for the component [Ixx, Iyy, Izz] around its center of mass')
 	
-	def execute(self):
-		
-		#Create internal variables based on inputs
-		r_s = self.r_s
-		l_s = self.l_s
-		h_s = self.h_s
-		h_yr=self.h_yr
-		h_ys=self.h_ys
-		f=self.f
-		q1=self.q1
-		tau_p =self.tau_p
-		B_g = self.B_g
-		B_g1 = self.B_g1
-		B_symax = self.B_symax
-		B_rymax = self.B_rymax
-		B_tsmax = self.B_tsmax
-		B_trmax = self.B_trmax
-		N_r=self.N_r
-		I_0=self.I_0
-		E_p=self.E_p
-		J_s=self.J_s
-		R_s=self.R_s
-		gen_eff =self.gen_eff
-		K_rad=self.K_rad
-		Active=self.Active
-		Structural_mass=self.Structural_mass
-		Copper=self.Copper
-		N_s=self.N_s
-		TC1=self.TC1
-		TC2=self.TC2
-		S=self.S
-		Q_r=self.Q_r
-		A_1=self.A_1
-		J_s=self.J_s
-		J_r=self.J_r
-		K_rad=self.K_rad
-		D_ratio=self.D_ratio
-		Current_ratio=self.Current_ratio
-		Slot_aspect_ratio1=self.Slot_aspect_ratio1
-		Slot_aspect_ratio2=self.Slot_aspect_ratio2
-		S_Nmax=self.S_Nmax
-		p=self.p
-		b_s=self.b_s
-		A_Curcalc=self.A_Curcalc
-		A_Cuscalc=self.A_Cuscalc
-		b_trmin=self.b_trmin
-		b_tr=self.b_tr
-		b_r=self.b_r
-		b_t=self.b_t
-		I=self.I
-		cm=self.cm
-
-		Losses=self.Losses
-		Mass=self.Mass
-		highSpeedSide_cm=self.highSpeedSide_cm
-		highSpeedSide_length=self.highSpeedSide_length
-		machine_rating=self.machine_rating
-		Gearbox_efficiency=self.Gearbox_efficiency
-	
-		n_nom=self.n_nom
-		I_s=self.I_s
-		L_s=self.L_s
-		L_r=self.L_r
-		L_sm=self.L_sm
-		R_R=self.R_R
-		Iron=self.Iron
+	# optional cache.EvaluationCache returning stored outputs for repeated input vectors
+	cache = None
+	_cached_outputs = None
 
+	def execute(self):
 		
-		rho_Fe= self.rho_Fe
-		rho_Copper=self.rho_Copper
-		
-		#Assign values to universal constants
-		g1          =9.81                  # m/s^2 acceleration due to gravity
-		sigma       =21.5e3                # shear stress
-		mu_0        =pi*4e-7               # permeability of free space
-		cofi        =0.9                   # power factor
-		h_w         = 0.005                # wedge height
-		m           =3                     # Number of phases
-		rho_Cu       =1.8*10**(-8)*1.4     # copper resisitivity
-		h_sy0  =0
-		
-		#Assign values to design constants
-		b_so=0.004												 # Stator slot opening
-		b_ro=0.004												 # rotor slot openinng
-		self.q1=5                          # Stator slots per pole per phase
-		q2=self.q1-1											 # Rotor slots per pole per phase
-		k_sfil =0.65								 			 # Stator Slot fill factor
-		P_Fe0h =4			               			 # specific hysteresis losses W/kg @ 1.5 T 
-		P_Fe0e =1			                     # specific hysteresis losses W/kg @ 1.5 T 
-		b_s_tau_s=0.45										 # Stator slot width /slot pitch ratio
-		b_r_tau_r=0.45										 # Rotor slot width /slot pitch ratio
-		y_tau_p=12./15										 # Stator coil span to pole pitch	
-		y_tau_pr=10./12										 # Rotor coil span to pole pitch
-		self.p=3													 # pole pairs
-		freq=60														 # grid frequency in Hz
-		k_fillr = 0.55 										# Rotor Slot fill factor
-		
-		K_rs     =1/(-1*self.S_Nmax)			 # Winding turns ratio between rotor and Staor		
-		I_SN   = self.machine_rating/(sqrt(3)*3000) # Rated current
-		I_SN_r =I_SN/K_rs									 # Stator rated current reduced to rotor
-					
-		# Calculating winding factor for stator and rotor	
-		k_y1=sin(pi*0.5*y_tau_p)										# winding Chording factor
-		k_q1=sin(pi/6)/(self.q1*sin(pi/(6*self.q1))) # winding zone factor
-		k_y2=sin(pi*0.5*y_tau_pr)										# winding Chording factor
-		k_q2=sin(pi/6)/(q2*sin(pi/(6*q2)))					# winding zone factor
-		k_wd1=k_y1*k_q1															# Stator winding factor
-		k_wd2=k_q2*k_y2															# Rotor winding factor
-		
-		
-		dia=2*self.r_s             												 # air gap diameter
-		g=(0.1+0.012*(self.machine_rating)**(1./3))*0.001  #air gap length in m
-		self.K_rad=self.l_s/dia														 # Aspect ratio
-		r_r=self.r_s-g             												 #rotor radius
-		self.tau_p=(pi*dia/(2*self.p))										 #pole pitch
-		
-
-		self.S=2*self.p*self.q1*m													# Stator Slots
-		N_slots_pp=self.S/(m*self.p*2)										# Number of stator slots per pole per phase
-
-		n  = self.S/2*self.p/self.q1        							#no of slots per pole per phase
-		tau_s=self.tau_p/(m*self.q1)        							#slot pitch
-		self.b_s=b_s_tau_s*tau_s;            							#Stator slot width
-		self.b_t=tau_s-self.b_s              							#Stator tooth width
+		# The sizing equations live in DFIG_core so they can also be evaluated on batches of designs
+		inputs = dict((name, getattr(self, name)) for name in DFIG_core.INPUTS)
+		if self.cache is None:
+			outputs = DFIG_core.evaluate(inputs)
+		else:
+			outputs = self.cache.evaluate(DFIG_core.evaluate, inputs)
+			if outputs is self._cached_outputs:
+				return    # repeated point, the output traits already hold these values
+			self._cached_outputs = outputs
+		for name in DFIG_core.OUTPUTS:
+			setattr(self, name, outputs[name])
 
+	def list_deriv_vars(self):
+		return DFIG_core.DERIV_INPUTS, DFIG_core.DERIV_OUTPUTS
 
-		self.Q_r=2*self.p*m*q2														# Rotor Slots								
-		tau_r=pi*(dia-2*g)/self.Q_r												# Rotor Slot pitch
-		self.b_r=b_r_tau_r*tau_r													# Rotot Slot width
-		self.b_tr=tau_r-self.b_r													# Rotor tooth width
-		
-		# Calculating equivalent slot openings
-		mu_rs				=0.005
-		mu_rr				=0.005
-		W_s					=(self.b_s/mu_rs)*1e-3  #in m
-		W_r					=(self.b_r/mu_rr)*1e-3  #in m
-		
-		self.Slot_aspect_ratio1=self.h_s/self.b_s
-		self.Slot_aspect_ratio2=self.h_r/self.b_r
-		
-		# Calculating Carter factor for stator,rotor and effective air gap length
-		gamma_s	= (2*W_s/g)**2/(5+2*W_s/g)
-		K_Cs=(tau_s)/(tau_s-g*gamma_s*0.5)  #page 3-13
-		gamma_r		= (2*W_r/g)**2/(5+2*W_r/g)
-		K_Cr=(tau_r)/(tau_r-g*gamma_r*0.5)  #page 3-13
-		K_C=K_Cs*K_Cr
-		g_eff=K_C*g
-	
-	
-		om_m=2*pi*self.n_nom/60															# mechanical frequency
-		om_e=self.p*om_m																		# Electrical frequency
-		K_s=0.3   																					# Saturation factor for Iron
-		n_c1=2    																					#number of conductors per coil
-		a1 =2    																						# number of parallel paths
-		self.N_s=round(2*self.p*N_slots_pp*n_c1/a1)					# Stator winding turns per phase
-		
-		self.N_r=round(self.N_s*k_wd1*K_rs/k_wd2)						# Rotor winding turns per phase
-		n_c2=self.N_r/(self.Q_r/m)													# rotor turns per coil							        
-		
-		# Calculating peak flux densities and back iron thickness
-		self.B_g1=mu_0*3*self.N_r*self.I_0*2**0.5*k_y2*k_q2/(pi*self.p*g_eff*(1+K_s))
-		self.B_g=self.B_g1*K_C
-		self.h_ys = self.B_g*self.tau_p/(self.B_symax*pi)
-		self.B_rymax = self.B_symax
-		self.h_yr=self.h_ys
-		self.B_tsmax=self.B_g*tau_s/(self.b_t) 
-		
-		d_se=dia+2*(self.h_ys+self.h_s+h_w)  								# stator outer diameter
-		self.D_ratio=d_se/dia																# Diameter ratio
-		self.f = self.n_nom*self.p/60
-		
-		# Stator slot fill factor
-		if (2*self.r_s>2):
-			K_fills=0.65
-		else:
-			K_fills=0.4
-			
-    # Stator winding calculation
-   
-    # End connection length  for stator winding coils
-		l_fs=2*(0.015+y_tau_p*self.tau_p/2/cos(40))+pi*(self.h_s)
-		
-		l_Cus = 2*self.N_s*(l_fs+self.l_s)/a1             # Length of Stator winding 
-		
-		# Conductor cross-section
-		A_s = self.b_s*(self.h_s-h_w)
-		A_scalc=self.b_s*1000*(self.h_s*1000-h_w*1000)
-		A_Cus = A_s*self.q1*self.p*K_fills/self.N_s
-		self.A_Cuscalc = A_scalc*self.q1*self.p*K_fills/self.N_s
-		
-		# Stator winding resistance
-		self.R_s=l_Cus*rho_Cu/A_Cus
-		tau_r_min=pi*(dia-2*(g+self.h_r))/self.Q_r
-		
-		# Peak magnetic loading on the rotor tooth
-		self.b_trmin=tau_r_min-b_r_tau_r*tau_r_min
-		self.B_trmax = self.B_g*tau_r/self.b_trmin
-		
-		
-		# Calculating leakage inductance in  stator
-		
-		K_01=1-0.033*(W_s**2/g/tau_s)
-		sigma_ds=0.0042
-		K_02=1-0.033*(W_r**2/g/tau_r)
-		sigma_dr=0.0062
-						
-		L_ssigmas=(2*mu_0*self.l_s*n_c1**2*self.S/m/a1**2)*((self.h_s-h_w)/(3*self.b_s)+h_w/b_so)  #slot leakage inductance
-		L_ssigmaew=(2*mu_0*self.l_s*n_c1**2*self.S/m/a1**2)*0.34*self.q1*(l_fs-0.64*self.tau_p*y_tau_p)/self.l_s #end winding leakage inductance
-		L_ssigmag=(2*mu_0*self.l_s*n_c1**2*self.S/m/a1**2)*(0.9*tau_s*self.q1*k_wd1*K_01*sigma_ds/g_eff) # tooth tip leakage inductance
-		L_ssigma=(L_ssigmas+L_ssigmaew+L_ssigmag)  																											# stator leakage inductance
-		self.L_sm =6*mu_0*self.l_s*self.tau_p*(k_wd1*self.N_s)**2/(pi**2*(self.p)*g_eff*(1+K_s))
-		self.L_s=(L_ssigmas+L_ssigmaew+L_ssigmag)  																											# stator  inductance
-		
-		# Calculating leakage inductance in  rotor
-		l_fr=(0.015+y_tau_pr*tau_r/2/cos(40*pi/180))+pi*(self.h_r)  # Rotor end connection length
-		L_rsl=(mu_0*self.l_s*(2*n_c2)**2*self.Q_r/m)*((self.h_r-h_w)/(3*self.b_r)+h_w/b_ro)  #slot leakage inductance
-		L_rel= (mu_0*self.l_s*(2*n_c2)**2*self.Q_r/m)*0.34*q2*(l_fr-0.64*tau_r*y_tau_pr)/self.l_s #end winding leakage inductance                  #end winding leakage inductance
-		L_rtl=(mu_0*self.l_s*(2*n_c2)**2*self.Q_r/m)*(0.9*tau_s*q2*k_wd2*K_02*sigma_dr/g_eff) # tooth tip leakage inductance
-		self.L_r=(L_rsl+L_rtl+L_rel)/K_rs**2  # rotor leakage inductance
-		sigma1=1-(self.L_sm**2/self.L_s/self.L_r)
-		
-		#Rotor Field winding
-		    
-		# conductor cross-section
-		diff=self.h_r-h_w
-		A_Cur=k_fillr*self.p*q2*self.b_r*diff/self.N_r
-		self.A_Curcalc=A_Cur*1e6
-		
-		L_cur=2*self.N_r*(l_fr+self.l_s)							# rotor winding length
-		R_r=rho_Cu*L_cur/A_Cur												# Rotor resistance
-		
-		# Equivalent rotor resistance reduced to stator
-		self.R_R=R_r/(K_rs**2)
-		
-		om_s=(self.n_nom)*2*pi/60        							# synchronous speed in rad/s
-		P_e=self.machine_rating/(1-self.S_Nmax)    		#Air gap power
-		
-		# Calculating No-load voltage 
-		self.E_p=om_s*self.N_s*k_wd1*self.r_s*self.l_s*self.B_g1*sqrt(2)
-		
-		I_r=P_e/m/self.E_p         										# rotor active current
-		
-		I_sm=self.E_p/(2*pi*freq*(self.L_s+self.L_sm)) # stator reactive current
-		self.I_s=sqrt((I_r**2+I_sm**2))								#Stator current
-		I_srated=self.machine_rating/3/K_rs/self.E_p	#Rated current
-		
-		# Calculating winding current densities and specific current loading
-		self.J_s=self.I_s/(self.A_Cuscalc)
-		self.J_r=I_r/(self.A_Curcalc)
-		self.A_1=2*m*self.N_s*self.I_s/pi/(2*self.r_s)
-		
-		self.Current_ratio=self.I_0/I_srated           # Ratio of magnetization current to rated current
-		
-		# Calculating masses of the electromagnetically active materials
-		V_Cuss=m*l_Cus*A_Cus
-		V_Cusr=m*L_cur*A_Cur
-		V_Fest=(self.l_s*pi*((self.r_s+self.h_s)**2-self.r_s**2)-(2*m*self.q1*self.p*self.b_s*self.h_s*self.l_s))
-		V_Fesy=self.l_s*pi*((self.r_s+self.h_s+self.h_ys)**2-(self.r_s+self.h_s)**2)
-		V_Fert=pi*self.l_s*(r_r**2-(r_r-self.h_r)**2)-2*m*q2*self.p*self.b_r*self.h_r*self.l_s
-		V_Fery=self.l_s*pi*((r_r-self.h_r)**2-(r_r-self.h_r-self.h_yr)**2)
-		self.Copper=(V_Cuss+V_Cusr)*self.rho_Copper
-		M_Fest=V_Fest*self.rho_Fe
-		M_Fesy=V_Fesy*self.rho_Fe
-		M_Fert=V_Fert*self.rho_Fe
-		M_Fery=V_Fery*self.rho_Fe
-		self.Iron=M_Fest+M_Fesy+M_Fert+M_Fery
-		M_gen=(self.Copper)+(self.Iron)
-		#K_gen=self.Cu*self.C_Cu+(self.Iron)*self.C_Fe #%M_pm*K_pm;
-		L_tot=self.l_s
-		self.Structural_mass=0.0002*M_gen**2+0.6457*M_gen+645.24
-		self.Mass=M_gen+self.Structural_mass
-		
-		# Calculating Losses and efficiency 
-    # 1. Copper losses
-		
-		K_R=1.2 # skin effect correction coefficient
-		
-		P_Cuss=m*self.I_s**2*self.R_s*K_R                         # Copper loss-stator
-		P_Cusr=m*I_r**2*self.R_R															# Copper loss-rotor
-		P_Cusnom=P_Cuss+P_Cusr																#  Copper loss-total
-		
-		# Iron Losses ( from Hysteresis and eddy currents)      
-		P_Hyys=M_Fesy*(self.B_symax/1.5)**2*(P_Fe0h*om_e/(2*pi*60))										# Hysteresis losses in stator yoke
-		P_Ftys=M_Fesy*(self.B_symax/1.5)**2*(P_Fe0e*(om_e/(2*pi*60))**2) 							# Eddy losses in stator yoke
-		P_Hyd=M_Fest*(self.B_tsmax/1.5)**2*(P_Fe0h*om_e/(2*pi*60))										# Hysteresis losses in stator teeth
-		P_Ftd=M_Fest*(self.B_tsmax/1.5)**2*(P_Fe0e*(om_e/(2*pi*60))**2)								# Eddy losses in stator teeth
-		P_Hyyr=M_Fery*(self.B_rymax/1.5)**2*(P_Fe0h*abs(self.S_Nmax)*om_e/(2*pi*60)) # Hysteresis losses in rotor yoke
-		P_Ftyr=M_Fery*(self.B_rymax/1.5)**2*(P_Fe0e*(abs(self.S_Nmax)*om_e/(2*pi*60))**2) #Eddy losses in rotor yoke
-		P_Hydr=M_Fert*(self.B_trmax/1.5)**2*(P_Fe0h*abs(self.S_Nmax)*om_e/(2*pi*60))	# Hysteresis losses in rotor teeth
-		P_Ftdr=M_Fert*(self.B_trmax/1.5)**2*(P_Fe0e*(abs(self.S_Nmax)*om_e/(2*pi*60))**2) # Eddy losses in rotor teeth
-		P_add=0.5*self.machine_rating/100																									# additional losses
-		P_Fesnom=P_Hyys+P_Ftys+P_Hyd+P_Ftd+P_Hyyr+P_Ftyr+P_Hydr+P_Ftdr 							# Total iron loss
-		delta_v=1																																		# allowable brush voltage drop
-		p_b=3*delta_v*I_r																														# Brush loss
-		
-		self.Losses=P_Cusnom+P_Fesnom+p_b+P_add
-		self.gen_eff=(P_e-self.Losses)*100/P_e
-		self.Overall_eff=self.gen_eff*self.Gearbox_efficiency
-		
-		# Calculating stator winding current density
-		self.J_s=self.I_s/self.A_Cuscalc
-		
-		# Calculating  electromagnetic torque
-		T_e=self.p *(self.machine_rating*1.01)/(2*pi*freq*(1-self.S_Nmax))
-		
-		# Calculating for tangential stress constraints
-		self.TC1=T_e/(2*pi*sigma)
-		self.TC2=self.r_s**2*self.l_s
-    
-    # Calculating mass moments of inertia and center of mass
-		r_out=d_se*0.5
-		self.I[0]   = (0.5*self.Mass*r_out**2)
-		self.I[1]   = (0.25*self.Mass*r_out**2+(1/12)*self.Mass*self.l_s**2) 
-		self.I[2]   = self.I[1]
-		cm[0]  = self.highSpeedSide_cm[0] + self.highSpeedSide_length/2. + self.l_s/2.
-		cm[1]  = self.highSpeedSide_cm[1]
-		cm[2]  = self.highSpeedSide_cm[2]
+	def provideJ(self):
+		# exact partials of the constrained outputs with respect to the design variables
+		return DFIG_core.jacobian(dict((name, getattr(self, name)) for name in DFIG_core.INPUTS))
 		
 class DFIG_Cost(Component):
 	""" Provides a material cost estimate for a DFIG generator. Manufacturing costs are excluded"""
@@ -429,18 +138,14 @@ class DFIG_Cost(Component):
 	Costs= Float(iotype='out', desc='Total cost')
 
 	def execute(self):
-		Copper=self.Copper
-		C_Cu=self.C_Cu
-		Iron=self.Iron
-		C_Fe=self.C_Fe
-		C_Fes=self.C_Fes
-		Costs=self.Costs
 		
-		Structural_mass=self.Structural_mass
-		# Material cost as a function of material mass and specific cost of material
-		K_gen=self.Copper*self.C_Cu+(self.Iron)*self.C_Fe #%M_pm*K_pm; # 
-		Cost_str=self.C_Fes*self.Structural_mass
-		self.Costs=K_gen+Cost_str
+		self.Costs = DFIG_core.costs(dict((name, getattr(self, name)) for name in DFIG_core.COST_INPUTS))['Costs']
+
+	def list_deriv_vars(self):
+		return DFIG_core.COST_DERIV_INPUTS, ('Costs',)
+
+	def provideJ(self):
+		return DFIG_core.costs_jacobian(dict((name, getattr(self, name)) for name in DFIG_core.COST_INPUTS))
 
 		
 class DFIG_Opt(Assembly):
@@ -476,10 +181,19 @@ class DFIG_Opt(Assembly):
 	rho_Fe=Float(iotype='in', desc='Steel density kg/m^3')
 	rho_Copper=Float(iotype='in', desc='Copper density kg/m^3')
 	
+	# sizing equations and name of the generator component, read by the multi-start tools
+	generator_core = DFIG_core
+	generator_name = 'DFIG'
+	# assembly variables of the rated power, speed and torque, read by the warm-start database
+	rating_variables = {'P_rated': 'DFIG_P_rated', 'N': 'DFIG_N_rated'}
+	
 	def __init__(self,Optimiser='',Objective_function='',print_results=''):
 		
 				super(DFIG_Opt,self).__init__()
-				""" Creates a new Assembly containing DFIG, DFIG_Cost and an optimizer"""
+				""" Creates a new Assembly containing DFIG, DFIG_Cost and an optimizer.
+				Optimiser='Genetic' runs generatorse.genetic on the core in place of the driver, evaluating
+				each de-duplicated generation in parallel and with the constraints; population_size,
+				generations, crossover_rate, mutation_rate and seed are read from the Genetic driver. """
 				
 				self.add('DFIG',DFIG())
 				self.connect('DFIG_r_s','DFIG.r_s')
@@ -523,39 +237,24 @@ class DFIG_Opt(Assembly):
 				self.driver.add_objective(self.Objective_function)
 				# set up design variables for the DFIG generator
 				self.driver.design_vars=['DFIG_r_s','DFIG_l_s','DFIG_h_s','DFIG_h_r','DFIG_S_Nmax','DFIG_B_symax','DFIG_I_0']
-				self.driver.add_parameter('DFIG_r_s', low=0.2, high=1)
-				self.driver.add_parameter('DFIG_l_s', low=0.4, high=2)
-				self.driver.add_parameter('DFIG_h_s', low=0.045, high=0.1)
-				self.driver.add_parameter('DFIG_h_r', low=0.045, high=0.1)
-				self.driver.add_parameter('DFIG_B_symax', low=1, high=2)
-				self.driver.add_parameter('DFIG_S_Nmax', low=-0.3, high=-0.1)
-				self.driver.add_parameter('DFIG_I_0', low=5, high=100)
+				for name, low, high in DFIG_core.DESIGN_VARIABLES:
+					self.driver.add_parameter('DFIG_'+name, low=low, high=high)
 				
 				self.driver.iprint=print_results
 				
 				# set up constraints for the DFIG generator
-				self.driver.add_constraint('DFIG.Overall_eff>=Eta_target')		  			      #constraint 1
-				self.driver.add_constraint('DFIG.E_p>500.0')															  #constraint 2
-				self.driver.add_constraint('DFIG.E_p<5000.0')															  #constraint 3
-				self.driver.add_constraint('DFIG.TC1<DFIG.TC2')															#constraint 4
-				self.driver.add_constraint('DFIG.B_g>=0.7')																	#constraint 5
-				self.driver.add_constraint('DFIG.B_g<=1.2')																	#constraint 6
-				self.driver.add_constraint('DFIG.B_rymax<2.')																#constraint 7
-				self.driver.add_constraint('DFIG.B_trmax<2.')																#constraint 8
-				self.driver.add_constraint('DFIG.B_tsmax<2.') 															#constraint 9
-				self.driver.add_constraint('DFIG.A_1<60000')  															#constraint 10
-				self.driver.add_constraint('DFIG.J_s<=6')											        			#constraint 11
-				self.driver.add_constraint('DFIG.J_r<=6')  																	#constraint 12
-				self.driver.add_constraint('DFIG.K_rad>=0.2')  					      							#constraint 13 #boldea Chapter 3
-				self.driver.add_constraint('DFIG.K_rad<=1.5')						      							#constraint 14
-				self.driver.add_constraint('DFIG.D_ratio>=1.37')  							      			#constraint 15 #boldea Chapter 3
-				self.driver.add_constraint('DFIG.D_ratio<=1.4')  														#constraint 16
-				self.driver.add_constraint('DFIG.Current_ratio>=0.1')												#constraint 17
-				self.driver.add_constraint('DFIG.Current_ratio<=0.3')												#constraint 18
-				self.driver.add_constraint('DFIG.Slot_aspect_ratio1>=4')										#constraint 19
-				self.driver.add_constraint('DFIG.Slot_aspect_ratio1<=10')										#constraint 20
+				for constraint in DFIG_core.CONSTRAINTS:
+					self.driver.add_constraint(expression('DFIG', constraint, DFIG_core))
 				#self.driver.add_constraint('DFIG.Mass<=25000')										#constraint 20
-				
+
+	def execute(self):
+		# the Genetic option evaluates each generation in parallel on the core, see genetic.optimize_assembly
+		if self.Optimiser == 'Genetic':
+			genetic.optimize_assembly(self)
+		else:
+			super(DFIG_Opt,self).execute()
+
+
 def DFIG_Opt_example():
 	
 	#Example optimization of a DFIG generator for costs on a 5 MW reference turbine
@@ -0,0 +1,424 @@
+"""DFIG_core.py
+Copyright (c) NREL. All rights reserved.
+Closed-form sizing equations of the doubly-fed induction generator, free of OpenMDAO. """
+
+from math import pi
+import numpy as np
+from generatorse import profiling
+from generatorse.ops import SCALAR, evaluate_batch as _evaluate_batch
+from generatorse.derivatives import jacobian as _jacobian
+
+INPUTS = ('r_s', 'l_s', 'h_s', 'h_r', 'B_symax', 'machine_rating', 'n_nom', 'Gearbox_efficiency',
+	'S_Nmax', 'I_0', 'rho_Fe', 'rho_Copper', 'highSpeedSide_cm', 'highSpeedSide_length')
+
+VECTOR_INPUTS = ('highSpeedSide_cm',)
+
+OUTPUTS = ('tau_p', 'p', 'B_g', 'q1', 'h_ys', 'h_yr', 'B_g1', 'B_rymax', 'B_tsmax', 'B_trmax', 'S', 'Q_r',
+	'N_s', 'N_r', 'f', 'E_p', 'I_s', 'b_s', 'b_r', 'b_t', 'b_trmin', 'b_tr', 'gen_eff',
+	'Structural_mass', 'TC1', 'TC2', 'A_1', 'J_s', 'J_r', 'K_rad', 'D_ratio', 'A_Cuscalc',
+	'A_Curcalc', 'Current_ratio', 'Slot_aspect_ratio1', 'Slot_aspect_ratio2', 'Overall_eff', 'R_s',
+	'L_sm', 'R_R', 'L_r', 'L_s', 'Copper', 'Iron', 'Losses', 'Mass', 'cm', 'I')
+
+# design variables of DFIG_Opt with the bounds passed to driver.add_parameter
+DESIGN_VARIABLES = (('r_s', 0.2, 1), ('l_s', 0.4, 2), ('h_s', 0.045, 0.1), ('h_r', 0.045, 0.1),
+	('B_symax', 1, 2), ('S_Nmax', -0.3, -0.1), ('I_0', 5, 100))
+
+# constraints of DFIG_Opt as (variable, relation, limit); a limit is a number, another variable of
+# the model or Eta_target, the target efficiency set on the assembly
+CONSTRAINTS = (
+	('Overall_eff', '>=', 'Eta_target'),
+	('E_p', '>', 500.0),
+	('E_p', '<', 5000.0),
+	('TC1', '<', 'TC2'),
+	('B_g', '>=', 0.7),
+	('B_g', '<=', 1.2),
+	('B_rymax', '<', 2.),
+	('B_trmax', '<', 2.),
+	('B_tsmax', '<', 2.),
+	('A_1', '<', 60000),
+	('J_s', '<=', 6),
+	('J_r', '<=', 6),
+	('K_rad', '>=', 0.2),    # boldea Chapter 3
+	('K_rad', '<=', 1.5),
+	('D_ratio', '>=', 1.37),    # boldea Chapter 3
+	('D_ratio', '<=', 1.4),
+	('Current_ratio', '>=', 0.1),
+	('Current_ratio', '<=', 0.3),
+	('Slot_aspect_ratio1', '>=', 4),
+	('Slot_aspect_ratio1', '<=', 10))
+
+# design variables of DFIG_Opt and the outputs its constraints and objective depend on
+DERIV_INPUTS = ('r_s', 'l_s', 'h_s', 'h_r', 'B_symax', 'S_Nmax', 'I_0')
+
+DERIV_OUTPUTS = ('Overall_eff', 'E_p', 'TC1', 'TC2', 'B_g', 'B_rymax', 'B_trmax', 'B_tsmax', 'A_1', 'J_s', 'J_r',
+	'K_rad', 'D_ratio', 'Current_ratio', 'Slot_aspect_ratio1', 'gen_eff', 'Mass', 'Copper', 'Iron',
+	'Structural_mass')
+
+
+
+def evaluate(inputs, ops=SCALAR, components=False):
+
+	""" Estimates overall mass, dimensions and efficiency of a DFIG.
+	``inputs`` maps the names in INPUTS to values; returns a dict keyed by OUTPUTS,
+	or with components=True the currents and loss components at the rated point. """
+
+	clock = profiling.start()
+
+	r_s = inputs['r_s']
+	l_s = inputs['l_s']
+	h_s = inputs['h_s']
+	h_r = inputs['h_r']
+	B_symax = inputs['B_symax']
+	machine_rating = inputs['machine_rating']
+	n_nom = inputs['n_nom']
+	Gearbox_efficiency = inputs['Gearbox_efficiency']
+	S_Nmax = inputs['S_Nmax']
+	I_0 = inputs['I_0']
+	rho_Fe = inputs['rho_Fe']
+	rho_Copper = inputs['rho_Copper']
+	highSpeedSide_cm = inputs['highSpeedSide_cm']
+	highSpeedSide_length = inputs['highSpeedSide_length']
+	
+	#Assign values to universal constants
+	g1          =9.81		# m/s^2 acceleration due to gravity
+	sigma       =21.5e3		# shear stress
+	mu_0        =pi*4e-7		# permeability of free space
+	cofi        =0.9		# power factor
+	h_w         = 0.005		# wedge height
+	m           =3		# Number of phases
+	rho_Cu       =1.8*10**(-8)*1.4		# copper resisitivity
+	h_sy0  =0
+	
+	#Assign values to design constants
+	b_so=0.004		# Stator slot opening
+	b_ro=0.004		# rotor slot openinng
+	q1=5		# Stator slots per pole per phase
+	q2=q1-1		# Rotor slots per pole per phase
+	k_sfil =0.65		# Stator Slot fill factor
+	P_Fe0h =4		# specific hysteresis losses W/kg @ 1.5 T
+	P_Fe0e =1		# specific hysteresis losses W/kg @ 1.5 T
+	b_s_tau_s=0.45		# Stator slot width /slot pitch ratio
+	b_r_tau_r=0.45		# Rotor slot width /slot pitch ratio
+	y_tau_p=12./15		# Stator coil span to pole pitch
+	y_tau_pr=10./12		# Rotor coil span to pole pitch
+	p=3		# pole pairs
+	freq=60		# grid frequency in Hz
+	k_fillr = 0.55		# Rotor Slot fill factor
+	
+	K_rs     =1/(-1*S_Nmax)		# Winding turns ratio between rotor and Staor
+	I_SN   = machine_rating/(ops.sqrt(3)*3000) # Rated current
+	I_SN_r =I_SN/K_rs		# Stator rated current reduced to rotor
+	
+	# Calculating winding factor for stator and rotor
+	k_y1=ops.sin(pi*0.5*y_tau_p)		# winding Chording factor
+	k_q1=ops.sin(pi/6)/(q1*ops.sin(pi/(6*q1))) # winding zone factor
+	k_y2=ops.sin(pi*0.5*y_tau_pr)		# winding Chording factor
+	k_q2=ops.sin(pi/6)/(q2*ops.sin(pi/(6*q2)))		# winding zone factor
+	k_wd1=k_y1*k_q1		# Stator winding factor
+	k_wd2=k_q2*k_y2		# Rotor winding factor
+	
+	
+	dia=2*r_s		# air gap diameter
+	g=(0.1+0.012*(machine_rating)**(1./3))*0.001  #air gap length in m
+	K_rad=l_s/dia		# Aspect ratio
+	r_r=r_s-g		#rotor radius
+	tau_p=(pi*dia/(2*p))		#pole pitch
+	
+	
+	S=2*p*q1*m		# Stator Slots
+	N_slots_pp=S/(m*p*2)		# Number of stator slots per pole per phase
+	
+	n  = S/2*p/q1		#no of slots per pole per phase
+	tau_s=tau_p/(m*q1)		#slot pitch
+	b_s=b_s_tau_s*tau_s;		#Stator slot width
+	b_t=tau_s-b_s		#Stator tooth width
+	
+	
+	Q_r=2*p*m*q2		# Rotor Slots
+	tau_r=pi*(dia-2*g)/Q_r		# Rotor Slot pitch
+	b_r=b_r_tau_r*tau_r		# Rotot Slot width
+	b_tr=tau_r-b_r		# Rotor tooth width
+	
+	# Calculating equivalent slot openings
+	mu_rs				=0.005
+	mu_rr				=0.005
+	W_s					=(b_s/mu_rs)*1e-3  #in m
+	W_r					=(b_r/mu_rr)*1e-3  #in m
+	
+	Slot_aspect_ratio1=h_s/b_s
+	Slot_aspect_ratio2=h_r/b_r
+	
+	# Calculating Carter factor for stator,rotor and effective air gap length
+	gamma_s	= (2*W_s/g)**2/(5+2*W_s/g)
+	K_Cs=(tau_s)/(tau_s-g*gamma_s*0.5)  #page 3-13
+	gamma_r		= (2*W_r/g)**2/(5+2*W_r/g)
+	K_Cr=(tau_r)/(tau_r-g*gamma_r*0.5)  #page 3-13
+	K_C=K_Cs*K_Cr
+	g_eff=K_C*g
+	
+	
+	om_m=2*pi*n_nom/60		# mechanical frequency
+	om_e=p*om_m		# Electrical frequency
+	K_s=0.3		# Saturation factor for Iron
+	n_c1=2		#number of conductors per coil
+	a1 =2		# number of parallel paths
+	N_s=ops.round(2*p*N_slots_pp*n_c1/a1)		# Stator winding turns per phase
+	
+	N_r=ops.round(N_s*k_wd1*K_rs/k_wd2)		# Rotor winding turns per phase
+	n_c2=N_r/(Q_r/m)		# rotor turns per coil
+	
+	# Calculating peak flux densities and back iron thickness
+	B_g1=mu_0*3*N_r*I_0*2**0.5*k_y2*k_q2/(pi*p*g_eff*(1+K_s))
+	B_g=B_g1*K_C
+	h_ys = B_g*tau_p/(B_symax*pi)
+	B_rymax = B_symax
+	h_yr=h_ys
+	B_tsmax=B_g*tau_s/(b_t)
+	
+	d_se=dia+2*(h_ys+h_s+h_w)		# stator outer diameter
+	D_ratio=d_se/dia		# Diameter ratio
+	f = n_nom*p/60
+	
+	clock = profiling.lap(clock, 'DFIG', 'em')
+	# Stator slot fill factor
+	K_fills=ops.where(2*r_s>2, 0.65, 0.4)
+	
+	# Stator winding calculation
+	
+	# End connection length  for stator winding coils
+	l_fs=2*(0.015+y_tau_p*tau_p/2/ops.cos(40))+pi*(h_s)
+	
+	l_Cus = 2*N_s*(l_fs+l_s)/a1		# Length of Stator winding
+	
+	# Conductor cross-section
+	A_s = b_s*(h_s-h_w)
+	A_scalc=b_s*1000*(h_s*1000-h_w*1000)
+	A_Cus = A_s*q1*p*K_fills/N_s
+	A_Cuscalc = A_scalc*q1*p*K_fills/N_s
+	
+	# Stator winding resistance
+	R_s=l_Cus*rho_Cu/A_Cus
+	tau_r_min=pi*(dia-2*(g+h_r))/Q_r
+	
+	# Peak magnetic loading on the rotor tooth
+	b_trmin=tau_r_min-b_r_tau_r*tau_r_min
+	B_trmax = B_g*tau_r/b_trmin
+	
+	
+	# Calculating leakage inductance in  stator
+	
+	K_01=1-0.033*(W_s**2/g/tau_s)
+	sigma_ds=0.0042
+	K_02=1-0.033*(W_r**2/g/tau_r)
+	sigma_dr=0.0062
+	
+	L_ssigmas=(2*mu_0*l_s*n_c1**2*S/m/a1**2)*((h_s-h_w)/(3*b_s)+h_w/b_so)  #slot leakage inductance
+	L_ssigmaew=(2*mu_0*l_s*n_c1**2*S/m/a1**2)*0.34*q1*(l_fs-0.64*tau_p*y_tau_p)/l_s #end winding leakage inductance
+	L_ssigmag=(2*mu_0*l_s*n_c1**2*S/m/a1**2)*(0.9*tau_s*q1*k_wd1*K_01*sigma_ds/g_eff) # tooth tip leakage inductance
+	L_ssigma=(L_ssigmas+L_ssigmaew+L_ssigmag)		# stator leakage inductance
+	L_sm =6*mu_0*l_s*tau_p*(k_wd1*N_s)**2/(pi**2*(p)*g_eff*(1+K_s))
+	L_s=(L_ssigmas+L_ssigmaew+L_ssigmag)		# stator  inductance
+	
+	# Calculating leakage inductance in  rotor
+	l_fr=(0.015+y_tau_pr*tau_r/2/ops.cos(40*pi/180))+pi*(h_r)  # Rotor end connection length
+	L_rsl=(mu_0*l_s*(2*n_c2)**2*Q_r/m)*((h_r-h_w)/(3*b_r)+h_w/b_ro)  #slot leakage inductance
+	L_rel= (mu_0*l_s*(2*n_c2)**2*Q_r/m)*0.34*q2*(l_fr-0.64*tau_r*y_tau_pr)/l_s #end winding leakage inductance		#end winding leakage inductance
+	L_rtl=(mu_0*l_s*(2*n_c2)**2*Q_r/m)*(0.9*tau_s*q2*k_wd2*K_02*sigma_dr/g_eff) # tooth tip leakage inductance
+	L_r=(L_rsl+L_rtl+L_rel)/K_rs**2  # rotor leakage inductance
+	sigma1=1-(L_sm**2/L_s/L_r)
+	
+	#Rotor Field winding
+	
+	# conductor cross-section
+	diff=h_r-h_w
+	A_Cur=k_fillr*p*q2*b_r*diff/N_r
+	A_Curcalc=A_Cur*1e6
+	
+	L_cur=2*N_r*(l_fr+l_s)		# rotor winding length
+	R_r=rho_Cu*L_cur/A_Cur		# Rotor resistance
+	
+	# Equivalent rotor resistance reduced to stator
+	R_R=R_r/(K_rs**2)
+	
+	om_s=(n_nom)*2*pi/60		# synchronous speed in rad/s
+	P_e=machine_rating/(1-S_Nmax)		#Air gap power
+	
+	# Calculating No-load voltage
+	E_p=om_s*N_s*k_wd1*r_s*l_s*B_g1*ops.sqrt(2)
+	
+	I_r=P_e/m/E_p		# rotor active current
+	
+	I_sm=E_p/(2*pi*freq*(L_s+L_sm)) # stator reactive current
+	I_s=ops.sqrt((I_r**2+I_sm**2))		#Stator current
+	I_srated=machine_rating/3/K_rs/E_p	#Rated current
+	
+	# Calculating winding current densities and specific current loading
+	J_s=I_s/(A_Cuscalc)
+	J_r=I_r/(A_Curcalc)
+	A_1=2*m*N_s*I_s/pi/(2*r_s)
+	
+	Current_ratio=I_0/I_srated		# Ratio of magnetization current to rated current
+	
+	clock = profiling.lap(clock, 'DFIG', 'winding')
+	# Calculating masses of the electromagnetically active materials
+	V_Cuss=m*l_Cus*A_Cus
+	V_Cusr=m*L_cur*A_Cur
+	V_Fest=(l_s*pi*((r_s+h_s)**2-r_s**2)-(2*m*q1*p*b_s*h_s*l_s))
+	V_Fesy=l_s*pi*((r_s+h_s+h_ys)**2-(r_s+h_s)**2)
+	V_Fert=pi*l_s*(r_r**2-(r_r-h_r)**2)-2*m*q2*p*b_r*h_r*l_s
+	V_Fery=l_s*pi*((r_r-h_r)**2-(r_r-h_r-h_yr)**2)
+	Copper=(V_Cuss+V_Cusr)*rho_Copper
+	M_Fest=V_Fest*rho_Fe
+	M_Fesy=V_Fesy*rho_Fe
+	M_Fert=V_Fert*rho_Fe
+	M_Fery=V_Fery*rho_Fe
+	Iron=M_Fest+M_Fesy+M_Fert+M_Fery
+	M_gen=(Copper)+(Iron)
+	#K_gen=Cu*C_Cu+(Iron)*C_Fe #%M_pm*K_pm;
+	L_tot=l_s
+	Structural_mass=0.0002*M_gen**2+0.6457*M_gen+645.24
+	Mass=M_gen+Structural_mass
+	
+	clock = profiling.lap(clock, 'DFIG', 'mass')
+	# Calculating Losses and efficiency
+	# 1. Copper losses
+	
+	K_R=1.2 # skin effect correction coefficient
+	
+	P_Cuss=m*I_s**2*R_s*K_R		# Copper loss-stator
+	P_Cusr=m*I_r**2*R_R		# Copper loss-rotor
+	P_Cusnom=P_Cuss+P_Cusr		#  Copper loss-total
+	
+	# Iron Losses ( from Hysteresis and eddy currents)
+	P_Hyys=M_Fesy*(B_symax/1.5)**2*(P_Fe0h*om_e/(2*pi*60))		# Hysteresis losses in stator yoke
+	P_Ftys=M_Fesy*(B_symax/1.5)**2*(P_Fe0e*(om_e/(2*pi*60))**2)		# Eddy losses in stator yoke
+	P_Hyd=M_Fest*(B_tsmax/1.5)**2*(P_Fe0h*om_e/(2*pi*60))		# Hysteresis losses in stator teeth
+	P_Ftd=M_Fest*(B_tsmax/1.5)**2*(P_Fe0e*(om_e/(2*pi*60))**2)		# Eddy losses in stator teeth
+	P_Hyyr=M_Fery*(B_rymax/1.5)**2*(P_Fe0h*abs(S_Nmax)*om_e/(2*pi*60)) # Hysteresis losses in rotor yoke
+	P_Ftyr=M_Fery*(B_rymax/1.5)**2*(P_Fe0e*(abs(S_Nmax)*om_e/(2*pi*60))**2) #Eddy losses in rotor yoke
+	P_Hydr=M_Fert*(B_trmax/1.5)**2*(P_Fe0h*abs(S_Nmax)*om_e/(2*pi*60))	# Hysteresis losses in rotor teeth
+	P_Ftdr=M_Fert*(B_trmax/1.5)**2*(P_Fe0e*(abs(S_Nmax)*om_e/(2*pi*60))**2) # Eddy losses in rotor teeth
+	P_add=0.5*machine_rating/100		# additional losses
+	P_Fesnom=P_Hyys+P_Ftys+P_Hyd+P_Ftd+P_Hyyr+P_Ftyr+P_Hydr+P_Ftdr		# Total iron loss
+	delta_v=1		# allowable brush voltage drop
+	p_b=3*delta_v*I_r		# Brush loss
+	
+	Losses=P_Cusnom+P_Fesnom+p_b+P_add
+	gen_eff=(P_e-Losses)*100/P_e
+	Overall_eff=gen_eff*Gearbox_efficiency
+	
+	clock = profiling.lap(clock, 'DFIG', 'losses')
+	if components:
+		return {'P_e': P_e, 'I_r': I_r, 'I_sm': I_sm, 'I_s': I_s, 'K_rs': K_rs, 'P_Cuss': P_Cuss, 'P_Cusr': P_Cusr,
+			'P_Fes': P_Hyys+P_Ftys+P_Hyd+P_Ftd, 'P_Hyr': P_Hyyr+P_Hydr, 'P_Ftr': P_Ftyr+P_Ftdr, 'p_b': p_b,
+			'P_add': P_add}
+	# Calculating stator winding current density
+	J_s=I_s/A_Cuscalc
+	
+	# Calculating  electromagnetic torque
+	T_e=p *(machine_rating*1.01)/(2*pi*freq*(1-S_Nmax))
+	
+	# Calculating for tangential stress constraints
+	TC1=T_e/(2*pi*sigma)
+	TC2=r_s**2*l_s
+	
+	clock = profiling.lap(clock, 'DFIG', 'em', calls=0)
+	# Calculating mass moments of inertia and center of mass
+	r_out=d_se*0.5
+	I_x   = (0.5*Mass*r_out**2)
+	I_y   = (0.25*Mass*r_out**2+(1/12)*Mass*l_s**2)
+	I = ops.vector(I_x, I_y, I_y)
+	cm = ops.vector(highSpeedSide_cm[0] + highSpeedSide_length/2. + l_s/2., highSpeedSide_cm[1], highSpeedSide_cm[2])
+
+	clock = profiling.lap(clock, 'DFIG', 'mass', calls=0)
+	return {'tau_p': tau_p, 'p': p, 'B_g': B_g, 'q1': q1, 'h_ys': h_ys, 'h_yr': h_yr, 'B_g1': B_g1,
+		'B_rymax': B_rymax, 'B_tsmax': B_tsmax, 'B_trmax': B_trmax, 'S': S, 'Q_r': Q_r, 'N_s': N_s,
+		'N_r': N_r, 'f': f, 'E_p': E_p, 'I_s': I_s, 'b_s': b_s, 'b_r': b_r, 'b_t': b_t,
+		'b_trmin': b_trmin, 'b_tr': b_tr, 'gen_eff': gen_eff, 'Structural_mass': Structural_mass,
+		'TC1': TC1, 'TC2': TC2, 'A_1': A_1, 'J_s': J_s, 'J_r': J_r, 'K_rad': K_rad, 'D_ratio': D_ratio,
+		'A_Cuscalc': A_Cuscalc, 'A_Curcalc': A_Curcalc, 'Current_ratio': Current_ratio,
+		'Slot_aspect_ratio1': Slot_aspect_ratio1, 'Slot_aspect_ratio2': Slot_aspect_ratio2,
+		'Overall_eff': Overall_eff, 'R_s': R_s, 'L_sm': L_sm, 'R_R': R_R, 'L_r': L_r, 'L_s': L_s,
+		'Copper': Copper, 'Iron': Iron, 'Losses': Losses, 'Mass': Mass, 'cm': cm, 'I': I}
+
+
+def slip_envelope(inputs, slips, loads):
+
+	""" Rotor-side current and power, loss components and efficiency of a DFIG design
+	over a grid of slips by loads (fractions of machine_rating), one row per slip,
+	in one NumPy pass. The stator is tied to the grid, so its voltage, magnetizing
+	current and iron losses stay as rated; the air gap power is the output over 1-slip
+	and the active current follows it. Copper and brush losses are scaled with the
+	currents of the rated point (slip S_Nmax) and the rotor iron losses with the rotor
+	frequency, hysteresis linearly and eddy currents squared. P_r is the slip power
+	through the rotor converter, negative when the rotor delivers it (above synchronous
+	speed); speed is the rotor speed for n_nom synchronous. """
+
+	rated = evaluate(inputs, components=True)
+	s = np.asarray(slips, dtype=float)[:, None]
+	P = np.asarray(loads, dtype=float)[None, :]*inputs['machine_rating']
+	P_e = P/(1 - s)
+	I_r = rated['I_r']*P_e/rated['P_e']
+	I_s = np.sqrt(I_r**2 + rated['I_sm']**2)
+	frequency = np.abs(s)/abs(inputs['S_Nmax'])
+	P_Cuss = rated['P_Cuss']*(I_s/rated['I_s'])**2
+	P_Cusr = rated['P_Cusr']*(I_r/rated['I_r'])**2
+	P_Fer = rated['P_Hyr']*frequency + rated['P_Ftr']*frequency**2
+	p_b = rated['p_b']*I_r/rated['I_r']
+	Losses = P_Cuss + P_Cusr + rated['P_Fes'] + P_Fer + p_b + rated['P_add']
+	with np.errstate(divide='ignore', invalid='ignore'):
+		gen_eff = np.where(P > 0, (P_e - Losses)*100/P_e, 0.0)
+	slip, power = np.broadcast_arrays(s, P)
+	shape = slip.shape
+	return {'slip': slip, 'power': power, 'speed': inputs['n_nom']*(1 - slip), 'P_e': P_e, 'P_r': s*P_e,
+		'I_r': I_r, 'I_rotor': I_r/rated['K_rs'], 'I_s': I_s, 'P_Cuss': P_Cuss, 'P_Cusr': P_Cusr,
+		'P_Fes': np.full(shape, rated['P_Fes']), 'P_Fer': P_Fer + np.zeros(shape), 'p_b': p_b,
+		'P_add': np.full(shape, rated['P_add']), 'Losses': Losses, 'gen_eff': gen_eff,
+		'Overall_eff': gen_eff*inputs['Gearbox_efficiency']}
+
+
+def evaluate_batch(inputs, exact=True):
+
+	""" Evaluates many DFIG designs at once; see PMSG_arms_core.evaluate_batch. """
+
+	return _evaluate_batch(evaluate, inputs, VECTOR_INPUTS, exact)
+
+
+def jacobian(inputs, wrt=DERIV_INPUTS, of=DERIV_OUTPUTS):
+
+	""" Exact partial derivatives of the outputs ``of`` with respect to the
+	inputs ``wrt``, one row per output. The turns N_s and N_r are
+	rounded in the model and carry no derivative. """
+
+	return _jacobian(evaluate, inputs, wrt, of)
+
+
+COST_INPUTS = ('Copper', 'Iron', 'Structural_mass', 'C_Cu', 'C_Fe', 'C_Fes')
+
+
+def costs(inputs):
+
+	""" Material cost estimate for a DFIG generator. Manufacturing costs are excluded. """
+
+	Copper = inputs['Copper']
+	Iron = inputs['Iron']
+	Structural_mass = inputs['Structural_mass']
+	C_Cu = inputs['C_Cu']
+	C_Fe = inputs['C_Fe']
+	C_Fes = inputs['C_Fes']
+	
+	# Material cost as a function of material mass and specific cost of material
+	K_gen=Copper*C_Cu+(Iron)*C_Fe
+	Cost_str=C_Fes*Structural_mass
+
+	return {'Costs': K_gen+Cost_str}
+
+
+COST_DERIV_INPUTS = ('Copper', 'Iron', 'Structural_mass')
+
+
+def costs_jacobian(inputs):
+
+	""" Partial derivatives of Costs with respect to the material masses. """
+
+	return _jacobian(lambda values, ops: costs(values), inputs, COST_DERIV_INPUTS, ('Costs',))
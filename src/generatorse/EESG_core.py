@@ -0,0 +1,582 @@
+"""EESG_core.py
+Copyright (c) NREL. All rights reserved.
+Closed-form sizing equations of the electrically excited synchronous generator, free of OpenMDAO.
+Electromagnetic design based on conventional magnetic circuit laws
+Structural design based on McDonald's thesis """
+
+from math import pi
+import numpy as np
+from generatorse import profiling
+from generatorse.ops import SCALAR, ArrayOps, evaluate_batch as _evaluate_batch
+from generatorse.derivatives import jacobian as _jacobian
+
+INPUTS = ('r_s', 'l_s', 'h_s', 'tau_p', 'machine_rating', 'n_nom', 'Torque', 'I_f', 'N_f', 'h_ys',
+	'h_yr', 'n_s', 'b_st', 'd_s', 't_ws', 'n_r', 'b_r', 'd_r', 't_wr', 'R_o', 'rho_Fes', 'rho_Fe',
+	'rho_Copper')
+
+VECTOR_INPUTS = ()
+
+OUTPUTS = ('h_p', 'b_p', 'p', 'n_brushes', 'A_Curcalc', 'b_s', 'b_t', 'A_Cuscalc', 'S', 'N_s', 'f', 'E_s',
+	'I_s', 'R_s', 'R_r', 'L_m', 'J_s', 'J_f', 'A_1', 'Load_mmf_ratio', 'gen_eff', 'B_g', 'B_gfm',
+	'B_symax', 'B_rymax', 'B_tmax', 'B_pc', 'Losses', 'K_rad', 'Mass', 'u_Ar', 'y_Ar', 'z_A_r',
+	'u_As', 'y_As', 'z_A_s', 'u_all_r', 'u_all_s', 'y_all', 'z_all_r', 'z_all_s', 'b_all_s',
+	'b_all_r', 'TC1', 'TC2', 'TC3', 'Iron', 'Copper', 'Structural_mass', 'Power_ratio',
+	'Slot_aspect_ratio', 'N_f', 't', 't_s')
+
+# design variables of EESG_Opt with the bounds passed to driver.add_parameter
+DESIGN_VARIABLES = (('r_s', 0.5, 9), ('l_s', 0.5, 2.5), ('h_s', 0.06, 0.15), ('tau_p', 0.04, .2),
+	('N_f', 10, 300), ('I_f', 1, 500), ('h_ys', 0.01, 0.25), ('h_yr', 0.01, 0.25), ('n_s', 5., 15.),
+	('b_st', 0.1, 1.5), ('d_s', 0.1, 1.5), ('t_ws', 0.001, 0.2), ('n_r', 5., 15.), ('b_r', 0.1, 1.5),
+	('d_r', 0.1, 1.5), ('t_wr', 0.001, 0.2))
+
+# quantities the model rounds, with their integer bounds, for the mixed-integer search of mixed.py;
+# the pole pairs p take the place of tau_p = pi*r_s/p and are bounded by those of r_s and tau_p
+INTEGER_VARIABLES = (('N_f', 10, 300), ('n_r', 5, 15), ('n_s', 5, 15), ('p', 8, 706))
+
+# constraints of EESG_Opt as (variable, relation, limit); a limit is a number, another variable of
+# the model or Eta_target, the target efficiency set on the assembly
+CONSTRAINTS = (
+	('B_symax', '<', 2),
+	('B_rymax', '<', 2),
+	('B_tmax', '<', 2),
+	('B_gfm', '>=', 0.617031),
+	('B_gfm', '<=', 1.057768),
+	('B_g', '>=', 0.7),
+	('B_g', '<=', 1.2),
+	('B_pc', '<=', 2),
+	('E_s', '>=', 500),
+	('E_s', '<=', 5000),
+	('u_As', '<', 'u_all_s'),
+	('z_A_s', '<', 'z_all_s'),
+	('y_As', '<', 'y_all'),
+	('u_Ar', '<', 'u_all_r'),
+	('z_A_r', '<', 'z_all_r'),
+	('y_Ar', '<', 'y_all'),
+	('TC1', '<', 'TC2'),
+	('TC1', '<', 'TC3'),
+	('b_r', '<', 'b_all_r'),
+	('b_st', '<', 'b_all_s'),
+	('A_1', '<', 60000),
+	('J_s', '<=', 6),
+	('J_f', '<=', 6),
+	('A_Cuscalc', '>=', 5),
+	('A_Cuscalc', '<=', 300),
+	('A_Curcalc', '>=', 10),
+	('A_Curcalc', '<=', 300),
+	('K_rad', '>', 0.2),
+	('K_rad', '<=', 0.27),
+	('Slot_aspect_ratio', '>=', 4),
+	('Slot_aspect_ratio', '<=', 10),
+	('gen_eff', '>=', 'Eta_target'),
+	('n_brushes', '<=', 6),
+	('Power_ratio', '<', 2))
+
+# design variables of EESG_Opt and the outputs its constraints and objective depend on
+DERIV_INPUTS = ('r_s', 'l_s', 'h_s', 'tau_p', 'N_f', 'I_f', 'h_ys', 'h_yr', 'n_s', 'b_st', 'd_s', 't_ws', 'n_r',
+	'b_r', 'd_r', 't_wr')
+
+DERIV_OUTPUTS = ('B_symax', 'B_rymax', 'B_tmax', 'B_gfm', 'B_g', 'B_pc', 'E_s', 'u_As', 'u_all_s', 'z_A_s',
+	'z_all_s', 'y_As', 'y_all', 'u_Ar', 'u_all_r', 'z_A_r', 'z_all_r', 'y_Ar', 'TC1', 'TC2', 'TC3', 'b_all_r',
+	'b_all_s', 'A_1', 'J_s', 'J_f', 'A_Cuscalc', 'A_Curcalc', 'K_rad', 'Slot_aspect_ratio', 'gen_eff',
+	'n_brushes', 'Mass', 'Copper', 'Iron', 'Structural_mass')
+
+
+def evaluate(inputs, ops=SCALAR, components=False):
+
+	""" Estimates overall mass, dimensions and efficiency of an EESG generator.
+	``inputs`` maps the names in INPUTS to values; returns a dict keyed by OUTPUTS,
+	or with components=True the circuit and loss components at the field current I_f. """
+
+	clock = profiling.start()
+
+	r_s = inputs['r_s']
+	l_s = inputs['l_s']
+	h_s = inputs['h_s']
+	tau_p = inputs['tau_p']
+	machine_rating = inputs['machine_rating']
+	n_nom = inputs['n_nom']
+	Torque = inputs['Torque']
+	I_f = inputs['I_f']
+	N_f = inputs['N_f']
+	h_ys = inputs['h_ys']
+	h_yr = inputs['h_yr']
+	n_s = inputs['n_s']
+	b_st = inputs['b_st']
+	d_s = inputs['d_s']
+	t_ws = inputs['t_ws']
+	n_r = inputs['n_r']
+	b_r = inputs['b_r']
+	d_r = inputs['d_r']
+	t_wr = inputs['t_wr']
+	R_o = inputs['R_o']
+	rho_Fes = inputs['rho_Fes']
+	rho_Fe = inputs['rho_Fe']
+	rho_Copper = inputs['rho_Copper']
+	
+	#Assign values to universal constants
+	
+	g1     =9.81		# m/s^2 acceleration due to gravity
+	E      =2e11		# N/m^2 young's modulus
+	sigma  =48.373e3		# shear stress
+	mu_0   =pi*4e-7		# permeability of free space
+	phi    =90*2*pi/360
+	
+	#Assign values to design constants
+	h_w    =0.005
+	b_so  =  0.004		# Stator slot opening
+	m      =3		# number of phases
+	q1     =2		# no of stator slots per pole per phase
+	b_s_tau_s=0.45		# ratio of slot width to slot pitch
+	k_sfil =0.65		# Slot fill factor
+	P_Fe0h =4		#specific hysteresis losses W/kg @ 1.5 T @50 Hz
+	P_Fe0e =1		#specific hysteresis losses W/kg @ 1.5 T @50 Hz
+	rho_Cu=1.8*10**(-8)*1.4		# resisitivity of copper
+	k_fes =0.9		# iron fill factor
+	y_tau_p=1		# coil span/pole pitch fullpitch
+	k_fillr = 0.7		# rotor slot fill factor
+	k_s=0.2		#magnetic saturation factor for iron
+	T = Torque
+	cos_phi=0.85		#power factor
+	
+	# back iron thickness for rotor and stator
+	t_s =h_ys
+	t =h_yr
+	
+	# Aspect ratio
+	K_rad=l_s/(2*r_s)
+	
+	###################################################### Electromagnetic design#############################################
+	
+	alpha_p=pi/2*.7
+	dia=2*r_s		# air gap diameter
+	# air gap length and minimum values
+	g=0.001*dia
+	g=ops.where(g<0.005, 0.005, g)
+	
+	r_r=r_s-g		#rotor radius
+	d_se=dia+2*h_s+2*h_ys		# stator outer diameter
+	p=ops.round_integer(pi*dia/(2*tau_p))		# number of pole pairs
+	S=2*p*q1*m		# number of slots of stator phase winding
+	N_conductors=S*2
+	N_s=N_conductors/2/3		# Stator turns per phase
+	alpha =180/S/p		#electrical angle
+	
+	tau_s=pi*dia/S		# slot pitch
+	
+	h_ps=0.1*tau_p		# height of pole shoe
+	b_pc=0.4*tau_p		# width of pole core
+	h_pc=0.6*tau_p		# height of pole core
+	h_p=0.7*tau_p		# pole height
+	b_p=h_p
+	b_s=tau_s * b_s_tau_s		#slot width
+	Slot_aspect_ratio=h_s/b_s
+	b_t=tau_s-b_s		#tooth width
+	
+	# Calculating carter factor and effective air gap
+	g_a=g
+	K_C1=(tau_s+10*g_a)/(tau_s-b_s+10*g_a)  # salient pole rotor
+	g_1=K_C1*g
+	
+	# calculating angular frequency
+	om_m=2*pi*n_nom/60
+	
+	om_e=60
+	f    =  n_nom*p/60
+	
+	# Slot fill factor according to air gap radius
+	
+	K_fills=ops.where(2*r_s>2, 0.65, 0.4)
+	
+	clock = profiling.lap(clock, 'EESG', 'em')
+	# Calculating Stator winding factor
+	k_y1=ops.sin(y_tau_p*pi/2)		# chording factor
+	k_q1=ops.sin(pi/6)/q1/ops.sin(pi/6/q1)		# winding zone factor
+	k_wd=k_y1*k_q1
+	
+	# Calculating stator winding conductor length, cross-section and resistance
+	shortpitch=0
+	l_Cus = 2*N_s*(2*(tau_p-shortpitch/m/q1)+l_s)		#length of winding
+	A_s = b_s*(h_s-h_w)
+	A_scalc=b_s*1000*(h_s*1000-h_w*1000)		# cross section in mm^2
+	A_Cus = A_s*q1*p*K_fills/N_s
+	A_Cuscalc = A_scalc*q1*p*K_fills/N_s
+	R_s=l_Cus*rho_Cu/A_Cus
+	
+	#field winding design, conductor lenght, cross-section and resistance
+	N_f=ops.round_relaxed(N_f)		# rounding the field winding turns to the nearest integer
+	
+	I_srated=machine_rating/(ops.sqrt(3)*5000*cos_phi)
+	l_pole=l_s-0.05+0.120  # 50mm smaller than stator and 120mm longer to accommodate end stack
+	K_fe=0.95
+	l_pfe=l_pole*K_fe
+	l_Cur=4*p*N_f*(l_pfe+b_pc+pi/4*(pi*(r_r-h_pc-h_ps)/p-b_pc))
+	A_Cur=k_fillr*h_pc*0.5/N_f*(pi*(r_r-h_pc-h_ps)/p-b_pc)
+	A_Curcalc=k_fillr*h_pc*1000*0.5/N_f*(pi*(r_r-h_pc-h_ps)*1000/p-b_pc*1000)
+	Slot_Area=A_Cur*2*N_f/k_fillr
+	R_r=rho_Cu*l_Cur/A_Cur
+	
+	#field winding current density
+	J_f=I_f/A_Curcalc
+	
+	# calculating air flux density
+	B_gfm=mu_0*N_f*I_f/(g_1*(1+k_s))  #No load air gap flux density
+	B_g=B_gfm*4*ops.sin(0.5*b_p*pi/tau_p)/pi  # fundamental component
+	B_symax=tau_p*B_g/pi/h_ys #stator yoke flux density
+	
+	L_fg=2*mu_0*p*l_s*4*N_f**2*((h_ps/(tau_p-b_p))+(h_pc/(3*pi*(r_r-h_pc-h_ps)/p-b_pc)))
+	
+	# calculating no load voltage and stator current
+	E_s=2*N_s*l_s*r_s*k_wd*om_m*B_g/ops.sqrt(2) #no load voltage
+	
+	I_s=(E_s-(E_s**2-4*R_s*machine_rating/m)**0.5)/(2*R_s)
+	
+	# Calculating stator winding current density and specific current loading
+	A_1 = 6*N_s*I_s/(pi*dia)
+	J_s=I_s/A_Cuscalc
+	
+	# Calculating magnetic loading in other parts of the machine
+	delta_m=0  # Initialising load angle
+	
+	# peak flux density in pole core, rotor yoke and stator teeth
+	B_pc=(1/b_pc)*((2*tau_p/pi)*B_g*ops.cos(delta_m)+(2*mu_0*I_f*N_f*((2*h_ps/(tau_p-b_p))+(h_pc/(tau_p-b_pc)))))
+	B_rymax= 0.5*b_pc*B_pc/h_yr
+	B_tmax=(B_gfm+B_g)*tau_s*0.5/b_t
+	
+	# Calculating leakage inductances in the stator
+	L_ssigmas=2*mu_0*l_s*N_s**2/p/q1*((h_s-h_w)/(3*b_s)+h_w/b_so)  #slot leakage inductance
+	L_ssigmaew=mu_0*1.2*N_s**2/p*1.2*(2/3*tau_p+0.01)		#end winding leakage inductance
+	L_ssigmag=2*mu_0*l_s*N_s**2/p/q1*(5*(g/b_so)/(5+4*(g/b_so))) # tooth tip leakage inductance
+	L_ssigma=(L_ssigmas+L_ssigmaew+L_ssigmag)  # stator leakage inductance
+	
+	# Calculating effective air gap
+	At_g=g_1*B_gfm/mu_0
+	At_t=h_s*(400*B_tmax+7*(B_tmax)**13)
+	At_sy=tau_p*0.5*(400*B_symax+7*(B_symax)**13)
+	At_pc=(h_pc+h_ps)*(400*B_pc+7*(B_pc)**13)
+	At_ry=tau_p*0.5*(400*B_rymax+7*(B_rymax)**13)
+	g_eff = (At_g+At_t+At_sy+At_pc+At_ry)*g_1/At_g
+	
+	L_m = 6*k_wd**2*N_s**2*mu_0*r_s*l_s/pi/g_eff/p**2
+	
+	B_r1=(mu_0*I_f*N_f*4*ops.sin(0.5*(b_p/tau_p)*pi))/g_eff/pi
+	
+	# Calculating direct axis and quadrature axes inductances
+	L_dm= (b_p/tau_p +(1/pi)*ops.sin(pi*b_p/tau_p))*L_m
+	L_qm=(b_p/tau_p -(1/pi)*ops.sin(pi*b_p/tau_p)+2/(3*pi)*ops.cos(b_p*pi/2*tau_p))*L_m
+	
+	# Calculating actual load angle
+	delta_m=(ops.atan(om_e*L_qm*I_s/E_s))
+	
+	L_d=L_dm+L_ssigma
+	L_q=L_qm+L_ssigma
+	I_sd=I_s*ops.sin(delta_m)
+	I_sq=I_s*ops.cos(delta_m)
+	
+	# induced voltage
+	E_p=om_e*L_dm*I_sd+ops.sqrt(E_s**2-(om_e*L_qm*I_sq)**2)
+	#M_sf =mu_0*8*r_s*l_s*k_wd*N_s*N_f*sin(0.5*b_p/tau_p*pi)/(p*g_eff*pi)
+	#I_f1=sqrt(2)*(E_p)/(om_e*M_sf)
+	#I_f2=(E_p/E_s)*B_g*g_eff*pi/(4*N_f*mu_0*sin(pi*b_p/2/tau_p))
+	#phi_max_stator=k_wd*N_s*pi*r_s*l_s*2*mu_0*N_f*I_f*4*sin(0.5*b_p/tau_p/pi)/(p*pi*g_eff*pi)
+	#M_sf=mu_0*8*r_s*l_s*k_wd*N_s*N_f*sin(0.5*b_p/tau_p/pi)/(p*g_eff*pi)
+	
+	L_tot=l_s+2*tau_p
+	
+	# Excitation power
+	V_fn=500
+	Power_excitation=V_fn*2*I_f		#total rated power in excitation winding
+	Power_ratio =Power_excitation*100/machine_rating
+	
+	clock = profiling.lap(clock, 'EESG', 'winding')
+	# Calculating Electromagnetically Active mass
+	L_tot=l_s+2*tau_p
+	V_Cuss=m*l_Cus*A_Cus		# volume of copper in stator
+	V_Cusr=l_Cur*A_Cur		# volume of copper in rotor
+	V_Fest=(l_s*pi*((r_s+h_s)**2-r_s**2)-2*m*q1*p*b_s*h_s*l_s) # volume of iron in stator tooth
+	V_Fesy=l_s*pi*((r_s+h_s+h_ys)**2-(r_s+h_s)**2) # volume of iron in stator yoke
+	V_Fert=2*p*l_pfe*(h_pc*b_pc+b_p*h_ps)		# volume of iron in rotor pole
+	V_Fery=l_pfe*pi*((r_r-h_ps-h_pc)**2-(r_r-h_ps-h_pc-h_yr)**2)		# # volume of iron in rotor yoke
+	
+	Copper=(V_Cuss+V_Cusr)*rho_Copper
+	M_Fest=V_Fest*rho_Fe
+	M_Fesy=V_Fesy*rho_Fe
+	M_Fert=V_Fert*rho_Fe
+	M_Fery=V_Fery*rho_Fe
+	Iron=M_Fest+M_Fesy+M_Fert+M_Fery
+	
+	I_snom=machine_rating/(3*E_s*cos_phi)
+	## Optional## Calculating mmf ratio
+	
+	F_1no_load=3*2**0.5*N_s*k_wd*I_s/(pi*p)
+	Nf_If_no_load=N_f*I_f
+	F_1_rated=(3*2**0.5*N_s*k_wd*I_srated)/(pi*p)
+	Nf_If_rated=2*Nf_If_no_load
+	Load_mmf_ratio=Nf_If_rated/F_1_rated
+	
+	clock = profiling.lap(clock, 'EESG', 'mass')
+	## Calculating losses
+	#1. Copper losses
+	K_R=1.2
+	P_Cuss=m*I_snom**2*R_s*K_R
+	P_Cusr=I_f**2*R_r
+	P_Cusnom_total=P_Cuss+P_Cusr
+	
+	#2. Iron losses ( Hysteresis and Eddy currents)
+	P_Hyys=M_Fesy*(B_symax/1.5)**2*(P_Fe0h*om_e/(2*pi*60)) # Hysteresis losses in stator yoke
+	P_Ftys=M_Fesy*(B_symax/1.5)**2*(P_Fe0e*(om_e/(2*pi*60))**2) # Eddy losses in stator yoke
+	P_Fesynom=P_Hyys+P_Ftys
+	P_Hyd=M_Fest*(B_tmax/1.5)**2*(P_Fe0h*om_e/(2*pi*60))		# Hysteresis losses in stator teeth
+	P_Ftd=M_Fest*(B_tmax/1.5)**2*(P_Fe0e*(om_e/(2*pi*60))**2) # Eddy losses in stator teeth
+	P_Festnom=P_Hyd+P_Ftd
+	
+	# brushes
+	delta_v=1
+	n_brushes=(I_f*2/120)
+	
+	n_brushes=ops.where(n_brushes<0.5, 1, ops.round(n_brushes))
+	
+	#3. brush losses
+	
+	p_b=2*delta_v*(I_f)
+	
+	Losses=P_Cusnom_total+P_Festnom+P_Fesynom+p_b
+	
+	gen_eff=machine_rating*100/(Losses+machine_rating)
+	
+	clock = profiling.lap(clock, 'EESG', 'losses')
+	if components:
+		return {'E_s': E_s, 'R_s': R_s*K_R, 'L_d': L_d, 'L_q': L_q, 'R_r': R_r, 'p': p, 'm': m, 'cos_phi': cos_phi,
+			'P_Hy': P_Hyys+P_Hyd, 'P_Ft': P_Ftys+P_Ftd, 'delta_v': delta_v, 'J_f': J_f}
+	################################################## Structural  Design ########################################################
+	
+	
+	## Structural deflection calculations
+	
+	#rotor structure
+	
+	q3                            = B_g**2/2/mu_0		# normal component of Maxwell's stress
+	l                                     = l_s		#l-stator core length
+	l_b       = 2*tau_p		#end winding length
+	l_e       =l_s+2*0.001*r_s		# equivalent core length
+	a_r                           = (b_r*d_r)-((b_r-2*t_wr)*(d_r-2*t_wr))  # cross-sectional area of rotor armms
+	A_r                           = l*t		# cross-sectional area of rotor cylinder
+	N_r                           = ops.round_integer(n_r)
+	theta_r               =pi/N_r		# half angle between spokes
+	I_r                           =l*t**3/12		# second moment of area of rotor cylinder
+	I_arm_axi_r   =((b_r*d_r**3)-((b_r-2*t_wr)*(d_r-2*t_wr)**3))/12  # second moment of area of rotor arm
+	I_arm_tor_r   = ((d_r*b_r**3)-((d_r-2*t_wr)*(b_r-2*t_wr)**3))/12  # second moment of area of rotot arm w.r.t torsion
+	R                                     = r_r-h_ps-h_pc-0.5*h_yr
+	R_1                           = R-h_yr*0.5		# inner radius of rotor cylinder
+	k_1                           = ops.sqrt(I_r/A_r)		# radius of gyration
+	m1                            =(k_1/R)**2
+	c                                     =R/500
+	
+	
+	u_all_r     =R/10000 # allowable radial deflection
+	b_all_r                  =2*pi*R_o/N_r  # allowable circumferential arm dimension
+	
+	# Calculating radial deflection of rotor structure according to Mc Donald's
+	Numer=R**3*((0.25*(ops.sin(theta_r)-(theta_r*ops.cos(theta_r)))/(ops.sin(theta_r))**2)-(0.5/ops.sin(theta_r))+(0.5/theta_r))
+	Pov=((theta_r/(ops.sin(theta_r))**2)+1/ops.tan(theta_r))*((0.25*R/A_r)+(0.25*R**3/I_r))
+	Qov=R**3/(2*I_r*theta_r*(m1+1))
+	Lov=(R_1-R_o)/a_r
+	Denom=I_r*(Pov-Qov+Lov) # radial deflection % rotor
+	u_Ar                             =(q3*R**2/E/h_yr)*(1+Numer/Denom)
+	
+	# Calculating axial deflection of rotor structure
+	w_r                                   =rho_Fes*g1*ops.sin(phi)*a_r*N_r
+	mass_st_lam=rho_Fe*2*pi*(R+0.5*h_yr)*l*h_yr		# mass of rotor yoke steel
+	W                             =g1*ops.sin(phi)*(mass_st_lam+(V_Cusr*rho_Copper)+M_Fert)/N_r  # weight of rotor cylinder
+	l_ir                  =R		# length of rotor arm beam at which rotor cylinder acts
+	l_iir                 =R_1
+	
+	y_Ar       =(W*l_ir**3/12/E/I_arm_axi_r)+(w_r*l_iir**4/24/E/I_arm_axi_r)  # axial deflection
+	
+	#Calculating torsional deflection of rotor structure
+	
+	z_all_r     =0.05*2*pi*R/360  # allowable torsional deflection
+	z_A_r       =(2*pi*(R-0.5*h_yr)*l/N_r)*sigma*(l_ir-0.5*h_yr)**3/3/E/I_arm_tor_r		# circumferential deflection
+	
+	#STATOR structure
+	
+	A_st      =l*t_s
+	a_s       = (b_st*d_s)-((b_st-2*t_ws)*(d_s-2*t_ws))
+	N_st                  = ops.round_integer(n_s)
+	theta_s               =pi/N_st
+	I_st      =l*t_s**3/12
+	I_arm_axi_s   =((b_st*d_s**3)-((b_st-2*t_ws)*(d_s-2*t_ws)**3))/12  # second moment of area of stator arm
+	I_arm_tor_s   = ((d_s*b_st**3)-((d_s-2*t_ws)*(b_st-2*t_ws)**3))/12  # second moment of area of rotot arm w.r.t torsion
+	R_st                  =(r_s+h_s+h_ys*0.5)
+	R_1s      = R_st-h_ys*0.5
+	k_2       = ops.sqrt(I_st/A_st)
+	m2        =(k_2/R_st)**2
+	
+	# allowable deflections
+	b_all_s                  =2*pi*R_o/N_st
+	u_all_s    = R_st/10000
+	y_all     =2*l/100		# allowable axial deflection
+	z_all_s     =0.05*2*pi*R_st/360  # allowable torsional deflection
+	
+	# Calculating radial deflection according to McDonald's
+	Numers=R_st**3*((0.25*(ops.sin(theta_s)-(theta_s*ops.cos(theta_s)))/(ops.sin(theta_s))**2)-(0.5/ops.sin(theta_s))+(0.5/theta_s))
+	Povs=((theta_s/(ops.sin(theta_s))**2)+1/ops.tan(theta_s))*((0.25*R_st/A_st)+(0.25*R_st**3/I_st))
+	Qovs=R_st**3/(2*I_st*theta_s*(m2+1))
+	Lovs=(R_1s-R_o)*0.5/a_s
+	Denoms=I_st*(Povs-Qovs+Lovs)
+	
+	u_As                             =(q3*R_st**2/E/t_s)*(1+Numers/Denoms)
+	
+	# Calculating axial deflection according to McDonald
+	l_is      =R_st-R_o
+	l_iis     =l_is
+	l_iiis    =l_is
+	mass_st_lam_s= M_Fest+pi*l*rho_Fe*((R_st+0.5*h_ys)**2-(R_st-0.5*h_ys)**2)
+	W_is                  =g1*ops.sin(phi)*(rho_Fes*l*d_s**2*0.5) # weight of rotor cylinder		# length of rotor arm beam at which self-weight acts
+	W_iis     =g1*ops.sin(phi)*(V_Cuss*rho_Copper+mass_st_lam_s)/2/N_st
+	w_s         =rho_Fes*g1*ops.sin(phi)*a_s*N_st
+	
+	
+	
+	X_comp1 = (W_is*l_is**3/12/E/I_arm_axi_s)
+	X_comp2 =(W_iis*l_iis**4/24/E/I_arm_axi_s)
+	X_comp3 =w_s*l_iiis**4/24/E/I_arm_axi_s
+	
+	y_As       =X_comp1+X_comp2+X_comp3  # axial deflection
+	
+	# Calculating torsional deflection
+	z_A_s  =2*pi*(R_st+0.5*t_s)*l/(2*N_st)*sigma*(l_is+0.5*t_s)**3/3/E/I_arm_tor_s
+	
+	# tangential stress constraints
+	TC1=T/(2*pi*sigma)
+	TC2=R**2*l
+	TC3=R_st**2*l
+	
+	mass_stru_steel  =2*(N_st*(R_1s-R_o)*a_s*rho_Fes)
+	
+	clock = profiling.lap(clock, 'EESG', 'structure')
+	# Calculating inactive mass and total mass
+	Structural_mass=mass_stru_steel+(N_r*(R_1-R_o)*a_r*rho_Fes)
+	
+	Mass=Copper+Iron+Structural_mass
+
+	clock = profiling.lap(clock, 'EESG', 'mass', calls=0)
+	return {'h_p': h_p, 'b_p': b_p, 'p': p, 'n_brushes': n_brushes, 'A_Curcalc': A_Curcalc, 'b_s': b_s,
+		'b_t': b_t, 'A_Cuscalc': A_Cuscalc, 'S': S, 'N_s': N_s, 'f': f, 'E_s': E_s, 'I_s': I_s,
+		'R_s': R_s, 'R_r': R_r, 'L_m': L_m, 'J_s': J_s, 'J_f': J_f, 'A_1': A_1,
+		'Load_mmf_ratio': Load_mmf_ratio, 'gen_eff': gen_eff, 'B_g': B_g, 'B_gfm': B_gfm,
+		'B_symax': B_symax, 'B_rymax': B_rymax, 'B_tmax': B_tmax, 'B_pc': B_pc, 'Losses': Losses,
+		'K_rad': K_rad, 'Mass': Mass, 'u_Ar': u_Ar, 'y_Ar': y_Ar, 'z_A_r': z_A_r, 'u_As': u_As,
+		'y_As': y_As, 'z_A_s': z_A_s, 'u_all_r': u_all_r, 'u_all_s': u_all_s, 'y_all': y_all,
+		'z_all_r': z_all_r, 'z_all_s': z_all_s, 'b_all_s': b_all_s, 'b_all_r': b_all_r, 'TC1': TC1,
+		'TC2': TC2, 'TC3': TC3, 'Iron': Iron, 'Copper': Copper, 'Structural_mass': Structural_mass,
+		'Power_ratio': Power_ratio, 'Slot_aspect_ratio': Slot_aspect_ratio, 'N_f': N_f, 't': t,
+		't_s': t_s}
+
+
+def field_current(inputs, speeds, loads, V_t=None, tolerance=1e-9, max_iterations=50):
+
+	""" Field current that holds the terminal voltage of an EESG design over a grid of
+	rotor speeds (rpm) by loads (fractions of machine_rating), one row per speed,
+	solved for all points at once. V_t, the phase voltage to hold, defaults to the
+	no-load voltage E_s of the design at n_nom. At each point the excitation voltage
+	follows from the salient-pole phasor diagram at the power factor of the model,
+	with the synchronous inductances L_d and L_q of the current field current, which
+	saturation makes depend on it; the field current is iterated until it changes by
+	less than tolerance (relative). Speeds of zero or less are parked points, with no
+	field or stator current and no losses; they count as converged only at no load.
+	Returns I_f, the field copper loss I_f**2*R_r, the other losses, gen_eff and the
+	converged mask, per point. """
+
+	n = np.asarray(speeds, dtype=float)[:, None]
+	P = np.asarray(loads, dtype=float)[None, :]*inputs['machine_rating']
+	n, P = np.broadcast_arrays(n, P)
+	running = n > 0
+	speed = np.where(running, n/inputs['n_nom'], 0.0)
+	# parked points are iterated at rated speed and no load, then zeroed
+	solved_speed = np.where(running, speed, 1.0)
+
+	def circuit(I_f):
+		with np.errstate(all='ignore'):
+			return evaluate(dict(inputs, I_f=ArrayOps.asarray(I_f)), ArrayOps, components=True)
+
+	rated = circuit(inputs['I_f'])
+	if V_t is None:
+		V_t = float(rated['E_s'])
+	m = rated['m']
+	phi = np.arccos(rated['cos_phi'])
+	I_s = np.where(running, P/(m*V_t*rated['cos_phi']), 0.0)
+	I_f = np.full(n.shape, float(inputs['I_f']))
+	converged = np.zeros(n.shape, dtype=bool)
+	for iteration in range(max_iterations):
+		values = circuit(I_f)
+		om_e = 2*pi*solved_speed*inputs['n_nom']*values['p']/60
+		# generator convention, the current lagging the terminal voltage by phi
+		E_Q = V_t + (values['R_s'] + 1j*om_e*values['L_q'])*I_s*np.exp(-1j*phi)
+		I_d = I_s*np.sin(np.angle(E_Q) + phi)
+		E_f = np.abs(E_Q) + om_e*(values['L_d'] - values['L_q'])*I_d
+		# the excitation voltage is proportional to the field current and the speed
+		I_f_new = I_f*E_f/(values['E_s']*solved_speed)
+		converged = np.abs(I_f_new - I_f) <= tolerance*np.abs(I_f_new)
+		I_f = I_f_new
+		if converged.all():
+			break
+	values = circuit(I_f)
+	I_f = np.where(running, I_f, 0.0)
+	P_Cuss = m*I_s**2*values['R_s']
+	P_Cur = I_f**2*values['R_r']
+	P_Fe = values['P_Hy']*speed + values['P_Ft']*speed**2
+	p_b = 2*values['delta_v']*I_f
+	Losses = P_Cuss + P_Cur + P_Fe + p_b
+	with np.errstate(divide='ignore', invalid='ignore'):
+		gen_eff = np.where(running & (P > 0), P*100/(Losses + P), 0.0)
+	return {'speed': n, 'power': P, 'I_f': I_f, 'J_f': np.where(running, values['J_f'], 0.0), 'I_s': I_s,
+		'E_f': np.where(running, E_f, 0.0), 'delta': np.where(running, np.angle(E_Q), 0.0), 'P_Cuss': P_Cuss,
+		'P_Cur': P_Cur, 'P_Fe': P_Fe, 'p_b': p_b, 'Losses': Losses, 'gen_eff': gen_eff,
+		'converged': np.where(running, converged, P == 0)}
+
+
+def evaluate_batch(inputs, exact=True):
+
+	""" Evaluates many EESG designs at once; see PMSG_arms_core.evaluate_batch. """
+
+	return _evaluate_batch(evaluate, inputs, VECTOR_INPUTS, exact)
+
+
+def jacobian(inputs, wrt=DERIV_INPUTS, of=DERIV_OUTPUTS):
+
+	""" Exact partial derivatives of the outputs ``of`` with respect to the
+	inputs ``wrt``, one row per output. The field turns N_f are differentiated
+	as a continuous variable; the arm counts n_r and n_s have zero partials. """
+
+	return _jacobian(evaluate, inputs, wrt, of)
+
+
+COST_INPUTS = ('Copper', 'Iron', 'Structural_mass', 'C_Cu', 'C_Fe', 'C_Fes')
+
+
+def costs(inputs):
+
+	""" Material cost estimate for an EESG generator. Manufacturing costs are excluded. """
+
+	Copper = inputs['Copper']
+	Iron = inputs['Iron']
+	Structural_mass = inputs['Structural_mass']
+	C_Cu = inputs['C_Cu']
+	C_Fe = inputs['C_Fe']
+	C_Fes = inputs['C_Fes']
+	
+	# Material cost as a function of material mass and specific cost of material
+	K_gen=Copper*C_Cu+Iron*C_Fe
+	Cost_str=C_Fes*Structural_mass
+
+	return {'Costs': K_gen+Cost_str}
+
+
+COST_DERIV_INPUTS = ('Copper', 'Iron', 'Structural_mass')
+
+
+def costs_jacobian(inputs):
+
+	""" Partial derivatives of Costs with respect to the material masses. """
+
+	return _jacobian(lambda values, ops: costs(values), inputs, COST_DERIV_INPUTS, ('Costs',))
@@ -11,6 +11,9 @@ from openmdao.lib.drivers.api import COBYLAdriver, CONMINdriver,NEWSUMTdriver,SL
 import numpy as np
 from numpy import array,float,min,sign
 from math import pi, cos, sqrt, radians, sin, exp, log10, log, tan, atan
+from generatorse import PMSG_arms_core, operating, genetic
+from generatorse.constraints import expression
+from generatorse.derivatives import jacobian
 
 class PMSG(Component):
 	
@@ -124,373 +127,242 @@ class PMSG(Component):
 	I=Array(np.array([0.0, 0.0, 0.0]),iotype='out', desc='Moments of Inertia for the component [Ixx, Iyy, Izz] around its center of mass')
 
 	
+	# optional cache.EvaluationCache returning stored outputs for repeated input vectors
+	cache = None
+	_cached_outputs = None
+
 	def execute(self):
 		
-		#Create internal variables based on inputs
-		r_s = self.r_s
-		l_s = self.l_s
-		h_s = self.h_s
-		tau_p =self.tau_p
-		B_g = self.B_g
-		n_r =self.n_r
-		n_s=self.n_s
-		t= self.t
-		t_s=self.t_s
-		b_r = self.b_r
-		d_r = self.d_r
-		t_wr =self.t_wr
-		b_st = self.b_st
-		d_s = self.d_s
-		t_ws =self.t_ws
-		b_s =self.b_s
-		b_t= self.b_t
-		h_ys = self.h_ys
-		h_yr  = self.h_yr
-		h_m =self.h_m
-		b_m =self.b_m
-		f=self.f
-		E_p=self.E_p
-		I_s=self.I_s
-		R_s=self.R_s
-		L_s=self.L_s
-		J_s=self.J_s
-		Mass=self.Mass
-		gen_eff =self.gen_eff
-		Losses=self.Losses
-		A_1=self.A_1
-		K_rad=self.K_rad
-		N_s=self.N_s
-		
-		mass_PM=self.mass_PM
-		Copper		=self.Copper
-		Iron=self.Iron
-		Structural_mass=self.Structural_mass
-		machine_rating=self.machine_rating
-		
-		u_As=self.u_As
-		u_Ar=self.u_Ar
-		y_As=self.y_As
-		y_Ar=self.y_Ar
-		z_A_s=self.z_A_s
-		z_A_r=self.z_A_r
-		z_all_s=self.z_all_s
-		z_all_r=self.z_all_r
-		R_out=self.R_out
-		B_pm1=self.B_pm1
-		B_tmax= self.B_tmax
-		B_symax=self.B_symax
-		B_rymax=self.B_rymax
-		B_smax=self.B_smax
-		B_pm1=self.B_pm1
-		A_Cuscalc=self.A_Cuscalc
-		b_all_r=self.b_all_r
-		b_all_s=self.b_all_s
-		S=self.S
-		machine_rating=self.machine_rating
-		Slot_aspect_ratio=self.Slot_aspect_ratio
-		Torque=self.Torque
-		main_shaft_cm = self.main_shaft_cm
-		main_shaft_length=self.main_shaft_length
-		cm=self.cm
-		I=self.I
-		TC1	=self.TC1
-		TC2=self.TC2
-		TC3=self.TC3
-		R_o=self.R_o
-		n_nom = self.n_nom
-		
-		rho_Fe= self.rho_Fe
-		rho_Fes=self.rho_Fes
-		rho_Copper=self.rho_Copper
-		rho_PM=self.rho_PM
-		
-		#Assign values to universal constants
-		
-		B_r    =1.2                 # Tesla remnant flux density
-		g1     =9.81                # m/s^2 acceleration due to gravity
-		E      =2e11                # N/m^2 young's modulus
-		sigma  =40e3                # shear stress assumed
-		ratio  =0.7                 # ratio of magnet width to pole pitch(bm/self.tau_p)
-		mu_0   =pi*4e-7              # permeability of free space
-		mu_r   =1.06								# relative permeability 
-		phi    =90*2*pi/360         # tilt angle (rotor tilt -90 degrees during transportation)
-		cofi   =0.85                 # power factor
-		
-		#Assign values to design constants
-		h_w    =0.005									# Slot wedge height
-		h_i    =0.001 								# coil insulation thickness
-		y_tau_p=1										 # Coil span to pole pitch
-		m      =3                    # no of phases
-		q1     =1                    # no of slots per pole per phase
-		b_s_tau_s=0.45 							 # slot width to slot pitch ratio
-		k_sfil =0.65								 # Slot fill factor
-		P_Fe0h =4			               #specific hysteresis losses W/kg @ 1.5 T 
-		P_Fe0e =1			               #specific hysteresis losses W/kg @ 1.5 T 
-		rho_Cu=1.8*10**(-8)*1.4			# Copper resisitivty
-		k_fes =0.9									# Stator iron fill factor per Grauers
-		b_so			=  0.004					# Slot opening
-		alpha_p		=  pi/2*0.7
+		# The sizing equations live in PMSG_arms_core so they can also be evaluated on batches of designs
+		inputs = dict((name, getattr(self, name)) for name in PMSG_arms_core.INPUTS)
+		if self.cache is None:
+			outputs = PMSG_arms_core.evaluate(inputs)
+		else:
+			outputs = self.cache.evaluate(PMSG_arms_core.evaluate, inputs)
+			if outputs is self._cached_outputs:
+				return    # repeated point, the output traits already hold these values
+			self._cached_outputs = outputs
+		for name in PMSG_arms_core.OUTPUTS:
+			setattr(self, name, outputs[name])
 
-		# back iron thickness for rotor and stator
-		self.t_s =self.h_ys    
-		self.t =self.h_yr
-		
-		
-		###################################################### Electromagnetic design#############################################
-		self.K_rad=self.l_s/(2*self.r_s)							# Aspect ratio
-		T =   self.Torque															# rated torque
-		l_u       =k_fes * self.l_s                   #useful iron stack length
-		We				=self.tau_p
-		l_b       = 2*self.tau_p  										#end winding length
-		l_e       =self.l_s+2*0.001*self.r_s     # equivalent core length
-		self.b_m  =0.7*self.tau_p								 # magnet width 	
-		
-		
-		# Calculating air gap length
-		dia				=  2*self.r_s              # air gap diameter
-		g         =  0.001*dia               # air gap length
-		r_m     	=  self.r_s+self.h_ys+self.h_s #magnet radius
-		r_r				=  self.r_s-g             #rotor radius
-		
-		self.p		=  round(pi*dia/(2*self.tau_p))	# pole pairs
-		self.f    =  self.n_nom*self.p/60					# outout frequency
-		self.S				= 2*self.p*q1*m 						# Stator slots
-		N_conductors=self.S*2					
-		self.N_s=N_conductors/2/3									# Stator turns per phase
-		tau_s=pi*dia/self.S												# Stator slot pitch
-		self.b_s	=  b_s_tau_s*tau_s    					#slot width 
-		self.b_t	=  tau_s-(self.b_s)          		#tooth width
-		self.Slot_aspect_ratio=self.h_s/self.b_s
-		
-		# Calculating Carter factor for statorand effective air gap length
-		gamma			=  4/pi*(b_so/2/(g+self.h_m/mu_r)*atan(b_so/2/(g+self.h_m/mu_r))-log(sqrt(1+(b_so/2/(g+self.h_m/mu_r))**2)))
-		k_C				=  tau_s/(tau_s-gamma*(g+self.h_m/mu_r))   # carter coefficient
-		g_eff			=  k_C*(g+self.h_m/mu_r)
-		
-		# angular frequency in radians
-		om_m			=  2*pi*self.n_nom/60
-		om_e			=  self.p*om_m/2
+	def list_deriv_vars(self):
+		return PMSG_arms_core.DERIV_INPUTS, PMSG_arms_core.DERIV_OUTPUTS
 
-		
-		# Calculating magnetic loading
-		self.B_pm1	 		=  B_r*self.h_m/mu_r/(g_eff)
-		self.B_g=  B_r*self.h_m/mu_r/(g_eff)*(4/pi)*sin(alpha_p)
-		self.B_symax=self.B_g*self.b_m*l_e/(2*self.h_ys*l_u)
-		self.B_rymax=self.B_g*self.b_m*l_e/(2*self.h_yr*self.l_s)
-		self.B_tmax	=self.B_g*tau_s/self.b_t
-		
-		#Calculating winding factor
-		k_wd			= sin(pi/6)/q1/sin(pi/6/q1)      
-		
-		L_t=self.l_s+2*self.tau_p
-		l					= L_t                          #length
-		
-		# Calculating no-load voltage induced in the stator
-		self.E_p	= 2*(self.N_s)*L_t*self.r_s*k_wd*om_m*self.B_g/sqrt(2)
-		
-		# Stator winding length ,cross-section and resistance
-		l_Cus			= 2*(self.N_s)*(2*self.tau_p+L_t)
-		A_s				= self.b_s*(self.h_s-h_w)*q1*self.p
-		A_scalc   = self.b_s*1000*(self.h_s*1000-h_w*1000)*q1*self.p
-		A_Cus			= A_s*k_sfil/(self.N_s)
-		self.A_Cuscalc = A_scalc *k_sfil/(self.N_s)
-		self.R_s	= l_Cus*rho_Cu/A_Cus
-		
-		# Calculating leakage inductance in  stator
-		L_m				= 2*m*k_wd**2*(self.N_s)**2*mu_0*self.tau_p*L_t/pi**2/g_eff/self.p
-		L_ssigmas=2*mu_0*self.l_s*self.N_s**2/self.p/q1*((self.h_s-h_w)/(3*self.b_s)+h_w/b_so)  #slot leakage inductance
-		L_ssigmaew=(2*mu_0*self.l_s*self.N_s**2/self.p/q1)*0.34*g*(l_e-0.64*self.tau_p*y_tau_p)/self.l_s                                #end winding leakage inductance
-		L_ssigmag=2*mu_0*self.l_s*self.N_s**2/self.p/q1*(5*(g*k_C/b_so)/(5+4*(g*k_C/b_so))) # tooth tip leakage inductance#tooth tip leakage inductance
-		L_ssigma	= (L_ssigmas+L_ssigmaew+L_ssigmag)
-		
-		self.L_s  = L_m+L_ssigma
-		Z=(self.machine_rating/(m*self.E_p))
-		
-		G=(self.E_p**2-(om_e*self.L_s*Z)**2)
-		
-		# Calculating stator current and electrical loading
-		self.I_s= sqrt(Z**2+(((self.E_p-G**0.5)/(om_e*self.L_s)**2)**2))
-		self.J_s	= self.I_s/self.A_Cuscalc
-		self.A_1 = 6*self.N_s*self.I_s/(pi*dia)
-		I_snom		=(self.machine_rating/m/self.E_p/cofi) #rated current
-		I_qnom		=self.machine_rating/(m*self.E_p)
-		X_snom		=om_e*(L_m+L_ssigma)
-		
-		self.B_smax=sqrt(2)*self.I_s*mu_0/g_eff
-		
-		# Calculating Electromagnetically active mass
-		
-		V_Cus 	=m*l_Cus*A_Cus     # copper volume
-		V_Fest	=L_t*2*self.p*q1*m*self.b_t*self.h_s   # volume of iron in stator tooth
-		V_Fesy	=L_t*pi*((self.r_s+self.h_s+self.h_ys)**2-(self.r_s+self.h_s)**2) # volume of iron in stator yoke
-		V_Fery	=L_t*pi*((r_r-self.h_m)**2-(r_r-self.h_m-self.h_yr)**2)
-		self.Copper		=V_Cus*self.rho_Copper
-		M_Fest	=V_Fest*self.rho_Fe    # Mass of stator tooth
-		M_Fesy	=V_Fesy*self.rho_Fe    # Mass of stator yoke
-		M_Fery	=V_Fery*self.rho_Fe    # Mass of rotor yoke
-		self.Iron		=M_Fest+M_Fesy+M_Fery
-		
-		# Calculating Losses
-		##1. Copper Losses
-		
-		K_R=1.2   # Skin effect correction co-efficient
-		P_Cu		=m*I_snom**2*self.R_s*K_R
+	def provideJ(self):
+		# exact partials of the constrained outputs with respect to the design variables
+		return PMSG_arms_core.jacobian(dict((name, getattr(self, name)) for name in PMSG_arms_core.INPUTS))
 
-		# Iron Losses ( from Hysteresis and eddy currents) 
-		P_Hyys	=M_Fesy*(self.B_symax/1.5)**2*(P_Fe0h*om_e/(2*pi*60)) # Hysteresis losses in stator yoke
-		P_Ftys	=M_Fesy*((self.B_symax/1.5)**2)*(P_Fe0e*(om_e/(2*pi*60))**2) # Eddy losses in stator yoke
-		P_Fesynom=P_Hyys+P_Ftys
-		P_Hyd=M_Fest*(self.B_tmax/1.5)**2*(P_Fe0h*om_e/(2*pi*60))  # Hysteresis losses in stator teeth
-		P_Ftd=M_Fest*(self.B_tmax/1.5)**2*(P_Fe0e*(om_e/(2*pi*60))**2) # Eddy losses in stator teeth
-		P_Festnom=P_Hyd+P_Ftd
-		
-		# additional stray losses due to leakage flux
-		P_ad=0.2*(P_Hyys + P_Ftys + P_Hyd + P_Ftd ) 
-		pFtm =300 # specific magnet loss
-		P_Ftm=pFtm*2*self.p*self.b_m*self.l_s
-		
-		self.Losses=P_Cu+P_Festnom+P_Fesynom+P_ad+P_Ftm
-		self.gen_eff=self.machine_rating*100/(self.machine_rating+self.Losses)
-		
-		
-		
-		################################################## Structural  Design ############################################################
-		
-		##Deflection Calculations##
-		
-		#rotor structure calculations
-		
-		a_r				= (self.b_r*self.d_r)-((self.b_r-2*self.t_wr)*(self.d_r-2*self.t_wr))  # cross-sectional area of rotor arms
-		A_r				= l*self.t																														 # cross-sectional area of rotor cylinder 
-		N_r				= round(self.n_r)																											 # rotor arms
-		theta_r		=pi*1/N_r                             																 # half angle between spokes
-		I_r				=l*self.t**3/12                         															# second moment of area of rotor cylinder
-		I_arm_axi_r	=((self.b_r*self.d_r**3)-((self.b_r-2*self.t_wr)*(self.d_r-2*self.t_wr)**3))/12  # second moment of area of rotor arm
-		I_arm_tor_r	= ((self.d_r*self.b_r**3)-((self.d_r-2*self.t_wr)*(self.b_r-2*self.t_wr)**3))/12  # second moment of area of rotot arm w.r.t torsion
-		R					= self.r_s-g-self.h_m-0.5*self.t                                       # Rotor mean radius
-		c					=R/500
-		self.u_all_r    =c/20 																	# allowable radial deflection
-		R_1				= R-self.t*0.5																#inner radius of rotor cylinder
-		k_1				= sqrt(I_r/A_r)                               # radius of gyration
-		m1				=(k_1/R)**2
-		l_ir			=R                                      			# length of rotor arm beam at which rotor cylinder acts
-		l_iir			=R_1 
-		self.b_all_r		=2*pi*self.R_o/N_r											#allowable circumferential arm dimension for rotor
-		
-		q3					= self.B_g**2/2/mu_0   											# normal component of Maxwell stress
-		
-		self.mass_PM   =(2*pi*(R+0.5*self.t)*l*self.h_m*ratio*self.rho_PM)           # magnet mass
-		
-		
-		# Calculating radial deflection of the rotor 
-		
-		Numer=R**3*((0.25*(sin(theta_r)-(theta_r*cos(theta_r)))/(sin(theta_r))**2)-(0.5/sin(theta_r))+(0.5/theta_r))
-		Pov=((theta_r/(sin(theta_r))**2)+1/tan(theta_r))*((0.25*R/A_r)+(0.25*R**3/I_r))
-		Qov=R**3/(2*I_r*theta_r*(m1+1))
-		Lov=(R_1-self.R_o)/a_r
-		Denom=I_r*(Pov-Qov+Lov) # radial deflection % rotor
-		
-		self.u_Ar				=(q3*R**2/E/self.t)*(1+Numer/Denom)
-		
-		# Calculating axial deflection of the rotor under its own weight
-		w_r					=self.rho_Fes*g1*sin(phi)*a_r*N_r																		 # uniformly distributed load of the weight of the rotor arm
-		mass_st_lam=self.rho_Fe*2*pi*(R)*l*self.h_yr                                     # mass of rotor yoke steel
-		W				=g1*sin(phi)*(mass_st_lam/N_r+(self.mass_PM)/N_r)  											 # weight of 1/nth of rotor cylinder
-		
-		y_a1=(W*l_ir**3/12/E/I_arm_axi_r)                                                # deflection from weight component of back iron
-		y_a2=(w_r*l_iir**4/24/E/I_arm_axi_r)																						 # deflection from weight component of yhe arms
-		self.y_Ar       =y_a1+y_a2 # axial deflection
-		self.y_all     =2*l/100    # allowable axial deflection
-		
-		# Calculating # circumferential deflection of the rotor
-		self.z_all_r     =0.05*2*pi*R/360  																														 # allowable torsional deflection
-		self.z_A_r       =(2*pi*(R-0.5*self.t)*l/N_r)*sigma*(l_ir-0.5*self.t)**3/3/E/I_arm_tor_r       # circumferential deflection
-		
-		val_str_rotor		= self.mass_PM+((mass_st_lam)+(N_r*(R_1-self.R_o)*a_r*self.rho_Fes))           #rotor mass
-		
+####################################################Staged evaluation#################################################################
 
+class PMSG_stage(Component):
+	
+	""" Runs one stage of the PMSG_arms equations. Subclasses name the PMSG_arms_core stage function and
+	declare its inputs and outputs, so the framework can skip a stage whose inputs did not change. """
+	
+	core_stage = None
+	core_inputs = ()
+	core_outputs = ()
+	
+	def execute(self):
 		
+		outputs = self.core_stage(dict((name, getattr(self, name)) for name in self.core_inputs))
+		for name in self.core_outputs:
+			setattr(self, name, outputs[name])
 
+	def list_deriv_vars(self):
+		return PMSG_arms_core.stage_deriv_vars(self.core_inputs, self.core_outputs)
+
+	def provideJ(self):
+		wrt, of = self.list_deriv_vars()
+		return jacobian(self.core_stage, dict((name, getattr(self, name)) for name in self.core_inputs), wrt, of)
+
+class PMSG_EM(PMSG_stage):
+	
+	""" Electromagnetic stage of the PMSG -arms generator: loading, active masses and losses. """
+	
+	core_stage = staticmethod(PMSG_arms_core.electromagnetic)
+	core_inputs = PMSG_arms_core.EM_INPUTS
+	core_outputs = PMSG_arms_core.EM_OUTPUTS
+	
+	# Inputs
+	r_s = Float(iotype='in', desc='airgap radius r_s')
+	l_s = Float(iotype='in', desc='Stator core length l_s')
+	h_s = Float(iotype='in', desc='Yoke height h_s')
+	tau_p =Float(iotype='in', desc='Pole pitch self.tau_p')
+	h_m=Float(iotype='in', desc='magnet height')
+	h_ys=Float(iotype='in', desc='Yoke height')
+	h_yr=Float(iotype='in', desc='rotor yoke height')
+	machine_rating=Float(iotype='in', desc='Machine rating')
+	n_nom=Float(iotype='in', desc='rated speed')
+	Torque=Float(iotype='in', desc='Rated torque ')
+	rho_Fe=Float(iotype='in', desc='Magnetic Steel density kg/m^3')
+	rho_Copper=Float(iotype='in', desc='Copper density kg/m^3')
+	
+	# Outputs
+	B_symax = Float(iotype='out', desc='Peak Stator Yoke flux density B_ymax')
+	B_tmax=Float(iotype='out', desc='Peak Teeth flux density')
+	B_rymax=Float(iotype='out', desc='Peak Rotor yoke flux density')
+	B_smax=Float(iotype='out', desc='Peak Stator flux density')
+	B_pm1=Float(iotype='out', desc='Fundamental component of peak air gap flux density')
+	B_g = Float(iotype='out', desc='Peak air gap flux density B_g')
+	N_s =Float(iotype='out', desc='Number of turns in the stator winding')
+	b_s=Float(iotype='out', desc='slot width')
+	b_t=Float(iotype='out', desc='tooth width')
+	A_Cuscalc=Float(iotype='out', desc='Conductor cross-section mm^2')
+	b_m=Float(iotype='out', desc='magnet width')
+	p=Float(iotype='out', desc='No of pole pairs')
+	E_p=Float(iotype='out', desc='Stator phase voltage')
+	f=Float(iotype='out', desc='Generator output frequency')
+	I_s=Float(iotype='out', desc='Generator output phase current')
+	R_s=Float(iotype='out', desc='Stator resistance')
+	L_s=Float(iotype='out', desc='Stator synchronising inductance')
+	A_1 =Float(0,iotype='out', desc='Electrical loading')
+	J_s=Float(iotype='out', desc='Current density')
+	K_rad=Float(iotype='out', desc='K_rad')
+	Losses=Float(iotype='out', desc='Total loss')
+	gen_eff=Float(iotype='out', desc='Generator efficiency')
+	TC1	=Float(iotype='out', desc='Torque constraint')
+	R_out=Float(iotype='out', desc='Outer radius')
+	S			=Float(iotype='out', desc='Stator slots')
+	Slot_aspect_ratio=Float(iotype='out', desc='Slot aspect ratio')
+	Copper		=Float(iotype='out', desc='Copper Mass')
+	Iron	=Float(iotype='out', desc='Electrical Steel Mass')
+	L_t=Float(iotype='out', desc='Total stator length including end windings')
+	R=Float(iotype='out', desc='Rotor mean radius')
+	M_Fest=Float(iotype='out', desc='Stator tooth iron mass')
+
+class PMSG_Rotor_structure(PMSG_stage):
+	
+	""" Rotor structure stage of the PMSG -arms generator: rotor deflections and masses. """
+	
+	core_stage = staticmethod(PMSG_arms_core.rotor_structure)
+	core_inputs = PMSG_arms_core.ROTOR_INPUTS
+	core_outputs = PMSG_arms_core.ROTOR_OUTPUTS
+	
+	# Inputs
+	R=Float(iotype='in', desc='Rotor mean radius')
+	L_t=Float(iotype='in', desc='Total stator length including end windings')
+	B_g = Float(iotype='in', desc='Peak air gap flux density B_g')
+	h_m=Float(iotype='in', desc='magnet height')
+	h_yr=Float(iotype='in', desc='rotor yoke height')
+	n_r =Float(iotype='in', desc='number of arms n')
+	b_r = Float(iotype='in', desc='arm width b_r')
+	d_r = Float(iotype='in', desc='arm depth d_r')
+	t_wr =Float(iotype='in', desc='arm depth thickness self.t_wr')
+	R_o=Float(iotype='in', desc='Shaft radius')
+	rho_Fes=Float(iotype='in', desc='Structural Steel density kg/m^3')
+	rho_Fe=Float(iotype='in', desc='Magnetic Steel density kg/m^3')
+	rho_PM=Float(iotype='in', desc='Magnet density kg/m^3')
+	t= Float(iotype='in', desc='rotor back iron')
+	
+	# Outputs
+	u_Ar	=Float(iotype='out', desc='Rotor radial deflection')
+	y_Ar =Float(iotype='out', desc='Rotor axial deflection')
+	z_A_r=Float(iotype='out', desc='Rotor circumferential deflection')
+	u_all_r=Float(iotype='out', desc='Allowable radial rotor')
+	z_all_r=Float(iotype='out', desc='Allowable circum rotor')
+	y_all=Float(iotype='out', desc='Allowable axial')
+	b_all_r=Float(iotype='out', desc='Allowable arm dimensions')
+	TC2=Float(iotype='out', desc='Torque constraint-rotor')
+	mass_PM=Float(iotype='out', desc='Magnet mass')
+	Rotor_mass=Float(iotype='out', desc='Rotor mass')
+	Rotor_arm_mass=Float(iotype='out', desc='Rotor arm mass')
+
+class PMSG_Stator_structure(PMSG_stage):
+	
+	""" Stator structure stage of the PMSG -arms generator: stator deflections and masses. """
+	
+	core_stage = staticmethod(PMSG_arms_core.stator_structure)
+	core_inputs = PMSG_arms_core.STATOR_INPUTS
+	core_outputs = PMSG_arms_core.STATOR_OUTPUTS
+	
+	# Inputs
+	r_s = Float(iotype='in', desc='airgap radius r_s')
+	h_s = Float(iotype='in', desc='Yoke height h_s')
+	h_ys=Float(iotype='in', desc='Yoke height')
+	L_t=Float(iotype='in', desc='Total stator length including end windings')
+	B_g = Float(iotype='in', desc='Peak air gap flux density B_g')
+	M_Fest=Float(iotype='in', desc='Stator tooth iron mass')
+	Copper		=Float(iotype='in', desc='Copper Mass')
+	n_s =Float(iotype='in', desc='number of stator arms n_s')
+	b_st = Float(iotype='in', desc='arm width b_r')
+	d_s= Float(iotype='in', desc='arm depth d_r')
+	t_ws =Float(iotype='in', desc='arm depth thickness self.t_wr')
+	R_o=Float(iotype='in', desc='Shaft radius')
+	rho_Fes=Float(iotype='in', desc='Structural Steel density kg/m^3')
+	rho_Fe=Float(iotype='in', desc='Magnetic Steel density kg/m^3')
+	
+	# Outputs
+	u_As=Float(iotype='out', desc='Stator radial deflection')
+	y_As =Float(iotype='out', desc='Stator axial deflection')
+	z_A_s=Float(iotype='out', desc='Stator circumferential deflection')
+	u_all_s=Float(iotype='out', desc='Allowable radial stator')
+	z_all_s=Float(iotype='out', desc='Allowable circum stator')
+	b_all_s=Float(iotype='out', desc='Allowable arm')
+	TC3=Float(iotype='out', desc='Torque constraint-stator')
+	Stator_mass=Float(iotype='out', desc='Stator mass')
+	Stator_arm_mass=Float(iotype='out', desc='Stator arm mass')
+	t_s= Float(iotype='out', desc='stator back iron ')
+
+class PMSG_Mass(PMSG_stage):
+	
+	""" Totals the PMSG -arms stage masses; moments of inertia and centre of mass. """
+	
+	core_stage = staticmethod(PMSG_arms_core.mass_properties)
+	core_inputs = PMSG_arms_core.MASS_INPUTS
+	core_outputs = PMSG_arms_core.MASS_OUTPUTS
+	
+	# Inputs
+	Rotor_mass=Float(iotype='in', desc='Rotor mass')
+	Stator_mass=Float(iotype='in', desc='Stator mass')
+	Rotor_arm_mass=Float(iotype='in', desc='Rotor arm mass')
+	Stator_arm_mass=Float(iotype='in', desc='Stator arm mass')
+	R_out=Float(iotype='in', desc='Outer radius')
+	l_s = Float(iotype='in', desc='Stator core length l_s')
+	main_shaft_cm = Array(np.array([0.0, 0.0, 0.0]),iotype='in', desc='Main Shaft CM')
+	main_shaft_length=Float(iotype='in', desc='main shaft length')
+	
+	# Outputs
+	Mass=Float(iotype='out', desc='Actual mass')
+	Structural_mass	=Float(iotype='out', desc='Structural Mass')
+	I=Array(np.array([0.0, 0.0, 0.0]),iotype='out', desc='Moments of Inertia for the component [Ixx, Iyy, Izz] around its center of mass')
+	cm=Array(np.array([0.0, 0.0, 0.0]),iotype='out', desc='COM [x,y,z]')
+
+
+class PMSG_staged(Assembly):
+	
+	""" PMSG -arms generator built from its electromagnetic, rotor structure, stator structure and mass
+	stages, with the inputs and outputs of PMSG. Each stage only runs when its own inputs change, so a
+	step in an arm variable does not repeat the electromagnetic design. """
+	
+	t= Float(iotype='out', desc='rotor back iron')
+	
+	def configure(self):
+		
+		stages = (('PMSG_EM', PMSG_EM()), ('PMSG_Rotor', PMSG_Rotor_structure()),
+			('PMSG_Stator', PMSG_Stator_structure()), ('PMSG_Mass', PMSG_Mass()))
+		sources = {}
+		for name, stage in stages:
+			self.add(name, stage)
+			self.driver.workflow.add(name)
+			for var in stage.core_inputs:
+				if var == 't':
+					continue    # the rotor keeps the back iron of its previous execution, as in PMSG
+				if var in sources:
+					self.connect(sources[var], '%s.%s' % (name, var))
+				else:
+					# generator input, passed through to the first stage reading it
+					self.create_passthrough('%s.%s' % (name, var))
+					sources[var] = var
+			for var in stage.core_outputs:
+				if var in PMSG_arms_core.OUTPUTS and var != 't':
+					self.create_passthrough('%s.%s' % (name, var))
+				sources[var] = '%s.%s' % (name, var)
+	
+	def execute(self):
 		
-		#stator structure deflection calculation
-		
-		a_s       = (self.b_st*self.d_s)-((self.b_st-2*self.t_ws)*(self.d_s-2*self.t_ws)) # cross-sectional area of stator armms
-		A_st      =l*self.t_s																															# cross-sectional area of stator cylinder 
-		N_st			= round(self.n_s)																												# stator arms
-		theta_s		=pi*1/N_st 																															# half angle between spokes
-		I_st       =l*self.t_s**3/12          																						# second moment of area of stator cylinder
-		k_2       = sqrt(I_st/A_st) 																											# radius of gyration
-		
-		I_arm_axi_s	=((self.b_st*self.d_s**3)-((self.b_st-2*self.t_ws)*(self.d_s-2*self.t_ws)**3))/12  # second moment of area of stator arm
-		I_arm_tor_s	= ((self.d_s*self.b_st**3)-((self.d_s-2*self.t_ws)*(self.b_st-2*self.t_ws)**3))/12  # second moment of area of rotot arm w.r.t torsion
-		R_st 			=self.r_s+self.h_s+self.h_ys*0.5                                        # stator cylinder mean radius
-		R_1s      = R_st-self.t_s*0.5																											#inner radius of stator cylinder, m
-		m2        =(k_2/R_st)**2
-		d_se=dia+2*(self.h_ys+self.h_s+h_w)  # stator outer diameter
-		
-		# allowable radial deflection of stator
-		c1        =R_st/500
-		self.u_all_s    = c1/20
-		
-						
-		self.R_out=(R/0.995+self.h_s+self.h_ys)
-		l_is      =R_st-self.R_o																													# distance at which the weight of the stator cylinder acts
-		l_iis     =l_is																																		# distance at which the weight of the stator cylinder acts
-		l_iiis    =l_is																																		# distance at which the weight of the stator cylinder acts
-		
-		
-				
-		mass_st_lam_s= M_Fest+pi*L_t*self.rho_Fe*((R_st+0.5*self.h_ys)**2-(R_st-0.5*self.h_ys)**2)
-		W_is			=0.5*g1*sin(phi)*(self.rho_Fes*l*self.d_s**2)                          # length of stator arm beam at which self-weight acts
-		W_iis     =g1*sin(phi)*(mass_st_lam_s+V_Cus*self.rho_Copper)/2/N_st							 # weight of stator cylinder and teeth
-		w_s         =self.rho_Fes*g1*sin(phi)*a_s*N_st																	 # uniformly distributed load of the arms
-		
-		#print (M_Fest+self.Copper)*g1
-		
-		mass_stru_steel  =2*(N_st*(R_1s-self.R_o)*a_s*self.rho_Fes)											# Structural mass of stator arms
-		
-		# Calculating radial deflection of the stator
-		
-		Numers=R_st**3*((0.25*(sin(theta_s)-(theta_s*cos(theta_s)))/(sin(theta_s))**2)-(0.5/sin(theta_s))+(0.5/theta_s))
-		Povs=((theta_s/(sin(theta_s))**2)+1/tan(theta_s))*((0.25*R_st/A_st)+(0.25*R_st**3/I_st))
-		Qovs=R_st**3/(2*I_st*theta_s*(m2+1))
-		Lovs=(R_1s-self.R_o)*0.5/a_s
-		Denoms=I_st*(Povs-Qovs+Lovs)
-		
-		self.u_As				=(q3*R_st**2/E/self.t_s)*(1+Numers/Denoms)
-		
-		# Calculating axial deflection of the stator
-		
-		X_comp1 = (W_is*l_is**3/12/E/I_arm_axi_s)																				# deflection component due to stator arm beam at which self-weight acts
-		X_comp2 =(W_iis*l_iis**4/24/E/I_arm_axi_s)																			# deflection component due to 1/nth of stator cylinder
-		X_comp3 =w_s*l_iiis**4/24/E/I_arm_axi_s																					# deflection component due to weight of arms
-		
-		self.y_As       =X_comp1+X_comp2+X_comp3  																			# axial deflection
-		
-		# Calculating circumferential deflection of the stator
-		self.z_A_s  =2*pi*(R_st+0.5*self.t_s)*l/(2*N_st)*sigma*(l_is+0.5*self.t_s)**3/3/E/I_arm_tor_s 
-		self.z_all_s     =0.05*2*pi*R_st/360  																					# allowable torsional deflection
-		self.b_all_s		=2*pi*self.R_o/N_st    																					# allowable circumferential arm dimension
-		
-		val_str_stator		= mass_stru_steel+mass_st_lam_s
-		val_str_mass=val_str_rotor+val_str_stator
-		
-		self.TC1=T/(2*pi*sigma)     # Desired shear stress 
-		self.TC2=R**2*l              # Evaluating Torque constraint for rotor
-		self.TC3=R_st**2*l           # Evaluating Torque constraint for stator
-		
-		self.Structural_mass=mass_stru_steel+(N_r*(R_1-self.R_o)*a_r*self.rho_Fes)
-		Stator=mass_st_lam_s+mass_stru_steel+self.Copper
-		Rotor=((2*pi*t*L_t*(R)*self.rho_Fe)+(N_r*(R_1-self.R_o)*a_r*self.rho_Fes))+self.mass_PM
-		self.Mass=Stator+Rotor
-			
-		# Calculating mass moments of inertia and center of mass
-		self.I[0]   = (0.5*self.Mass*self.R_out**2)
-		self.I[1]   = (0.25*self.Mass*self.R_out**2+(1/12)*self.Mass*self.l_s**2) 
-		self.I[2]   = self.I[1]
-		cm[0]  = self.main_shaft_cm[0] + self.main_shaft_length/2. + self.l_s/2
-		cm[1]  = self.main_shaft_cm[1]
-		cm[2]  = self.main_shaft_cm[2]
+		super(PMSG_staged, self).execute()
+		self.t = self.PMSG_Rotor.t
 
 ####################################################Cost Analysis#######################################################################
 
@@ -513,21 +385,69 @@ class PMSG_Cost(Component):
 	Costs= Float(iotype='out', desc='Total cost')
 	
 	def execute(self):
-		Copper=self.Copper
-		C_Cu=self.C_Cu
-		Iron=self.Iron
-		C_Fe=self.C_Fe
-		C_Fes=self.C_Fes
-		C_PM=self.C_PM
-		Costs=self.Costs
-		Structural_mass=self.Structural_mass
 		
-		# Material cost as a function of material mass and specific cost of material
-		K_gen=self.Copper*self.C_Cu+self.Iron*self.C_Fe+self.C_PM*self.mass_PM
-		Cost_str=self.C_Fes*self.Structural_mass
-		self.Costs=K_gen+Cost_str
+		self.Costs = PMSG_arms_core.costs(dict((name, getattr(self, name)) for name in PMSG_arms_core.COST_INPUTS))['Costs']
+
+	def list_deriv_vars(self):
+		return PMSG_arms_core.COST_DERIV_INPUTS, ('Costs',)
+
+	def provideJ(self):
+		return PMSG_arms_core.costs_jacobian(dict((name, getattr(self, name)) for name in PMSG_arms_core.COST_INPUTS))
 		
   
+####################################################Annual energy#######################################################################
+
+class PMSG_Energy(Component):
+	
+	""" Annual energy production and generator losses of a PMSG_arms design over a Weibull wind
+	distribution, from its losses across the operating range; AEL may serve as the objective. """
+	# Inputs: the main dimensions and rating, as for PMSG
+	r_s=Float(iotype='in', units='m', desc='airgap radius r_s')
+	l_s=Float(iotype='in', units='m', desc='Stator core length l_s')
+	h_s=Float(iotype='in', units='m', desc='Yoke height h_s')
+	tau_p=Float(iotype='in', units='m', desc='Pole pitch self.tau_p')
+	h_m=Float(iotype='in', units='m', desc='Magnet height')
+	h_ys=Float(iotype='in', units='m', desc='Yoke height')
+	h_yr=Float(iotype='in', units='m', desc='rotor yoke height')
+	machine_rating=Float(iotype='in', units='W', desc='Machine rating')
+	n_nom=Float(iotype='in', units='rpm', desc='rated speed')
+	Torque=Float(iotype='in', units='N*m', desc='Rated torque ')
+	rho_Fe=Float(iotype='in', units='kg*m**-3', desc='Magnetic Steel density ')
+	rho_Copper=Float(iotype='in', units='kg*m**-3', desc='Copper density ')
+	
+	# wind distribution and power curve
+	mean_wind_speed=Float(10.0, iotype='in', units='m/s', desc='Annual mean wind speed at hub height')
+	weibull_shape=Float(2.0, iotype='in', desc='Weibull shape factor')
+	v_in=Float(3.0, iotype='in', units='m/s', desc='Cut-in wind speed')
+	v_rated=Float(11.4, iotype='in', units='m/s', desc='Rated wind speed')
+	v_out=Float(25.0, iotype='in', units='m/s', desc='Cut-out wind speed')
+	n_min=Float(0.5, iotype='in', desc='Minimum rotor speed as a fraction of rated speed')
+	
+	# Outputs
+	AEP=Float(iotype='out', units='kW*h', desc='Annual energy production')
+	AEL=Float(iotype='out', units='kW*h', desc='Annual energy loss of the generator')
+	
+	def wind(self):
+		return {'mean': self.mean_wind_speed, 'shape': self.weibull_shape, 'v_in': self.v_in,
+			'v_rated': self.v_rated, 'v_out': self.v_out, 'n_min': self.n_min}
+	
+	def execute(self):
+		
+		inputs = dict((name, getattr(self, name)) for name in PMSG_arms_core.EM_INPUTS)
+		energy = operating.annual_energy(lambda n, P: PMSG_arms_core.operating_losses(inputs, n, P),
+			self.machine_rating, self.n_nom, **self.wind())
+		self.AEP = energy['AEP']
+		self.AEL = energy['AEL']
+
+	def list_deriv_vars(self):
+		return PMSG_arms_core.ENERGY_DERIV_INPUTS, ('AEL',)
+
+	def provideJ(self):
+		# AEP depends on the rating only; AEL on dual numbers through PMSG_arms_core.energy_loss
+		inputs = dict((name, getattr(self, name)) for name in PMSG_arms_core.EM_INPUTS)
+		return PMSG_arms_core.energy_jacobian(inputs, **self.wind())
+		
+
 ####################################################OPTIMISATION SET_UP ###############################################################
 
 class PMSG_arms_Opt(Assembly):
@@ -577,14 +497,25 @@ class PMSG_arms_Opt(Assembly):
  	
   
 	
-	def __init__(self,Optimiser='',Objective_function='',print_results=''):
+	# sizing equations and name of the generator component, read by the multi-start tools
+	generator_core = PMSG_arms_core
+	generator_name = 'PMSG'
+	# assembly variables of the rated power, speed and torque, read by the warm-start database
+	rating_variables = {'P_rated': 'P_rated', 'N': 'N', 'T_rated': 'T_rated'}
+	
+	def __init__(self,Optimiser='',Objective_function='',print_results='',staged=False):
 		
 		super(PMSG_arms_Opt,self).__init__()
 
-		""" Creates a new Assembly containing PMSG and an optimizer"""
+		""" Creates a new Assembly containing PMSG and an optimizer. With staged=True the generator is
+		the PMSG_staged assembly, which re-runs only the stages whose inputs changed. The annual
+		energy component PMSG_Energy is added only for an objective on it, e.g. 'PMSG_Energy.AEL'.
+		Optimiser='Genetic' runs generatorse.genetic on the core in place of the driver, evaluating
+		each de-duplicated generation in parallel and with the constraints; population_size,
+		generations, crossover_rate, mutation_rate and seed are read from the Genetic driver. """
 		
 		# add PMSG component, connect i/o
-		self.add('PMSG',PMSG())
+		self.add('PMSG',PMSG_staged() if staged else PMSG())
 		self.connect('PMSG_r_s','PMSG.r_s')
 		self.connect('PMSG_l_s','PMSG.l_s')
 		self.connect('PMSG_h_s','PMSG.h_s')
@@ -631,62 +562,43 @@ class PMSG_arms_Opt(Assembly):
 		self.connect('PMSG.Structural_mass','PMSG_Cost.Structural_mass')
 		self.connect('PMSG_Cost.Costs','Costs')
 		
+		# add PMSG_Energy component only for an annual energy objective such as 'PMSG_Energy.AEL'
+		workflow = ['PMSG','PMSG_Cost']
+		if Objective_function.startswith('PMSG_Energy.'):
+			self.add('PMSG_Energy',PMSG_Energy())
+			for name in PMSG_arms_core.EM_INPUTS:
+				source = {'machine_rating': 'P_rated', 'n_nom': 'N', 'Torque': 'T_rated'}.get(name)
+				if source is None:
+					source = name if name.startswith('rho_') else 'PMSG_'+name
+				self.connect(source,'PMSG_Energy.'+name)
+			workflow.append('PMSG_Energy')
+		
 		# add optimizer and set-up problem (using user defined input on objective function"
 		self.Optimiser=Optimiser
 		self.Objective_function=Objective_function
 		Opt1=globals()[self.Optimiser]
 		self.add('driver',Opt1())
 		self.driver.add_objective(self.Objective_function)
-		self.driver.workflow.add(['PMSG','PMSG_Cost'])
+		self.driver.workflow.add(workflow)
 		# set up design variables for the PMSG_arms generator
 		self.driver.design_vars=['PMSG_r_s','PMSG_l_s','PMSG_h_s','PMSG_tau_p','PMSG_h_m','PMSG_h_ys','PMSG_h_yr','PMSG_n_r','PMSG_n_s','PMSG_b_r','PMSG_b_st','PMSG_d_r','PMSG_d_st','PMSG_t_wr','PMSG_t_ws']
-		self.driver.add_parameter('PMSG_r_s', low=0.5, high=9)
-		self.driver.add_parameter('PMSG_l_s', low=0.5, high=2.5)
-		self.driver.add_parameter('PMSG_h_s', low=0.04, high=0.1)
-		self.driver.add_parameter('PMSG_tau_p', low=0.04, high=0.1)
-		self.driver.add_parameter('PMSG_h_m', low=0.005, high=0.1)
-		self.driver.add_parameter('PMSG_n_r', low=5., high=15.)
-		self.driver.add_parameter('PMSG_h_yr', low=0.045, high=0.25)
-		self.driver.add_parameter('PMSG_h_ys', low=0.045, high=0.25)
-		self.driver.add_parameter('PMSG_b_r', low=0.1, high=1.5)
-		self.driver.add_parameter('PMSG_d_r', low=0.1, high=1.5)
-		self.driver.add_parameter('PMSG_t_wr', low=0.001, high=0.2)
-		self.driver.add_parameter('PMSG_n_s', low=5., high=15.)
-		self.driver.add_parameter('PMSG_b_st', low=0.1, high=1.5)
-		self.driver.add_parameter('PMSG_d_s', low=0.1, high=1.5)
-		self.driver.add_parameter('PMSG_t_ws', low=0.001, high=0.2)
+		for name, low, high in PMSG_arms_core.DESIGN_VARIABLES:
+			self.driver.add_parameter('PMSG_'+name, low=low, high=high)
 		
 		self.driver.iprint=print_results
 		
 		# set up constraints for the PMSG_arms generator
-		self.driver.add_constraint('PMSG.B_symax<2')										  #1
-		self.driver.add_constraint('PMSG.B_rymax<2')										  #2
-		self.driver.add_constraint('PMSG.B_tmax<2')									      #3
-		self.driver.add_constraint('PMSG.B_smax<PMSG.B_g') 								#4
-		self.driver.add_constraint('PMSG.B_g>=0.7')  											#5                
-		self.driver.add_constraint('PMSG.B_g<=1.2') 											#6
-		self.driver.add_constraint('PMSG.E_p>=500')											  #7
-		self.driver.add_constraint('PMSG.E_p<=5000')											#8
-		self.driver.add_constraint('PMSG.u_As<PMSG.u_all_s')							#9
-		self.driver.add_constraint('PMSG.z_A_s<PMSG.z_all_s')							#10
-		self.driver.add_constraint('PMSG.y_As<PMSG.y_all')  							#11
-		self.driver.add_constraint('PMSG.u_Ar<PMSG.u_all_r')							#12
-		self.driver.add_constraint('PMSG.z_A_r<PMSG.z_all_r')							#13
-		self.driver.add_constraint('PMSG.y_Ar<PMSG.y_all') 								#14
-		self.driver.add_constraint('PMSG.TC1<PMSG.TC2')    								#15
-		self.driver.add_constraint('PMSG.TC1<PMSG.TC3')    								#16
-		self.driver.add_constraint('PMSG.b_r<PMSG.b_all_r')								#17
-		self.driver.add_constraint('PMSG.b_st<PMSG.b_all_s')							#18
-		self.driver.add_constraint('PMSG.A_1<60000')											#19
-		self.driver.add_constraint('PMSG.J_s<=6') 												#20
-		self.driver.add_constraint('PMSG.A_Cuscalc>=5') 									#21
-		self.driver.add_constraint('PMSG.K_rad>0.2')											#22
-		self.driver.add_constraint('PMSG.K_rad<=0.27')										#23 
-		self.driver.add_constraint('PMSG.Slot_aspect_ratio>=4')						#24
-		self.driver.add_constraint('PMSG.Slot_aspect_ratio<=10')					#25	
-		self.driver.add_constraint('PMSG.gen_eff>=Eta_target')			#26
+		for constraint in PMSG_arms_core.CONSTRAINTS:
+			self.driver.add_constraint(expression('PMSG', constraint, PMSG_arms_core))
+
+	def execute(self):
+		# the Genetic option evaluates each generation in parallel on the core, see genetic.optimize_assembly
+		if self.Optimiser == 'Genetic':
+			genetic.optimize_assembly(self)
+		else:
+			super(PMSG_arms_Opt,self).execute()
+
 
-				
 def PMSG_arms_Opt_example():
 	
 	#Example optimization of a PMSG_arms generator for costs on a 5 MW reference turbine
@@ -0,0 +1,645 @@
+"""PMSG_arms_core.py
+Copyright (c) NREL. All rights reserved.
+Closed-form sizing equations of the PMSG-arms generator, free of OpenMDAO.
+Electromagnetic design based on conventional magnetic circuit laws
+Structural design based on McDonald's thesis """
+
+from math import pi
+import numpy as np
+from generatorse import operating, profiling
+from generatorse.ops import SCALAR, evaluate_batch as _evaluate_batch
+from generatorse.derivatives import jacobian as _jacobian
+
+INPUTS = ('r_s', 'l_s', 'h_s', 'tau_p', 'machine_rating', 'n_nom', 'Torque', 'h_m', 'h_ys', 'h_yr',
+	'n_s', 'b_st', 'd_s', 't_ws', 'n_r', 'b_r', 'd_r', 't_wr', 't', 'R_o',
+	'rho_Fes', 'rho_Fe', 'rho_Copper', 'rho_PM', 'main_shaft_cm', 'main_shaft_length')
+
+VECTOR_INPUTS = ('main_shaft_cm',)
+
+OUTPUTS = ('B_symax', 'B_tmax', 'B_rymax', 'B_smax', 'B_pm1', 'B_g', 'N_s', 'b_s', 'b_t', 'A_Cuscalc',
+	'b_m', 'p', 'E_p', 'f', 'I_s', 'R_s', 'L_s', 'A_1', 'J_s', 'Mass', 'K_rad', 'Losses', 'gen_eff',
+	'u_Ar', 'y_Ar', 'z_A_r', 'u_As', 'y_As', 'z_A_s', 'u_all_r', 'u_all_s', 'y_all', 'z_all_s', 'z_all_r',
+	'b_all_s', 'b_all_r', 'TC1', 'TC2', 'TC3', 'R_out', 'S', 'Slot_aspect_ratio',
+	'mass_PM', 'Copper', 'Iron', 'Structural_mass', 'cm', 'I', 't', 't_s')
+
+# The model is evaluated in stages so that a change of structural variables need not repeat the
+# electromagnetic design. Each stage reads the names in its *_INPUTS (design inputs or outputs of an
+# earlier stage) and produces its *_OUTPUTS; L_t, R, M_Fest and the stage masses are intermediates.
+EM_INPUTS = ('r_s', 'l_s', 'h_s', 'tau_p', 'h_m', 'h_ys', 'h_yr', 'machine_rating', 'n_nom', 'Torque',
+	'rho_Fe', 'rho_Copper')
+
+EM_OUTPUTS = ('B_symax', 'B_tmax', 'B_rymax', 'B_smax', 'B_pm1', 'B_g', 'N_s', 'b_s', 'b_t', 'A_Cuscalc',
+	'b_m', 'p', 'E_p', 'f', 'I_s', 'R_s', 'L_s', 'A_1', 'J_s', 'K_rad', 'Losses', 'gen_eff', 'TC1', 'R_out', 'S',
+	'Slot_aspect_ratio', 'Copper', 'Iron', 'L_t', 'R', 'M_Fest')
+
+ROTOR_INPUTS = ('R', 'L_t', 'B_g', 'h_m', 'h_yr', 'n_r', 'b_r', 'd_r', 't_wr', 'R_o', 'rho_Fes', 'rho_Fe',
+	'rho_PM', 't')
+
+ROTOR_OUTPUTS = ('u_Ar', 'y_Ar', 'z_A_r', 'u_all_r', 'z_all_r', 'y_all', 'b_all_r', 'TC2', 'mass_PM',
+	'Rotor_mass', 'Rotor_arm_mass', 't')
+
+STATOR_INPUTS = ('r_s', 'h_s', 'h_ys', 'L_t', 'B_g', 'M_Fest', 'Copper', 'n_s', 'b_st', 'd_s', 't_ws', 'R_o',
+	'rho_Fes', 'rho_Fe')
+
+STATOR_OUTPUTS = ('u_As', 'y_As', 'z_A_s', 'u_all_s', 'z_all_s', 'b_all_s', 'TC3', 'Stator_mass',
+	'Stator_arm_mass', 't_s')
+
+MASS_INPUTS = ('Rotor_mass', 'Stator_mass', 'Rotor_arm_mass', 'Stator_arm_mass', 'R_out', 'l_s',
+	'main_shaft_cm', 'main_shaft_length')
+
+MASS_OUTPUTS = ('Mass', 'Structural_mass', 'I', 'cm')
+
+# design variables of PMSG_arms_Opt with the bounds passed to driver.add_parameter
+DESIGN_VARIABLES = (('r_s', 0.5, 9), ('l_s', 0.5, 2.5), ('h_s', 0.04, 0.1), ('tau_p', 0.04, 0.1),
+	('h_m', 0.005, 0.1), ('n_r', 5., 15.), ('h_yr', 0.045, 0.25), ('h_ys', 0.045, 0.25), ('b_r', 0.1, 1.5),
+	('d_r', 0.1, 1.5), ('t_wr', 0.001, 0.2), ('n_s', 5., 15.), ('b_st', 0.1, 1.5), ('d_s', 0.1, 1.5),
+	('t_ws', 0.001, 0.2))
+
+# quantities the model rounds, with their integer bounds, for the mixed-integer search of mixed.py;
+# the pole pairs p take the place of tau_p = pi*r_s/p and are bounded by those of r_s and tau_p
+INTEGER_VARIABLES = (('n_r', 5, 15), ('n_s', 5, 15), ('p', 16, 706))
+
+# constraints of PMSG_arms_Opt as (variable, relation, limit); a limit is a number, another variable of
+# the model or Eta_target, the target efficiency set on the assembly
+CONSTRAINTS = (
+	('B_symax', '<', 2),
+	('B_rymax', '<', 2),
+	('B_tmax', '<', 2),
+	('B_smax', '<', 'B_g'),
+	('B_g', '>=', 0.7),
+	('B_g', '<=', 1.2),
+	('E_p', '>=', 500),
+	('E_p', '<=', 5000),
+	('u_As', '<', 'u_all_s'),
+	('z_A_s', '<', 'z_all_s'),
+	('y_As', '<', 'y_all'),
+	('u_Ar', '<', 'u_all_r'),
+	('z_A_r', '<', 'z_all_r'),
+	('y_Ar', '<', 'y_all'),
+	('TC1', '<', 'TC2'),
+	('TC1', '<', 'TC3'),
+	('b_r', '<', 'b_all_r'),
+	('b_st', '<', 'b_all_s'),
+	('A_1', '<', 60000),
+	('J_s', '<=', 6),
+	('A_Cuscalc', '>=', 5),
+	('K_rad', '>', 0.2),
+	('K_rad', '<=', 0.27),
+	('Slot_aspect_ratio', '>=', 4),
+	('Slot_aspect_ratio', '<=', 10),
+	('gen_eff', '>=', 'Eta_target'))
+
+# design variables of PMSG_arms_Opt and the outputs its constraints and objective depend on
+DERIV_INPUTS = ('r_s', 'l_s', 'h_s', 'tau_p', 'h_m', 'h_ys', 'h_yr', 'n_r', 'n_s', 'b_r', 'b_st', 'd_r', 'd_s',
+	't_wr', 't_ws')
+
+DERIV_OUTPUTS = ('B_symax', 'B_rymax', 'B_tmax', 'B_smax', 'B_g', 'E_p', 'u_As', 'u_all_s', 'z_A_s', 'z_all_s',
+	'y_As', 'y_all', 'u_Ar', 'u_all_r', 'z_A_r', 'z_all_r', 'y_Ar', 'TC1', 'TC2', 'TC3', 'b_all_r', 'b_all_s',
+	'A_1', 'J_s', 'A_Cuscalc', 'K_rad', 'Slot_aspect_ratio', 'gen_eff', 'Mass', 'mass_PM', 'Copper', 'Iron',
+	'Structural_mass')
+
+
+def electromagnetic(inputs, ops=SCALAR, components=False):
+
+	""" Electromagnetic stage: pole and slot layout, magnetic and electric loading,
+	active masses and losses. Depends only on the main dimensions, not on the arms.
+	With components=True, returns the rated current and loss components instead. """
+
+	clock = profiling.start()
+
+	r_s = inputs['r_s']
+	l_s = inputs['l_s']
+	h_s = inputs['h_s']
+	tau_p = inputs['tau_p']
+	h_m = inputs['h_m']
+	h_ys = inputs['h_ys']
+	h_yr = inputs['h_yr']
+	machine_rating = inputs['machine_rating']
+	n_nom = inputs['n_nom']
+	Torque = inputs['Torque']
+	rho_Fe = inputs['rho_Fe']
+	rho_Copper = inputs['rho_Copper']
+
+	#Assign values to universal constants
+
+	B_r    =1.2                 # Tesla remnant flux density
+	g1     =9.81                # m/s^2 acceleration due to gravity
+	E      =2e11                # N/m^2 young's modulus
+	sigma  =40e3                # shear stress assumed
+	ratio  =0.7                 # ratio of magnet width to pole pitch(bm/tau_p)
+	mu_0   =pi*4e-7              # permeability of free space
+	mu_r   =1.06								# relative permeability
+	phi    =90*2*pi/360         # tilt angle (rotor tilt -90 degrees during transportation)
+	cofi   =0.85                 # power factor
+
+	#Assign values to design constants
+	h_w    =0.005									# Slot wedge height
+	h_i    =0.001 								# coil insulation thickness
+	y_tau_p=1										 # Coil span to pole pitch
+	m      =3                    # no of phases
+	q1     =1                    # no of slots per pole per phase
+	b_s_tau_s=0.45 							 # slot width to slot pitch ratio
+	k_sfil =0.65								 # Slot fill factor
+	P_Fe0h =4			               #specific hysteresis losses W/kg @ 1.5 T
+	P_Fe0e =1			               #specific hysteresis losses W/kg @ 1.5 T
+	rho_Cu=1.8*10**(-8)*1.4			# Copper resisitivty
+	k_fes =0.9									# Stator iron fill factor per Grauers
+	b_so			=  0.004					# Slot opening
+	alpha_p		=  pi/2*0.7
+
+	# back iron thickness for rotor and stator
+	t =h_yr
+
+	###################################################### Electromagnetic design#############################################
+	K_rad=l_s/(2*r_s)							# Aspect ratio
+	T =   Torque															# rated torque
+	l_u       =k_fes * l_s                   #useful iron stack length
+	We				=tau_p
+	l_b       = 2*tau_p  										#end winding length
+	l_e       =l_s+2*0.001*r_s     # equivalent core length
+	b_m  =0.7*tau_p								 # magnet width
+
+	# Calculating air gap length
+	dia				=  2*r_s              # air gap diameter
+	g         =  0.001*dia               # air gap length
+	r_m     	=  r_s+h_ys+h_s #magnet radius
+	r_r				=  r_s-g             #rotor radius
+
+	p		=  ops.round_integer(pi*dia/(2*tau_p))	# pole pairs
+	f    =  n_nom*p/60					# outout frequency
+	S				= 2*p*q1*m 						# Stator slots
+	N_conductors=S*2
+	N_s=N_conductors/2/3									# Stator turns per phase
+	tau_s=pi*dia/S												# Stator slot pitch
+	b_s	=  b_s_tau_s*tau_s    					#slot width
+	b_t	=  tau_s-(b_s)          		#tooth width
+	Slot_aspect_ratio=h_s/b_s
+
+	# Calculating Carter factor for statorand effective air gap length
+	gamma			=  4/pi*(b_so/2/(g+h_m/mu_r)*ops.atan(b_so/2/(g+h_m/mu_r))-ops.log(ops.sqrt(1+(b_so/2/(g+h_m/mu_r))**2)))
+	k_C				=  tau_s/(tau_s-gamma*(g+h_m/mu_r))   # carter coefficient
+	g_eff			=  k_C*(g+h_m/mu_r)
+
+	# angular frequency in radians
+	om_m			=  2*pi*n_nom/60
+	om_e			=  p*om_m/2
+
+	# Calculating magnetic loading
+	B_pm1	 		=  B_r*h_m/mu_r/(g_eff)
+	B_g=  B_r*h_m/mu_r/(g_eff)*(4/pi)*ops.sin(alpha_p)
+	B_symax=B_g*b_m*l_e/(2*h_ys*l_u)
+	B_rymax=B_g*b_m*l_e/(2*h_yr*l_s)
+	B_tmax	=B_g*tau_s/b_t
+
+	clock = profiling.lap(clock, 'PMSG_arms', 'em')
+	#Calculating winding factor
+	k_wd			= ops.sin(pi/6)/q1/ops.sin(pi/6/q1)
+
+	L_t=l_s+2*tau_p
+	l					= L_t                          #length
+
+	# Calculating no-load voltage induced in the stator
+	E_p	= 2*(N_s)*L_t*r_s*k_wd*om_m*B_g/ops.sqrt(2)
+
+	# Stator winding length ,cross-section and resistance
+	l_Cus			= 2*(N_s)*(2*tau_p+L_t)
+	A_s				= b_s*(h_s-h_w)*q1*p
+	A_scalc   = b_s*1000*(h_s*1000-h_w*1000)*q1*p
+	A_Cus			= A_s*k_sfil/(N_s)
+	A_Cuscalc = A_scalc *k_sfil/(N_s)
+	R_s	= l_Cus*rho_Cu/A_Cus
+
+	# Calculating leakage inductance in  stator
+	L_m				= 2*m*k_wd**2*(N_s)**2*mu_0*tau_p*L_t/pi**2/g_eff/p
+	L_ssigmas=2*mu_0*l_s*N_s**2/p/q1*((h_s-h_w)/(3*b_s)+h_w/b_so)  #slot leakage inductance
+	L_ssigmaew=(2*mu_0*l_s*N_s**2/p/q1)*0.34*g*(l_e-0.64*tau_p*y_tau_p)/l_s                                #end winding leakage inductance
+	L_ssigmag=2*mu_0*l_s*N_s**2/p/q1*(5*(g*k_C/b_so)/(5+4*(g*k_C/b_so))) # tooth tip leakage inductance#tooth tip leakage inductance
+	L_ssigma	= (L_ssigmas+L_ssigmaew+L_ssigmag)
+
+	L_s  = L_m+L_ssigma
+	Z=(machine_rating/(m*E_p))
+
+	G=(E_p**2-(om_e*L_s*Z)**2)
+
+	# Calculating stator current and electrical loading
+	I_s= ops.sqrt(Z**2+(((E_p-G**0.5)/(om_e*L_s)**2)**2))
+	J_s	= I_s/A_Cuscalc
+	A_1 = 6*N_s*I_s/(pi*dia)
+	I_snom		=(machine_rating/m/E_p/cofi) #rated current
+	I_qnom		=machine_rating/(m*E_p)
+	X_snom		=om_e*(L_m+L_ssigma)
+
+	B_smax=ops.sqrt(2)*I_s*mu_0/g_eff
+
+	clock = profiling.lap(clock, 'PMSG_arms', 'winding')
+	# Calculating Electromagnetically active mass
+
+	V_Cus 	=m*l_Cus*A_Cus     # copper volume
+	V_Fest	=L_t*2*p*q1*m*b_t*h_s   # volume of iron in stator tooth
+	V_Fesy	=L_t*pi*((r_s+h_s+h_ys)**2-(r_s+h_s)**2) # volume of iron in stator yoke
+	V_Fery	=L_t*pi*((r_r-h_m)**2-(r_r-h_m-h_yr)**2)
+	Copper		=V_Cus*rho_Copper
+	M_Fest	=V_Fest*rho_Fe    # Mass of stator tooth
+	M_Fesy	=V_Fesy*rho_Fe    # Mass of stator yoke
+	M_Fery	=V_Fery*rho_Fe    # Mass of rotor yoke
+	Iron		=M_Fest+M_Fesy+M_Fery
+
+	clock = profiling.lap(clock, 'PMSG_arms', 'mass')
+	# Calculating Losses
+	##1. Copper Losses
+
+	K_R=1.2   # Skin effect correction co-efficient
+	P_Cu		=m*I_snom**2*R_s*K_R
+
+	# Iron Losses ( from Hysteresis and eddy currents)
+	P_Hyys	=M_Fesy*(B_symax/1.5)**2*(P_Fe0h*om_e/(2*pi*60)) # Hysteresis losses in stator yoke
+	P_Ftys	=M_Fesy*((B_symax/1.5)**2)*(P_Fe0e*(om_e/(2*pi*60))**2) # Eddy losses in stator yoke
+	P_Fesynom=P_Hyys+P_Ftys
+	P_Hyd=M_Fest*(B_tmax/1.5)**2*(P_Fe0h*om_e/(2*pi*60))  # Hysteresis losses in stator teeth
+	P_Ftd=M_Fest*(B_tmax/1.5)**2*(P_Fe0e*(om_e/(2*pi*60))**2) # Eddy losses in stator teeth
+	P_Festnom=P_Hyd+P_Ftd
+
+	# additional stray losses due to leakage flux
+	P_ad=0.2*(P_Hyys + P_Ftys + P_Hyd + P_Ftd )
+	pFtm =300 # specific magnet loss
+	P_Ftm=pFtm*2*p*b_m*l_s
+
+	Losses=P_Cu+P_Festnom+P_Fesynom+P_ad+P_Ftm
+	gen_eff=machine_rating*100/(machine_rating+Losses)
+
+	# main dimensions shared with the structural stages
+	R					= r_s-g-h_m-0.5*t                                       # Rotor mean radius
+	R_out=(R/0.995+h_s+h_ys)
+	TC1=T/(2*pi*sigma)     # Desired shear stress
+
+	clock = profiling.lap(clock, 'PMSG_arms', 'losses')
+	if components:
+		return {'I_snom': I_snom, 'P_Cu': P_Cu, 'P_Hyys': P_Hyys, 'P_Ftys': P_Ftys, 'P_Hyd': P_Hyd, 'P_Ftd': P_Ftd,
+			'P_ad': P_ad, 'P_Ftm': P_Ftm}
+	return {'B_symax': B_symax, 'B_tmax': B_tmax, 'B_rymax': B_rymax, 'B_smax': B_smax, 'B_pm1': B_pm1,
+		'B_g': B_g, 'N_s': N_s, 'b_s': b_s, 'b_t': b_t, 'A_Cuscalc': A_Cuscalc, 'b_m': b_m, 'p': p,
+		'E_p': E_p, 'f': f, 'I_s': I_s, 'R_s': R_s, 'L_s': L_s, 'A_1': A_1, 'J_s': J_s, 'K_rad': K_rad,
+		'Losses': Losses, 'gen_eff': gen_eff, 'TC1': TC1, 'R_out': R_out, 'S': S,
+		'Slot_aspect_ratio': Slot_aspect_ratio, 'Copper': Copper, 'Iron': Iron, 'L_t': L_t, 'R': R,
+		'M_Fest': M_Fest}
+
+
+def rotor_structure(inputs, ops=SCALAR):
+
+	""" Rotor structure stage: arm and cylinder deflections, magnet and rotor masses.
+	Depends on the electromagnetic stage through R, L_t and B_g. """
+
+	clock = profiling.start()
+
+	R = inputs['R']
+	L_t = inputs['L_t']
+	B_g = inputs['B_g']
+	h_m = inputs['h_m']
+	h_yr = inputs['h_yr']
+	n_r = inputs['n_r']
+	b_r = inputs['b_r']
+	d_r = inputs['d_r']
+	t_wr = inputs['t_wr']
+	R_o = inputs['R_o']
+	rho_Fes = inputs['rho_Fes']
+	rho_Fe = inputs['rho_Fe']
+	rho_PM = inputs['rho_PM']
+	t_prev = inputs['t']    # rotor back iron from the previous execution, used by the rotor mass below
+
+	#Assign values to universal constants
+
+	g1     =9.81                # m/s^2 acceleration due to gravity
+	E      =2e11                # N/m^2 young's modulus
+	sigma  =40e3                # shear stress assumed
+	ratio  =0.7                 # ratio of magnet width to pole pitch(bm/tau_p)
+	mu_0   =pi*4e-7              # permeability of free space
+	phi    =90*2*pi/360         # tilt angle (rotor tilt -90 degrees during transportation)
+
+	t =h_yr
+	l =L_t
+
+	a_r				= (b_r*d_r)-((b_r-2*t_wr)*(d_r-2*t_wr))  # cross-sectional area of rotor arms
+	A_r				= l*t																														 # cross-sectional area of rotor cylinder
+	N_r				= ops.round_integer(n_r)																											 # rotor arms
+	theta_r		=pi*1/N_r                             																 # half angle between spokes
+	I_r				=l*t**3/12                         															# second moment of area of rotor cylinder
+	I_arm_axi_r	=((b_r*d_r**3)-((b_r-2*t_wr)*(d_r-2*t_wr)**3))/12  # second moment of area of rotor arm
+	I_arm_tor_r	= ((d_r*b_r**3)-((d_r-2*t_wr)*(b_r-2*t_wr)**3))/12  # second moment of area of rotot arm w.r.t torsion
+	c					=R/500
+	u_all_r    =c/20 																	# allowable radial deflection
+	R_1				= R-t*0.5																#inner radius of rotor cylinder
+	k_1				= ops.sqrt(I_r/A_r)                               # radius of gyration
+	m1				=(k_1/R)**2
+	l_ir			=R                                      			# length of rotor arm beam at which rotor cylinder acts
+	l_iir			=R_1
+	b_all_r		=2*pi*R_o/N_r											#allowable circumferential arm dimension for rotor
+
+	q3					= B_g**2/2/mu_0   											# normal component of Maxwell stress
+
+	mass_PM   =(2*pi*(R+0.5*t)*l*h_m*ratio*rho_PM)           # magnet mass
+
+	# Calculating radial deflection of the rotor
+
+	Numer=R**3*((0.25*(ops.sin(theta_r)-(theta_r*ops.cos(theta_r)))/(ops.sin(theta_r))**2)-(0.5/ops.sin(theta_r))+(0.5/theta_r))
+	Pov=((theta_r/(ops.sin(theta_r))**2)+1/ops.tan(theta_r))*((0.25*R/A_r)+(0.25*R**3/I_r))
+	Qov=R**3/(2*I_r*theta_r*(m1+1))
+	Lov=(R_1-R_o)/a_r
+	Denom=I_r*(Pov-Qov+Lov) # radial deflection % rotor
+
+	u_Ar				=(q3*R**2/E/t)*(1+Numer/Denom)
+
+	# Calculating axial deflection of the rotor under its own weight
+	w_r					=rho_Fes*g1*ops.sin(phi)*a_r*N_r																		 # uniformly distributed load of the weight of the rotor arm
+	mass_st_lam=rho_Fe*2*pi*(R)*l*h_yr                                     # mass of rotor yoke steel
+	W				=g1*ops.sin(phi)*(mass_st_lam/N_r+(mass_PM)/N_r)  											 # weight of 1/nth of rotor cylinder
+
+	y_a1=(W*l_ir**3/12/E/I_arm_axi_r)                                                # deflection from weight component of back iron
+	y_a2=(w_r*l_iir**4/24/E/I_arm_axi_r)																						 # deflection from weight component of yhe arms
+	y_Ar       =y_a1+y_a2 # axial deflection
+	y_all     =2*l/100    # allowable axial deflection
+
+	# Calculating # circumferential deflection of the rotor
+	z_all_r     =0.05*2*pi*R/360  																														 # allowable torsional deflection
+	z_A_r       =(2*pi*(R-0.5*t)*l/N_r)*sigma*(l_ir-0.5*t)**3/3/E/I_arm_tor_r       # circumferential deflection
+
+	TC2=R**2*l              # Evaluating Torque constraint for rotor
+
+	Rotor_arm_mass=N_r*(R_1-R_o)*a_r*rho_Fes
+	Rotor_mass=((2*pi*t_prev*L_t*(R)*rho_Fe)+Rotor_arm_mass)+mass_PM
+
+	clock = profiling.lap(clock, 'PMSG_arms', 'structure')
+	return {'u_Ar': u_Ar, 'y_Ar': y_Ar, 'z_A_r': z_A_r, 'u_all_r': u_all_r, 'z_all_r': z_all_r, 'y_all': y_all,
+		'b_all_r': b_all_r, 'TC2': TC2, 'mass_PM': mass_PM, 'Rotor_mass': Rotor_mass,
+		'Rotor_arm_mass': Rotor_arm_mass, 't': t}
+
+
+def stator_structure(inputs, ops=SCALAR):
+
+	""" Stator structure stage: arm and cylinder deflections and stator masses.
+	Depends on the electromagnetic stage through L_t, B_g, M_Fest and Copper. """
+
+	clock = profiling.start()
+
+	r_s = inputs['r_s']
+	h_s = inputs['h_s']
+	h_ys = inputs['h_ys']
+	L_t = inputs['L_t']
+	B_g = inputs['B_g']
+	M_Fest = inputs['M_Fest']
+	Copper = inputs['Copper']
+	n_s = inputs['n_s']
+	b_st = inputs['b_st']
+	d_s = inputs['d_s']
+	t_ws = inputs['t_ws']
+	R_o = inputs['R_o']
+	rho_Fes = inputs['rho_Fes']
+	rho_Fe = inputs['rho_Fe']
+
+	#Assign values to universal constants
+
+	g1     =9.81                # m/s^2 acceleration due to gravity
+	E      =2e11                # N/m^2 young's modulus
+	sigma  =40e3                # shear stress assumed
+	mu_0   =pi*4e-7              # permeability of free space
+	phi    =90*2*pi/360         # tilt angle (rotor tilt -90 degrees during transportation)
+
+	t_s =h_ys
+	l =L_t
+
+	q3					= B_g**2/2/mu_0   											# normal component of Maxwell stress
+
+	a_s       = (b_st*d_s)-((b_st-2*t_ws)*(d_s-2*t_ws)) # cross-sectional area of stator armms
+	A_st      =l*t_s																															# cross-sectional area of stator cylinder
+	N_st			= ops.round_integer(n_s)																												# stator arms
+	theta_s		=pi*1/N_st 																															# half angle between spokes
+	I_st       =l*t_s**3/12          																						# second moment of area of stator cylinder
+	k_2       = ops.sqrt(I_st/A_st) 																											# radius of gyration
+
+	I_arm_axi_s	=((b_st*d_s**3)-((b_st-2*t_ws)*(d_s-2*t_ws)**3))/12  # second moment of area of stator arm
+	I_arm_tor_s	= ((d_s*b_st**3)-((d_s-2*t_ws)*(b_st-2*t_ws)**3))/12  # second moment of area of rotot arm w.r.t torsion
+	R_st 			=r_s+h_s+h_ys*0.5                                        # stator cylinder mean radius
+	R_1s      = R_st-t_s*0.5																											#inner radius of stator cylinder, m
+	m2        =(k_2/R_st)**2
+
+	# allowable radial deflection of stator
+	c1        =R_st/500
+	u_all_s    = c1/20
+
+	l_is      =R_st-R_o																													# distance at which the weight of the stator cylinder acts
+	l_iis     =l_is																																		# distance at which the weight of the stator cylinder acts
+	l_iiis    =l_is																																		# distance at which the weight of the stator cylinder acts
+
+	mass_st_lam_s= M_Fest+pi*L_t*rho_Fe*((R_st+0.5*h_ys)**2-(R_st-0.5*h_ys)**2)
+	W_is			=0.5*g1*ops.sin(phi)*(rho_Fes*l*d_s**2)                          # length of stator arm beam at which self-weight acts
+	W_iis     =g1*ops.sin(phi)*(mass_st_lam_s+Copper)/2/N_st							 # weight of stator cylinder and teeth
+	w_s         =rho_Fes*g1*ops.sin(phi)*a_s*N_st																	 # uniformly distributed load of the arms
+
+	mass_stru_steel  =2*(N_st*(R_1s-R_o)*a_s*rho_Fes)											# Structural mass of stator arms
+
+	# Calculating radial deflection of the stator
+
+	Numers=R_st**3*((0.25*(ops.sin(theta_s)-(theta_s*ops.cos(theta_s)))/(ops.sin(theta_s))**2)-(0.5/ops.sin(theta_s))+(0.5/theta_s))
+	Povs=((theta_s/(ops.sin(theta_s))**2)+1/ops.tan(theta_s))*((0.25*R_st/A_st)+(0.25*R_st**3/I_st))
+	Qovs=R_st**3/(2*I_st*theta_s*(m2+1))
+	Lovs=(R_1s-R_o)*0.5/a_s
+	Denoms=I_st*(Povs-Qovs+Lovs)
+
+	u_As				=(q3*R_st**2/E/t_s)*(1+Numers/Denoms)
+
+	# Calculating axial deflection of the stator
+
+	X_comp1 = (W_is*l_is**3/12/E/I_arm_axi_s)																				# deflection component due to stator arm beam at which self-weight acts
+	X_comp2 =(W_iis*l_iis**4/24/E/I_arm_axi_s)																			# deflection component due to 1/nth of stator cylinder
+	X_comp3 =w_s*l_iiis**4/24/E/I_arm_axi_s																					# deflection component due to weight of arms
+
+	y_As       =X_comp1+X_comp2+X_comp3  																			# axial deflection
+
+	# Calculating circumferential deflection of the stator
+	z_A_s  =2*pi*(R_st+0.5*t_s)*l/(2*N_st)*sigma*(l_is+0.5*t_s)**3/3/E/I_arm_tor_s
+	z_all_s     =0.05*2*pi*R_st/360  																					# allowable torsional deflection
+	b_all_s		=2*pi*R_o/N_st    																					# allowable circumferential arm dimension
+
+	TC3=R_st**2*l           # Evaluating Torque constraint for stator
+
+	Stator_arm_mass=mass_stru_steel
+	Stator_mass=mass_st_lam_s+mass_stru_steel+Copper
+
+	clock = profiling.lap(clock, 'PMSG_arms', 'structure')
+	return {'u_As': u_As, 'y_As': y_As, 'z_A_s': z_A_s, 'u_all_s': u_all_s, 'z_all_s': z_all_s,
+		'b_all_s': b_all_s, 'TC3': TC3, 'Stator_mass': Stator_mass, 'Stator_arm_mass': Stator_arm_mass,
+		't_s': t_s}
+
+
+def mass_properties(inputs, ops=SCALAR):
+
+	""" Totals the stage masses and estimates the moments of inertia and centre of mass. """
+
+	clock = profiling.start()
+
+	Rotor_mass = inputs['Rotor_mass']
+	Stator_mass = inputs['Stator_mass']
+	Rotor_arm_mass = inputs['Rotor_arm_mass']
+	Stator_arm_mass = inputs['Stator_arm_mass']
+	R_out = inputs['R_out']
+	l_s = inputs['l_s']
+	main_shaft_cm = inputs['main_shaft_cm']
+	main_shaft_length = inputs['main_shaft_length']
+
+	Structural_mass=Stator_arm_mass+Rotor_arm_mass
+	Mass=Stator_mass+Rotor_mass
+
+	# Calculating mass moments of inertia and center of mass
+	I_x   = (0.5*Mass*R_out**2)
+	I_y   = (0.25*Mass*R_out**2+(1/12)*Mass*l_s**2)
+	I = ops.vector(I_x, I_y, I_y)
+	cm = ops.vector(main_shaft_cm[0] + main_shaft_length/2. + l_s/2, main_shaft_cm[1], main_shaft_cm[2])
+
+	clock = profiling.lap(clock, 'PMSG_arms', 'mass')
+	return {'Mass': Mass, 'Structural_mass': Structural_mass, 'I': I, 'cm': cm}
+
+
+def operating_losses(inputs, n, P):
+
+	""" Losses and efficiency of a PMSG-arms design away from its rated point, at rotor
+	speeds n (rpm) and output powers P (W), which may be NumPy arrays broadcast against
+	each other. The rated losses of the electromagnetic stage are scaled: the EMF and
+	frequency with speed, copper losses with the square of the current drawn at the
+	power factor of the rated point, hysteresis with frequency, eddy-current and
+	magnet losses with its square, and stray losses with the iron losses. """
+
+	em = electromagnetic(dict((name, inputs[name]) for name in EM_INPUTS), components=True)
+	n = np.asarray(n, dtype=float)
+	P = np.asarray(P, dtype=float)
+	speed = n/inputs['n_nom']
+	with np.errstate(divide='ignore', invalid='ignore'):
+		I_s = np.where(speed > 0, P/(speed*inputs['machine_rating'])*em['I_snom'], 0.0)
+	P_Cu = em['P_Cu']*(I_s/em['I_snom'])**2
+	P_Fe = (em['P_Hyys'] + em['P_Hyd'])*speed + (em['P_Ftys'] + em['P_Ftd'])*speed**2
+	P_ad = em['P_ad']*P_Fe/(em['P_Hyys'] + em['P_Ftys'] + em['P_Hyd'] + em['P_Ftd'])
+	P_Ftm = em['P_Ftm']*speed**2
+	Losses = P_Cu + P_Fe + P_ad + P_Ftm
+	with np.errstate(divide='ignore', invalid='ignore'):
+		gen_eff = np.where(P > 0, P*100/(P + Losses), 0.0)
+	return {'I_s': I_s, 'P_Cu': P_Cu, 'P_Fe': P_Fe, 'P_ad': P_ad, 'P_Ftm': P_Ftm, 'Losses': Losses,
+		'gen_eff': gen_eff}
+
+
+def operating_map(inputs, speeds, loads):
+
+	""" Losses and efficiency over a grid of rotor speeds (rpm) by loads (fractions of
+	machine_rating), one row per speed; also returns the grid as speed and power. """
+
+	speed = np.asarray(speeds, dtype=float)[:, None]
+	power = np.asarray(loads, dtype=float)[None, :]*inputs['machine_rating']
+	result = operating_losses(inputs, speed, power)
+	result['speed'], result['power'] = np.broadcast_arrays(speed, power)
+	return result
+
+
+def energy_loss(inputs, ops=SCALAR, **wind):
+
+	""" Annual energy loss AEL (kWh) of operating.annual_energy for the losses of
+	operating_losses, with wind the annual_energy distribution and curve parameters.
+	The operating points enter only through hour-weighted sums of speed and load, so
+	the loss components of the rated point may be dual numbers. """
+
+	em = electromagnetic(dict((name, inputs[name]) for name in EM_INPUTS), ops, components=True)
+	n_nom = float(inputs['n_nom'])
+	machine_rating = float(inputs['machine_rating'])
+	hours, n, P = operating.annual_hours(machine_rating, n_nom, **wind)
+	running = P > 0
+	hours, speed, P = hours[running], n[running]/n_nom, P[running]
+	S_1 = float(np.dot(hours, speed))
+	S_2 = float(np.dot(hours, speed**2))
+	S_Cu = float(np.dot(hours, (P/(speed*machine_rating))**2))
+	E_Fe = (em['P_Hyys'] + em['P_Hyd'])*S_1 + (em['P_Ftys'] + em['P_Ftd'])*S_2
+	E_ad = em['P_ad']*E_Fe/(em['P_Hyys'] + em['P_Ftys'] + em['P_Hyd'] + em['P_Ftd'])
+	return {'AEL': (em['P_Cu']*S_Cu + E_Fe + E_ad + em['P_Ftm']*S_2)/1e3}
+
+
+ENERGY_DERIV_INPUTS = tuple(name for name in DERIV_INPUTS if name in EM_INPUTS)
+
+
+def energy_jacobian(inputs, wrt=ENERGY_DERIV_INPUTS, **wind):
+
+	""" Partial derivatives of AEL with respect to the main dimensions; the weights of
+	the operating points depend on the rating only. """
+
+	return _jacobian(lambda values, ops: energy_loss(values, ops, **wind), inputs, wrt, ('AEL',))
+
+
+STAGES = ((electromagnetic, EM_INPUTS, EM_OUTPUTS), (rotor_structure, ROTOR_INPUTS, ROTOR_OUTPUTS),
+	(stator_structure, STATOR_INPUTS, STATOR_OUTPUTS), (mass_properties, MASS_INPUTS, MASS_OUTPUTS))
+
+
+def evaluate(inputs, ops=SCALAR):
+
+	""" Estimates overall mass, dimensions and efficiency of a PMSG-arms generator.
+	``inputs`` maps the names in INPUTS to values; returns a dict keyed by OUTPUTS. """
+
+	values = dict(inputs)
+	for stage, stage_inputs, stage_outputs in STAGES:
+		outputs = stage(dict((name, values[name]) for name in stage_inputs), ops)
+		for name in stage_outputs:
+			values[name] = outputs[name]
+	return dict((name, values[name]) for name in OUTPUTS)
+
+
+def stage_deriv_vars(stage_inputs, stage_outputs):
+
+	""" Names of the scalar inputs and outputs of a stage that have partial
+	derivatives; the rotor back iron t of the previous execution is excluded. """
+
+	return (tuple(name for name in stage_inputs if name not in VECTOR_INPUTS + ('t',)),
+		tuple(name for name in stage_outputs if name not in ('I', 'cm', 't', 't_s')))
+
+
+def evaluate_batch(inputs, exact=True):
+
+	""" Evaluates many PMSG-arms designs at once. Every input may be a scalar or
+	a NumPy array (main_shaft_cm is shared); returns a dict of output arrays
+	matching ``evaluate`` design by design, bit for bit when exact=True. """
+
+	return _evaluate_batch(evaluate, inputs, VECTOR_INPUTS, exact)
+
+
+def jacobian(inputs, wrt=DERIV_INPUTS, of=DERIV_OUTPUTS):
+
+	""" Exact partial derivatives of the outputs ``of`` with respect to the
+	inputs ``wrt``, one row per output. The arm counts n_r and n_s are rounded
+	in the model and have zero partials. """
+
+	return _jacobian(evaluate, inputs, wrt, of)
+
+
+COST_INPUTS = ('Copper', 'Iron', 'mass_PM', 'Structural_mass', 'C_Cu', 'C_Fe', 'C_Fes', 'C_PM')
+
+
+def costs(inputs):
+
+	""" Material cost estimate for a PMSG_arms generator. Manufacturing costs are excluded. """
+
+	Copper = inputs['Copper']
+	Iron = inputs['Iron']
+	mass_PM = inputs['mass_PM']
+	Structural_mass = inputs['Structural_mass']
+	C_Cu = inputs['C_Cu']
+	C_Fe = inputs['C_Fe']
+	C_Fes = inputs['C_Fes']
+	C_PM = inputs['C_PM']
+	
+	# Material cost as a function of material mass and specific cost of material
+	K_gen=Copper*C_Cu+Iron*C_Fe+C_PM*mass_PM
+	Cost_str=C_Fes*Structural_mass
+
+	return {'Costs': K_gen+Cost_str}
+
+
+COST_DERIV_INPUTS = ('Copper', 'Iron', 'mass_PM', 'Structural_mass')
+
+
+def costs_jacobian(inputs):
+
+	""" Partial derivatives of Costs with respect to the material masses. """
+
+	return _jacobian(lambda values, ops: costs(values), inputs, COST_DERIV_INPUTS, ('Costs',))
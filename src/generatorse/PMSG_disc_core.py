@@ -0,0 +1,453 @@
+"""PMSG_disc_core.py
+Copyright (c) NREL. All rights reserved.
+Closed-form sizing equations of the PMSG-disc generator, free of OpenMDAO.
+Electromagnetic design based on conventional magnetic circuit laws
+Structural design based on McDonald's thesis """
+
+from math import pi
+from generatorse import profiling
+from generatorse.ops import SCALAR, evaluate_batch as _evaluate_batch
+from generatorse.derivatives import jacobian as _jacobian
+
+INPUTS = ('r_s', 'l_s', 'h_s', 'tau_p', 'machine_rating', 'n_nom', 'Torque', 'h_m', 'h_ys', 'h_yr',
+	'n_s', 'b_st', 'd_s', 't_ws', 't_d', 'R_o', 'rho_Fes', 'rho_Fe', 'rho_Copper', 'rho_PM',
+	'main_shaft_cm', 'main_shaft_length')
+
+VECTOR_INPUTS = ('main_shaft_cm',)
+
+OUTPUTS = ('B_symax', 'B_tmax', 'B_rymax', 'B_smax', 'B_pm1', 'B_g', 'N_s', 'b_s', 'b_t', 'A_Cuscalc',
+	'b_m', 'p', 'E_p', 'f', 'I_s', 'R_s', 'L_s', 'A_1', 'J_s', 'Mass', 'K_rad', 'Losses',
+	'gen_eff', 'u_Ar', 'y_Ar', 'u_As', 'y_As', 'z_A_s', 'u_all_r', 'u_all_s', 'y_all', 'z_all_s',
+	'z_all_r', 'b_all_s', 'TC1', 'TC2', 'TC3', 'R_out', 'S', 'Slot_aspect_ratio', 'mass_PM',
+	'Copper', 'Iron', 'Structural_mass', 'cm', 'I', 't', 't_s')
+
+# design variables of PMSG_disc_Opt with the bounds passed to driver.add_parameter
+DESIGN_VARIABLES = (('r_s', 0.5, 9), ('l_s', 0.5, 2.5), ('h_s', 0.04, 0.1), ('tau_p', 0.04, 0.1),
+	('h_m', 0.005, 0.1), ('h_yr', 0.045, 0.25), ('h_ys', 0.045, 0.25), ('t_d', 0.1, 0.25), ('n_s', 5., 15.),
+	('b_st', 0.1, 1.5), ('d_s', 0.1, 1.5), ('t_ws', 0.001, 0.2))
+
+# quantities the model rounds, with their integer bounds, for the mixed-integer search of mixed.py;
+# the pole pairs p take the place of tau_p = pi*r_s/p and are bounded by those of r_s and tau_p
+INTEGER_VARIABLES = (('n_s', 5, 15), ('p', 16, 706))
+
+# constraints of PMSG_disc_Opt as (variable, relation, limit); a limit is a number, another variable of
+# the model or Eta_target, the target efficiency set on the assembly
+CONSTRAINTS = (
+	('B_symax', '<', 2),
+	('B_rymax', '<', 2),
+	('B_tmax', '<', 2),
+	('B_smax', '<', 'B_g'),
+	('B_g', '>=', 0.7),
+	('B_g', '<=', 1.2),
+	('E_p', '>=', 500),
+	('E_p', '<=', 5000),
+	('u_As', '<', 'u_all_s'),
+	('z_A_s', '<', 'z_all_s'),
+	('y_As', '<', 'y_all'),
+	('u_Ar', '<', 'u_all_r'),
+	('y_Ar', '<', 'y_all'),
+	('TC1', '<', 'TC2'),
+	('TC1', '<', 'TC3'),
+	('b_st', '<', 'b_all_s'),
+	('A_1', '<', 60000),
+	('J_s', '<=', 6),
+	('A_Cuscalc', '>=', 5),
+	('K_rad', '>', 0.2),
+	('K_rad', '<=', 0.27),
+	('Slot_aspect_ratio', '>=', 4),
+	('Slot_aspect_ratio', '<=', 10),
+	('gen_eff', '>=', 'Eta_target'))
+
+# design variables of PMSG_disc_Opt, plus the shaft radius R_o that sizes the disc, and the outputs the
+# constraints and objective depend on
+DERIV_INPUTS = ('r_s', 'l_s', 'h_s', 'tau_p', 'h_m', 'h_yr', 'h_ys', 't_d', 'n_s', 'b_st', 'd_s', 't_ws', 'R_o')
+
+DERIV_OUTPUTS = ('B_symax', 'B_rymax', 'B_tmax', 'B_smax', 'B_g', 'E_p', 'u_As', 'u_all_s', 'z_A_s', 'z_all_s',
+	'y_As', 'y_all', 'u_Ar', 'u_all_r', 'y_Ar', 'TC1', 'TC2', 'TC3', 'b_all_s', 'A_1', 'J_s', 'A_Cuscalc', 'K_rad',
+	'Slot_aspect_ratio', 'gen_eff', 'Mass', 'mass_PM', 'Copper', 'Iron', 'Structural_mass')
+
+# width [m] over which the slope of the rotor deflection magnitudes u_Ar and y_Ar is smoothed about zero
+DEFLECTION_SMOOTHING = 1e-7
+
+
+
+def evaluate(inputs, ops=SCALAR):
+
+	""" Estimates overall mass, dimensions and efficiency of a PMSG-disc generator.
+	``inputs`` maps the names in INPUTS to values; returns a dict keyed by OUTPUTS. """
+
+	clock = profiling.start()
+
+	r_s = inputs['r_s']
+	l_s = inputs['l_s']
+	h_s = inputs['h_s']
+	tau_p = inputs['tau_p']
+	machine_rating = inputs['machine_rating']
+	n_nom = inputs['n_nom']
+	Torque = inputs['Torque']
+	h_m = inputs['h_m']
+	h_ys = inputs['h_ys']
+	h_yr = inputs['h_yr']
+	n_s = inputs['n_s']
+	b_st = inputs['b_st']
+	d_s = inputs['d_s']
+	t_ws = inputs['t_ws']
+	t_d = inputs['t_d']
+	R_o = inputs['R_o']
+	rho_Fes = inputs['rho_Fes']
+	rho_Fe = inputs['rho_Fe']
+	rho_Copper = inputs['rho_Copper']
+	rho_PM = inputs['rho_PM']
+	main_shaft_cm = inputs['main_shaft_cm']
+	main_shaft_length = inputs['main_shaft_length']
+	
+	#Assign values to universal constants
+	
+	B_r    =1.2		# Tesla remnant flux density
+	g1      =9.81		# m/s^2 acceleration due to gravity
+	E      =2e11		# N/m^2 young's modulus
+	sigma  =40e3		# shear stress assumed
+	ratio  =0.7		# ratio of magnet width to pole pitch(bm/tau_p)
+	mu_0   =pi*4e-7		# permeability of free space
+	mu_r   =1.06		# relative permeability
+	phi    =90*2*pi/360		# tilt angle (rotor tilt -90 degrees during transportation)
+	cofi   =0.85		# power factor
+	
+	#Assign values to design constants
+	h_w    =0.005		# wedge height
+	y_tau_p=1		# coiil span to pole pitch
+	m      =3		# no of phases
+	q1     =1		# no of slots per pole per phase
+	b_s_tau_s=0.45		# slot width/slot pitch ratio
+	k_sfil =0.65		# Slot fill factor
+	P_Fe0h =4		#specific hysteresis losses W/kg @ 1.5 T
+	P_Fe0e =1		#specific hysteresis losses W/kg @ 1.5 T
+	rho_Cu=1.8*10**(-8)*1.4		# resistivity of copper
+	b_so			=  0.004		#stator slot opening
+	k_fes =0.9		#useful iron stack length
+	T =   Torque
+	v=0.3		# poisson's ratio
+	
+	# back iron thickness for rotor and stator
+	t_s =h_ys
+	t =h_yr
+	
+	# Aspect ratio
+	K_rad=l_s/(2*r_s) # aspect ratio
+	
+	###################################################### Electromagnetic design#############################################
+	
+	dia				=  2*r_s		# air gap diameter
+	g         =  0.001*dia		# air gap length
+	b_m  =0.7*tau_p		# magnet width
+	l_u       =k_fes * l_s		#useful iron stack length
+	We				=tau_p
+	l_b       = 2*tau_p		#end winding length
+	l_e       =l_s+2*0.001*r_s		# equivalent core length
+	r_r				=  r_s-g		#rotor radius
+	p		=  ops.round_integer(pi*dia/(2*tau_p))		# pole pairs
+	f    =  n_nom*p/60		# frequency
+	S				= 2*p*q1*m		# Stator slots
+	N_conductors=S*2
+	N_s=N_conductors/2/3		# Stator turns per phase
+	tau_s=pi*dia/S		# slot pitch
+	b_s	=  b_s_tau_s*tau_s		#slot width
+	b_t	=  tau_s-(b_s)		#tooth width
+	Slot_aspect_ratio=h_s/b_s
+	alpha_p		=  pi/2*0.7
+	
+	# Calculating Carter factor for statorand effective air gap length
+	gamma			=  4/pi*(b_so/2/(g+h_m/mu_r)*ops.atan(b_so/2/(g+h_m/mu_r))-ops.log(ops.sqrt(1+(b_so/2/(g+h_m/mu_r))**2)))
+	k_C				=  tau_s/(tau_s-gamma*(g+h_m/mu_r))		# carter coefficient
+	g_eff			=  k_C*(g+h_m/mu_r)
+	
+	# angular frequency in radians
+	om_m			=  2*pi*n_nom/60
+	om_e			=  p*om_m/2
+	
+	# Calculating magnetic loading
+	B_pm1	 		=  B_r*h_m/mu_r/(g_eff)
+	B_g=  B_r*h_m/mu_r/(g_eff)*(4/pi)*ops.sin(alpha_p)
+	B_symax=B_g*b_m*l_e/(2*h_ys*l_u)
+	B_rymax=B_g*b_m*l_e/(2*h_yr*l_s)
+	B_tmax	=B_g*tau_s/b_t
+	
+	
+	k_wd			= ops.sin(pi/6)/q1/ops.sin(pi/6/q1)		# winding factor
+	L_t=l_s+2*tau_p
+	
+	clock = profiling.lap(clock, 'PMSG_disc', 'em')
+	# Stator winding length ,cross-section and resistance
+	l_Cus			= 2*(N_s)*(2*tau_p+L_t)
+	A_s				= b_s*(h_s-h_w)*q1*p
+	A_scalc   = b_s*1000*(h_s*1000-h_w*1000)*q1*p
+	A_Cus			= A_s*k_sfil/(N_s)
+	A_Cuscalc = A_scalc *k_sfil/(N_s)
+	R_s	= l_Cus*rho_Cu/A_Cus
+	
+	# Calculating leakage inductance in  stator
+	L_m				= 2*m*k_wd**2*(N_s)**2*mu_0*tau_p*L_t/pi**2/g_eff/p
+	L_ssigmas=2*mu_0*l_s*N_s**2/p/q1*((h_s-h_w)/(3*b_s)+h_w/b_so)  #slot leakage inductance
+	L_ssigmaew=(2*mu_0*l_s*N_s**2/p/q1)*0.34*g*(l_e-0.64*tau_p*y_tau_p)/l_s #end winding leakage inductance
+	L_ssigmag=2*mu_0*l_s*N_s**2/p/q1*(5*(g*k_C/b_so)/(5+4*(g*k_C/b_so))) # tooth tip leakage inductance#tooth tip leakage inductance
+	L_ssigma	= (L_ssigmas+L_ssigmaew+L_ssigmag)
+	L_s  = L_m+L_ssigma
+	
+	# Calculating no-load voltage induced in the stator and stator current
+	E_p	= 2*(N_s)*L_t*r_s*k_wd*om_m*B_g/ops.sqrt(2)
+	
+	Z=(machine_rating/(m*E_p))
+	G=(E_p**2-(om_e*L_s*Z)**2)
+	I_s= ops.sqrt(Z**2+(((E_p-G**0.5)/(om_e*L_s)**2)**2))
+	B_smax=ops.sqrt(2)*I_s*mu_0/g_eff
+	
+	# Calculating stator current and electrical loading
+	J_s	= I_s/A_Cuscalc
+	I_snom		=(machine_rating/m/E_p/cofi) #rated current
+	I_qnom		=machine_rating/(m*E_p)
+	X_snom		=om_e*(L_m+L_ssigma)
+	A_1 = 6*N_s*I_s/(pi*dia)
+	
+	clock = profiling.lap(clock, 'PMSG_disc', 'winding')
+	#Calculating electromagnetically active mass
+	
+	V_Cus 	=m*l_Cus*A_Cus		# copper volume
+	V_Fest	=L_t*2*p*q1*m*b_t*h_s		# volume of iron in stator tooth
+	V_Fesy	=L_t*pi*((r_s+h_s+h_ys)**2-(r_s+h_s)**2) # volume of iron in stator yoke
+	V_Fery	=L_t*pi*((r_r-h_m)**2-(r_r-h_m-h_yr)**2) # volume of iron in rotor yoke
+	Copper		=V_Cus*rho_Copper
+	M_Fest	=V_Fest*rho_Fe		# mass of stator tooth
+	M_Fesy	=V_Fesy*rho_Fe		# mass of stator yoke
+	M_Fery	=V_Fery*rho_Fe		# mass of rotor yoke
+	Iron		=M_Fest+M_Fesy+M_Fery
+	
+	clock = profiling.lap(clock, 'PMSG_disc', 'mass')
+	#Calculating losses"
+	#1.Copper losses
+	K_R=1.2		# Skin effect correction co-efficient
+	P_Cu		=m*I_snom**2*R_s*K_R
+	
+	# Iron Losses ( from Hysteresis and eddy currents)
+	P_Hyys	=M_Fesy*(B_symax/1.5)**2*(P_Fe0h*om_e/(2*pi*60)) # Hysteresis losses in stator yoke
+	P_Ftys	=M_Fesy*((B_symax/1.5)**2)*(P_Fe0e*(om_e/(2*pi*60))**2)# Eddy losses in stator yoke
+	P_Fesynom=P_Hyys+P_Ftys
+	P_Hyd=M_Fest*(B_tmax/1.5)**2*(P_Fe0h*om_e/(2*pi*60)) # Hysteresis losses in stator teeth
+	P_Ftd=M_Fest*(B_tmax/1.5)**2*(P_Fe0e*(om_e/(2*pi*60))**2) # Eddy losses in stator teeth
+	P_Festnom=P_Hyd+P_Ftd
+	P_ad=0.2*(P_Hyys + P_Ftys + P_Hyd + P_Ftd ) # additional stray losses due to leakage flux
+	pFtm =300		# specific magnet loss
+	P_Ftm=pFtm*2*p*b_m*l_s		#magnet losses
+	
+	Losses=P_Cu+P_Festnom+P_Fesynom+P_ad+P_Ftm
+	gen_eff=machine_rating*100/(machine_rating+Losses)
+	
+	clock = profiling.lap(clock, 'PMSG_disc', 'losses')
+	################################################## Structural  Design ############################################################
+	
+	## Structural deflection calculations
+	#rotor structure
+	R					= r_s-g-h_m-0.5*t		# mean radius of the rotor rim
+	l=L_t
+	b					=R_o		# Shaft radius
+	R_b				=R-0.5*t		# Inner radius of the rotor
+	R_a=R+0.5*h_yr		# Outer radius of rotor yoke
+	a=R-0.5*t;
+	a_1=R_b
+	c					=R/500
+	u_all_r    =c/20		# allowable radial deflection
+	y_all    =2*l/100		# allowable axial deflection
+	R_1				= R-t*0.5		#inner radius of rotor cylinder
+	K					=4*(ops.sin(ratio*pi/2))/pi
+	q3					= B_g**2/2/mu_0		# normal component of Maxwell's stress
+	
+	mass_PM   =(2*pi*(R+0.5*t)*l*h_m*ratio*rho_PM)		# magnet mass
+	mass_st_lam=rho_Fe*2*pi*R*l*h_yr		# mass of rotor yoke steel
+	
+	
+	# Calculation of radial deflection of rotor
+	# cylindrical shell function and circular plate parameters for disc rotor based on Table 11.2 Roark's formulas
+	lamb   =((3*(1-v**2)/R_a**2/h_yr**2)**0.25)
+	x1=lamb*l
+	C_2=ops.cosh(x1)*ops.sin(x1)+ops.sinh(x1)*ops.cos(x1)
+	C_3=ops.sinh(x1)*ops.sin(x1)
+	C_4=ops.cosh(x1)*ops.sin(x1)-ops.sinh(x1)*ops.cos(x1)
+	C_11=(ops.sinh(x1))**2-(ops.sin(x1))**2
+	C_13=ops.cosh(x1)*ops.sinh(x1)-ops.cos(x1)*ops.sin(x1)
+	C_14=(ops.sinh(x1)**2+ops.sin(x1)**2)
+	C_a1=ops.cosh(x1*0.5)*ops.cos(x1*0.5)
+	C_a2=ops.cosh(x1*0.5)*ops.sin(x1*0.5)+ops.sinh(x1*0.5)*ops.cos(x1*0.5)
+	F_1_x0=ops.cosh(lamb*0)*ops.cos(lamb*0)
+	F_1_ls2=ops.cosh(lamb*0.5*l_s)*ops.cos(lamb*0.5*l_s)
+	F_2_x0=ops.cosh(lamb*0)*ops.sin(lamb*0)+ops.sinh(lamb*0)*ops.cos(lamb*0)
+	F_2_ls2=ops.cosh(x1/2)*ops.sin(x1/2)+ops.sinh(x1/2)*ops.cos(x1/2)
+	
+	a=ops.where(l_s<2*a, l_s/2, l_s*0.5-1)
+	
+	F_a4_x0=ops.cosh(lamb*(0))*ops.sin(lamb*(0))-ops.sinh(lamb*(0))*ops.cos(lamb*(0))
+	F_a4_ls2=ops.cosh(pi/180*lamb*(0.5*l_s-a))*ops.sin(pi/180*lamb*(0.5*l_s-a))-ops.sinh(pi/180*lamb*(0.5*l_s-a))*ops.cos(pi/180*lamb*(0.5*l_s-a))
+	
+	D_r=E*h_yr**3/(12*(1-v**2))
+	D_ax=E*t_d**3/(12*(1-v**2))
+	
+	# Radial deflection analytical model from McDonald's thesis defined in parts
+	Part_1 =R_b*((1-v)*R_b**2+(1+v)*R_o**2)/(R_b**2-R_o**2)/E
+	Part_2 =(C_2*C_a2-2*C_3*C_a1)/2/C_11
+	Part_3 = (C_3*C_a2-C_4*C_a1)/C_11
+	Part_4 =((0.25/D_r/lamb**3))
+	Part_5=q3*R_b**2/(E*(R_a-R_b))
+	f_d = Part_5/(Part_1-t_d*(Part_4*Part_2*F_2_ls2-Part_3*2*Part_4*F_1_ls2-Part_4*F_a4_ls2))
+	fr=f_d*t_d
+	u_Ar				=ops.abs_smooth(Part_5+fr/2/D_r/lamb**3*((-F_1_x0/C_11)*(C_3*C_a2-C_4*C_a1)+(F_2_x0/2/C_11)*(C_2*C_a2-2*C_3*C_a1)-F_a4_x0/2), DEFLECTION_SMOOTHING)
+	
+	# Calculation of Axial deflection of rotor
+	W=0.5*g1*ops.sin(phi)*((l-t_d)*h_yr*rho_Fes)		# uniform annular line load acting on rotor cylinder assumed as an annular plate
+	w=rho_Fes*g1*ops.sin(phi)*t_d		# disc assumed as plate with a uniformly distributed pressure between
+	a_i=R_o
+	
+	# Flat circular plate constants according to Roark's table 11.2
+	C_2p= 0.25*(1-(((R_o/R)**2)*(1+(2*ops.log(R/R_o)))))
+	C_3p=(R_o/4/R)*((1+(R_o/R)**2)*ops.log(R/R_o)+(R_o/R)**2-1)
+	C_6= (R_o/4/R_a)*((R_o/R_a)**2-1+2*ops.log(R_a/R_o))
+	C_5=0.5*(1-(R_o/R)**2)
+	C_8= 0.5*(1+v+(1-v)*((R_o/R)**2))
+	C_9=(R_o/R)*(0.5*(1+v)*ops.log(R/R_o) + (1-v)/4*(1-(R_o/R)**2))
+	
+	# Flat circular plate loading constants
+	L_11=(1 + 4*(R_o/a_1)**2 - 5*(R_o/a_1)**4 - 4*((R_o/a_1)**2)*ops.log(a_1/R_o)*(2+(R_o/a_1)**2))/64
+	L_14=(1/16)*(1-(R_o/R_b)**4-4*(R_o/R_b)**2*ops.log(R_b/R_o))
+	y_ai=-W*(a_1**3)*(C_2p*(C_6*a_1/R_o - C_6)/C_5 - a_1*C_3p/R_o +C_3p)/D_ax  # Axial deflection of plate due to The deflection of an annular plate with a uniform annular line load
+	
+	# Axial Deflection due to uniformaly distributed pressure load
+	M_rb=-w*R**2*(C_6*(R**2-R_o**2)*0.5/R/R_o-L_14)/C_5
+	Q_b=w*0.5*(R**2-R_o**2)/R_o
+	y_aii=M_rb*R_a**2*C_2p/D_ax+Q_b*R_a**3*C_3p/D_ax-w*R_a**4*L_11/D_ax
+	
+	y_Ar=ops.abs_smooth(y_ai+y_aii, DEFLECTION_SMOOTHING)
+	
+	z_all_r=0.05*2*pi*R/360  # allowable torsional deflection of rotor
+	
+	
+	#stator structure deflection calculation
+	
+	R_out=(R/0.995+h_s+h_ys)
+	a_s       = (b_st*d_s)-((b_st-2*t_ws)*(d_s-2*t_ws)) # cross-sectional area of stator armms
+	A_st      =l*t_s		# cross-sectional area of rotor cylinder
+	N_st			= ops.round_integer(n_s)
+	theta_s		=pi*1/N_st  # half angle between spokes
+	I_st       =l*t_s**3/12		# second moment of area of stator cylinder
+	I_arm_axi_s	=((b_st*d_s**3)-((b_st-2*t_ws)*(d_s-2*t_ws)**3))/12  # second moment of area of stator arm
+	I_arm_tor_s	= ((d_s*b_st**3)-((d_s-2*t_ws)*(b_st-2*t_ws)**3))/12  # second moment of area of rotot arm w.r.t torsion
+	R_st 			=r_s+h_s+h_ys*0.5
+	k_2       = ops.sqrt(I_st/A_st)  # radius of gyration
+	b_all_s		=2*pi*R_o/N_st
+	m2        =(k_2/R_st)**2
+	c1        =R_st/500
+	R_1s      = R_st-t_s*0.5
+	d_se=dia+2*(h_ys+h_s+h_w)  # stator outer diameter
+	
+	# Calculation of radial deflection of stator
+	Numers=R_st**3*((0.25*(ops.sin(theta_s)-(theta_s*ops.cos(theta_s)))/(ops.sin(theta_s))**2)-(0.5/ops.sin(theta_s))+(0.5/theta_s))
+	Povs=((theta_s/(ops.sin(theta_s))**2)+1/ops.tan(theta_s))*((0.25*R_st/A_st)+(0.25*R_st**3/I_st))
+	Qovs=R_st**3/(2*I_st*theta_s*(m2+1))
+	Lovs=(R_1s-R_o)*0.5/a_s
+	Denoms=I_st*(Povs-Qovs+Lovs)
+	
+	u_As				=(q3*R_st**2/E/t_s)*(1+Numers/Denoms)
+	
+	# Calculation of axial deflection of stator
+	mass_st_lam_s= M_Fest+pi*l*rho_Fe*((R_st+0.5*h_ys)**2-(R_st-0.5*h_ys)**2)
+	W_is			=0.5*g1*ops.sin(phi)*(rho_Fes*l*d_s**2)		# length of stator arm beam at which self-weight acts
+	W_iis     =g1*ops.sin(phi)*(mass_st_lam_s+V_Cus*rho_Copper)/2/N_st		# weight of stator cylinder and teeth
+	w_s         =rho_Fes*g1*ops.sin(phi)*a_s*N_st		# uniformly distributed load of the arms
+	
+	l_is      =R_st-R_o		# distance at which the weight of the stator cylinder acts
+	l_iis     =l_is		# distance at which the weight of the stator cylinder acts
+	l_iiis    =l_is		# distance at which the weight of the stator cylinder acts
+	u_all_s    = c1/20
+	
+	X_comp1 = (W_is*l_is**3/12/E/I_arm_axi_s)		# deflection component due to stator arm beam at which self-weight acts
+	X_comp2 =(W_iis*l_iis**4/24/E/I_arm_axi_s)		# deflection component due to 1/nth of stator cylinder
+	X_comp3 =w_s*l_iiis**4/24/E/I_arm_axi_s		# deflection component due to weight of arms
+	
+	y_As       =X_comp1+X_comp2+X_comp3  # axial deflection
+	
+	# Stator circumferential deflection
+	z_all_s     =0.05*2*pi*R_st/360  # allowable torsional deflection
+	z_A_s  =2*pi*(R_st+0.5*t_s)*l/(2*N_st)*sigma*(l_is+0.5*t_s)**3/3/E/I_arm_tor_s
+	
+	mass_stru_steel  =2*(N_st*(R_1s-R_o)*a_s*rho_Fes)
+	
+	TC1=T/(2*pi*sigma)		# Torque/shear stress
+	TC2=R**2*l		# Evaluating Torque constraint for rotor
+	TC3=R_st**2*l		# Evaluating Torque constraint for stator
+	Structural_mass=mass_stru_steel+(pi*(R**2-R_o**2)*t_d*rho_Fes)
+	Mass =  Structural_mass+Iron+Copper+mass_PM
+	
+	clock = profiling.lap(clock, 'PMSG_disc', 'structure')
+	# Calculating mass moments of inertia and center of mass
+	I_x   = (0.5*Mass*R_out**2)
+	I_y   = (0.25*Mass*R_out**2+(1/12)*Mass*l_s**2)
+	I = ops.vector(I_x, I_y, I_y)
+	cm = ops.vector(main_shaft_cm[0] + main_shaft_length/2. + l_s/2, main_shaft_cm[1], main_shaft_cm[2])
+
+	clock = profiling.lap(clock, 'PMSG_disc', 'mass', calls=0)
+	return {'B_symax': B_symax, 'B_tmax': B_tmax, 'B_rymax': B_rymax, 'B_smax': B_smax, 'B_pm1': B_pm1,
+		'B_g': B_g, 'N_s': N_s, 'b_s': b_s, 'b_t': b_t, 'A_Cuscalc': A_Cuscalc, 'b_m': b_m, 'p': p,
+		'E_p': E_p, 'f': f, 'I_s': I_s, 'R_s': R_s, 'L_s': L_s, 'A_1': A_1, 'J_s': J_s, 'Mass': Mass,
+		'K_rad': K_rad, 'Losses': Losses, 'gen_eff': gen_eff, 'u_Ar': u_Ar, 'y_Ar': y_Ar, 'u_As': u_As,
+		'y_As': y_As, 'z_A_s': z_A_s, 'u_all_r': u_all_r, 'u_all_s': u_all_s, 'y_all': y_all,
+		'z_all_s': z_all_s, 'z_all_r': z_all_r, 'b_all_s': b_all_s, 'TC1': TC1, 'TC2': TC2, 'TC3': TC3,
+		'R_out': R_out, 'S': S, 'Slot_aspect_ratio': Slot_aspect_ratio, 'mass_PM': mass_PM,
+		'Copper': Copper, 'Iron': Iron, 'Structural_mass': Structural_mass, 'cm': cm, 'I': I, 't': t,
+		't_s': t_s}
+
+
+def evaluate_batch(inputs, exact=True):
+
+	""" Evaluates many PMSG-disc designs at once; see PMSG_arms_core.evaluate_batch. """
+
+	return _evaluate_batch(evaluate, inputs, VECTOR_INPUTS, exact)
+
+
+def jacobian(inputs, wrt=DERIV_INPUTS, of=DERIV_OUTPUTS):
+
+	""" Exact partial derivatives of the outputs ``of`` with respect to the
+	inputs ``wrt``, one row per output. The rotor deflections u_Ar and y_Ar
+	are magnitudes; their partials are smoothed within DEFLECTION_SMOOTHING
+	of zero so they do not flip sign there. The arm count n_s is rounded in
+	the model and has zero partials. """
+
+	return _jacobian(evaluate, inputs, wrt, of)
+
+
+COST_INPUTS = ('Copper', 'Iron', 'mass_PM', 'Structural_mass', 'C_Cu', 'C_Fe', 'C_Fes', 'C_PM')
+
+
+def costs(inputs):
+
+	""" Material cost estimate for a PMSG_disc generator. Manufacturing costs are excluded. """
+
+	Copper = inputs['Copper']
+	Iron = inputs['Iron']
+	mass_PM = inputs['mass_PM']
+	Structural_mass = inputs['Structural_mass']
+	C_Cu = inputs['C_Cu']
+	C_Fe = inputs['C_Fe']
+	C_Fes = inputs['C_Fes']
+	C_PM = inputs['C_PM']
+	
+	# Material cost as a function of material mass and specific cost of material
+	K_gen=Copper*C_Cu+Iron*C_Fe+C_PM*mass_PM
+	Cost_str=C_Fes*Structural_mass
+
+	return {'Costs': K_gen+Cost_str}
+
+
+COST_DERIV_INPUTS = ('Copper', 'Iron', 'mass_PM', 'Structural_mass')
+
+
+def costs_jacobian(inputs):
+
+	""" Partial derivatives of Costs with respect to the material masses. """
+
+	return _jacobian(lambda values, ops: costs(values), inputs, COST_DERIV_INPUTS, ('Costs',))
@@ -0,0 +1,470 @@
+"""SCIG_core.py
+Copyright (c) NREL. All rights reserved.
+Closed-form sizing equations of the squirrel-cage induction generator, free of OpenMDAO. """
+
+from math import pi
+import numpy as np
+from generatorse import profiling
+from generatorse.ops import SCALAR, evaluate_batch as _evaluate_batch
+from generatorse.derivatives import jacobian as _jacobian
+
+INPUTS = ('r_s', 'l_s', 'h_s', 'h_r', 'I_0', 'machine_rating', 'n_nom', 'B_symax', 'Gearbox_efficiency',
+	'rho_Fe', 'rho_Copper', 'highSpeedSide_cm', 'highSpeedSide_length')
+
+VECTOR_INPUTS = ('highSpeedSide_cm',)
+
+OUTPUTS = ('tau_p', 'S_N', 'h_ys', 'h_yr', 'b_s', 'b_r', 'b_t', 'b_trmin', 'b_tr', 'N_s', 'Q_r', 'p',
+	'q1', 'A_Cuscalc', 'S', 'r_r', 'B_g', 'B_g1', 'B_rymax', 'B_tsmax', 'B_trmax', 'f', 'E_p',
+	'I_s', 'Losses', 'Active_mass', 'gen_eff', 'A_1', 'J_s', 'J_r', 'R_s', 'L_s', 'L_sm', 'R_R',
+	'TC1', 'TC2', 'K_rad', 'D_ratio', 'Slot_aspect_ratio1', 'Slot_aspect_ratio2', 'D_ratio_UL',
+	'D_ratio_LL', 'K_rad_UL', 'K_rad_LL', 'Overall_eff', 'Copper', 'Iron', 'Structural_mass',
+	'Mass', 'A_bar', 'cm', 'I')
+
+# design variables of SCIG_Opt with the bounds passed to driver.add_parameter
+DESIGN_VARIABLES = (('r_s', 0.2, 1), ('l_s', 0.4, 2), ('h_s', 0.04, 0.1), ('h_r', 0.04, 0.1),
+	('B_symax', 1, 2), ('I_0', 5, 200))
+
+# constraints of SCIG_Opt as (variable, relation, limit); a limit is a number, another variable of
+# the model or Eta_target, the target efficiency set on the assembly
+CONSTRAINTS = (
+	('Overall_eff', '>=', 'Eta_target'),
+	('E_p', '>', 500.0),
+	('E_p', '<', 5000.0),
+	('TC1', '<', 'TC2'),
+	('B_g', '>=', 0.7),
+	('B_g', '<=', 1.2),
+	('B_rymax', '<', 2.),
+	('B_trmax', '<', 2.),
+	('B_tsmax', '<', 2.),
+	('A_1', '<', 60000),
+	('J_s', '<=', 6),
+	('J_r', '<=', 6),
+	('K_rad', '>=', 'K_rad_LL'),    # boldea Chapter 3
+	('K_rad', '<=', 'K_rad_UL'),
+	('D_ratio', '>=', 'D_ratio_LL'),    # boldea Chapter 3
+	('D_ratio', '<=', 'D_ratio_UL'),
+	('Slot_aspect_ratio1', '>=', 4),
+	('Slot_aspect_ratio1', '<=', 10))
+
+# design variables of SCIG_Opt and the outputs its constraints and objective depend on
+DERIV_INPUTS = ('r_s', 'l_s', 'h_s', 'h_r', 'B_symax', 'I_0')
+
+DERIV_OUTPUTS = ('Overall_eff', 'E_p', 'TC1', 'TC2', 'B_g', 'B_rymax', 'B_trmax', 'B_tsmax', 'A_1', 'J_s', 'J_r',
+	'K_rad', 'D_ratio', 'Slot_aspect_ratio1', 'gen_eff', 'Mass', 'Copper', 'Iron', 'Structural_mass')
+
+
+
+def evaluate(inputs, ops=SCALAR, components=False):
+
+	""" Estimates overall mass, dimensions and efficiency of a SCIG.
+	``inputs`` maps the names in INPUTS to values; returns a dict keyed by OUTPUTS,
+	or with components=True the equivalent circuit and iron losses at rated slip. """
+
+	clock = profiling.start()
+
+	r_s = inputs['r_s']
+	l_s = inputs['l_s']
+	h_s = inputs['h_s']
+	h_r = inputs['h_r']
+	I_0 = inputs['I_0']
+	machine_rating = inputs['machine_rating']
+	n_nom = inputs['n_nom']
+	B_symax = inputs['B_symax']
+	Gearbox_efficiency = inputs['Gearbox_efficiency']
+	rho_Fe = inputs['rho_Fe']
+	rho_Copper = inputs['rho_Copper']
+	highSpeedSide_cm = inputs['highSpeedSide_cm']
+	highSpeedSide_length = inputs['highSpeedSide_length']
+	
+	#Assign values to universal constants
+	g1          =9.81		# m/s^2 acceleration due to gravity
+	sigma       =21.5e3		# shear stress
+	mu_0        =pi*4e-7		# permeability of free space
+	cofi        =0.9		# power factor
+	h_w         = 0.005		# wedge height
+	m           =3		# Number of phases
+	
+	
+	#Assign values to design constants
+	q1     =6		# Number of slots per pole per phase
+	b_s_tau_s   =0.45		# Stator Slot width/Slot pitch ratio
+	b_r_tau_r   =0.45		# Rotor Slot width/Slot pitch ratio
+	S_N    =-0.002		# Slip
+	y_tau_p     =12./15		# Coil span/pole pitch
+	freq        =60		# frequency in Hz
+	k_y1        =ops.sin(pi*0.5*y_tau_p)		# winding Chording factor
+	k_q1        =ops.sin(pi/6)/q1/ops.sin(pi/6/q1)# # zone factor
+	k_wd        =k_y1*k_q1		# Calcuating winding factor
+	P_Fe0h      =4		#specific hysteresis losses W/kg @ 1.5 T @50 Hz
+	P_Fe0e      =1		#specific hysteresis losses W/kg @ 1.5 T @50 Hz
+	rho_Cu      =1.8*10**(-8)*1.4		# Copper resistivity
+	
+	n_1         =n_nom/(1-S_N) # actual rotor speed
+	
+	
+	
+	
+	dia         =2*r_s		# air gap diameter
+	p      = 3		# number of pole pairs
+	K_rad=l_s/dia		# Aspect ratio
+	K_rad_LL=0.5		# lower limit on aspect ratio
+	K_rad_UL =1.5		# upper limit on aspect ratio
+	
+	# Calculating air gap length
+	g=(0.1+0.012*(machine_rating)**(1./3))*1e-3
+	
+	r_r          =r_s-g		#rotor radius
+	
+	
+	tau_p=pi*dia/2/p		# Calculating pole pitch
+	
+	S=2*m*p*q1		# Calculating Stator slots
+	
+	
+	tau_s=tau_p/m/q1		# Stator slot pitch
+	
+	
+	N_slots_pp  =S/(m*p*2)		# Slots per pole per phase
+	
+	
+	b_s          =b_s_tau_s*tau_s		# Calculating stator slot width
+	b_so        =0.004;		#Stator slot opening wdth
+	b_ro        =0.004;		#Rotor slot opening wdth
+	b_t        =tau_s-b_s		#tooth width
+	q2          =4		# rotor slots per pole per phase
+	Q_r    =2*p*m*q2		# Calculating Rotor slots
+	tau_r       =pi*(dia-2*g)/Q_r		# rotot slot pitch
+	b_r          =b_r_tau_r*tau_r		# Rotor slot width
+	b_tr=tau_r-b_r		# rotor tooth width
+	tau_r_min=pi*(dia-2*(g+h_r))/Q_r
+	b_trmin=tau_r_min-b_r_tau_r*tau_r_min # minumum rotor tooth width
+	
+	
+	# Calculating equivalent slot openings
+	mu_rs       =0.005;
+	mu_rr       =0.005;
+	W_s         =(b_s/mu_rs)*1e-3;		# Stator
+	W_r         =(b_r/mu_rr)*1e-3;		# Rotor
+	
+	Slot_aspect_ratio1=h_s/b_s  # Stator slot aspect ratio
+	Slot_aspect_ratio2=h_r/b_r  # Rotor slot aspect ratio
+	
+	# Calculating Carter factor for stator,rotor and effective air gap length
+	gamma_s     = (2*W_s/g)**2/(5+2*W_s/g)
+	K_Cs        =(tau_s)/(tau_s-g*gamma_s*0.5)  #page 3-13 Boldea Induction machines Chapter 3
+	gamma_r     = (2*W_r/g)**2/(5+2*W_r/g)
+	K_Cr        =(tau_r)/(tau_r-g*gamma_r*0.5)  #page 3-13 Boldea Boldea Induction machines Chapter 3
+	K_C         =K_Cs*K_Cr
+	g_eff       =K_C*g
+	
+	om_m        =2*pi*n_nom/60		# mechanical frequency
+	om_e        =p*om_m		# electrical frequency
+	f      =n_nom*p/60
+	K_s         =0.3		# saturation factor for Iron
+	n_c         =2		#number of conductors per coil
+	a1          =2		# number of parallel paths
+	
+	# Calculating stator winding turns
+	N_s    =ops.round(2*p*N_slots_pp*n_c/a1)
+	
+	# Calculating Peak flux densities
+	B_g1   =mu_0*3*N_s*I_0*ops.sqrt(2)*k_y1*k_q1/(pi*p*g_eff*(1+K_s))
+	B_g    =B_g1*K_C
+	B_rymax=B_symax
+	
+	
+	# calculating back iron thickness
+	h_ys= B_g*tau_p/(B_symax*pi)
+	h_yr= h_ys
+	
+	d_se        =dia+2*(h_ys+h_s+h_w)  # stator outer diameter
+	D_ratio=d_se/dia		# Diameter ratio
+	
+	# limits for Diameter ratio depending on pole pairs
+	if (2*p==2) :
+		D_ratio_LL =1.65
+		D_ratio_UL =1.69
+	elif (2*p==4) :
+		D_ratio_LL =1.46
+		D_ratio_UL =1.49
+	elif (2*p==6) :
+		D_ratio_LL =1.37
+		D_ratio_UL =1.4
+	elif (2*p==8):
+		D_ratio_LL =1.27
+		D_ratio_UL =1.3
+	else:
+		D_ratio_LL =1.2
+		D_ratio_UL =1.24
+	
+	
+	clock = profiling.lap(clock, 'SCIG', 'em')
+	# Stator slot fill factor
+	
+	K_fills=ops.where(2*r_s>2, 0.65, 0.4)
+	
+		# Stator winding length and cross-section
+	l_fs=2*(0.015+y_tau_p*tau_p/2/ops.cos(40*pi/180))+pi*(h_s) # end connection
+	l_Cus = 2*N_s*(l_fs+l_s)/a1		#shortpitch
+	A_s = b_s*(h_s-h_w)		#Slot area
+	A_scalc=b_s*1000*(h_s*1000-h_w*1000)		#Conductor cross-section (mm^2)
+	A_Cus = A_s*q1*p*K_fills/N_s		#Conductor cross-section (m^2)
+	A_Cuscalc = A_scalc*q1*p*K_fills/N_s
+	
+	# Stator winding resistance
+	R_s          =l_Cus*rho_Cu/A_Cus
+	
+	# Calculating no-load voltage
+	om_s        =(n_nom)*2*pi/60		# rated angular frequency
+	P_e         =machine_rating/(1-S_N)		# Electrical power
+	E_p    =om_s*N_s*k_wd*r_s*l_s*B_g1*ops.sqrt(2)
+	
+	
+	S_GN=(machine_rating-S_N*machine_rating)
+	T_e         =p *(S_GN)/(2*pi*freq*(1-S_N))
+	
+	
+	I_srated    =machine_rating/3/E_p/cofi
+	
+	#Rotor design
+	k_fillr     = 0.7		#       Rotor slot fill factor
+	diff        = h_r-h_w
+	A_bar      = b_r*diff		# bar cross section
+	Beta_skin   = ops.sqrt(pi*mu_0*freq/2/rho_Cu)		#co-efficient for skin effect correction
+	k_rm        = Beta_skin*h_r		#co-efficient for skin effect correction
+	J_b         = 6e+06		# Bar current density
+	K_i         = 0.864
+	I_b         = 2*m*N_s*k_wd*I_srated/Q_r		# bar current
+	
+	# Calculating bar resistance
+	R_rb        =rho_Cu*k_rm*(l_s)/(A_bar)
+	
+	
+	I_er        =I_b/(2*ops.sin(pi*p/Q_r))		# End ring current
+	J_er        = 0.8*J_b		# End ring current density
+	A_er        =I_er/J_er		# End ring cross-section
+	b           =h_r		# End ring dimension
+	a           =A_er/b		# End ring dimension
+	D_er=(r_s*2-2*g)-0.003		# End ring diameter
+	l_er=pi*(D_er-b)/Q_r		#  End ring segment length
+	
+	# Calculating end ring resistance
+	R_re=rho_Cu*l_er/(2*A_er*(ops.sin(pi*p/Q_r))**2)
+	
+	# Calculating equivalent rotor resistance
+	R_R=(R_rb+R_re)*4*m*(k_wd*N_s)**2/Q_r
+	
+	
+	
+	
+	# Calculating Rotor and Stator teeth flux density
+	B_trmax = B_g*tau_r/b_trmin
+	B_tsmax=tau_s*B_g/b_t
+	
+	# Calculating Equivalent core lengths
+	l_r=l_s+(4)*g  # for axial cooling
+	l_se =l_s+(2/3)*g
+	K_fe=0.95		# Iron factor
+	L_e=l_se *K_fe		# radial cooling
+	
+	
+	# Calculating leakage inductance in  stator
+	
+	L_ssigmas=(2*mu_0*l_s*N_s**2/p/q1)*((h_s-h_w)/(3*b_s)+h_w/b_so)  #slot leakage inductance
+	L_ssigmaew=(2*mu_0*l_s*N_s**2/p/q1)*0.34*q1*(l_fs-0.64*tau_p*y_tau_p)/l_s #end winding leakage inductance
+	L_ssigmag=2*mu_0*l_s*N_s**2/p/q1*(5*(g*K_C/b_so)/(5+4*(g*K_C/b_so))) # tooth tip leakage inductance
+	L_s=(L_ssigmas+L_ssigmaew+L_ssigmag)  # stator leakage inductance
+	
+	L_sm =6*mu_0*l_s*tau_p*(k_wd*N_s)**2/(pi**2*(p)*g_eff*(1+K_s))
+	
+	
+	
+	lambda_ei=2.3*D_er/(4*Q_r*l_s*(ops.sin(pi*p/Q_r)**2))*ops.log(4.7*dia/(a+2*b))
+	lambda_b=h_r/3/b_r+h_w/b_ro
+	L_i=pi*dia/Q_r
+	
+	# Calculating leakage inductance in  rotor
+	L_rsl=(mu_0*l_s)*((h_r-h_w)/(3*b_r)+h_w/b_ro)  #slot leakage inductance
+	L_rel=mu_0*(l_s*lambda_b+2*lambda_ei*L_i)		#end winding leakage inductance
+	L_rtl=(mu_0*l_s)*(0.9*tau_r*0.09/g_eff) # tooth tip leakage inductance
+	L_rsigma=(L_rsl+L_rtl+L_rel)*4*m*(k_wd*N_s)**2/Q_r  # rotor leakage inductance
+	
+	# Calculating rotor current
+	I_r=ops.sqrt(-S_N*P_e/m/R_R)
+	
+	
+	I_sm=E_p/(2*pi*freq*L_sm)
+	
+	# Calculating stator currents and specific current loading
+	I_s=ops.sqrt((I_r**2+I_sm**2))
+	
+	A_1=2*m*N_s*I_s/pi/(2*r_s)
+	
+	clock = profiling.lap(clock, 'SCIG', 'winding')
+	# Calculating masses of the electromagnetically active materials
+	
+	V_Cuss=m*l_Cus*A_Cus		# Volume of copper in stator
+	V_Cusr=(Q_r*l_s*A_bar+pi*(D_er*A_er-A_er*b))		# Volume of copper in rotor
+	V_Fest=(l_s*pi*((r_s+h_s)**2-r_s**2)-2*m*q1*p*b_s*h_s*l_s) # Volume of iron in stator teeth
+	V_Fesy=l_s*pi*((r_s+h_s+h_ys)**2-(r_s+h_s)**2)		# Volume of iron in stator yoke
+	r_r=r_s-g		# rotor radius
+	V_Fert=pi*l_s*(r_r**2-(r_r-h_r)**2)-2*m*q2*p*b_r*h_r*l_s # Volume of iron in rotor teeth
+	V_Fery=l_s*pi*((r_r-h_r)**2-(r_r-h_r-h_yr)**2)		# Volume of iron in rotor yoke
+	Copper=(V_Cuss+V_Cusr)*rho_Copper		# Mass of Copper
+	M_Fest=V_Fest*rho_Fe		# Mass of stator teeth
+	M_Fesy=V_Fesy*rho_Fe		# Mass of stator yoke
+	M_Fert=V_Fert*rho_Fe		# Mass of rotor tooth
+	M_Fery=V_Fery*rho_Fe		# Mass of rotor yoke
+	Iron=M_Fest+M_Fesy+M_Fert+M_Fery
+	Active_mass=(Copper+Iron)
+	L_tot=l_s
+	Structural_mass=0.0001*Active_mass**2+0.8841*Active_mass-132.5
+	
+	Mass=Active_mass+Structural_mass
+	
+	clock = profiling.lap(clock, 'SCIG', 'mass')
+	# Calculating Losses and efficiency
+	
+	# 1. Copper losses
+	K_R=1.2 # skin effect correction coefficient
+	P_Cuss=m*I_s**2*R_s*K_R  # Copper loss-stator
+	P_Cusr=m*I_r**2*R_R		# Copper loss-rotor
+	P_Cusnom=P_Cuss+P_Cusr		# Copper loss-total
+	
+	# Iron Losses ( from Hysteresis and eddy currents)
+	P_Hyys=M_Fesy*(B_symax/1.5)**2*(P_Fe0h*om_e/(2*pi*60))		# Hysteresis losses in stator yoke
+	P_Ftys=M_Fesy*(B_symax/1.5)**2*(P_Fe0e*(om_e/(2*pi*60))**2)		# Eddy losses in stator yoke
+	P_Hyd=M_Fest*(B_tsmax/1.5)**2*(P_Fe0h*om_e/(2*pi*60))		# Hysteresis losses in stator tooth
+	P_Ftd=M_Fest*(B_tsmax/1.5)**2*(P_Fe0e*(om_e/(2*pi*60))**2)		# Eddy losses in stator tooth
+	P_Hyyr=M_Fery*(B_rymax/1.5)**2*(P_Fe0h*abs(S_N)*om_e/(2*pi*60)) # Hysteresis losses in rotor yoke
+	P_Ftyr=M_Fery*(B_rymax/1.5)**2*(P_Fe0e*(abs(S_N)*om_e/(2*pi*60))**2) # Eddy losses in rotor yoke
+	P_Hydr=M_Fert*(B_trmax/1.5)**2*(P_Fe0h*abs(S_N)*om_e/(2*pi*60))		# Hysteresis losses in rotor tooth
+	P_Ftdr=M_Fert*(B_trmax/1.5)**2*(P_Fe0e*(abs(S_N)*om_e/(2*pi*60))**2) # Eddy losses in rotor tooth
+	
+	# Calculating Additional losses
+	P_add=0.5*machine_rating/100
+	
+	P_Fesnom=P_Hyys+P_Ftys+P_Hyd+P_Ftd+P_Hyyr+P_Ftyr+P_Hydr+P_Ftdr
+	Losses=P_Cusnom+P_Fesnom+P_add;
+	gen_eff=(P_e-Losses)*100/P_e
+	Overall_eff=gen_eff*Gearbox_efficiency
+	
+	clock = profiling.lap(clock, 'SCIG', 'losses')
+	if components:
+		return {'E_p': E_p, 'R_s': R_s*K_R, 'L_s': L_s, 'L_sm': L_sm, 'R_R': R_R, 'L_rsigma': L_rsigma,
+			'freq': freq, 'p': p, 'm': m, 'S_N': S_N, 'P_Fes': P_Hyys+P_Ftys+P_Hyd+P_Ftd,
+			'P_Hyr': P_Hyyr+P_Hydr, 'P_Ftr': P_Ftyr+P_Ftdr, 'P_add': P_add}
+	# Calculating current densities in the stator and rotor
+	J_s=I_s/A_Cuscalc
+	J_r=I_r/(A_bar)/1e6
+	
+	# Calculating Tangential stress constraints
+	TC1=T_e/(2*pi*sigma)
+	TC2=r_s**2*l_s
+	
+	clock = profiling.lap(clock, 'SCIG', 'em', calls=0)
+	# Calculating mass moments of inertia and center of mass
+	r_out=d_se*0.5
+	I_x   = (0.5*Mass*r_out**2)
+	I_y   = (0.25*Mass*r_out**2+(1/12)*Mass*l_s**2)
+	I = ops.vector(I_x, I_y, I_y)
+	cm = ops.vector(highSpeedSide_cm[0] + highSpeedSide_length/2. + l_s/2., highSpeedSide_cm[1], highSpeedSide_cm[2])
+
+	clock = profiling.lap(clock, 'SCIG', 'mass', calls=0)
+	return {'tau_p': tau_p, 'S_N': S_N, 'h_ys': h_ys, 'h_yr': h_yr, 'b_s': b_s, 'b_r': b_r, 'b_t': b_t,
+		'b_trmin': b_trmin, 'b_tr': b_tr, 'N_s': N_s, 'Q_r': Q_r, 'p': p, 'q1': q1,
+		'A_Cuscalc': A_Cuscalc, 'S': S, 'r_r': r_r, 'B_g': B_g, 'B_g1': B_g1, 'B_rymax': B_rymax,
+		'B_tsmax': B_tsmax, 'B_trmax': B_trmax, 'f': f, 'E_p': E_p, 'I_s': I_s, 'Losses': Losses,
+		'Active_mass': Active_mass, 'gen_eff': gen_eff, 'A_1': A_1, 'J_s': J_s, 'J_r': J_r, 'R_s': R_s,
+		'L_s': L_s, 'L_sm': L_sm, 'R_R': R_R, 'TC1': TC1, 'TC2': TC2, 'K_rad': K_rad,
+		'D_ratio': D_ratio, 'Slot_aspect_ratio1': Slot_aspect_ratio1,
+		'Slot_aspect_ratio2': Slot_aspect_ratio2, 'D_ratio_UL': D_ratio_UL, 'D_ratio_LL': D_ratio_LL,
+		'K_rad_UL': K_rad_UL, 'K_rad_LL': K_rad_LL, 'Overall_eff': Overall_eff, 'Copper': Copper,
+		'Iron': Iron, 'Structural_mass': Structural_mass, 'Mass': Mass, 'A_bar': A_bar, 'cm': cm,
+		'I': I}
+
+
+def torque_slip(inputs, slips):
+
+	""" Torque, currents, powers and efficiency of a SCIG design against slip, from the
+	per-phase equivalent circuit of evaluate (stator resistance R_s with its skin effect
+	factor, leakage L_s, magnetizing L_sm, rotor resistance R_R and leakage L_rsigma),
+	supplied at E_p and the grid frequency, for an array of slips at once. Slip is
+	negative when generating; T_e, the electromagnetic torque, P_ag, the air gap
+	power, and the power factor cos_phi take the motor sign, while P_shaft and P_elec (the shaft and terminal power)
+	are positive when generating. Iron losses are those of evaluate, with the rotor
+	iron scaled to the rotor frequency, and gen_eff is zero outside generation. """
+
+	circuit = evaluate(inputs, components=True)
+	s = np.asarray(slips, dtype=float)
+	m = circuit['m']
+	om_e = 2*pi*circuit['freq']
+	om_sync = om_e/circuit['p']
+	Z_s = circuit['R_s'] + 1j*om_e*circuit['L_s']
+	Y_m = 1/(1j*om_e*circuit['L_sm'])
+	# the rotor admittance stays finite at zero slip
+	Y_r = s/(circuit['R_R'] + 1j*s*om_e*circuit['L_rsigma'])
+	I_s = circuit['E_p']/(Z_s + 1/(Y_m + Y_r))
+	E_g = circuit['E_p'] - I_s*Z_s
+	I_r = E_g*Y_r
+	P_ag = m*np.abs(E_g)**2*Y_r.real
+	P_Cuss = m*np.abs(I_s)**2*circuit['R_s']
+	P_Cusr = s*P_ag
+	P_shaft = -(1 - s)*P_ag
+	P_Fer = (circuit['P_Hyr']*np.abs(s) + circuit['P_Ftr']*s**2/abs(circuit['S_N']))/abs(circuit['S_N'])
+	Losses = P_Cuss + P_Cusr + circuit['P_Fes'] + P_Fer + circuit['P_add']
+	P_elec = P_shaft - Losses
+	generating = (P_shaft > 0) & (P_elec > 0)
+	gen_eff = np.where(generating, P_elec*100/np.where(generating, P_shaft, 1.0), 0.0)
+	return {'slip': s, 'speed': 60*om_sync*(1 - s)/(2*pi), 'T_e': P_ag/om_sync, 'I_s': np.abs(I_s),
+		'I_r': np.abs(I_r), 'cos_phi': np.cos(np.angle(I_s)), 'P_ag': P_ag, 'P_shaft': P_shaft, 'P_elec': P_elec,
+		'P_Cuss': P_Cuss, 'P_Cusr': P_Cusr, 'P_Fes': np.full(s.shape, circuit['P_Fes']), 'P_Fer': P_Fer,
+		'P_add': np.full(s.shape, circuit['P_add']), 'Losses': Losses, 'gen_eff': gen_eff,
+		'Overall_eff': gen_eff*inputs['Gearbox_efficiency']}
+
+
+def evaluate_batch(inputs, exact=True):
+
+	""" Evaluates many SCIG designs at once; see PMSG_arms_core.evaluate_batch. """
+
+	return _evaluate_batch(evaluate, inputs, VECTOR_INPUTS, exact)
+
+
+def jacobian(inputs, wrt=DERIV_INPUTS, of=DERIV_OUTPUTS):
+
+	""" Exact partial derivatives of the outputs ``of`` with respect to the
+	inputs ``wrt``, one row per output. The stator turns N_s are
+	rounded in the model and carry no derivative. """
+
+	return _jacobian(evaluate, inputs, wrt, of)
+
+
+COST_INPUTS = ('Copper', 'Iron', 'Structural_mass', 'C_Cu', 'C_Fe', 'C_Fes')
+
+
+def costs(inputs):
+
+	""" Material cost estimate for a SCIG generator. Manufacturing costs are excluded. """
+
+	Copper = inputs['Copper']
+	Iron = inputs['Iron']
+	Structural_mass = inputs['Structural_mass']
+	C_Cu = inputs['C_Cu']
+	C_Fe = inputs['C_Fe']
+	C_Fes = inputs['C_Fes']
+	
+	# Material cost as a function of material mass and specific cost of material
+	K_gen=Copper*C_Cu+Iron*C_Fe
+	Cost_str=C_Fes*Structural_mass
+
+	return {'Costs': K_gen+Cost_str}
+
+
+COST_DERIV_INPUTS = ('Copper', 'Iron', 'Structural_mass')
+
+
+def costs_jacobian(inputs):
+
+	""" Partial derivatives of Costs with respect to the material masses. """
+
+	return _jacobian(lambda values, ops: costs(values), inputs, COST_DERIV_INPUTS, ('Costs',))
@@ -0,0 +1,219 @@
+"""benchmark.py
+Copyright (c) NREL. All rights reserved.
+Performance benchmarks of the generator models, written as JSON so that runs
+on different versions can be compared. Measures the latency of one design
+(core and OpenMDAO component), the throughput of batched evaluation, the
+wall time and evaluation counts of each *_Opt assembly with the CONMIN, SLSQP
+and COBYLA drivers, and the peak memory of each case.
+
+	python -m generatorse.benchmark --output benchmark.json """
+
+import sys
+import json
+import time
+import timeit
+import platform
+import argparse
+import importlib
+import numpy as np
+
+from generatorse import doe, profiling, reference, trace
+
+try:
+	import tracemalloc
+except ImportError:
+	tracemalloc = None    # Python 2: the peak resident size of the process is reported instead
+try:
+	import resource
+except ImportError:
+	resource = None
+
+OPTIMISERS = ('CONMINdriver', 'SLSQPdriver', 'COBYLAdriver')
+
+# 5 MW reference designs of the *_Opt_example functions: module, component, core inputs and assembly inputs
+CASES = {
+	'PMSG_arms': {'module': 'generatorse.PMSG_arms', 'component': 'PMSG', 'opt': 'PMSG_arms_Opt',
+		'objective': 'PMSG_Cost.Costs',
+		'inputs': reference.PMSG_ARMS,
+		'opt_inputs': dict(P_rated=5e6, T_rated=4.143289e6, Eta_target=93, N=12.1, PMSG_r_s=3.26, PMSG_l_s=1.6,
+			PMSG_h_s=0.070, PMSG_tau_p=0.080, PMSG_h_m=0.009, PMSG_h_ys=0.075, PMSG_h_yr=0.075, PMSG_n_s=5,
+			PMSG_b_st=0.480, PMSG_n_r=5, PMSG_b_r=0.530, PMSG_d_r=0.700, PMSG_d_s=0.350, PMSG_t_wr=0.06,
+			PMSG_t_ws=0.06, PMSG_R_o=0.43, C_Cu=4.786, C_Fe=0.556, C_Fes=0.50139, C_PM=95, rho_Fe=7700,
+			rho_Fes=7850, rho_Copper=8900, rho_PM=7450)},
+	'PMSG_disc': {'module': 'generatorse.PMSG_disc', 'component': 'PMSG', 'opt': 'PMSG_disc_Opt',
+		'objective': 'PMSG_Cost.Costs',
+		'inputs': reference.PMSG_DISC,
+		'opt_inputs': dict(P_rated=5e6, T_rated=4.143289e6, Eta_target=93, N=12.1, PMSG_r_s=3.49, PMSG_l_s=1.5,
+			PMSG_h_s=0.060, PMSG_tau_p=0.07, PMSG_h_m=0.0105, PMSG_h_ys=0.085, PMSG_h_yr=0.055, PMSG_n_s=5,
+			PMSG_b_st=0.460, PMSG_t_d=0.105, PMSG_d_s=0.350, PMSG_t_ws=0.150, PMSG_R_o=0.43, C_Cu=4.786,
+			C_Fe=0.556, C_Fes=0.50139, C_PM=95, rho_Fe=7700, rho_Fes=7850, rho_Copper=8900, rho_PM=7450)},
+	'EESG': {'module': 'generatorse.EESG', 'component': 'EESG', 'opt': 'EESG_Opt', 'objective': 'EESG_Cost.Costs',
+		'inputs': reference.EESG,
+		'opt_inputs': dict(Eta_target=93.0, P_rated=5e6, T_rated=4.143289e6, N_rated=12.1, EESG_r_s=3.2,
+			EESG_l_s=1.4, EESG_h_s=0.060, EESG_tau_p=0.170, EESG_I_f=69, EESG_N_f=100, EESG_h_ys=0.130,
+			EESG_h_yr=0.120, EESG_n_s=5, EESG_b_st=0.470, EESG_n_r=5, EESG_b_r=0.480, EESG_d_r=0.510,
+			EESG_d_s=0.400, EESG_t_wr=0.140, EESG_t_ws=0.070, EESG_R_o=0.43, C_Cu=4.786, C_Fe=0.556,
+			C_Fes=0.50139, rho_Fe=7700, rho_Fes=7850, rho_Copper=8900)},
+	'DFIG': {'module': 'generatorse.DFIG', 'component': 'DFIG', 'opt': 'DFIG_Opt', 'objective': 'DFIG_Cost.Costs',
+		'inputs': reference.DFIG,
+		'opt_inputs': dict(Eta_target=93, DFIG_P_rated=5e6, DFIG_N_rated=1200, Gearbox_efficiency=0.955,
+			DFIG_r_s=0.61, DFIG_l_s=0.49, DFIG_h_s=0.08, DFIG_h_r=0.1, DFIG_I_0=40, DFIG_B_symax=1.3,
+			DFIG_S_Nmax=-0.2, C_Cu=4.786, C_Fe=0.556, C_Fes=0.50139, rho_Fe=7700, rho_Copper=8900)},
+	'SCIG': {'module': 'generatorse.SCIG', 'component': 'SCIG', 'opt': 'SCIG_Opt', 'objective': 'SCIG_Cost.Costs',
+		'inputs': reference.SCIG,
+		'opt_inputs': dict(SCIG_r_s=0.55, SCIG_l_s=1.3, SCIG_h_s=0.090, SCIG_h_r=0.050, SCIG_I_0=140,
+			SCIG_B_symax=1.4, Eta_target=93, SCIG_P_rated=5e6, Gearbox_efficiency=0.955, SCIG_N_rated=1200,
+			C_Cu=4.786, C_Fe=0.556, C_Fes=0.50139, rho_Fe=7700, rho_Copper=8900)},
+}
+
+MODELS = ('PMSG_arms', 'PMSG_disc', 'EESG', 'DFIG', 'SCIG')
+
+
+def core(model):
+	return importlib.import_module('generatorse.%s_core' % model)
+
+
+def latency(function, number=100, repeat=5):
+	""" Best and median time of one call, over repeat runs of number calls. """
+
+	times = [t/number for t in timeit.repeat(function, number=number, repeat=repeat)]
+	return {'seconds': min(times), 'median_seconds': float(np.median(times)), 'calls': number*repeat}
+
+
+def peak_memory(function):
+	""" Peak memory allocated while function runs, in bytes; on Python 2 the peak
+	resident size of the whole process. """
+
+	if tracemalloc is not None:
+		tracemalloc.start()
+		try:
+			function()
+			return tracemalloc.get_traced_memory()[1]
+		finally:
+			tracemalloc.stop()
+	function()
+	if resource is not None:
+		# ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+		scale = 1 if sys.platform == 'darwin' else 1024
+		return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss*scale
+	return None
+
+
+def bench_execute(model, number=100, repeat=5):
+	""" Latency of the core evaluation of the reference design and, when OpenMDAO is
+	available, of the execute method of the component. """
+
+	inputs = CASES[model]['inputs']
+	evaluate = core(model).evaluate
+	records = [dict(latency(lambda: evaluate(inputs), number, repeat), model=model, benchmark='core_evaluate',
+		peak_memory=peak_memory(lambda: evaluate(inputs)))]
+	try:
+		component = getattr(importlib.import_module(CASES[model]['module']), CASES[model]['component'])()
+	except ImportError as error:
+		records.append({'model': model, 'benchmark': 'execute', 'status': 'skipped: %s' % error})
+		return records
+	for name, value in inputs.items():
+		setattr(component, name, value)
+	records.append(dict(latency(component.execute, number, repeat), model=model, benchmark='execute',
+		peak_memory=peak_memory(component.execute)))
+	return records
+
+
+def bench_batch(model, sizes=(1000, 10000), repeat=3):
+	""" Throughput of evaluate_batch on LHS samples within the DESIGN_VARIABLES bounds. """
+
+	records = []
+	for size in sizes:
+		designs = doe.samples(core(model).DESIGN_VARIABLES, size, seed=0)
+		for exact in (True, False):
+			run = lambda: doe.evaluate(core(model), CASES[model]['inputs'], designs, exact=exact,
+				limits={'Eta_target': 93.})
+			timing = latency(run, 1, repeat)
+			records.append(dict(timing, model=model, benchmark='batch', size=size, exact=exact,
+				designs_per_second=size/timing['seconds'], peak_memory=peak_memory(run)))
+	return records
+
+
+def bench_optimize(model, optimiser):
+	""" Wall time, model and gradient evaluation counts and optimum of the *_Opt assembly
+	of a model from its reference design. """
+
+	case = CASES[model]
+	record = {'model': model, 'benchmark': 'optimize', 'optimiser': optimiser}
+	try:
+		module = importlib.import_module(case['module'])
+	except ImportError as error:
+		record['status'] = 'skipped: %s' % error
+		return record
+	opt = getattr(module, case['opt'])(optimiser, case['objective'], 0)
+	for name, value in case['opt_inputs'].items():
+		setattr(opt, name, value)
+	with trace.Counter(getattr(opt, case['component'])) as counter:
+		t0 = timeit.default_timer()
+		try:
+			opt.run()
+			record['status'] = 'ok'
+		except Exception as error:
+			record['status'] = 'failed: %s' % error
+		record['seconds'] = timeit.default_timer() - t0
+	record['evaluations'] = counter.counts['execute']
+	record['gradient_evaluations'] = counter.counts['provideJ']
+	if record['status'] == 'ok':
+		record['objective'] = float(opt.get(case['objective']))
+	return record
+
+
+def profile_sections(models=MODELS, number=100):
+	""" Section timings of number core evaluations of each model, as profiling.rows. """
+
+	with profiling.profile() as timers:
+		for model in models:
+			evaluate, inputs = core(model).evaluate, CASES[model]['inputs']
+			for k in range(number):
+				evaluate(inputs)
+	return timers.rows
+
+
+def run(models=MODELS, optimisers=OPTIMISERS, sizes=(1000, 10000), number=100, repeat=5, optimize=True,
+		profile=False):
+	""" Runs the benchmarks and returns them with a description of the environment; with
+	profile, also the time spent in each section of the cores. """
+
+	results = []
+	for model in models:
+		results.extend(bench_execute(model, number, repeat))
+		results.extend(bench_batch(model, sizes, min(repeat, 3)))
+		if optimize:
+			results.extend(bench_optimize(model, optimiser) for optimiser in optimisers)
+	report = {'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'python': platform.python_version(),
+		'numpy': np.__version__, 'platform': platform.platform(), 'machine': platform.machine(),
+		'results': results}
+	if profile:
+		report['profile'] = profile_sections(models, number)
+	return report
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description='Benchmarks of the GeneratorSE models and optimizers.')
+	parser.add_argument('--models', nargs='+', default=MODELS, choices=MODELS)
+	parser.add_argument('--optimisers', nargs='+', default=OPTIMISERS)
+	parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 10000], help='batch sizes')
+	parser.add_argument('--number', type=int, default=100, help='calls per latency run')
+	parser.add_argument('--repeat', type=int, default=5, help='latency runs')
+	parser.add_argument('--no-optimize', action='store_true', help='skip the *_Opt runs')
+	parser.add_argument('--profile', action='store_true', help='time the sections of the cores')
+	parser.add_argument('--output', help='JSON file, standard output by default')
+	args = parser.parse_args(argv)
+	report = run(args.models, args.optimisers, args.sizes, args.number, args.repeat, not args.no_optimize,
+		args.profile)
+	if args.output:
+		with open(args.output, 'w') as f:
+			json.dump(report, f, indent=1)
+	else:
+		json.dump(report, sys.stdout, indent=1)
+		sys.stdout.write('\n')
+	return report
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,68 @@
+"""cache.py
+Copyright (c) NREL. All rights reserved.
+Opt-in memoization of the generator cores. Optimizers and DOE runs evaluate the
+same design repeatedly (line searches returning to the base point, unchanged
+individuals of a genetic population); a cache attached to a component returns
+the stored outputs of such points instead of recomputing them. """
+
+from collections import OrderedDict
+import numpy as np
+
+
+class EvaluationCache(object):
+
+	""" Bounded least-recently-used store of core outputs, keyed on the core
+	function and the full input vector. One cache may be shared by several
+	components, of the same or of different generator types. """
+
+	def __init__(self, maxsize=256):
+		self.maxsize = maxsize
+		self.hits = 0
+		self.misses = 0
+		self._entries = OrderedDict()
+
+	def __len__(self):
+		return len(self._entries)
+
+	@staticmethod
+	def key(evaluate, inputs):
+		""" Hashable key of a core function and its input dictionary. """
+		items = []
+		for name in sorted(inputs):
+			value = inputs[name]
+			if isinstance(value, np.ndarray):
+				value = (value.shape, tuple(value.ravel().tolist()))
+			items.append((name, value))
+		return (evaluate,) + tuple(items)
+
+	def evaluate(self, evaluate, inputs):
+		""" Outputs of ``evaluate(inputs)``, computed only if this input vector
+		is not stored. The returned dictionary is shared: its arrays are stored
+		as read-only copies, so that they cannot be changed in place. """
+		key = self.key(evaluate, inputs)
+		outputs = self._entries.pop(key, None)
+		if outputs is None:
+			self.misses += 1
+			outputs = dict((name, self._frozen(value)) for name, value in evaluate(inputs).items())
+			if len(self._entries) >= self.maxsize:
+				self._entries.popitem(last=False)    # least recently used
+		else:
+			self.hits += 1
+		self._entries[key] = outputs
+		return outputs
+
+	@staticmethod
+	def _frozen(value):
+		if isinstance(value, np.ndarray):
+			value = value.copy()    # the core may return an input array
+			value.flags.writeable = False
+		return value
+
+	def clear(self):
+		""" Drops the stored outputs and resets the counters. """
+		self._entries.clear()
+		self.hits = 0
+		self.misses = 0
+
+	def info(self):
+		return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries), 'maxsize': self.maxsize}
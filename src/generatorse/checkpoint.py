@@ -0,0 +1,37 @@
+"""checkpoint.py
+Copyright (c) NREL. All rights reserved.
+Checkpoint files of long optimization runs. The genetic and multi-start
+runs save their state (population or finished starts, iteration count,
+random state and best design so far) every few iterations, and resume from
+the last saved state after a crash. """
+
+import os
+import pickle
+
+
+def save(path, state):
+	""" Writes state to path. The file is written under a temporary name and then
+	renamed, so a crash while saving leaves the previous checkpoint intact. """
+
+	temporary = path + '.tmp'
+	with open(temporary, 'wb') as f:
+		pickle.dump(state, f, 2)
+	if os.name == 'nt' and os.path.exists(path):
+		os.remove(path)    # rename does not replace an existing file on Windows
+	os.rename(temporary, path)
+
+
+def load(path, kind=None):
+	""" State saved at path; kind, if given, must match the kind of run that saved it. """
+
+	with open(path, 'rb') as f:
+		state = pickle.load(f)
+	if kind is not None and state.get('kind') != kind:
+		raise ValueError('%s is a %s checkpoint, not a %s one' % (path, state.get('kind'), kind))
+	return state
+
+
+def due(iteration, interval):
+	""" True when a run checkpointing every interval iterations saves at iteration. """
+
+	return bool(interval) and iteration % interval == 0
@@ -0,0 +1,105 @@
+"""constraints.py
+Copyright (c) NREL. All rights reserved.
+Constraint tables of the *_Opt assemblies. Each core lists its constraints as
+(variable, relation, limit) tuples in CONSTRAINTS; this module turns them into
+driver.add_constraint strings and into normalized margins. """
+
+import numpy as np
+
+RELATIONS = ('<', '<=', '>', '>=')
+
+
+def expression(model, constraint, core):
+	""" Constraint string for driver.add_constraint, e.g. ('B_smax', '<', 'B_g') of the
+	component 'PMSG' gives 'PMSG.B_smax<PMSG.B_g'. Limits naming an assembly variable
+	such as Eta_target are left unprefixed. """
+
+	name, relation, limit = constraint
+	if isinstance(limit, str) and (limit in core.INPUTS or limit in core.OUTPUTS):
+		limit = '%s.%s' % (model, limit)
+	return '%s.%s%s%s' % (model, name, relation, limit)
+
+
+def limit_names(constraints):
+	""" Variables a constraint table refers to, constrained variables and named limits. """
+
+	names = []
+	for name, relation, limit in constraints:
+		for var in (name, limit):
+			if isinstance(var, str) and var not in names:
+				names.append(var)
+	return names
+
+
+class ConstraintSet(object):
+
+	""" A constraint table compiled for evaluation as array operations: the variables
+	and limits are gathered into one array and the margins of all constraints follow
+	from a single subtraction and division, for one design or a batch of them. """
+
+	def __init__(self, constraints):
+		self.constraints = tuple(tuple(constraint) for constraint in constraints)
+		for name, relation, limit in self.constraints:
+			if relation not in RELATIONS:
+				raise ValueError('Unknown relation %s in constraint on %s' % (relation, name))
+		self.names = limit_names(self.constraints)
+		index = dict((name, k) for k, name in enumerate(self.names))
+		self.lhs = np.array([index[name] for name, relation, limit in self.constraints], dtype=int)
+		self.named = np.array([isinstance(limit, str) for name, relation, limit in self.constraints])
+		self.rhs = np.array([index[limit] if isinstance(limit, str) else 0 for name, relation, limit in self.constraints],
+			dtype=int)
+		self.constants = np.array([0.0 if isinstance(limit, str) else limit for name, relation, limit in self.constraints],
+			dtype=float)
+		self.sign = np.array([1.0 if relation in ('<', '<=') else -1.0 for name, relation, limit in self.constraints])
+
+	def __len__(self):
+		return len(self.constraints)
+
+	def margins(self, values, limits=None):
+		""" Normalized margins, (constraints,) for one design or (constraints, n) when values
+		holds arrays of n designs. """
+
+		limits = limits or {}
+		arrays = [np.asarray(limits[name] if name in limits else values[name], dtype=float) for name in self.names]
+		shape = ()
+		for array in arrays:
+			if array.shape != shape:
+				shape = np.broadcast(np.empty(shape), array).shape
+		table = np.empty((len(arrays),) + shape)
+		for k, array in enumerate(arrays):
+			table[k] = array
+		column = (slice(None),) + (None,)*len(shape)
+		lhs = table[self.lhs]
+		rhs = table[self.rhs]
+		rhs[~self.named] = self.constants[~self.named][column]
+		scale = np.abs(rhs)
+		scale[scale == 0.0] = 1.0
+		margins = rhs - lhs
+		margins *= self.sign[column]
+		margins /= scale
+		return margins
+
+	def max_violation(self, values, limits=None):
+		""" Largest normalized violation of each design, 0 when all constraints hold. """
+		return np.maximum(np.max(-self.margins(values, limits), axis=0), 0.0)
+
+
+_compiled = {}
+
+
+def compiled(constraints):
+	""" ConstraintSet of a constraint table, compiled once per table. """
+
+	key = tuple(tuple(constraint) for constraint in constraints)
+	if key not in _compiled:
+		_compiled[key] = ConstraintSet(key)
+	return _compiled[key]
+
+
+def margins(constraints, values, limits=None):
+	""" Normalized margin of each constraint, (limit - value)/|limit| for upper limits and
+	(value - limit)/|limit| for lower ones, so a satisfied constraint has a margin >= 0.
+	values maps the model variables to floats or to arrays of a batch of designs; limits
+	holds named limits that are not model variables, such as Eta_target. """
+
+	return compiled(constraints).margins(values, limits)
@@ -0,0 +1,223 @@
+"""derivatives.py
+Copyright (c) NREL. All rights reserved.
+Exact partial derivatives of the generator cores. The core equations are
+evaluated once on dual numbers, which carry the value of every intermediate
+quantity together with its gradient with respect to the chosen inputs, so the
+derivatives are analytic (chain rule applied to each operation) rather than
+finite-difference approximations."""
+
+import math
+import numpy as np
+
+
+class Dual(object):
+
+	""" Value with its gradient with respect to the seeded inputs. """
+
+	__slots__ = ('value', 'deriv')
+	__array_ufunc__ = None    # let NumPy scalars defer to the reflected operators below
+
+	def __init__(self, value, deriv):
+		self.value = value
+		self.deriv = deriv
+
+	def __float__(self):
+		return float(self.value)
+
+	def __repr__(self):
+		return 'Dual(%r, %r)' % (self.value, self.deriv)
+
+	def __neg__(self):
+		return Dual(-self.value, -self.deriv)
+
+	def __pos__(self):
+		return self
+
+	def __abs__(self):
+		return -self if self.value < 0 else self
+
+	def __add__(self, other):
+		if isinstance(other, Dual):
+			return Dual(self.value + other.value, self.deriv + other.deriv)
+		return Dual(self.value + other, self.deriv)
+
+	__radd__ = __add__
+
+	def __sub__(self, other):
+		if isinstance(other, Dual):
+			return Dual(self.value - other.value, self.deriv - other.deriv)
+		return Dual(self.value - other, self.deriv)
+
+	def __rsub__(self, other):
+		return Dual(other - self.value, -self.deriv)
+
+	def __mul__(self, other):
+		if isinstance(other, Dual):
+			return Dual(self.value*other.value, self.deriv*other.value + other.deriv*self.value)
+		return Dual(self.value*other, self.deriv*other)
+
+	__rmul__ = __mul__
+
+	def __truediv__(self, other):
+		if isinstance(other, Dual):
+			return Dual(self.value/other.value, (self.deriv*other.value - other.deriv*self.value)/other.value**2)
+		return Dual(self.value/other, self.deriv/other)
+
+	def __rtruediv__(self, other):
+		return Dual(other/self.value, -other*self.deriv/self.value**2)
+
+	__div__ = __truediv__
+	__rdiv__ = __rtruediv__
+
+	def __pow__(self, other):
+		if isinstance(other, Dual):
+			value = self.value**other.value
+			return Dual(value, other.value*self.value**(other.value - 1)*self.deriv + value*math.log(self.value)*other.deriv)
+		return Dual(self.value**other, other*self.value**(other - 1)*self.deriv)
+
+	def __rpow__(self, other):
+		value = other**self.value
+		return Dual(value, value*math.log(other)*self.deriv)
+
+	def __lt__(self, other):
+		return self.value < value(other)
+
+	def __le__(self, other):
+		return self.value <= value(other)
+
+	def __gt__(self, other):
+		return self.value > value(other)
+
+	def __ge__(self, other):
+		return self.value >= value(other)
+
+
+def value(x):
+	""" Plain value of a dual number or constant. """
+	return x.value if isinstance(x, Dual) else x
+
+
+def _unary(fn, dfn):
+	def apply(x):
+		if isinstance(x, Dual):
+			return Dual(fn(x.value), dfn(x.value)*x.deriv)
+		return fn(x)
+	return staticmethod(apply)
+
+
+class DualOps(object):
+
+	""" Evaluates the generator equations on dual numbers. Rounded quantities
+	(pole pairs, arm counts) are piecewise constant and carry a zero
+	derivative, except those rounded with round_relaxed. """
+
+	sin = _unary(math.sin, math.cos)
+	cos = _unary(math.cos, lambda x: -math.sin(x))
+	tan = _unary(math.tan, lambda x: 1/math.cos(x)**2)
+	atan = _unary(math.atan, lambda x: 1/(1 + x*x))
+	sinh = _unary(math.sinh, math.cosh)
+	cosh = _unary(math.cosh, math.sinh)
+	exp = _unary(math.exp, math.exp)
+	log = _unary(math.log, lambda x: 1/x)
+	sqrt = _unary(math.sqrt, lambda x: 0.5/math.sqrt(x))
+
+	@staticmethod
+	def round(x):
+		return round(value(x))
+
+	round_integer = round
+
+	@staticmethod
+	def round_relaxed(x):
+		# keeps the derivative of the unrounded variable so that a gradient
+		# driver can move a finely stepped integer such as the field turns
+		if isinstance(x, Dual):
+			return Dual(round(x.value), x.deriv)
+		return round(x)
+
+	@staticmethod
+	def abs_smooth(x, width):
+		# keeps the value |x| but replaces the sign jump of its derivative by
+		# x/sqrt(x**2 + width**2), the slope of the smooth sqrt(x**2 + width**2)
+		if isinstance(x, Dual):
+			return Dual(abs(x.value), x.value/math.sqrt(x.value**2 + width**2)*x.deriv)
+		return abs(x)
+
+	@staticmethod
+	def where(condition, x, y):
+		return x if condition else y
+
+	@staticmethod
+	def vector(*values):
+		return [value(v) for v in values]
+
+
+def seed(inputs, wrt):
+	""" Copy of ``inputs`` with the entries named in ``wrt`` replaced by dual
+	numbers carrying unit gradients. """
+	seeded = dict(inputs)
+	n = len(wrt)
+	for k, name in enumerate(wrt):
+		deriv = np.zeros(n)
+		deriv[k] = 1.0
+		seeded[name] = Dual(float(inputs[name]), deriv)
+	return seeded
+
+
+def jacobian(evaluate, inputs, wrt, of):
+	""" Exact Jacobian of a core ``evaluate(inputs, ops)`` function.
+
+	Returns an array with one row per output in ``of`` and one column per input
+	in ``wrt``, in the layout expected from Component.provideJ. """
+
+	outputs = evaluate(seed(inputs, wrt), DualOps)
+	J = np.zeros((len(of), len(wrt)))
+	for i, name in enumerate(of):
+		if isinstance(outputs[name], Dual):
+			J[i, :] = outputs[name].deriv
+	return J
+
+
+def finite_difference(evaluate, inputs, wrt, of, step=1e-6):
+	""" Central finite-difference Jacobian of a core ``evaluate`` function,
+	with a step relative to each input value. """
+
+	J = np.zeros((len(of), len(wrt)))
+	for j, name in enumerate(wrt):
+		h = step*max(1.0, abs(inputs[name]))
+		plus = dict(inputs)
+		plus[name] = inputs[name] + h
+		minus = dict(inputs)
+		minus[name] = inputs[name] - h
+		f_plus = evaluate(plus)
+		f_minus = evaluate(minus)
+		for i, output in enumerate(of):
+			J[i, j] = (f_plus[output] - f_minus[output])/(2*h)
+	return J
+
+
+def check_partials(evaluate, inputs, wrt, of, step=1e-6, out=None):
+	""" Compares the analytic Jacobian with central finite differences.
+
+	Returns a list of (output, input, analytic, finite difference, relative
+	error) tuples and, if ``out`` is a file-like object, writes them as a table.
+	The relative error is taken against max(|analytic|, |finite difference|)
+	so that exact zeros compare as zero. Inputs that are rounded inside the
+	model (arm counts) show an analytic zero; a finite difference across a
+	rounding step is meaningless. """
+
+	analytic = jacobian(evaluate, inputs, wrt, of)
+	approx = finite_difference(evaluate, inputs, wrt, of, step)
+	results = []
+	for i, output in enumerate(of):
+		for j, name in enumerate(wrt):
+			a = analytic[i, j]
+			f = approx[i, j]
+			scale = max(abs(a), abs(f))
+			error = abs(a - f)/scale if scale > 0 else 0.0
+			results.append((output, name, a, f, error))
+	if out is not None:
+		out.write('%-20s %-12s %16s %16s %10s\n' % ('output', 'input', 'analytic', 'fd', 'rel error'))
+		for row in results:
+			out.write('%-20s %-12s %16.8g %16.8g %10.2e\n' % row)
+	return results
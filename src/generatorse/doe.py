@@ -0,0 +1,90 @@
+"""doe.py
+Copyright (c) NREL. All rights reserved.
+Design-of-experiments sweeps over the DESIGN_VARIABLES bounds of a core.
+Samples are drawn by Latin hypercube, Sobol sequence or full factorial and
+evaluated in vectorized chunks, recording every output of the core, the
+material costs and the normalized margin of each constraint, to map the
+feasible region of a machine type before optimizing it. """
+
+import itertools
+import numpy as np
+
+from generatorse import constraints
+
+try:
+	from scipy.stats import qmc
+except ImportError:
+	qmc = None    # Sobol sampling needs SciPy 1.7 or later
+
+METHODS = ('lhs', 'sobol', 'full_factorial')
+
+
+def unit_samples(method, n, dimensions, seed=None, levels=3):
+	""" Samples in the unit hypercube, (n, dimensions); full_factorial ignores n and
+	returns levels**dimensions points, levels being an int or one int per dimension. """
+
+	random = np.random.RandomState(seed)
+	if method == 'lhs':
+		# one point in each of n strata per dimension, strata paired at random
+		strata = np.array([random.permutation(n) for _ in range(dimensions)]).T
+		return (strata + random.random_sample((n, dimensions)))/n
+	if method == 'sobol':
+		if qmc is None:
+			raise ImportError('Sobol sampling requires scipy.stats.qmc (SciPy 1.7 or later)')
+		return qmc.Sobol(dimensions, scramble=True, seed=seed).random(n)
+	if method == 'full_factorial':
+		levels = np.broadcast_to(levels, (dimensions,))
+		axes = [np.linspace(0.0, 1.0, k) if k > 1 else np.array([0.5]) for k in levels]
+		return np.array(list(itertools.product(*axes)), dtype=float).reshape(-1, dimensions)
+	raise ValueError('Unknown sampling method %s, expected one of %s' % (method, ', '.join(METHODS)))
+
+
+def samples(design_variables, n, method='lhs', seed=None, levels=3):
+	""" Designs (n, variables) spread over the bounds of a DESIGN_VARIABLES table. """
+
+	low = np.array([var[1] for var in design_variables], dtype=float)
+	high = np.array([var[2] for var in design_variables], dtype=float)
+	return low + unit_samples(method, n, len(design_variables), seed, levels)*(high - low)
+
+
+def evaluate(core, inputs, designs, cost_inputs=None, limits=None, exact=True):
+	""" Record of a chunk of designs (n, variables): the design variables, every core
+	output, Costs when cost_inputs are given, the margins (n, constraints) in the order
+	of the core CONSTRAINTS and the feasible flag of each design. """
+
+	designs = np.atleast_2d(np.asarray(designs, dtype=float))
+	n = len(designs)
+	values = dict(inputs)
+	for k, var in enumerate(core.DESIGN_VARIABLES):
+		values[var[0]] = designs[:, k]
+	outputs = core.evaluate_batch(values, exact)
+	values.update(outputs)
+	record = dict((var[0], designs[:, k]) for k, var in enumerate(core.DESIGN_VARIABLES))
+	record.update(outputs)
+	if cost_inputs is not None:
+		costs = dict(cost_inputs, **dict((name, outputs[name]) for name in core.COST_INPUTS if name in outputs))
+		record['Costs'] = np.array(np.broadcast_to(core.costs(costs)['Costs'], (n,)))
+	margins = constraints.margins(core.CONSTRAINTS, values, limits)
+	record['margins'] = np.array(np.broadcast_to(margins.T, (n, len(margins))))
+	record['feasible'] = np.all(record['margins'] >= 0.0, axis=1)
+	return record
+
+
+def iter_sweep(core, inputs, n=1000, method='lhs', cost_inputs=None, limits=None, chunk_size=10000, seed=None,
+		levels=3, exact=True):
+	""" Generates the records of a sweep one chunk of at most chunk_size designs at a time. """
+
+	designs = samples(core.DESIGN_VARIABLES, n, method, seed, levels)
+	for start in range(0, len(designs), chunk_size):
+		yield evaluate(core, inputs, designs[start:start + chunk_size], cost_inputs, limits, exact)
+
+
+def sweep(core, inputs, n=1000, method='lhs', cost_inputs=None, limits=None, chunk_size=10000, seed=None,
+		levels=3, exact=True):
+	""" Evaluates n designs of a core sampled by method ('lhs', 'sobol' or 'full_factorial')
+	within its DESIGN_VARIABLES bounds. inputs holds the fixed model inputs and limits
+	the named constraint limits, e.g. {'Eta_target': 93.}. Returns the records of all
+	chunks joined, one array entry per design. """
+
+	chunks = list(iter_sweep(core, inputs, n, method, cost_inputs, limits, chunk_size, seed, levels, exact))
+	return dict((name, np.concatenate([chunk[name] for chunk in chunks])) for name in chunks[0])
@@ -0,0 +1,157 @@
+"""fleet.py
+Copyright (c) NREL. All rights reserved.
+Fleet sizing: one machine type optimized for a family of ratings, e.g. 2 to
+15 MW. The ratings are sorted and split into contiguous blocks, by default
+one per worker process; the middle rating of each block starts from the
+given inputs (or the warm-start database), and the others start from the
+optimum of their converged neighbour towards it, so that the blocks run in
+parallel and each run begins close to its answer (continuation in rating).
+The optima are gathered into one table, in the order of the specs. """
+
+import multiprocessing
+import numpy as np
+
+from generatorse import multistart, results, warmstart
+
+# seconds between checks of the running jobs
+POLL = 0.01
+
+
+def rating_inputs(opt_class, spec):
+	""" Assembly inputs of a (P_rated, T_rated, N) spec; assemblies without a torque
+	input (DFIG, SCIG) take P_rated and N only. """
+
+	rating = dict(zip(('P_rated', 'T_rated', 'N'), spec))
+	return dict((name, float(rating[key])) for key, name in opt_class.rating_variables.items())
+
+
+def spec_rating(opt_class, spec):
+	""" Warm-start database key of a spec, from the assembly inputs it sets, so that DFIG
+	and SCIG optima are stored under the torque warmstart.rating gives the assembly. """
+
+	return warmstart.assembly_rating(opt_class, rating_inputs(opt_class, spec))
+
+
+def plan(specs, chains):
+	""" Continuation plan of specs (P_rated, T_rated, N): the index of the spec each one
+	starts from, -1 for the first of each chain. Specs are ordered by power, torque and
+	speed and cut into chains contiguous blocks, each run outwards from its middle. """
+
+	order = sorted(range(len(specs)), key=lambda k: tuple(specs[k]))
+	parents = [-1]*len(specs)
+	for block in np.array_split(np.array(order, dtype=int), max(min(chains, len(specs)), 1)):
+		middle = len(block)//2
+		for position in range(len(block)):
+			if position != middle:
+				parents[block[position]] = int(block[position + 1 if position < middle else position - 1])
+	return parents
+
+
+def fleet(opt_class, specs, inputs, optimiser='CONMINdriver', objective=None, processes=None, chains=None,
+		database=None, tolerance=1e-6):
+	""" Optimizes opt_class (PMSG_arms_Opt, EESG_Opt, ...) for each (P_rated, T_rated, N)
+	of specs. inputs are the assembly variables set for every rating (Eta_target,
+	costs, densities, fixed dimensions and the design variables from which the first
+	run of each chain starts). database, a warmstart.Database, supplies those first
+	starts where it holds an optimum of the machine type and stores every optimum
+	found; save it afterwards. processes=1 runs in this process. chains, the number of
+	continuation chains, defaults to the number of processes; the optima depend on it
+	but not on the processes. Returns the table of table(). """
+
+	model = opt_class.generator_name
+	machine = warmstart.machine_type(opt_class)
+	if objective is None:
+		objective = '%s_Cost.Costs' % model
+	if processes is None:
+		processes = multiprocessing.cpu_count()
+	parents = plan(specs, chains or processes)
+	children = dict((k, [j for j, parent in enumerate(parents) if parent == k]) for k in range(len(specs)))
+	starts = [None]*len(specs)
+	found = [None]*len(specs)
+
+	def first_start(k):
+		design = None
+		if database is not None:
+			design = database.lookup(machine, spec_rating(opt_class, specs[k]),
+				design_variables=opt_class.generator_core.DESIGN_VARIABLES)
+		return design or {}
+
+	def job(k):
+		if parents[k] < 0:
+			starts[k] = first_start(k)
+		else:
+			parent = found[parents[k]]
+			# a failed neighbour passes on its own start instead of its optimum
+			starts[k] = parent['design'] if parent['error'] is None else starts[parents[k]]
+		return (k, (opt_class, optimiser, objective, dict(inputs, **rating_inputs(opt_class, specs[k])), starts[k]))
+
+	def collect(k, handle):
+		try:
+			return handle.get()[1]
+		except Exception as error:
+			# a job that raised outside the assembly run, e.g. inputs that cannot be sent to a worker
+			return {'start': starts[k], 'design': None, 'objective': None, 'margins': None,
+				'feasible': False, 'error': '%s: %s' % (type(error).__name__, error), 'time': 0.0}
+
+	ready = [k for k in range(len(specs)) if parents[k] < 0]
+	if processes == 1:
+		while ready:
+			k, result = multistart._optimize_indexed(job(ready.pop(0)))
+			found[k] = result
+			ready.extend(children[k])
+	else:
+		pool = multiprocessing.Pool(processes)
+		running = {}
+		try:
+			for k in ready:
+				running[k] = pool.apply_async(multistart._optimize_indexed, (job(k),))
+			while running:
+				done = [k for k in sorted(running) if running[k].ready()]
+				if not done:
+					running[min(running)].wait(POLL)
+				for k in done:
+					found[k] = collect(k, running.pop(k))
+					for child in children[k]:
+						running[child] = pool.apply_async(multistart._optimize_indexed, (job(child),))
+		finally:
+			pool.close()
+			pool.join()
+
+	multistart.rank(found, tolerance)
+	if database is not None:
+		for spec, result in zip(specs, found):
+			database.record_result(opt_class, spec_rating(opt_class, spec), result, objective)
+	return table(opt_class, specs, found, parents)
+
+
+def table(opt_class, specs, found, parents):
+	""" Consolidated table: P_rated, T_rated, N, seed (the spec started from, -1 for
+	none), objective, feasible, error, time, one column per design variable and the
+	margins (specs, constraints), one entry per spec. """
+
+	core = opt_class.generator_core
+	specs = np.array(specs, dtype=float).reshape(-1, 3)
+	record = {'P_rated': specs[:, 0], 'T_rated': specs[:, 1], 'N': specs[:, 2], 'seed': np.array(parents, dtype=int),
+		'objective': np.array([np.nan if r['objective'] is None else r['objective'] for r in found], dtype=float),
+		'feasible': np.array([r['feasible'] for r in found], dtype=bool),
+		'error': [r['error'] for r in found], 'time': np.array([r['time'] for r in found], dtype=float),
+		'margins': np.array([np.full(len(core.CONSTRAINTS), np.nan) if r['margins'] is None else r['margins']
+			for r in found], dtype=float).reshape(len(found), len(core.CONSTRAINTS))}
+	for name, low, high in core.DESIGN_VARIABLES:
+		record[name] = np.array([np.nan if r['design'] is None else r['design'][name] for r in found], dtype=float)
+	return record
+
+
+def save(record, opt_class, path):
+	""" Writes a fleet table to CSV, one row per spec. """
+
+	core = opt_class.generator_core
+	names = ['P_rated', 'T_rated', 'N', 'seed', 'objective', 'feasible', 'time'] + [var[0] for var in core.DESIGN_VARIABLES]
+	header = names + [results.constraint_name(constraint) for constraint in core.CONSTRAINTS] + ['error']
+	with open(path, 'w') as f:
+		f.write(','.join(header) + '\n')
+		for k in range(len(record['P_rated'])):
+			row = [repr(float(record[name][k])) if name != 'seed' else str(record[name][k]) for name in names]
+			row += [repr(float(value)) for value in record['margins'][k]]
+			row.append('"%s"' % record['error'][k].replace('"', "'") if record['error'][k] else '')
+			f.write(','.join(row) + '\n')
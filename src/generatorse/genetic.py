@@ -0,0 +1,243 @@
+"""genetic.py
+Copyright (c) NREL. All rights reserved.
+Genetic algorithm over the DESIGN_VARIABLES and CONSTRAINTS tables of a core,
+with each generation evaluated in parallel. Every worker process holds a
+model with the fixed inputs already set, receives a chunk of genomes and
+evaluates it as one batch; genomes repeated within a generation or carried
+over from an earlier one (elites, unmutated copies) are evaluated once. """
+
+import importlib
+import multiprocessing
+import numpy as np
+
+from generatorse import checkpoint, doe
+
+_model = None    # model of a worker process, set by _init_worker
+
+
+class PopulationModel(object):
+
+	""" A core with its fixed inputs, the objective and the constraint limits set,
+	evaluating arrays of genomes ordered as the core DESIGN_VARIABLES. The objective
+	is a core output or 'Costs', computed by the core costs function from cost_inputs. """
+
+	def __init__(self, core, inputs, cost_inputs=None, objective='Costs', limits=None):
+		self.core_name = core.__name__    # modules do not pickle, workers import the core by name
+		self.inputs = dict(inputs)
+		self.cost_inputs = dict(cost_inputs or {})
+		self.objective = objective
+		self.limits = dict(limits or {})
+
+	@property
+	def core(self):
+		return importlib.import_module(self.core_name)
+
+	def evaluate(self, genomes):
+		""" Objective (n,) and normalized constraint margins (n, constraints) of the genomes. """
+
+		record = doe.evaluate(self.core, self.inputs, genomes, self.cost_inputs if self.objective == 'Costs' else None,
+			self.limits)
+		return np.array(record[self.objective], dtype=float), record['margins']
+
+
+def _init_worker(model):
+	global _model
+	_model = model
+
+
+def _evaluate_chunk(genomes):
+	return _model.evaluate(genomes)
+
+
+class PopulationEvaluator(object):
+
+	""" Evaluates populations of a PopulationModel in a pool of worker processes, each
+	holding its own copy of the model. Results are remembered per genome, so every
+	distinct genome is evaluated once per run; evaluations counts the model runs and
+	hits the genomes answered from earlier results; results may pass in those of an earlier
+	evaluator. processes=1 evaluates in this process. """
+
+	def __init__(self, model, processes=None, results=None):
+		self.model = model
+		self.processes = processes or multiprocessing.cpu_count()
+		self.evaluations = 0
+		self.hits = 0
+		self._results = {} if results is None else results
+		self._pool = None
+		if processes != 1:
+			self._pool = multiprocessing.Pool(self.processes, _init_worker, (model,))
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+	def close(self):
+		if self._pool is not None:
+			self._pool.close()
+			self._pool.join()
+			self._pool = None
+
+	def evaluate(self, genomes):
+		""" Objective (n,) and margins (n, constraints) of a population (n, variables). """
+
+		genomes = np.atleast_2d(np.asarray(genomes, dtype=float))
+		keys = [tuple(genome) for genome in genomes]
+		new = []
+		for key in keys:
+			if key not in self._results and key not in new:
+				new.append(key)
+		self.hits += len(keys) - len(new)
+		self.evaluations += len(new)
+		if new:
+			new_genomes = np.array(new)
+			if self._pool is None:
+				chunks = [self.model.evaluate(new_genomes)]
+			else:
+				parts = np.array_split(new_genomes, min(self.processes, len(new)))
+				chunks = self._pool.map(_evaluate_chunk, parts)
+			objective = np.concatenate([chunk[0] for chunk in chunks])
+			margins = np.concatenate([chunk[1] for chunk in chunks])
+			for k, key in enumerate(new):
+				self._results[key] = (objective[k], margins[k])
+		objective = np.array([self._results[key][0] for key in keys])
+		margins = np.array([self._results[key][1] for key in keys])
+		return objective, margins
+
+
+def violation(margins):
+	""" Total constraint violation of each individual; infinite for failed designs. """
+
+	total = np.sum(np.maximum(-margins, 0.0), axis=-1)
+	return np.where(np.isnan(total), np.inf, total)
+
+
+def order(objective, margins):
+	""" Indices from best to worst: feasible designs by objective, then infeasible ones
+	by total violation, so that no penalty weights need tuning. """
+
+	total = np.where(np.isnan(objective), np.inf, violation(margins))
+	objective = np.where(total > 0.0, np.inf, objective)
+	return np.lexsort((objective, total))
+
+
+def genetic(core, inputs, cost_inputs=None, objective='Costs', limits=None, population_size=60, generations=50,
+		crossover_rate=0.9, mutation_rate=0.1, elitism=2, processes=None, seed=None, tolerance=1e-6,
+		checkpoint_path=None, checkpoint_interval=10):
+	""" Minimizes objective of a core over its DESIGN_VARIABLES bounds subject to its CONSTRAINTS.
+
+	inputs holds the fixed model inputs (rating, speed, torque, densities, ...) and
+	limits the named constraint limits, e.g. {'Eta_target': 93.}. Parents are picked by
+	binary tournament, recombined by blend crossover and mutated with Gaussian steps of
+	a tenth of the variable range; the elitism best individuals pass on unchanged.
+	With checkpoint_path the state is saved every checkpoint_interval generations and
+	the run can be continued by resume. Returns the best design with its objective,
+	margins and feasibility, the best objective of each generation and the evaluation
+	counts. """
+
+	random = np.random.RandomState(seed)
+	low = np.array([var[1] for var in core.DESIGN_VARIABLES], dtype=float)
+	high = np.array([var[2] for var in core.DESIGN_VARIABLES], dtype=float)
+	settings = {'core': core.__name__, 'inputs': inputs, 'cost_inputs': cost_inputs, 'objective': objective,
+		'limits': limits, 'population_size': population_size, 'generations': generations,
+		'crossover_rate': crossover_rate, 'mutation_rate': mutation_rate, 'elitism': elitism, 'tolerance': tolerance}
+	state = {'kind': 'genetic', 'settings': settings, 'generation': 0,
+		'population': low + random.random_sample((population_size, len(low)))*(high - low),
+		'random_state': random.get_state(), 'history': [], 'best': None, 'results': {},
+		'evaluations': 0, 'hits': 0}
+	return _evolve(state, processes, checkpoint_path, checkpoint_interval)
+
+
+def resume(checkpoint_path, processes=None, checkpoint_interval=10):
+	""" Continues the genetic run saved at checkpoint_path; the result is the one the
+	uninterrupted run would have returned. """
+
+	return _evolve(checkpoint.load(checkpoint_path, 'genetic'), processes, checkpoint_path, checkpoint_interval)
+
+
+def _evolve(state, processes, checkpoint_path, checkpoint_interval):
+	""" Runs the generations of a genetic run from state, saving it when due. """
+
+	settings = state['settings']
+	core = importlib.import_module(settings['core'])
+	population_size = settings['population_size']
+	elitism = settings['elitism']
+	low = np.array([var[1] for var in core.DESIGN_VARIABLES], dtype=float)
+	high = np.array([var[2] for var in core.DESIGN_VARIABLES], dtype=float)
+	n = len(low)
+	random = np.random.RandomState()
+	random.set_state(state['random_state'])
+	population = state['population']
+	history = list(state['history'])
+	model = PopulationModel(core, settings['inputs'], settings['cost_inputs'], settings['objective'], settings['limits'])
+	with PopulationEvaluator(model, processes, state['results']) as evaluator:
+		evaluator.evaluations, evaluator.hits = state['evaluations'], state['hits']
+		for generation in range(state['generation'], settings['generations'] + 1):
+			if checkpoint_path and generation > state['generation'] and checkpoint.due(generation, checkpoint_interval):
+				state.update(generation=generation, population=population, random_state=random.get_state(),
+					history=history, results=evaluator._results, evaluations=evaluator.evaluations,
+					hits=evaluator.hits, best=best)
+				checkpoint.save(checkpoint_path, state)
+			values, margins = evaluator.evaluate(population)
+			ranking = order(values, margins)
+			history.append(values[ranking[0]])
+			best = {'design': dict((var[0], population[ranking[0], k]) for k, var in enumerate(core.DESIGN_VARIABLES)),
+				'objective': values[ranking[0]], 'margins': margins[ranking[0]],
+				'feasible': bool(np.all(margins[ranking[0]] >= -settings['tolerance']))}
+			if generation == settings['generations']:
+				break
+			rank = np.empty(population_size, dtype=int)
+			rank[ranking] = np.arange(population_size)
+			children = [population[k] for k in ranking[:elitism]]
+			while len(children) < population_size:
+				pair = random.randint(population_size, size=(2, 2))
+				mother, father = [population[min(p, key=lambda k: rank[k])] for p in pair]
+				if random.random_sample() < settings['crossover_rate']:
+					alpha = random.uniform(-0.5, 1.5, n)
+					child = mother + alpha*(father - mother)
+				else:
+					child = mother.copy()
+				mutate = random.random_sample(n) < settings['mutation_rate']
+				child = child + mutate*random.normal(0.0, 0.1, n)*(high - low)
+				children.append(np.clip(child, low, high))
+			population = np.array(children)
+		best.update(history=np.array(history), evaluations=evaluator.evaluations, hits=evaluator.hits)
+		return best
+
+
+# settings of the OpenMDAO Genetic driver read by optimize_assembly, with the defaults of genetic
+DRIVER_SETTINGS = (('population_size', 60), ('generations', 50), ('crossover_rate', 0.9), ('mutation_rate', 0.1),
+	('seed', None))
+
+
+def optimize_assembly(opt, processes=None):
+	""" Runs genetic for an *_Opt assembly built with Optimiser='Genetic', in place of its
+	driver: the fixed inputs, material costs and Eta_target are read from the assembly
+	after one pass of its workflow, the population size, generations, rates and seed
+	from its Genetic driver, and the objective from its Objective_function ('X.Mass' or
+	'X_Cost.Costs'). The workflow is run again at the best design, so the assembly holds
+	its outputs. Returns the genetic result. """
+
+	core = opt.generator_core
+	model = opt.generator_name
+	component, output = opt.Objective_function.split('.')
+	if component == model + '_Cost' and output == 'Costs':
+		objective = 'Costs'
+	elif component == model and output in core.OUTPUTS:
+		objective = output
+	else:
+		raise ValueError('The genetic search minimizes an output of %s or %s_Cost.Costs, not %s'
+			% (model, model, opt.Objective_function))
+	opt.driver.workflow.run()
+	names = set(var[0] for var in core.DESIGN_VARIABLES)
+	inputs = dict((name, getattr(getattr(opt, model), name)) for name in core.INPUTS if name not in names)
+	cost_inputs = dict((name, getattr(getattr(opt, model + '_Cost'), name)) for name in core.COST_INPUTS
+		if name.startswith('C_'))
+	settings = dict((name, getattr(opt.driver, name, default)) for name, default in DRIVER_SETTINGS)
+	best = genetic(core, inputs, cost_inputs, objective, {'Eta_target': opt.Eta_target}, processes=processes,
+		**settings)
+	for name, value in best['design'].items():
+		setattr(opt, '%s_%s' % (model, name), float(value))
+	opt.driver.workflow.run()
+	return best
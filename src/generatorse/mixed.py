@@ -0,0 +1,303 @@
+"""mixed.py
+Copyright (c) NREL. All rights reserved.
+Mixed-integer optimization of the generator cores. The models round the pole
+pairs (p = round(pi*dia/(2*tau_p))), the arm counts n_r and n_s and the EESG
+field turns N_f, so a gradient driver treating them as continuous meets flat
+plateaus. Here those quantities, listed in the INTEGER_VARIABLES of a core, are
+enumerated or branched on, and the continuous design variables are optimized
+for each integer assignment (SLSQP on the core, SciPy required), the
+subproblems of one round running in parallel worker processes. Solved
+assignments are kept and reused by every branch that reaches them.
+
+	best = mixed.minimize(PMSG_arms_core, inputs, cost_inputs, {'Eta_target': 93.},
+		ranges={'p': (90, 110)}) """
+
+import importlib
+import itertools
+import multiprocessing
+import time
+from math import ceil, floor, pi
+import numpy as np
+
+from generatorse import constraints
+from generatorse.ops import SCALAR, RelaxedOps
+
+try:
+	from scipy.optimize import minimize as _minimize
+except ImportError:
+	_minimize = None
+
+METHODS = ('branch', 'enumerate')
+
+
+class Problem(object):
+
+	""" The continuous subproblem of a core for bounds of its integer quantities: the
+	design variables other than the integers (and tau_p, when the pole pairs are one
+	of them, as tau_p = pi*r_s/p) plus the integers, each within its bounds. With all
+	bounds closed on one value the integers are fixed and the model is evaluated as is;
+	otherwise they are relaxed to continuous values (RelaxedOps). The design variables of
+	INTEGER_VARIABLES left out of integers are still rounded; the pole pairs, when left
+	out, are relaxed with the integers, and the model then jumps where they round. """
+
+	def __init__(self, core, inputs, cost_inputs=None, objective='Costs', limits=None, integers=None):
+		self.core_name = core.__name__    # modules do not pickle, workers import the core by name
+		self.inputs = dict(inputs)
+		self.cost_inputs = dict(cost_inputs or {})
+		self.objective = objective
+		self.limits = dict(limits or {})
+		table = dict((var[0], var[1:]) for var in core.INTEGER_VARIABLES)
+		self.integers = tuple(integers if integers is not None else table)
+		for name in self.integers:
+			if name not in table:
+				raise ValueError('%s is not an integer variable of %s' % (name, core.__name__))
+		self.bounds = dict((name, table[name]) for name in self.integers)
+		skip = set(self.integers) | (set(['tau_p']) if 'p' in self.integers else set())
+		self.continuous = tuple(var for var in core.DESIGN_VARIABLES if var[0] not in skip)
+		self.tau_p = [var[1:] for var in core.DESIGN_VARIABLES if var[0] == 'tau_p'][0] if 'p' in self.integers else None
+		self.rounded = tuple(name for name in table if name not in self.integers and name != 'p')
+		self.evaluations = 0
+
+	@property
+	def core(self):
+		return importlib.import_module(self.core_name)
+
+	def design(self, x, assignment):
+		""" Design variables of the core from continuous values x and integer values. """
+
+		design = dict((var[0], float(value)) for var, value in zip(self.continuous, x))
+		design.update((name, float(assignment[name])) for name in self.integers if name != 'p')
+		if 'p' in self.integers:
+			design['tau_p'] = pi*design['r_s']/assignment['p']
+		return design
+
+	def values(self, design):
+		""" Continuous values and integer values of a design, the pole pairs taken from
+		r_s and tau_p. """
+
+		x = np.array([design[var[0]] for var in self.continuous], dtype=float)
+		assignment = dict((name, design[name]) for name in self.integers if name != 'p')
+		if 'p' in self.integers:
+			assignment['p'] = pi*design['r_s']/design['tau_p']
+		return x, assignment
+
+	def evaluate(self, design, relaxed=False):
+		""" Objective and normalized margins of a design: those of the core CONSTRAINTS,
+		then the bounds of tau_p when it follows from the pole pairs. """
+
+		core = self.core
+		values = dict(self.inputs)
+		values.update(design)
+		if relaxed:
+			# the other rounded design variables are rounded here, as the model would
+			for name in self.rounded:
+				values[name] = float(round(values[name]))
+		self.evaluations += 1
+		try:
+			outputs = core.evaluate(values, RelaxedOps if relaxed else SCALAR)
+		except (ValueError, TypeError, ZeroDivisionError, OverflowError):    # complex or undefined results
+			return np.nan, None
+		values.update(outputs)
+		if self.objective == 'Costs':
+			objective = core.costs(dict(outputs, **self.cost_inputs))['Costs']
+		else:
+			objective = outputs[self.objective]
+		margins = constraints.margins(core.CONSTRAINTS, values, self.limits)
+		if self.tau_p is not None:
+			low, high = self.tau_p
+			margins = np.append(margins, [(design['tau_p'] - low)/low, (high - design['tau_p'])/high])
+		return float(objective), margins
+
+	def solve(self, node, start, maxiter=100, tolerance=1e-6):
+		""" Optimum of the subproblem of node (integer -> (low, high)) from the design start. """
+
+		if _minimize is None:
+			raise ImportError('The mixed-integer search requires scipy.optimize')
+		fixed = all(low == high for low, high in node.values())
+		names = [name for name in self.integers if node[name][0] != node[name][1]]
+		low = np.array([var[1] for var in self.continuous] + [node[name][0] for name in names], dtype=float)
+		high = np.array([var[2] for var in self.continuous] + [node[name][1] for name in names], dtype=float)
+		x, assignment = self.values(start)
+		u0 = np.clip((np.append(x, [assignment[name] for name in names]) - low)/(high - low), 0.0, 1.0)
+		n = len(self.continuous)
+		last = {}
+
+		def split(u):
+			y = low + u*(high - low)
+			integers = dict((name, node[name][0]) for name in self.integers)
+			integers.update(zip(names, y[n:]))
+			return self.design(y[:n], integers), integers
+
+		def point(u):
+			key = u.tobytes()
+			if last.get('key') != key:
+				design = split(u)[0]
+				objective, margins = self.evaluate(design, relaxed=not fixed)
+				last.update(key=key, objective=objective, margins=margins)
+			return last['objective'], last['margins']
+
+		objective, margins = point(u0)
+		scale = abs(objective) if np.isfinite(objective) and objective != 0.0 else 1.0
+		count = len(self.core.CONSTRAINTS) + (2 if self.tau_p is not None else 0)
+
+		def fun(u):
+			objective = point(u)[0]
+			return objective/scale if np.isfinite(objective) else 1e6
+
+		def cons(u):
+			margins = point(u)[1]
+			return margins if margins is not None and np.all(np.isfinite(margins)) else -np.ones(count)
+
+		with np.errstate(all='ignore'):
+			solution = _minimize(fun, u0, method='SLSQP', bounds=[(0.0, 1.0)]*len(u0),
+				constraints=[{'type': 'ineq', 'fun': cons}], options={'maxiter': maxiter, 'ftol': 1e-9})
+		design, integers = split(np.clip(solution.x, 0.0, 1.0))
+		objective, margins = self.evaluate(design, relaxed=not fixed)
+		if 'p' in self.integers:
+			design['p'] = integers['p']
+		return {'node': dict(node), 'integers': integers, 'design': design,
+			'objective': None if np.isnan(objective) else objective, 'margins': margins,
+			'feasible': margins is not None and bool(np.all(margins >= -tolerance)), 'relaxed': not fixed}
+
+
+def _solve(job):
+	""" Solves one subproblem; module level, so that it can be sent to the worker processes. """
+
+	problem, node, start, maxiter, tolerance = job
+	t0 = time.time()
+	problem.evaluations = 0
+	try:
+		result = problem.solve(node, start, maxiter, tolerance)
+		result['error'] = None
+	except Exception as error:
+		result = {'node': dict(node), 'integers': None, 'design': None, 'objective': None, 'margins': None,
+			'feasible': False, 'relaxed': None, 'error': '%s: %s' % (type(error).__name__, error)}
+	result['evaluations'] = problem.evaluations
+	result['time'] = time.time() - t0
+	return result
+
+
+def _key(problem, assignment):
+	return tuple(int(round(assignment[name])) for name in problem.integers)
+
+
+def _leaf(problem, key):
+	return dict((name, (value, value)) for name, value in zip(problem.integers, key))
+
+
+def _better(result, best):
+	if best is None:
+		return True
+	if result['feasible'] != best['feasible']:
+		return result['feasible']
+	return result['objective'] < best['objective']
+
+
+def minimize(core, inputs, cost_inputs=None, limits=None, objective='Costs', integers=None, ranges=None, start=None,
+		method='branch', processes=None, maxiter=100, max_nodes=200, tolerance=1e-6, solved=None):
+	""" Minimizes objective of a core over its design variables with the quantities of
+	integers (default all its INTEGER_VARIABLES) held to integer values.
+
+	inputs holds the fixed model inputs and limits the named constraint limits, e.g.
+	{'Eta_target': 93.}; ranges narrows the integer bounds, e.g. {'p': (90, 110)}; start,
+	a design of the core, starts every subproblem (default the middle of the bounds).
+	method 'enumerate' solves every integer assignment; 'branch' runs a best-first
+	branch-and-bound on the relaxations, rounding each relaxed optimum to an assignment
+	and splitting on the most fractional integer (the widest range, halved, after an
+	infeasible relaxation), children starting from the optimum of their parent, until
+	max_nodes subproblems are solved. As the models are not convex the relaxations bound the objective
+	only approximately, so branch may miss an assignment enumerate finds. processes=1
+	solves in this process. solved, the solved entry of an earlier result, supplies
+	assignments already optimized. Returns the best assignment with its design,
+	objective, margins and feasibility, the solved assignments, and the counts of nodes
+	and model evaluations. """
+
+	if method not in METHODS:
+		raise ValueError('Unknown method %s, expected one of %s' % (method, ', '.join(METHODS)))
+	problem = Problem(core, inputs, cost_inputs, objective, limits, integers)
+	for name, bound in (ranges or {}).items():
+		if name not in problem.bounds:
+			raise ValueError('%s is not one of the integer variables %s' % (name, ', '.join(problem.integers)))
+		problem.bounds[name] = bound
+	bounds = dict((name, (int(ceil(low)), int(floor(high)))) for name, (low, high) in problem.bounds.items())
+	if start is None:
+		start = dict((var[0], 0.5*(var[1] + var[2])) for var in core.DESIGN_VARIABLES)
+		if 'p' in problem.integers:
+			# in the middle of the pole pair range
+			start['tau_p'] = pi*start['r_s']/(0.5*sum(bounds['p']))
+	solved = dict(solved or {})
+	state = {'nodes': 0, 'evaluations': 0, 'best': None}
+	pool = None if processes == 1 else multiprocessing.Pool(processes)
+
+	def run(jobs):
+		jobs = [(problem, node, node_start, maxiter, tolerance) for node, node_start in jobs]
+		results = list(map(_solve, jobs)) if pool is None else pool.map(_solve, jobs)
+		for result in results:
+			state['nodes'] += 1
+			state['evaluations'] += result['evaluations']
+		return results
+
+	def record(keys, starts):
+		keys = [key for key in dict.fromkeys(keys) if key not in solved]
+		for key, result in zip(keys, run([(_leaf(problem, key), starts[key]) for key in keys])):
+			solved[key] = result
+		for key in starts:
+			result = solved[key]
+			if result['error'] is None and result['objective'] is not None and _better(result, state['best']):
+				state['best'] = result
+
+	try:
+		if method == 'enumerate':
+			keys = list(itertools.product(*[range(bounds[name][0], bounds[name][1] + 1) for name in problem.integers]))
+			record(keys, dict((key, start) for key in keys))
+		else:
+			width = processes or multiprocessing.cpu_count()
+			queue = [(-np.inf, 0, bounds, start)]
+			order = 1
+			while queue and state['nodes'] < max_nodes:
+				queue.sort(key=lambda entry: entry[:2])
+				batch, queue = queue[:width], queue[width:]
+				results = run([(node, node_start) for _, _, node, node_start in batch])
+				leaves = {}
+				for result in results:
+					if result['error'] is not None or result['objective'] is None:
+						continue
+					best = state['best']
+					if best is not None and best['feasible'] and result['objective'] >= best['objective'] - tolerance*abs(best['objective']):
+						continue
+					# the rounded relaxed optimum is the assignment tried in this branch
+					key = _key(problem, result['integers'])
+					key = tuple(min(max(value, bounds[name][0]), bounds[name][1]) for name, value in zip(problem.integers, key))
+					leaves.setdefault(key, result['design'])
+					node = result['node']
+					open_names = [name for name in problem.integers if node[name][0] != node[name][1]]
+					if not open_names:
+						continue
+					if result['feasible']:
+						fraction = dict((name, abs(result['integers'][name] - round(result['integers'][name])))
+							for name in open_names)
+						if max(fraction.values()) <= 1e-6:
+							continue
+						name = max(open_names, key=lambda name: fraction[name])
+						value = result['integers'][name]
+						children = ((node[name][0], int(floor(value))), (int(ceil(value)), node[name][1]))
+						priority = result['objective']
+					else:
+						# no bound from an infeasible relaxation: halve the widest range, searched last
+						name = max(open_names, key=lambda name: node[name][1] - node[name][0])
+						middle = (node[name][0] + node[name][1])//2
+						children = ((node[name][0], middle), (middle + 1, node[name][1]))
+						priority = np.inf
+					for child in children:
+						queue.append((priority, order, dict(node, **{name: child}), result['design']))
+						order += 1
+				record(list(leaves), leaves)
+	finally:
+		if pool is not None:
+			pool.close()
+			pool.join()
+
+	best = dict(state['best'] or {'design': None, 'objective': None, 'margins': None, 'feasible': False,
+		'integers': None})
+	best.update(solved=solved, nodes=state['nodes'], evaluations=state['evaluations'], method=method)
+	return best
@@ -0,0 +1,131 @@
+"""multistart.py
+Copyright (c) NREL. All rights reserved.
+Multi-start optimization of the *_Opt assemblies. The gradient drivers stop
+at the local optimum nearest their starting point, so the same problem is
+solved from several starting designs drawn within the add_parameter bounds,
+in a pool of worker processes, and the optima are ranked. """
+
+import time
+import multiprocessing
+import numpy as np
+
+from generatorse import checkpoint, constraints
+
+
+def starting_points(design_variables, n, seed=None):
+	""" n designs drawn uniformly within the bounds of a DESIGN_VARIABLES table. """
+
+	random = np.random.RandomState(seed)
+	low = np.array([var[1] for var in design_variables], dtype=float)
+	high = np.array([var[2] for var in design_variables], dtype=float)
+	samples = low + random.random_sample((n, len(design_variables)))*(high - low)
+	return [dict((var[0], x) for var, x in zip(design_variables, row)) for row in samples]
+
+
+def optimum(opt, objective):
+	""" Design, objective and normalized constraint margins of an assembly after its run. """
+
+	core = opt.generator_core
+	model = opt.generator_name
+	design = dict((var[0], opt.get('%s_%s' % (model, var[0]))) for var in core.DESIGN_VARIABLES)
+	component = getattr(opt, model)
+	values = dict((name, getattr(component, name)) for name in constraints.limit_names(core.CONSTRAINTS)
+		if name != 'Eta_target')
+	margins = constraints.margins(core.CONSTRAINTS, values, {'Eta_target': opt.Eta_target})
+	return design, float(opt.get(objective)), margins
+
+
+def _optimize(job):
+	""" Builds an assembly, sets its inputs and starting design and runs the driver.
+	Module level, so that it can be sent to the worker processes. """
+
+	opt_class, optimiser, objective, inputs, start = job
+	model = opt_class.generator_name
+	result = {'start': start, 'design': None, 'objective': None, 'margins': None,
+		'feasible': False, 'error': None, 'time': 0.0}
+	t0 = time.time()
+	try:
+		opt = opt_class(optimiser, objective, 0)
+		for name, value in inputs.items():
+			setattr(opt, name, value)
+		for name, value in start.items():
+			setattr(opt, '%s_%s' % (model, name), value)
+		opt.run()
+		result['design'], result['objective'], result['margins'] = optimum(opt, objective)
+	except Exception as error:
+		result['error'] = '%s: %s' % (type(error).__name__, error)
+	result['time'] = time.time() - t0
+	return result
+
+
+def rank(results, tolerance=1e-6):
+	""" Sorts optima feasible first, then by objective; failed runs come last. A run is
+	feasible when no normalized margin is below -tolerance. """
+
+	for result in results:
+		if result['margins'] is not None:
+			result['feasible'] = bool(np.all(result['margins'] >= -tolerance))
+	def key(result):
+		if result['error'] is not None or result['objective'] is None or np.isnan(result['objective']):
+			return (2, 0.0)
+		return (0 if result['feasible'] else 1, result['objective'])
+	return sorted(results, key=key)
+
+
+def _optimize_indexed(job):
+	return job[0], _optimize(job[1])
+
+
+def multistart(opt_class, inputs, n_starts=8, optimiser='CONMINdriver', objective=None, starts=None,
+		processes=None, seed=None, tolerance=1e-6, checkpoint_path=None, checkpoint_interval=1):
+	""" Optimizes opt_class (PMSG_arms_Opt, EESG_Opt, ...) from n_starts random designs.
+
+	inputs maps the assembly variables to set before each run (Eta_target, P_rated,
+	fixed dimensions, costs and densities); objective defaults to the cost of the
+	generator. starts may list explicit starting designs instead of random ones.
+	processes=1 runs the starts in this process. With checkpoint_path the finished
+	starts are saved every checkpoint_interval runs, and resume completes the others.
+	Returns one dictionary per start with the keys start, design, objective, margins
+	(normalized, in the order of the core CONSTRAINTS), feasible, error and time,
+	best first. """
+
+	model = opt_class.generator_name
+	if objective is None:
+		objective = '%s_Cost.Costs' % model
+	if starts is None:
+		starts = starting_points(opt_class.generator_core.DESIGN_VARIABLES, n_starts, seed)
+	state = {'kind': 'multistart', 'opt_class': opt_class, 'optimiser': optimiser, 'objective': objective,
+		'inputs': inputs, 'starts': starts, 'tolerance': tolerance, 'results': {}, 'best': None}
+	return _run(state, processes, checkpoint_path, checkpoint_interval)
+
+
+def resume(checkpoint_path, processes=None, checkpoint_interval=1):
+	""" Runs the starts of the multi-start run saved at checkpoint_path that had not
+	finished, and returns the ranked optima of all of them. """
+
+	return _run(checkpoint.load(checkpoint_path, 'multistart'), processes, checkpoint_path, checkpoint_interval)
+
+
+def _run(state, processes, checkpoint_path, checkpoint_interval):
+	""" Runs the unfinished starts of state, saving it when due. """
+
+	results = state['results']
+	jobs = [(k, (state['opt_class'], state['optimiser'], state['objective'], state['inputs'], start))
+		for k, start in enumerate(state['starts']) if k not in results]
+	pool = None
+	if processes == 1:
+		finished = (_optimize_indexed(job) for job in jobs)
+	else:
+		pool = multiprocessing.Pool(processes)
+		finished = pool.imap_unordered(_optimize_indexed, jobs)
+	try:
+		for count, (k, result) in enumerate(finished, 1):
+			results[k] = result
+			if checkpoint_path and (checkpoint.due(count, checkpoint_interval) or len(results) == len(state['starts'])):
+				state['best'] = rank(list(results.values()), state['tolerance'])[0]
+				checkpoint.save(checkpoint_path, state)
+	finally:
+		if pool is not None:
+			pool.close()
+			pool.join()
+	return rank([results[k] for k in range(len(state['starts']))], state['tolerance'])
@@ -0,0 +1,71 @@
+"""operating.py
+Copyright (c) NREL. All rights reserved.
+Operating points of a variable-speed wind turbine generator and annual energy
+weighting. A wind speed distribution (Weibull) is mapped through an idealized
+power and speed curve to the rotor speed and output power of the generator,
+and the losses of an operating-map function are weighted by the hours spent
+at each wind speed, to give the annual energy loss of a design. """
+
+from math import gamma
+import numpy as np
+
+HOURS_PER_YEAR = 8760.0
+
+
+def weibull_scale(mean, shape=2.0):
+	""" Scale parameter of the Weibull distribution of the given mean wind speed. """
+
+	return mean/gamma(1.0 + 1.0/shape)
+
+
+def wind_probability(v, mean=10.0, shape=2.0):
+	""" Probability of each wind speed bin centred on the evenly spaced speeds v (m/s),
+	from the Weibull distribution of the given mean (Rayleigh for shape 2). """
+
+	v = np.asarray(v, dtype=float)
+	step = v[1] - v[0] if len(v) > 1 else 1.0
+	scale = weibull_scale(mean, shape)
+	cdf = lambda x: 1.0 - np.exp(-(np.maximum(x, 0.0)/scale)**shape)
+	return cdf(v + 0.5*step) - cdf(v - 0.5*step)
+
+
+def operating_points(v, P_rated, n_rated, v_in=3.0, v_rated=11.4, v_out=25.0, n_min=0.5):
+	""" Rotor speed (rpm) and generator output power (W) at wind speeds v: below rated,
+	power follows the cube of the wind speed at a constant tip speed ratio, with the
+	speed held above n_min times rated; above rated both are held at rated; outside
+	v_in to v_out the turbine is parked. """
+
+	v = np.asarray(v, dtype=float)
+	running = (v >= v_in) & (v <= v_out)
+	fraction = np.minimum(v/v_rated, 1.0)
+	P = np.where(running, P_rated*fraction**3, 0.0)
+	n = np.where(running, n_rated*np.maximum(fraction, n_min), 0.0)
+	return n, P
+
+
+def annual_hours(P_rated, n_rated, mean=10.0, shape=2.0, v=None, **curve):
+	""" Hours per year spent at each of the operating points of annual_energy, with the
+	rotor speed (rpm) and output power (W) of the points. """
+
+	if v is None:
+		v = np.arange(0.5, 30.0, 0.5)
+	n, P = operating_points(v, P_rated, n_rated, **curve)
+	return HOURS_PER_YEAR*wind_probability(v, mean, shape), n, P
+
+
+def annual_energy(losses, P_rated, n_rated, mean=10.0, shape=2.0, v=None, **curve):
+	""" Annual energy produced and lost by a generator. losses is a function of rotor
+	speed and output power arrays returning a dict with Losses and the loss components
+	(an operating_losses function of a core bound to a design); curve holds the
+	operating_points parameters. Returns AEP and AEL in kWh, the share of AEL, and the
+	annual energy of each loss component, in kWh. """
+
+	hours, n, P = annual_hours(P_rated, n_rated, mean, shape, v, **curve)
+	running = P > 0
+	result = losses(n[running], P[running])
+	energy = dict(('E_' + name[2:] if name.startswith('P_') else name, float(np.dot(hours[running], value))/1e3)
+		for name, value in result.items() if name.startswith('P_'))
+	energy['AEP'] = float(np.dot(hours, P))/1e3
+	energy['AEL'] = float(np.dot(hours[running], result['Losses']))/1e3
+	energy['loss_share'] = energy['AEL']/(energy['AEP'] + energy['AEL']) if energy['AEP'] > 0 else 0.0
+	return energy
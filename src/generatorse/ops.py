@@ -0,0 +1,185 @@
+"""ops.py
+Copyright (c) NREL. All rights reserved.
+Math namespaces used by the generator cores. The same equations are evaluated
+on plain floats (one design) or on NumPy arrays (a batch of designs) by passing
+a different namespace as the ``ops`` argument of a core ``evaluate`` function."""
+
+import math
+import numpy as np
+
+nan = float('nan')
+
+
+class ScalarOps(object):
+
+	""" Evaluates the generator equations on plain floats with the math module. """
+
+	sin = staticmethod(math.sin)
+	cos = staticmethod(math.cos)
+	tan = staticmethod(math.tan)
+	atan = staticmethod(math.atan)
+	sinh = staticmethod(math.sinh)
+	cosh = staticmethod(math.cosh)
+	exp = staticmethod(math.exp)
+	log = staticmethod(math.log)
+	sqrt = staticmethod(math.sqrt)
+	round = staticmethod(round)
+	round_relaxed = round    # rounded design variables whose derivative is taken as continuous
+	round_integer = round    # integer design quantities branched on by mixed.py (pole pairs, arm counts)
+
+	@staticmethod
+	def abs_smooth(x, width):
+		# |x|; only its derivative is smoothed, over ``width`` about zero
+		return abs(x)
+
+	@staticmethod
+	def where(condition, x, y):
+		return x if condition else y
+
+	@staticmethod
+	def vector(*values):
+		return np.array(values)
+
+
+def _pow(x, y):
+	# Python float power, with NaN where the scalar path would raise or go complex
+	try:
+		z = x**y
+	except (ValueError, ZeroDivisionError, OverflowError):
+		return nan
+	return z if isinstance(z, float) else nan
+
+
+def _elementwise(fn, *args):
+	# apply a scalar function element by element so results round exactly as on floats
+	args = np.broadcast_arrays(*[np.asarray(a, dtype=float) for a in args])
+	shape = args[0].shape
+	flat = [a.ravel().tolist() for a in args]
+	values = np.fromiter((fn(*v) for v in zip(*flat)), dtype=float, count=args[0].size)
+	return values.reshape(shape).view(ExactArray)
+
+
+def _safe(fn):
+	def apply(*v):
+		try:
+			return float(fn(*v))
+		except (ValueError, ZeroDivisionError, OverflowError):
+			return nan
+	return apply
+
+
+class ExactArray(np.ndarray):
+
+	""" ndarray whose power operator rounds exactly like Python floats.
+	NumPy uses its own SIMD pow and fast paths for x**2 and x**0.5, which can
+	differ from the C library pow used for floats in the last bit. """
+
+	def __pow__(self, other):
+		return _elementwise(_pow, self, other)
+
+	def __rpow__(self, other):
+		return _elementwise(_pow, other, self)
+
+
+class ArrayOps(object):
+
+	""" Evaluates the generator equations on NumPy arrays with NumPy ufuncs. """
+
+	array = np.ndarray
+	sin = staticmethod(np.sin)
+	cos = staticmethod(np.cos)
+	tan = staticmethod(np.tan)
+	atan = staticmethod(np.arctan)
+	sinh = staticmethod(np.sinh)
+	cosh = staticmethod(np.cosh)
+	exp = staticmethod(np.exp)
+	log = staticmethod(np.log)
+	sqrt = staticmethod(np.sqrt)
+
+	@staticmethod
+	def round(x):
+		# round half to even, as the NumPy ufunc does
+		return np.round(x)
+
+	round_relaxed = round
+	round_integer = round
+
+	@staticmethod
+	def abs_smooth(x, width):
+		return np.abs(x)
+
+	@classmethod
+	def where(cls, condition, x, y):
+		return np.where(condition, x, y).view(cls.array)
+
+	@classmethod
+	def asarray(cls, x):
+		return np.array(x, dtype=float).view(cls.array)
+
+	@staticmethod
+	def vector(*values):
+		values = np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in values])
+		return np.stack(values, axis=-1)
+
+
+class ExactArrayOps(ArrayOps):
+
+	""" Evaluates the generator equations on NumPy arrays, reproducing the
+	scalar (math module) results bit for bit. Transcendental functions and
+	powers are applied element by element with the same C library calls used
+	for floats; sqrt and the arithmetic operators are IEEE exact in NumPy. """
+
+	array = ExactArray
+	sin = staticmethod(lambda x: _elementwise(_safe(math.sin), x))
+	cos = staticmethod(lambda x: _elementwise(_safe(math.cos), x))
+	tan = staticmethod(lambda x: _elementwise(_safe(math.tan), x))
+	atan = staticmethod(lambda x: _elementwise(_safe(math.atan), x))
+	sinh = staticmethod(lambda x: _elementwise(_safe(math.sinh), x))
+	cosh = staticmethod(lambda x: _elementwise(_safe(math.cosh), x))
+	exp = staticmethod(lambda x: _elementwise(_safe(math.exp), x))
+	log = staticmethod(lambda x: _elementwise(_safe(math.log), x))
+	round = staticmethod(lambda x: _elementwise(_safe(round), x))
+	round_relaxed = round
+	round_integer = round
+
+
+class RelaxedOps(ScalarOps):
+
+	""" Evaluates the generator equations on plain floats with the integer design
+	quantities (pole pairs, arm counts, field turns) left continuous: the relaxation
+	solved at the nodes of a mixed-integer search. Other rounded quantities, such as
+	the EESG brush count, are still rounded. """
+
+	round_relaxed = staticmethod(float)
+	round_integer = round_relaxed
+
+
+SCALAR = ScalarOps
+
+
+def evaluate_batch(evaluate, inputs, vector_inputs=(), exact=True):
+	""" Evaluates a core ``evaluate`` function on arrays of designs.
+
+	Every entry of ``inputs`` may be a scalar or an array; arrays are broadcast
+	against each other. Entries named in ``vector_inputs`` (e.g. main_shaft_cm)
+	are shared by all designs. Returns a dict of arrays with one leading entry
+	per design; vector outputs such as I and cm have shape (n, 3). With
+	exact=False plain NumPy ufuncs are used, which is much faster but may
+	differ from the scalar path in the last bit. Designs for which the scalar
+	path would raise (e.g. a negative square root) come back as NaN. """
+
+	ops = ExactArrayOps if exact else ArrayOps
+	arrays = {}
+	for name, value in inputs.items():
+		arrays[name] = np.asarray(value, dtype=float) if name in vector_inputs else ops.asarray(value)
+	shape = np.broadcast(*[arrays[name] for name in arrays if name not in vector_inputs] + [np.empty(())]).shape
+	with np.errstate(all='ignore'):
+		outputs = evaluate(arrays, ops)
+	batch = {}
+	for name, value in outputs.items():
+		value = np.asarray(value, dtype=float)
+		if value.ndim > len(shape):
+			batch[name] = np.array(np.broadcast_to(value, shape + value.shape[-1:]))
+		else:
+			batch[name] = np.array(np.broadcast_to(value, shape))
+	return batch
@@ -0,0 +1,109 @@
+"""profiling.py
+Copyright (c) NREL. All rights reserved.
+Optional timers for the sections of the generator cores: electromagnetic design
+(em), winding and inductance (winding), losses, structural deflection (structure)
+and mass and inertia (mass). A section timed twice within one function counts a
+single call; a section split across the stages of a core counts one call per
+stage (two per PMSG_arms evaluation for structure and mass), so that a staged
+partial run is counted too. They are off by default; a disabled timer costs one
+function call and a comparison per section. """
+
+from timeit import default_timer
+
+SECTIONS = ('em', 'winding', 'losses', 'structure', 'mass')
+
+enabled = False
+
+# (model, section) -> [calls, seconds]
+totals = {}
+
+
+def start():
+	""" Stamp at the start of a timed function, None when the timers are off. """
+
+	if enabled:
+		return default_timer()
+	return None
+
+
+def lap(stamp, model, section, calls=1):
+	""" Adds the time since stamp to the section of model and returns a new stamp; calls=0
+	for the second lap of a section within one function. """
+
+	if stamp is None:
+		return None
+	now = default_timer()
+	total = totals.get((model, section))
+	if total is None:
+		total = totals[(model, section)] = [0, 0.0]
+	total[0] += calls
+	total[1] += now - stamp
+	return default_timer()
+
+
+def enable(clear=True):
+	""" Switches the timers on, by default clearing the previous totals. """
+
+	global enabled
+	if clear:
+		reset()
+	enabled = True
+
+
+def disable():
+	global enabled
+	enabled = False
+
+
+def reset():
+	totals.clear()
+
+
+class profile(object):
+	""" Context manager timing the sections evaluated within it:
+
+		with profiling.profile() as timers:
+			opt.run()
+		print(timers.report())
+	"""
+
+	def __enter__(self):
+		self.was_enabled = enabled
+		enable()
+		return self
+
+	def __exit__(self, *args):
+		if not self.was_enabled:
+			disable()
+		self.rows = rows()
+		return False
+
+	def report(self):
+		return report(self.rows)
+
+
+def rows():
+	""" One dictionary per timed section with the keys model, section, calls, seconds
+	and share (of the time of the model), by model and in the order of SECTIONS. """
+
+	result = []
+	for model in sorted(set(key[0] for key in totals)):
+		total = sum(seconds for (name, section), (calls, seconds) in totals.items() if name == model)
+		for section in SECTIONS:
+			if (model, section) in totals:
+				calls, seconds = totals[(model, section)]
+				result.append({'model': model, 'section': section, 'calls': calls, 'seconds': seconds,
+					'share': seconds/total if total > 0 else 0.0})
+	return result
+
+
+def report(table=None):
+	""" Formatted table of the section timings. """
+
+	if table is None:
+		table = rows()
+	lines = ['%-10s %-10s %10s %12s %10s %7s' % ('model', 'section', 'calls', 'seconds', 'us/call', 'share')]
+	for row in table:
+		lines.append('%-10s %-10s %10d %12.6f %10.2f %6.1f%%' % (row['model'], row['section'], row['calls'],
+			row['seconds'], 1e6*row['seconds']/max(row['calls'], 1), 100.*row['share']))
+	return '\n'.join(lines)
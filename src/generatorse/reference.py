@@ -0,0 +1,31 @@
+"""reference.py
+Copyright (c) NREL. All rights reserved.
+Core inputs of the 5 MW reference designs of the *_Opt_example functions, used
+by the benchmarks and the unit tests. """
+
+import numpy as np
+
+PMSG_ARMS = dict(r_s=3.26, l_s=1.6, h_s=0.07, tau_p=0.08, h_m=0.009, h_ys=0.075, h_yr=0.075, t=0.075,
+	n_s=5., b_st=0.48, n_r=5., b_r=0.53, d_r=0.7, d_s=0.35, t_wr=0.06, t_ws=0.06, R_o=0.43,
+	machine_rating=5.0e6, n_nom=12.1, Torque=4.143289e6,
+	rho_Fe=7700., rho_Fes=7850., rho_Copper=8900., rho_PM=7450.,
+	main_shaft_cm=np.array([0.0, 0.0, 0.0]), main_shaft_length=2.0)
+
+PMSG_DISC = dict(r_s=3.49, l_s=1.5, h_s=0.06, tau_p=0.07, h_m=0.0105, h_ys=0.085, h_yr=0.055,
+	n_s=5., b_st=0.46, t_d=0.105, d_s=0.35, t_ws=0.15, R_o=0.43,
+	machine_rating=5.0e6, n_nom=12.1, Torque=4.143289e6,
+	rho_Fe=7700., rho_Fes=7850., rho_Copper=8900., rho_PM=7450.,
+	main_shaft_cm=np.array([0.0, 0.0, 0.0]), main_shaft_length=2.0)
+
+EESG = dict(r_s=3.2, l_s=1.4, h_s=0.06, tau_p=0.17, I_f=69., N_f=100., h_ys=0.13, h_yr=0.12,
+	n_s=5., b_st=0.47, n_r=5., b_r=0.48, d_r=0.51, d_s=0.4, t_wr=0.14, t_ws=0.07, R_o=0.43,
+	machine_rating=5.0e6, n_nom=12.1, Torque=4.143289e6,
+	rho_Fe=7700., rho_Fes=7850., rho_Copper=8900.)
+
+DFIG = dict(r_s=0.61, l_s=0.49, h_s=0.08, h_r=0.1, I_0=40., B_symax=1.3, S_Nmax=-0.2,
+	machine_rating=5.0e6, n_nom=1200., Gearbox_efficiency=0.955, rho_Fe=7700., rho_Copper=8900.,
+	highSpeedSide_cm=np.array([0.0, 0.0, 0.0]), highSpeedSide_length=2.0)
+
+SCIG = dict(r_s=0.55, l_s=1.3, h_s=0.09, h_r=0.05, I_0=140., B_symax=1.4,
+	machine_rating=5.0e6, n_nom=1200., Gearbox_efficiency=0.955, rho_Fe=7700., rho_Copper=8900.,
+	highSpeedSide_cm=np.array([0.0, 0.0, 0.0]), highSpeedSide_length=2.0)
@@ -0,0 +1,220 @@
+"""results.py
+Copyright (c) NREL. All rights reserved.
+Streaming result files for large sweeps. Records of many designs are
+appended chunk by chunk under a fixed schema (every input and output of a
+core, the material cost, the normalized constraint margins, with units and
+limits), either as one raw float64 file per column or as CSV, so that the
+memory held does not grow with the number of designs written. """
+
+import os
+import json
+import numpy as np
+
+from generatorse import doe
+
+# three-component outputs, stored as name[0], name[1], name[2]
+VECTOR_OUTPUTS = ('I', 'cm')
+
+# SI units of the core variables, as computed; counts and ratios are '-'
+_UNIT_NAMES = (
+	('m', 'r_s l_s h_s tau_p h_m h_ys h_yr h_r d_s t_ws b_st d_r t_wr b_r t t_s t_d R_o R_out r_r h_p '
+		'b_p b_s b_t b_m b_trmin b_tr u_Ar y_Ar z_A_r u_As y_As z_A_s u_all_r u_all_s y_all z_all_r z_all_s '
+		'b_all_r b_all_s main_shaft_length highSpeedSide_length main_shaft_cm highSpeedSide_cm cm'),
+	('m**2', 'A_bar'),
+	('m**3', 'TC1 TC2 TC3'),
+	('mm**2', 'A_Cuscalc A_Curcalc'),
+	('T', 'B_symax B_tmax B_rymax B_smax B_pm1 B_g B_g1 B_tsmax B_trmax B_gfm B_pc'),
+	('W', 'machine_rating Losses'),
+	('rpm', 'n_nom'),
+	('N*m', 'Torque'),
+	('V', 'E_p E_s'),
+	('A', 'I_s I_f I_0'),
+	('A/m', 'A_1'),
+	('A/mm**2', 'J_s J_r J_f'),
+	('Hz', 'f'),
+	('ohm', 'R_s R_r R_R'),
+	('H', 'L_s L_m L_sm L_r'),
+	('kg', 'Mass mass_PM Copper Iron Structural_mass Active_mass'),
+	('kg*m**2', 'I'),
+	('kg/m**3', 'rho_Fe rho_Fes rho_Copper rho_PM'),
+	('USD/kg', 'C_Cu C_Fe C_Fes C_PM'),
+	('USD', 'Costs'),
+	('%', 'gen_eff Overall_eff Power_ratio'))
+
+UNITS = dict((name, unit) for unit, names in _UNIT_NAMES for name in names.split())
+
+
+def constraint_name(constraint):
+	""" Column name of the margin of a constraint, e.g. 'margin:B_smax<B_g'. """
+	return 'margin:%s%s%s' % constraint
+
+
+def variables(core):
+	""" Inputs and outputs of a core, once each (EESG returns its rounded N_f as an output). """
+	names = []
+	for name in core.INPUTS + core.OUTPUTS:
+		if name not in names:
+			names.append(name)
+	return names
+
+
+def schema(core, costs=True):
+	""" Columns of a result file of a core, as (name, unit) pairs: the inputs, the
+	outputs, Costs, one margin per entry of CONSTRAINTS and the feasible flag. """
+
+	columns = []
+	for name in variables(core):
+		unit = UNITS.get(name, '-')
+		if name in core.VECTOR_INPUTS or name in VECTOR_OUTPUTS:
+			columns.extend(('%s[%d]' % (name, k), unit) for k in range(3))
+		else:
+			columns.append((name, unit))
+	if costs:
+		columns.append(('Costs', UNITS['Costs']))
+	columns.extend((constraint_name(constraint), '-') for constraint in core.CONSTRAINTS)
+	columns.append(('feasible', '-'))
+	return columns
+
+
+class ResultWriter(object):
+
+	""" Appends records of a core to path under the schema of that core.
+
+	format='columns' makes path a directory holding schema.json and one raw float64
+	file per column, readable column by column with read(path, names); format='csv'
+	writes a CSV file whose '#' header lines give the units and the limits. Records
+	are dicts of arrays such as doe.evaluate returns; inputs missing from a record are
+	taken from the fixed inputs. Rows are buffered and written every chunk_size rows. """
+
+	def __init__(self, path, core, inputs=None, limits=None, format='columns', costs=True, chunk_size=10000):
+		if format not in ('columns', 'csv'):
+			raise ValueError('Unknown result format %s, expected columns or csv' % format)
+		self.path = path
+		self.core = core
+		self.inputs = dict(inputs or {})
+		self.format = format
+		self.chunk_size = chunk_size
+		self.columns = schema(core, costs)
+		self.rows = 0
+		self._buffer = []
+		self._buffered = 0
+		self.meta = {'core': core.__name__, 'columns': [name for name, unit in self.columns],
+			'units': [unit for name, unit in self.columns], 'constraints': [list(c) for c in core.CONSTRAINTS],
+			'limits': dict(limits or {}), 'rows': 0}
+		if format == 'columns':
+			if not os.path.isdir(path):
+				os.makedirs(path)
+			self._files = [open(os.path.join(path, 'c%04d.f8' % k), 'wb') for k in range(len(self.columns))]
+			self._write_meta()
+		else:
+			self._file = open(path, 'w')
+			self._file.write('# core: %s\n' % core.__name__)
+			self._file.write('# units: %s\n' % ','.join(self.meta['units']))
+			self._file.write('# limits: %s\n' % json.dumps(self.meta['limits'], sort_keys=True))
+			self._file.write(','.join(self.meta['columns']) + '\n')
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *args):
+		self.close()
+
+	def _write_meta(self):
+		with open(os.path.join(self.path, 'schema.json'), 'w') as meta:
+			json.dump(self.meta, meta, indent=1)
+
+	def _table(self, record):
+		""" Record as an array (rows, columns) in schema order. """
+
+		n = len(record['margins'])
+		table = np.empty((n, len(self.columns)))
+		k = 0
+		for name in variables(self.core):
+			value = record[name] if name in record else self.inputs.get(name, np.nan)
+			if name in self.core.VECTOR_INPUTS or name in VECTOR_OUTPUTS:
+				table[:, k:k + 3] = np.broadcast_to(value, (n, 3))
+				k += 3
+			else:
+				table[:, k] = value
+				k += 1
+		if self.meta['columns'][k] == 'Costs':
+			table[:, k] = record.get('Costs', np.nan)
+			k += 1
+		table[:, k:k + len(self.core.CONSTRAINTS)] = record['margins']
+		table[:, -1] = record['feasible']
+		return table
+
+	def write(self, record):
+		""" Buffers a record and writes the buffer out once it holds chunk_size rows. """
+
+		table = self._table(record)
+		self._buffer.append(table)
+		self._buffered += len(table)
+		if self._buffered >= self.chunk_size:
+			self.flush()
+
+	def flush(self):
+		if not self._buffer:
+			return
+		table = np.concatenate(self._buffer)
+		self._buffer = []
+		self._buffered = 0
+		if self.format == 'columns':
+			for k, column in enumerate(self._files):
+				np.ascontiguousarray(table[:, k]).tofile(column)
+		else:
+			np.savetxt(self._file, table, delimiter=',', fmt='%.17g')
+		self.rows += len(table)
+
+	def close(self):
+		self.flush()
+		self.meta['rows'] = self.rows
+		if self.format == 'columns':
+			for column in self._files:
+				column.close()
+			self._files = []
+			self._write_meta()
+		elif not self._file.closed:
+			self._file.close()
+
+
+def read(path, names=None):
+	""" Columns of a result file as a dict of arrays, with its schema under the key
+	'schema'. Column files are memory-mapped, so names may select a few columns of a
+	file too large to load. """
+
+	if os.path.isdir(path):
+		with open(os.path.join(path, 'schema.json')) as meta:
+			meta = json.load(meta)
+		result = {'schema': meta}
+		for k, name in enumerate(meta['columns']):
+			if names is None or name in names:
+				result[name] = np.memmap(os.path.join(path, 'c%04d.f8' % k), dtype=float, mode='r',
+					shape=(meta['rows'],)) if meta['rows'] else np.empty(0)
+		return result
+	header = {}
+	with open(path) as csv:
+		for line in csv:
+			if not line.startswith('#'):
+				break
+			key, value = line[1:].split(':', 1)
+			header[key.strip()] = value.strip()
+		columns = line.strip().split(',')
+		data = np.loadtxt(csv, delimiter=',', ndmin=2).reshape(-1, len(columns))
+	meta = {'core': header.get('core'), 'columns': columns, 'units': header.get('units', '').split(','),
+		'limits': json.loads(header.get('limits', '{}')), 'rows': len(data)}
+	result = {'schema': meta}
+	for k, name in enumerate(columns):
+		if names is None or name in names:
+			result[name] = data[:, k]
+	return result
+
+
+def write_sweep(path, core, inputs, n=1000, method='lhs', cost_inputs=None, limits=None, format='columns',
+		chunk_size=10000, seed=None, levels=3, exact=True):
+	""" Runs doe.iter_sweep and streams its chunks to a result file; returns the rows written. """
+
+	with ResultWriter(path, core, inputs, limits, format, cost_inputs is not None, chunk_size) as writer:
+		for record in doe.iter_sweep(core, inputs, n, method, cost_inputs, limits, chunk_size, seed, levels, exact):
+			writer.write(record)
+	return writer.rows
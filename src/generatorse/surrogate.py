@@ -0,0 +1,290 @@
+"""surrogate.py
+Copyright (c) NREL. All rights reserved.
+Surrogate models of the generator cores for pre-screening designs. A Kriging,
+radial basis function or polynomial model is trained on a design-of-experiments
+sweep of a core (PMSG_arms by default in the examples) and predicts Mass, Costs,
+gen_eff and the constraint margins. Large candidate sets are ranked on the
+surrogate, the most promising candidates are verified with the full model, and
+the verified designs start the optimization of the *_Opt assembly.
+
+	results = surrogate.optimize(PMSG_arms_Opt, opt_inputs, core_inputs, cost_inputs,
+		limits={'Eta_target': 93.}) """
+
+import itertools
+import numpy as np
+
+from generatorse import doe, genetic, multistart
+
+try:
+	from scipy.optimize import minimize
+except ImportError:
+	minimize = None    # Kriging then keeps one correlation length for all variables
+
+KINDS = ('kriging', 'rbf', 'polynomial')
+
+OUTPUTS = ('Mass', 'Costs', 'gen_eff')
+
+
+class Polynomial(object):
+
+	""" Least-squares polynomial response surface of the given degree, with all
+	interaction terms. """
+
+	def __init__(self, degree=2):
+		self.degree = degree
+
+	def _terms(self, x):
+		columns = [np.ones(len(x))]
+		for degree in range(1, self.degree + 1):
+			for combination in itertools.combinations_with_replacement(range(x.shape[1]), degree):
+				columns.append(np.prod(x[:, combination], axis=1))
+		return np.array(columns).T
+
+	def fit(self, x, y):
+		self.coefficients = np.linalg.lstsq(self._terms(x), y, rcond=None)[0]
+		return self
+
+	def predict(self, x):
+		return self._terms(x).dot(self.coefficients)
+
+
+class RBF(object):
+
+	""" Radial basis function interpolation with a linear polynomial tail; kernel is
+	'cubic' or 'thin_plate'. smoothing > 0 relaxes the interpolation for noisy data. """
+
+	def __init__(self, kernel='cubic', smoothing=0.0):
+		if kernel not in ('cubic', 'thin_plate'):
+			raise ValueError('Unknown kernel %s, expected cubic or thin_plate' % kernel)
+		self.kernel = kernel
+		self.smoothing = smoothing
+
+	def _phi(self, x, centres):
+		r = np.sqrt(np.maximum(_squared_distances(x, centres), 0.0))
+		if self.kernel == 'cubic':
+			return r**3
+		return np.where(r > 0.0, r**2*np.log(np.where(r > 0.0, r, 1.0)), 0.0)
+
+	def fit(self, x, y):
+		n, d = x.shape
+		tail = np.hstack([np.ones((n, 1)), x])
+		system = np.zeros((n + d + 1, n + d + 1))
+		system[:n, :n] = self._phi(x, x) + self.smoothing*np.eye(n)
+		system[:n, n:] = tail
+		system[n:, :n] = tail.T
+		rhs = np.vstack([y, np.zeros((d + 1, y.shape[1]))])
+		try:
+			solution = np.linalg.solve(system, rhs)
+		except np.linalg.LinAlgError:
+			solution = np.linalg.lstsq(system, rhs, rcond=None)[0]
+		self.centres = x
+		self.weights = solution[:n]
+		self.tail = solution[n:]
+		return self
+
+	def predict(self, x):
+		return self._phi(x, self.centres).dot(self.weights) + np.hstack([np.ones((len(x), 1)), x]).dot(self.tail)
+
+
+class Kriging(object):
+
+	""" Ordinary Kriging with a Gaussian correlation, one correlation parameter per
+	variable fitted by maximum likelihood (with SciPy) and shared by the outputs. The
+	parameters stay above 0.1 on the unit-scaled inputs, where the correlation matrix
+	becomes too ill-conditioned to interpolate. """
+
+	def __init__(self, theta=None, nugget=1e-10):
+		self.theta = theta
+		self.nugget = nugget
+
+	def _likelihood(self, log_theta, x, y):
+		""" Concentrated negative log-likelihood and the factors needed to predict. """
+
+		n = len(x)
+		theta = 10.0**np.broadcast_to(log_theta, (x.shape[1],))
+		R = np.exp(-_squared_distances(x*np.sqrt(theta), x*np.sqrt(theta))) + self.nugget*np.eye(n)
+		try:
+			L = np.linalg.cholesky(R)
+		except np.linalg.LinAlgError:
+			return np.inf, None
+		solve = lambda b: np.linalg.solve(L.T, np.linalg.solve(L, b))
+		R_inv_one = solve(np.ones(n))
+		mean = R_inv_one.dot(y)/R_inv_one.sum()
+		gamma = solve(y - mean)
+		variance = np.maximum(np.sum((y - mean)*gamma, axis=0)/n, 1e-300)
+		value = 0.5*n*np.sum(np.log(variance)) + y.shape[1]*np.sum(np.log(np.diag(L)))
+		return value, (theta, mean, gamma, variance, L, R_inv_one)
+
+	def fit(self, x, y):
+		if self.theta is not None:
+			log_theta = np.log10(np.broadcast_to(self.theta, (x.shape[1],)))
+		else:
+			# one length for all variables on a coarse grid, then one per variable
+			grid = np.linspace(-1.0, 2.0, 13)
+			log_theta = np.full(x.shape[1], grid[np.argmin([self._likelihood(t, x, y)[0] for t in grid])])
+			if minimize is not None:
+				result = minimize(lambda t: self._likelihood(t, x, y)[0], log_theta, method='L-BFGS-B',
+					bounds=[(-1.0, 3.0)]*x.shape[1], options={'maxiter': 50})
+				if np.isfinite(result.fun):
+					log_theta = result.x
+		value, factors = self._likelihood(log_theta, x, y)
+		if factors is None:
+			raise np.linalg.LinAlgError('Kriging correlation matrix is not positive definite, raise the nugget')
+		self.theta, self.mean, self.gamma, self.variance, self.L, self.R_inv_one = factors
+		self.x = x
+		return self
+
+	def _correlation(self, x):
+		scale = np.sqrt(self.theta)
+		return np.exp(-_squared_distances(x*scale, self.x*scale))
+
+	def predict(self, x):
+		return self.mean + self._correlation(x).dot(self.gamma)
+
+	def mse(self, x):
+		""" Mean squared prediction error of each output at x, (n, outputs). """
+
+		r = self._correlation(x)
+		v = np.linalg.solve(self.L, r.T)
+		u = 1.0 - r.dot(self.R_inv_one)
+		spread = 1.0 - np.sum(v**2, axis=0) + u**2/self.R_inv_one.sum()
+		return np.maximum(spread, 0.0)[:, None]*self.variance
+
+
+def _squared_distances(x, y):
+	return np.maximum(np.sum(x**2, axis=1)[:, None] + np.sum(y**2, axis=1)[None, :] - 2.0*x.dot(y.T), 0.0)
+
+
+def model(kind='kriging', **options):
+	""" A Kriging, RBF or Polynomial model by name. """
+
+	if kind == 'kriging':
+		return Kriging(**options)
+	if kind == 'rbf':
+		return RBF(**options)
+	if kind == 'polynomial':
+		return Polynomial(**options)
+	raise ValueError('Unknown surrogate %s, expected one of %s' % (kind, ', '.join(KINDS)))
+
+
+class Surrogate(object):
+
+	""" Predicts outputs (those present in the training record) and the normalized
+	margins of the CONSTRAINTS of a core from its design variables. Inputs are scaled
+	to the DESIGN_VARIABLES bounds; outputs positive over the training set are fitted
+	in logarithms, and margins are clipped to +-margin_clip, since only their sign
+	near zero matters for screening. """
+
+	def __init__(self, core, kind='kriging', outputs=OUTPUTS, margin_clip=1.0, **options):
+		self.core = core
+		self.kind = kind
+		self.outputs = outputs
+		self.margin_clip = margin_clip
+		self.options = options
+		self.low = np.array([var[1] for var in core.DESIGN_VARIABLES], dtype=float)
+		self.high = np.array([var[2] for var in core.DESIGN_VARIABLES], dtype=float)
+
+	def _unit(self, designs):
+		return (np.atleast_2d(np.asarray(designs, dtype=float)) - self.low)/(self.high - self.low)
+
+	def _targets(self, record):
+		columns = [record[name] for name in self.names]
+		return np.column_stack(columns + [np.clip(record['margins'], -self.margin_clip, self.margin_clip)])
+
+	def fit(self, record):
+		""" Trains on a doe.evaluate or doe.sweep record, leaving out failed designs. """
+
+		self.names = tuple(name for name in self.outputs if name in record)
+		x = np.column_stack([record[var[0]] for var in self.core.DESIGN_VARIABLES])
+		y = self._targets(record)
+		valid = np.all(np.isfinite(y), axis=1)
+		x, y = self._unit(x[valid]), y[valid]
+		self.log = np.zeros(y.shape[1], dtype=bool)
+		self.log[:len(self.names)] = np.all(y[:, :len(self.names)] > 0.0, axis=0)
+		y = np.where(self.log, np.log(np.where(self.log, y, 1.0)), y)
+		self.shift = y.mean(axis=0)
+		self.scale = np.where(y.std(axis=0) > 0.0, y.std(axis=0), 1.0)
+		self.model = model(self.kind, **self.options).fit(x, (y - self.shift)/self.scale)
+		self.samples = int(valid.sum())
+		return self
+
+	def predict(self, designs, chunk_size=5000):
+		""" Predicted outputs, margins (n, constraints) and feasible flag of designs (n, variables). """
+
+		designs = np.atleast_2d(np.asarray(designs, dtype=float))
+		y = np.vstack([self.model.predict(self._unit(designs[start:start + chunk_size]))
+			for start in range(0, len(designs), chunk_size)])*self.scale + self.shift
+		y = np.where(self.log, np.exp(np.where(self.log, y, 0.0)), y)
+		predicted = dict((name, y[:, k]) for k, name in enumerate(self.names))
+		predicted['margins'] = np.clip(y[:, len(self.names):], -self.margin_clip, self.margin_clip)
+		predicted['feasible'] = np.all(predicted['margins'] >= 0.0, axis=1)
+		return predicted
+
+	def score(self, record):
+		""" Coefficient of determination of each output on a record of full-model designs,
+		and of each margin (clipped as in training), as 'margins'. """
+
+		designs = np.column_stack([record[var[0]] for var in self.core.DESIGN_VARIABLES])
+		predicted = self.predict(designs)
+		y = self._targets(record)
+		p = np.column_stack([predicted[name] for name in self.names] + [predicted['margins']])
+		valid = np.all(np.isfinite(y), axis=1)
+		y, p = y[valid], p[valid]
+		spread = np.sum((y - y.mean(axis=0))**2, axis=0)
+		r2 = 1.0 - np.sum((y - p)**2, axis=0)/np.where(spread > 0.0, spread, 1.0)
+		scores = dict((name, r2[k]) for k, name in enumerate(self.names))
+		scores['margins'] = r2[len(self.names):]
+		return scores
+
+
+def train(core, inputs, n=200, kind='kriging', cost_inputs=None, limits=None, method='lhs', seed=None, **options):
+	""" Surrogate of core trained on a sweep of n full-model designs within its bounds;
+	the sweep is kept as the training attribute. """
+
+	record = doe.sweep(core, inputs, n, method, cost_inputs, limits, seed=seed)
+	surrogate = Surrogate(core, kind, **options).fit(record)
+	surrogate.training = record
+	return surrogate
+
+
+def screen(surrogate, inputs, cost_inputs=None, limits=None, n_candidates=10000, n_verify=20, objective='Costs',
+		safety=0.0, method='lhs', seed=None):
+	""" Ranks n_candidates designs on the surrogate, feasible ones by objective (with
+	predicted margins of at least safety), and verifies the n_verify best with the full
+	model. Returns the doe.evaluate record of the verified designs, best first, with the
+	predicted objective as 'predicted'. """
+
+	if objective not in surrogate.names:
+		raise ValueError('The surrogate was not trained on %s, it predicts %s (Costs needs cost_inputs in train)'
+			% (objective, ', '.join(surrogate.names)))
+	core = surrogate.core
+	candidates = doe.samples(core.DESIGN_VARIABLES, n_candidates, method, seed)
+	predicted = surrogate.predict(candidates)
+	best = genetic.order(predicted[objective], predicted['margins'] - safety)[:n_verify]
+	record = doe.evaluate(core, inputs, candidates[best], cost_inputs, limits)
+	record['predicted'] = predicted[objective][best]
+	ranking = genetic.order(record[objective], record['margins'])
+	return dict((name, values[ranking]) for name, values in record.items())
+
+
+def starts(record, core, n=4):
+	""" The first n designs of a record as starting points for multistart. """
+
+	return [dict((var[0], float(record[var[0]][k])) for var in core.DESIGN_VARIABLES)
+		for k in range(min(n, len(record['feasible'])))]
+
+
+def optimize(opt_class, opt_inputs, inputs, cost_inputs=None, limits=None, n_train=200, n_candidates=10000,
+		n_verify=20, n_starts=4, kind='kriging', objective='Costs', optimiser='CONMINdriver', processes=None,
+		seed=None, **options):
+	""" Optimizes opt_class (PMSG_arms_Opt, ...) from the best verified designs of a
+	surrogate screen. inputs are the fixed inputs of the core and opt_inputs those of
+	the assembly, as for multistart. Returns the ranked multistart results. """
+
+	core = opt_class.generator_core
+	surrogate = train(core, inputs, n_train, kind, cost_inputs, limits, seed=seed, **options)
+	verified = screen(surrogate, inputs, cost_inputs, limits, n_candidates, n_verify, objective, seed=seed)
+	objective_path = '%s_Cost.Costs' % opt_class.generator_name if objective == 'Costs' else \
+		'%s.%s' % (opt_class.generator_name, objective)
+	return multistart.multistart(opt_class, opt_inputs, optimiser=optimiser, objective=objective_path,
+		starts=starts(verified, core, n_starts), processes=processes)
@@ -0,0 +1,206 @@
+"""trace.py
+Copyright (c) NREL. All rights reserved.
+Convergence traces of the *_Opt assemblies. While a Trace is active it counts the
+model (execute) and gradient (provideJ) evaluations of the generator component
+and records, at each pass through the workflow, the objective, the largest
+normalized constraint violation and the design vector, so that the drivers can
+be compared on the same problem.
+
+	with trace.Trace(opt) as history:
+		opt.run()
+	history.save('EESG_CONMIN.npz') """
+
+import time
+import numpy as np
+
+from generatorse import constraints
+
+OPTIMISERS = ('CONMINdriver', 'SLSQPdriver', 'COBYLAdriver', 'NEWSUMTdriver')
+
+COLUMNS = ('evaluations', 'gradients', 'objective', 'max_violation', 'time')
+
+
+class Counter(object):
+
+	""" Counts the execute (model) and provideJ (gradient) calls of one component while
+	active, by wrapping the bound methods of that instance only, so that other instances
+	of its class are not counted. hook, if given, is called with the method name after
+	each counted call. """
+
+	def __init__(self, component, hook=None):
+		self.component = component
+		self.hook = hook
+		self.counts = {'execute': 0, 'provideJ': 0}
+		self.originals = []
+
+	def __enter__(self):
+		try:
+			for name in sorted(self.counts):
+				if hasattr(self.component, name):
+					original = self.component.__dict__.get(name)
+					setattr(self.component, name, self._counted(name, getattr(self.component, name)))
+					self.originals.append((name, original))
+		except Exception:
+			self.__exit__()
+			raise
+		return self
+
+	def __exit__(self, *args):
+		while self.originals:
+			name, original = self.originals.pop()
+			if original is None:
+				delattr(self.component, name)
+			else:
+				setattr(self.component, name, original)
+		return False
+
+	def _counted(self, name, method):
+		def counted(*args, **kwargs):
+			self.counts[name] += 1
+			result = method(*args, **kwargs)
+			if self.hook is not None:
+				self.hook(name)
+			return result
+		return counted
+
+
+class Trace(object):
+
+	""" Records the workflow passes of an assembly with generator_core and generator_name,
+	while active. There is one row per model evaluation; the gradients column counts the
+	gradient evaluations so far, so that a new value marks a new iteration of a gradient
+	driver. Only the components of this assembly are counted. """
+
+	def __init__(self, opt, objective=None):
+		self.opt = opt
+		self.model = opt.generator_name
+		self.core = opt.generator_core
+		self.objective = objective or getattr(opt, 'Objective_function', '') or '%s_Cost.Costs' % self.model
+		driver = getattr(opt, 'driver', None)
+		self.optimiser = type(driver).__name__ if driver is not None else ''
+		self.names = tuple(var[0] for var in self.core.DESIGN_VARIABLES)
+		self.constraints = constraints.compiled(self.core.CONSTRAINTS)
+		self.component = getattr(opt, self.model)
+		self.cost = getattr(opt, self.model + '_Cost', None)
+		self.evaluations = 0
+		self.gradients = 0
+		self.rows = []
+		self.designs = []
+		self.counters = []
+		self.t0 = None
+
+	def __enter__(self):
+		self.t0 = time.time()
+		counters = [Counter(self.component, self._model_called)]
+		if self.cost is not None:
+			# the objective is read once the cost component has run on the new design
+			counters.append(Counter(self.cost, self._cost_called))
+		try:
+			for counter in counters:
+				self.counters.append(counter.__enter__())
+		except Exception:
+			self.__exit__()
+			raise
+		return self
+
+	def __exit__(self, *args):
+		while self.counters:
+			self.counters.pop().__exit__()
+		return False
+
+	def _model_called(self, name):
+		if name == 'provideJ':
+			self.gradients += 1
+		else:
+			self.evaluations += 1
+			if self.cost is None:
+				self._append()
+
+	def _cost_called(self, name):
+		if name == 'execute':
+			self._append()
+
+	def _append(self):
+		component = self.component
+		values = dict((name, getattr(component, name)) for name in constraints.limit_names(self.core.CONSTRAINTS)
+			if name != 'Eta_target')
+		limits = {'Eta_target': getattr(self.opt, 'Eta_target', 0.0)}
+		try:
+			objective = float(self.opt.get(self.objective))
+		except Exception:
+			objective = np.nan
+		self.rows.append((self.evaluations, self.gradients, objective,
+			float(self.constraints.max_violation(values, limits)), time.time() - self.t0))
+		self.designs.append([float(getattr(component, name)) for name in self.names])
+
+	def table(self):
+		""" Dictionary of arrays: the COLUMNS, design (one column per name) and names. """
+
+		rows = np.array(self.rows, dtype=float).reshape(-1, len(COLUMNS))
+		table = dict((name, rows[:, k]) for k, name in enumerate(COLUMNS))
+		table['design'] = np.array(self.designs, dtype=float).reshape(-1, len(self.names))
+		table['names'] = self.names
+		return table
+
+	def summary(self, tolerance=1e-6):
+		""" Counts, final objective and violation, and the evaluations needed to come
+		within 0.1 % of the final objective while feasible. """
+
+		table = self.table()
+		summary = {'model': self.model, 'optimiser': self.optimiser, 'objective': np.nan,
+			'max_violation': np.nan, 'evaluations': self.evaluations, 'gradients': self.gradients,
+			'passes': len(self.rows), 'evaluations_to_converge': None, 'time': 0.0}
+		if self.rows:
+			final = table['objective'][-1]
+			summary.update(objective=final, max_violation=table['max_violation'][-1], time=table['time'][-1])
+			close = (table['max_violation'] <= tolerance) & (np.abs(table['objective'] - final) <= 1e-3*abs(final))
+			if close.any():
+				summary['evaluations_to_converge'] = int(table['evaluations'][np.argmax(close)])
+		return summary
+
+	def save(self, path):
+		""" Writes the trace to a compressed .npz file, read back by load. """
+
+		table = self.table()
+		table['names'] = np.array(self.names)
+		table['model'] = np.array(self.model)
+		table['optimiser'] = np.array(self.optimiser)
+		table['objective_name'] = np.array(self.objective)
+		np.savez_compressed(path, **table)
+
+
+def load(path):
+	""" The table of a trace written by Trace.save, with model, optimiser and
+	objective_name as strings. """
+
+	with np.load(path) as data:
+		table = dict((name, data[name]) for name in data.files)
+	for name in ('model', 'optimiser', 'objective_name'):
+		table[name] = str(table[name])
+	table['names'] = tuple(str(name) for name in table['names'])
+	return table
+
+
+def compare(opt_class, inputs, optimisers=OPTIMISERS, objective=None, path=None):
+	""" Optimizes opt_class from the same inputs with each driver and returns the trace
+	summaries; path, a pattern with %s for the driver name, saves each trace. A driver
+	that fails gets an error entry in its summary. """
+
+	summaries = []
+	for optimiser in optimisers:
+		opt = opt_class(optimiser, objective or '%s_Cost.Costs' % opt_class.generator_name, 0)
+		for name, value in inputs.items():
+			setattr(opt, name, value)
+		error = None
+		with Trace(opt) as history:
+			try:
+				opt.run()
+			except Exception as exception:
+				error = '%s: %s' % (type(exception).__name__, exception)
+		summary = history.summary()
+		summary['optimiser'] = optimiser
+		summary['error'] = error
+		summaries.append(summary)
+		if path:
+			history.save(path % optimiser)
+	return summaries
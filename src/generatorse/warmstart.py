@@ -0,0 +1,195 @@
+"""warmstart.py
+Copyright (c) NREL. All rights reserved.
+Persistent database of converged optimal designs, keyed by machine type
+(PMSG_arms, PMSG_disc, EESG, DFIG, SCIG), rated power P_rated, rated speed N
+and rated torque T_rated. A new optimization starts from the stored optimum
+of the nearest rating, or from an inverse-distance interpolation of the
+nearest ones, instead of the 5 MW values of the examples.
+
+	database = warmstart.Database('optima.json')
+	database.start(opt)     # sets opt's design variables
+	opt.run()
+	database.record(opt)
+	database.save() """
+
+import os
+import json
+import time
+from math import pi
+import numpy as np
+
+from generatorse import multistart
+
+KEYS = ('P_rated', 'N', 'T_rated')
+
+METHODS = ('nearest', 'interpolate')
+
+
+def machine_type(opt_class):
+	""" Machine type of an *_Opt assembly class or instance: PMSG_arms_Opt gives PMSG_arms. """
+
+	if not isinstance(opt_class, type):
+		opt_class = type(opt_class)
+	name = opt_class.__name__
+	return name[:-4] if name.endswith('_Opt') else name
+
+
+def rating(opt):
+	""" P_rated, N and T_rated of an assembly. """
+
+	return assembly_rating(opt, dict((name, getattr(opt, name)) for name in opt.rating_variables.values()))
+
+
+def assembly_rating(opt_class, inputs):
+	""" P_rated, N and T_rated of an assembly class or instance from its assembly inputs
+	(name -> value); the torque of assemblies without a torque input (DFIG, SCIG)
+	follows from the power and speed. """
+
+	values = dict((key, float(inputs[name])) for key, name in opt_class.rating_variables.items())
+	if 'T_rated' not in values:
+		values['T_rated'] = values['P_rated']/(values['N']*2*pi/60)
+	return values
+
+
+def _distances(points, point):
+	""" Distances of rating points (n, 3) to point in logarithms of P_rated, N and T_rated,
+	so that a rating twice as large is as far as one half as large. """
+
+	return np.sqrt(np.sum(np.log(points/point)**2, axis=1))
+
+
+def _better(entry, old):
+	if entry['feasible'] != old['feasible']:
+		return entry['feasible']
+	if old['objective'] is None or entry['objective'] is None:
+		return old['objective'] is None
+	return entry['objective'] < old['objective']
+
+
+class Database(object):
+
+	""" Optimal designs stored in a JSON file at path, read when it exists. Each entry
+	holds machine, P_rated, N, T_rated, design (design variable -> value), objective,
+	objective_name, feasible and time. """
+
+	def __init__(self, path=None):
+		self.path = path
+		self.entries = []
+		if path is not None and os.path.exists(path):
+			with open(path) as f:
+				self.entries = json.load(f)['entries']
+
+	def __len__(self):
+		return len(self.entries)
+
+	def save(self, path=None):
+		""" Writes the database under a temporary name and renames it over path. """
+
+		path = path or self.path
+		temporary = path + '.tmp'
+		with open(temporary, 'w') as f:
+			json.dump({'keys': KEYS, 'entries': self.entries}, f, indent=1, sort_keys=True)
+		if os.name == 'nt' and os.path.exists(path):
+			os.remove(path)    # rename does not replace an existing file on Windows
+		os.rename(temporary, path)
+
+	def add(self, machine, rating, design, objective=None, objective_name=None, feasible=True):
+		""" Stores an optimum. An entry of the same machine and rating is replaced when the
+		new one is better: feasible where the old one was not, or of lower objective.
+		Returns True when the optimum was stored. """
+
+		entry = {'machine': machine, 'design': dict((name, float(value)) for name, value in design.items()),
+			'objective': None if objective is None else float(objective), 'objective_name': objective_name,
+			'feasible': bool(feasible), 'time': time.strftime('%Y-%m-%dT%H:%M:%S')}
+		entry.update((key, float(rating[key])) for key in KEYS)
+		for k, old in enumerate(self.entries):
+			if old['machine'] == machine and all(np.isclose(old[key], entry[key], rtol=1e-9) for key in KEYS):
+				if not _better(entry, old):
+					return False
+				self.entries[k] = entry
+				return True
+		self.entries.append(entry)
+		return True
+
+	def select(self, machine, feasible=True):
+		""" Entries of a machine type, only the feasible ones by default. """
+
+		return [entry for entry in self.entries if entry['machine'] == machine and (entry['feasible'] or not feasible)]
+
+	def nearest(self, machine, rating, n=1, feasible=True):
+		""" The n stored optima of machine closest to rating, with their distances. """
+
+		entries = self.select(machine, feasible)
+		if not entries:
+			return [], np.zeros(0)
+		points = np.array([[entry[key] for key in KEYS] for entry in entries])
+		distances = _distances(points, np.array([rating[key] for key in KEYS], dtype=float))
+		closest = np.argsort(distances, kind='mergesort')[:n]
+		return [entries[k] for k in closest], distances[closest]
+
+	def lookup(self, machine, rating, method='interpolate', neighbours=4, power=2.0, design_variables=None,
+			feasible=True):
+		""" Starting design for rating: the design of the nearest stored optimum, or the
+		inverse-distance weighted mean of the designs of the neighbours nearest ones
+		(an exact match is returned as stored). design_variables, a DESIGN_VARIABLES
+		table, clips the design to its bounds. None when nothing is stored. """
+
+		if method not in METHODS:
+			raise ValueError('Unknown lookup method %s, expected one of %s' % (method, ', '.join(METHODS)))
+		entries, distances = self.nearest(machine, rating, 1 if method == 'nearest' else neighbours, feasible)
+		if not entries:
+			return None
+		if method == 'nearest' or distances[0] == 0.0:
+			design = dict(entries[0]['design'])
+		else:
+			weights = 1.0/distances**power
+			weights /= weights.sum()
+			names = [name for name in entries[0]['design'] if all(name in entry['design'] for entry in entries)]
+			design = dict((name, float(np.dot(weights, [entry['design'][name] for entry in entries])))
+				for name in names)
+		if design_variables is not None:
+			for name, low, high in design_variables:
+				if name in design:
+					design[name] = min(max(design[name], low), high)
+		return design
+
+	def start(self, opt, method='interpolate', **options):
+		""" Sets the design variables of an assembly to the stored optimum for its rating.
+		Returns the starting design, or None (leaving the assembly alone) when no optimum
+		of its machine type is stored. """
+
+		design = self.lookup(machine_type(opt), rating(opt), method,
+			design_variables=opt.generator_core.DESIGN_VARIABLES, **options)
+		if design is not None:
+			for name, value in design.items():
+				setattr(opt, '%s_%s' % (opt.generator_name, name), value)
+		return design
+
+	def record(self, opt, objective=None, tolerance=1e-6):
+		""" Stores the optimum of an assembly after its run; objective defaults to its
+		Objective_function. Returns True when it was stored. """
+
+		objective = objective or opt.Objective_function
+		design, value, margins = multistart.optimum(opt, objective)
+		return self.add(machine_type(opt), rating(opt), design, value, objective, bool(np.all(margins >= -tolerance)))
+
+	def record_result(self, opt_class, rating, result, objective=None):
+		""" Stores a result of multistart (a dictionary with design, objective and feasible). """
+
+		if result.get('error') is not None or result.get('design') is None:
+			return False
+		return self.add(machine_type(opt_class), rating, result['design'], result['objective'], objective,
+			result['feasible'])
+
+
+def optimize(opt, path, method='interpolate', **options):
+	""" Runs an assembly from the stored optimum nearest its rating, stores its optimum in
+	the database at path and saves it. Returns the starting design (None without a
+	stored optimum). """
+
+	database = Database(path)
+	design = database.start(opt, method, **options)
+	opt.run()
+	database.record(opt)
+	database.save(path)
+	return design
@@ -0,0 +1,51 @@
+"""
+_stubs.py
+
+Copyright (c) NREL. All rights reserved.
+Reference designs and assembly stand-ins shared by the unit tests.
+"""
+
+# Reference designs for a 5MW turbine
+from generatorse.reference import PMSG_ARMS, PMSG_DISC, EESG, DFIG, SCIG
+
+
+# Material costs, with the magnet cost for the permanent magnet machines
+COSTS = dict(C_Cu=4.786, C_Fe=0.556, C_Fes=0.50139)
+
+PM_COSTS = dict(COSTS, C_PM=95.)
+
+LIMITS = {'Eta_target': 93.}
+
+
+class Outputs(object):
+
+    """ Holds the outputs of a component as attributes. """
+
+    def __init__(self, values):
+        self.__dict__.update(values)
+
+
+class Opt_stub(object):
+
+    """ Base of the stand-ins for the *_Opt assemblies: subclasses set generator_core and
+    generator_name and give a run() that fills in the component outputs. """
+
+    generator_core = None
+    generator_name = None
+
+    def __init__(self, Optimiser='', Objective_function='', print_results=''):
+        self.Objective_function = Objective_function
+        self.Eta_target = 0.0
+
+    def design(self, reference, **values):
+        """ Returns the reference design with the assembly's design variables set over it. """
+        inputs = dict(reference, **values)
+        for name, low, high in self.generator_core.DESIGN_VARIABLES:
+            inputs[name] = getattr(self, self.generator_name + '_' + name)
+        return inputs
+
+    def get(self, path):
+        value = self
+        for name in path.split('.'):
+            value = getattr(value, name)
+        return value
@@ -0,0 +1,70 @@
+"""
+test_batch.py
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+import numpy as np
+
+from generatorse import PMSG_arms_core
+from test._stubs import PMSG_ARMS
+
+
+def random_designs(core, base, n, seed=0):
+    # scatter every scalar input by +/-20% around the base design
+    rng = np.random.RandomState(seed)
+    designs = {}
+    for name in core.INPUTS:
+        if name in core.VECTOR_INPUTS:
+            designs[name] = base[name]
+        else:
+            designs[name] = base[name]*rng.uniform(0.8, 1.2, n)
+    return designs
+
+
+def design(designs, core, k):
+    return dict((name, designs[name] if name in core.VECTOR_INPUTS else designs[name][k]) for name in core.INPUTS)
+
+
+class Test_PMSG_arms_batch(unittest.TestCase):
+
+    def setUp(self):
+
+        self.n = 40
+        self.designs = random_designs(PMSG_arms_core, PMSG_ARMS, self.n)
+
+    def test_matches_scalar(self):
+
+        batch = PMSG_arms_core.evaluate_batch(self.designs)
+        for k in range(self.n):
+            outputs = PMSG_arms_core.evaluate(design(self.designs, PMSG_arms_core, k))
+            for name in PMSG_arms_core.OUTPUTS:
+                np.testing.assert_array_equal(batch[name][k], outputs[name], err_msg=name)
+
+    def test_shapes(self):
+
+        batch = PMSG_arms_core.evaluate_batch(self.designs)
+        self.assertEqual(set(batch), set(PMSG_arms_core.OUTPUTS))
+        self.assertEqual(batch['Mass'].shape, (self.n,))
+        self.assertEqual(batch['I'].shape, (self.n, 3))
+        self.assertEqual(batch['cm'].shape, (self.n, 3))
+
+    def test_broadcast_scalar_inputs(self):
+
+        inputs = dict(PMSG_ARMS)
+        inputs['l_s'] = np.array([1.4, 1.6, 1.8])
+        batch = PMSG_arms_core.evaluate_batch(inputs)
+        self.assertEqual(batch['p'].shape, (3,))
+        self.assertEqual(batch['Mass'][1], PMSG_arms_core.evaluate(PMSG_ARMS)['Mass'])
+
+    def test_fast_path(self):
+
+        exact = PMSG_arms_core.evaluate_batch(self.designs)
+        fast = PMSG_arms_core.evaluate_batch(self.designs, exact=False)
+        np.testing.assert_allclose(fast['Mass'], exact['Mass'], rtol=1e-12)
+        np.testing.assert_allclose(fast['gen_eff'], exact['gen_eff'], rtol=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
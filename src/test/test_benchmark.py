@@ -0,0 +1,66 @@
+"""
+test_benchmark.py
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from generatorse import benchmark, trace
+
+
+class Model(object):
+
+    def execute(self):
+        return 'executed'
+
+
+class Test_benchmark(unittest.TestCase):
+
+    def test_cases(self):
+
+        for model in benchmark.MODELS:
+            core = benchmark.core(model)
+            self.assertEqual(sorted(benchmark.CASES[model]['inputs']), sorted(core.INPUTS), msg=model)
+            for name, low, high in core.DESIGN_VARIABLES:
+                self.assertTrue(any(key.endswith('_' + name) for key in benchmark.CASES[model]['opt_inputs']),
+                    msg='%s %s' % (model, name))
+
+    def test_report(self):
+
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'benchmark.json')
+            benchmark.main(['--models', 'SCIG', '--sizes', '20', '--number', '2', '--repeat', '1', '--no-optimize',
+                '--profile', '--output', path])
+            with open(path) as f:
+                report = json.load(f)
+        finally:
+            shutil.rmtree(directory)
+        kinds = [(record['benchmark'], record.get('exact')) for record in report['results']]
+        self.assertEqual(kinds, [('core_evaluate', None), ('execute', None), ('batch', True), ('batch', False)])
+        core = report['results'][0]
+        self.assertGreater(core['seconds'], 0.0)
+        self.assertGreater(core['peak_memory'], 0)
+        self.assertEqual(report['results'][2]['size'], 20)
+        self.assertEqual([row['section'] for row in report['profile']], ['em', 'winding', 'losses', 'mass'])
+
+    def test_counter(self):
+
+        model, other = Model(), Model()
+        with trace.Counter(model) as counter:
+            self.assertEqual(model.execute(), 'executed')
+            model.execute()
+            other.execute()
+        self.assertEqual(counter.counts, {'execute': 2, 'provideJ': 0})
+        self.assertNotIn('execute', model.__dict__)
+        model.execute()
+        self.assertEqual(counter.counts['execute'], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
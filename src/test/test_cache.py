@@ -0,0 +1,74 @@
+"""
+test_cache.py
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+import numpy as np
+
+from generatorse import PMSG_arms_core, DFIG_core
+from generatorse.cache import EvaluationCache
+from test._stubs import PMSG_ARMS, DFIG
+
+
+class Test_EvaluationCache(unittest.TestCase):
+
+    def test_hits_and_misses(self):
+
+        cache = EvaluationCache()
+        first = cache.evaluate(PMSG_arms_core.evaluate, PMSG_ARMS)
+        second = cache.evaluate(PMSG_arms_core.evaluate, dict(PMSG_ARMS))
+        self.assertIs(first, second)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 1, 1))
+        self.assertEqual(first['Mass'], PMSG_arms_core.evaluate(PMSG_ARMS)['Mass'])
+
+        cache.evaluate(PMSG_arms_core.evaluate, dict(PMSG_ARMS, l_s=1.7))
+        cache.evaluate(PMSG_arms_core.evaluate, dict(PMSG_ARMS, main_shaft_cm=np.array([1.0, 0.0, 0.0])))
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+    def test_read_only(self):
+
+        cache = EvaluationCache()
+        cm = cache.evaluate(DFIG_core.evaluate, DFIG)['cm']
+        with self.assertRaises(ValueError):
+            cm[0] += 1.0
+        np.testing.assert_array_equal(cache.evaluate(DFIG_core.evaluate, dict(DFIG))['cm'],
+            DFIG_core.evaluate(DFIG)['cm'])
+        self.assertTrue(DFIG['highSpeedSide_cm'].flags.writeable)
+
+    def test_key_shape(self):
+
+        row = dict(DFIG, highSpeedSide_cm=np.zeros((1, 4)))
+        column = dict(DFIG, highSpeedSide_cm=np.zeros((4, 1)))
+        self.assertNotEqual(EvaluationCache.key(DFIG_core.evaluate, row), EvaluationCache.key(DFIG_core.evaluate, column))
+
+    def test_shared_between_cores(self):
+
+        cache = EvaluationCache()
+        cache.evaluate(PMSG_arms_core.evaluate, PMSG_ARMS)
+        outputs = cache.evaluate(DFIG_core.evaluate, DFIG)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(outputs['Mass'], DFIG_core.evaluate(DFIG)['Mass'])
+
+    def test_lru_eviction(self):
+
+        cache = EvaluationCache(maxsize=2)
+        for l_s in (1.5, 1.6, 1.5, 1.7):    # 1.6 is then the least recently used and is evicted
+            cache.evaluate(PMSG_arms_core.evaluate, dict(PMSG_ARMS, l_s=l_s))
+        self.assertEqual(len(cache), 2)
+        cache.evaluate(PMSG_arms_core.evaluate, dict(PMSG_ARMS, l_s=1.5))
+        cache.evaluate(PMSG_arms_core.evaluate, dict(PMSG_ARMS, l_s=1.6))
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_clear(self):
+
+        cache = EvaluationCache()
+        cache.evaluate(PMSG_arms_core.evaluate, PMSG_ARMS)
+        cache.evaluate(PMSG_arms_core.evaluate, PMSG_ARMS)
+        cache.clear()
+        self.assertEqual(cache.info(), {'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 256})
+
+
+if __name__ == "__main__":
+    unittest.main()
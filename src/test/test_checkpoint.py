@@ -0,0 +1,93 @@
+"""
+test_checkpoint.py
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+from generatorse import DFIG_core, checkpoint, genetic, multistart
+from test._stubs import DFIG, COSTS, Outputs, Opt_stub
+
+
+RUNS = []
+
+
+class DFIG_Opt_stub(Opt_stub):
+
+    """ Stands in for DFIG_Opt, evaluating the core at the starting design; crash_above
+    interrupts the run for starts with a larger I_0. """
+
+    generator_core = DFIG_core
+    generator_name = 'DFIG'
+    crash_above = None
+
+    def run(self):
+        if self.crash_above is not None and self.DFIG_I_0 > self.crash_above:
+            raise KeyboardInterrupt
+        RUNS.append(self.DFIG_I_0)
+        inputs = self.design(DFIG)
+        self.DFIG = Outputs(DFIG_core.evaluate(inputs))
+        self.DFIG_Cost = Outputs({'Costs': self.DFIG.Mass})
+
+
+class Test_checkpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'run.pkl')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        DFIG_Opt_stub.crash_above = None
+
+    def test_save_load(self):
+
+        checkpoint.save(self.path, {'kind': 'genetic', 'generation': 3})
+        checkpoint.save(self.path, {'kind': 'genetic', 'generation': 6})
+        self.assertEqual(checkpoint.load(self.path, 'genetic')['generation'], 6)
+        self.assertEqual(os.listdir(self.directory), ['run.pkl'])
+        self.assertRaises(ValueError, checkpoint.load, self.path, 'multistart')
+        self.assertEqual([checkpoint.due(k, 3) for k in range(1, 7)], [False, False, True, False, False, True])
+        self.assertFalse(checkpoint.due(3, None))
+
+    def test_genetic_resume(self):
+
+        settings = dict(limits={'Eta_target': 93.}, population_size=16, generations=10, seed=5, processes=1)
+        uninterrupted = genetic.genetic(DFIG_core, DFIG, COSTS, **settings)
+        saved = genetic.genetic(DFIG_core, DFIG, COSTS, checkpoint_path=self.path, checkpoint_interval=4, **settings)
+        state = checkpoint.load(self.path)
+        self.assertEqual(state['generation'], 8)
+        self.assertEqual(len(state['history']), 8)
+        self.assertEqual(state['best']['objective'], state['history'][-1])
+
+        resumed = genetic.resume(self.path, processes=1)
+        for result in (saved, resumed):
+            self.assertEqual(result['objective'], uninterrupted['objective'])
+            np.testing.assert_array_equal(result['history'], uninterrupted['history'])
+            self.assertEqual(result['evaluations'], uninterrupted['evaluations'])
+
+    def test_multistart_resume(self):
+
+        starts = multistart.starting_points(DFIG_core.DESIGN_VARIABLES, 6, seed=2)
+        for k, start in enumerate(starts):
+            start['I_0'] = 10.*(k + 1)
+        del RUNS[:]
+        DFIG_Opt_stub.crash_above = 35.
+        self.assertRaises(KeyboardInterrupt, multistart.multistart, DFIG_Opt_stub, {}, starts=starts, processes=1,
+            checkpoint_path=self.path)
+        self.assertEqual(sorted(checkpoint.load(self.path)['results']), [0, 1, 2])
+
+        DFIG_Opt_stub.crash_above = None
+        results = multistart.resume(self.path, processes=1)
+        self.assertEqual(RUNS, [10., 20., 30., 40., 50., 60.])
+        self.assertEqual(sorted(result['start']['I_0'] for result in results), [10., 20., 30., 40., 50., 60.])
+        self.assertEqual(checkpoint.load(self.path)['best']['objective'], results[0]['objective'])
+
+
+if __name__ == "__main__":
+    unittest.main()
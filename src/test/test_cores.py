@@ -0,0 +1,126 @@
+"""
+test_cores.py
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+import numpy as np
+
+from generatorse import PMSG_arms_core, PMSG_disc_core, EESG_core, DFIG_core, SCIG_core
+from test import _stubs
+from test._stubs import PMSG_DISC, EESG, DFIG, SCIG, PM_COSTS
+
+
+# A first execution: no rotor back iron carried over from a previous one
+PMSG_ARMS = dict(_stubs.PMSG_ARMS, t=0.0)
+
+
+class Test_cores(unittest.TestCase):
+
+    def check(self, core, inputs, mass, eff):
+
+        outputs = core.evaluate(inputs)
+        self.assertEqual(set(outputs), set(core.OUTPUTS))
+        self.assertAlmostEqual(outputs['Mass'], mass, 6)
+        self.assertAlmostEqual(outputs['gen_eff'], eff, 10)
+        return outputs
+
+    def test_PMSG_arms(self):
+
+        outputs = self.check(PMSG_arms_core, PMSG_ARMS, 74249.48763741093, 93.43418267745142)
+        self.assertEqual(outputs['t'], PMSG_ARMS['h_yr'])
+        np.testing.assert_array_equal(outputs['cm'], [1.8, 0.0, 0.0])
+
+    def test_PMSG_disc(self):
+
+        self.check(PMSG_disc_core, PMSG_DISC, 123674.59784074685, 93.66515304204626)
+
+    def test_EESG(self):
+
+        outputs = self.check(EESG_core, dict(EESG, N_f=99.7), 130823.74127458173, 91.8348408655116)
+        self.assertEqual(outputs['N_f'], 100)
+
+    def test_DFIG(self):
+
+        self.check(DFIG_core, DFIG, 21890.847896163636, 98.670111067023)
+
+    def test_SCIG(self):
+
+        self.check(SCIG_core, SCIG, 40729.31598698678, 98.49562794756211)
+
+    def test_costs(self):
+
+        masses = dict(Copper=5000., Iron=60000., mass_PM=1700., Structural_mass=20000.)
+        inputs = dict(masses, **PM_COSTS)
+        self.assertAlmostEqual(PMSG_arms_core.costs(inputs)['Costs'], 228817.8, 6)
+        self.assertAlmostEqual(PMSG_disc_core.costs(inputs)['Costs'], 228817.8, 6)
+        for core in (EESG_core, DFIG_core, SCIG_core):
+            self.assertAlmostEqual(core.costs(inputs)['Costs'], 67317.8, 6)
+
+
+class Test_PMSG_arms_stages(unittest.TestCase):
+
+    def test_stage_dependencies(self):
+
+        # structural variables must not reach the electromagnetic stage, nor rotor ones the stator
+        rotor = ('n_r', 'b_r', 'd_r', 't_wr')
+        stator = ('n_s', 'b_st', 'd_s', 't_ws')
+        for name in rotor + stator:
+            self.assertNotIn(name, PMSG_arms_core.EM_INPUTS)
+        for name in rotor:
+            self.assertNotIn(name, PMSG_arms_core.STATOR_INPUTS)
+        for name in stator:
+            self.assertNotIn(name, PMSG_arms_core.ROTOR_INPUTS)
+
+    def test_stages_match_evaluate(self):
+
+        # run the stages one by one, each from only its declared inputs
+        values = dict(PMSG_ARMS, t=0.06)
+        for stage, stage_inputs, stage_outputs in PMSG_arms_core.STAGES:
+            outputs = stage(dict((name, values[name]) for name in stage_inputs))
+            self.assertEqual(set(outputs), set(stage_outputs))
+            values.update(outputs)
+        reference = PMSG_arms_core.evaluate(dict(PMSG_ARMS, t=0.06))
+        for name in PMSG_arms_core.OUTPUTS:
+            np.testing.assert_array_equal(values[name], reference[name], err_msg=name)
+
+    def test_stage_outputs_cover_model(self):
+
+        produced = set()
+        for stage, stage_inputs, stage_outputs in PMSG_arms_core.STAGES:
+            self.assertTrue(set(stage_inputs) <= set(PMSG_arms_core.INPUTS) | produced)
+            produced.update(stage_outputs)
+        self.assertTrue(set(PMSG_arms_core.OUTPUTS) <= produced)
+
+
+class Test_cores_batch(unittest.TestCase):
+
+    def check(self, core, base, n=20):
+
+        # scatter every scalar input by +/-20% and compare each design with the scalar path
+        rng = np.random.RandomState(1)
+        designs = dict((name, base[name] if name in core.VECTOR_INPUTS else base[name]*rng.uniform(0.8, 1.2, n))
+            for name in core.INPUTS)
+        batch = core.evaluate_batch(designs)
+        for k in range(n):
+            outputs = core.evaluate(dict((name, designs[name] if name in core.VECTOR_INPUTS else designs[name][k])
+                for name in core.INPUTS))
+            for name in core.OUTPUTS:
+                np.testing.assert_array_equal(batch[name][k], outputs[name], err_msg=name)
+
+    def test_PMSG_disc(self):
+        self.check(PMSG_disc_core, PMSG_DISC)
+
+    def test_EESG(self):
+        self.check(EESG_core, EESG)
+
+    def test_DFIG(self):
+        self.check(DFIG_core, DFIG)
+
+    def test_SCIG(self):
+        self.check(SCIG_core, SCIG)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+test_derivatives.py
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+import numpy as np
+
+from generatorse import PMSG_arms_core, PMSG_disc_core, EESG_core, DFIG_core, SCIG_core, derivatives
+from test._stubs import PMSG_ARMS, PMSG_DISC, EESG, DFIG, SCIG, PM_COSTS
+
+
+COSTS = dict(PM_COSTS, Copper=5000., Iron=60000., mass_PM=1700., Structural_mass=20000.)
+
+
+class Test_PMSG_arms_derivatives(unittest.TestCase):
+
+    def test_check_partials(self):
+
+        for output, name, analytic, fd, error in derivatives.check_partials(PMSG_arms_core.evaluate, PMSG_ARMS,
+                PMSG_arms_core.DERIV_INPUTS, PMSG_arms_core.DERIV_OUTPUTS):
+            self.assertLess(error, 1e-5, msg='d%s/d%s: %g vs %g' % (output, name, analytic, fd))
+
+    def test_values_match_scalar(self):
+
+        outputs = PMSG_arms_core.evaluate(PMSG_ARMS)
+        duals = PMSG_arms_core.evaluate(derivatives.seed(PMSG_ARMS, PMSG_arms_core.DERIV_INPUTS), derivatives.DualOps)
+        for name in PMSG_arms_core.DERIV_OUTPUTS:
+            self.assertEqual(derivatives.value(duals[name]), outputs[name], msg=name)
+
+    def test_arm_counts(self):
+
+        J = PMSG_arms_core.jacobian(PMSG_ARMS)
+        self.assertEqual(J.shape, (len(PMSG_arms_core.DERIV_OUTPUTS), len(PMSG_arms_core.DERIV_INPUTS)))
+        for name in ('n_r', 'n_s'):
+            self.assertTrue(np.all(J[:, PMSG_arms_core.DERIV_INPUTS.index(name)] == 0.0))
+
+    def test_costs(self):
+
+        J = PMSG_arms_core.costs_jacobian(COSTS)
+        np.testing.assert_allclose(J, [[4.786, 0.556, 95., 0.50139]])
+
+
+class Test_PMSG_disc_derivatives(unittest.TestCase):
+
+    def test_check_partials(self):
+
+        for output, name, analytic, fd, error in derivatives.check_partials(PMSG_disc_core.evaluate, PMSG_DISC,
+                PMSG_disc_core.DERIV_INPUTS, PMSG_disc_core.DERIV_OUTPUTS):
+            if abs(analytic - fd) > 1e-6:
+                self.assertLess(error, 1e-5, msg='d%s/d%s: %g vs %g' % (output, name, analytic, fd))
+
+    def test_smooth_deflection(self):
+
+        # the slope of |x| fades to zero across the smoothing width instead of flipping sign
+        x = derivatives.Dual(0.5*PMSG_disc_core.DEFLECTION_SMOOTHING, np.ones(1))
+        y = derivatives.DualOps.abs_smooth(-x, PMSG_disc_core.DEFLECTION_SMOOTHING)
+        self.assertEqual(y.value, x.value)
+        self.assertAlmostEqual(y.deriv[0], 1/np.sqrt(5.), 12)
+        self.assertEqual(derivatives.DualOps.abs_smooth(x*0, 1.).deriv[0], 0.0)
+
+    def test_costs(self):
+
+        J = PMSG_disc_core.costs_jacobian(COSTS)
+        np.testing.assert_allclose(J, [[4.786, 0.556, 95., 0.50139]])
+
+
+class Test_EESG_derivatives(unittest.TestCase):
+
+    def test_check_partials(self):
+
+        # N_f is rounded inside the model, so it is checked separately below
+        wrt = [name for name in EESG_core.DERIV_INPUTS if name != 'N_f']
+        for output, name, analytic, fd, error in derivatives.check_partials(EESG_core.evaluate, EESG, wrt,
+                EESG_core.DERIV_OUTPUTS):
+            if abs(analytic - fd) > 1e-6:
+                self.assertLess(error, 1e-5, msg='d%s/d%s: %g vs %g' % (output, name, analytic, fd))
+
+    def test_field_turns(self):
+
+        # a one-turn central difference is accurate enough for the smooth dependence on N_f
+        J = EESG_core.jacobian(EESG)
+        plus = EESG_core.evaluate(dict(EESG, N_f=101.))
+        minus = EESG_core.evaluate(dict(EESG, N_f=99.))
+        k = EESG_core.DERIV_INPUTS.index('N_f')
+        for i, output in enumerate(EESG_core.DERIV_OUTPUTS):
+            np.testing.assert_allclose(J[i, k], (plus[output] - minus[output])/2, rtol=1e-3, atol=1e-9,
+                err_msg=output)
+        self.assertGreater(J[EESG_core.DERIV_OUTPUTS.index('E_s'), k], 0.0)
+
+    def test_costs(self):
+
+        J = EESG_core.costs_jacobian(COSTS)
+        np.testing.assert_allclose(J, [[4.786, 0.556, 0.50139]])
+
+
+class Test_induction_derivatives(unittest.TestCase):
+
+    def check(self, core, inputs):
+
+        for output, name, analytic, fd, error in derivatives.check_partials(core.evaluate, inputs,
+                core.DERIV_INPUTS, core.DERIV_OUTPUTS):
+            if abs(analytic - fd) > 1e-6:
+                self.assertLess(error, 1e-5, msg='d%s/d%s: %g vs %g' % (output, name, analytic, fd))
+
+    def test_DFIG(self):
+        self.check(DFIG_core, DFIG)
+
+    def test_SCIG(self):
+        self.check(SCIG_core, SCIG)
+
+    def test_costs(self):
+
+        for core in (DFIG_core, SCIG_core):
+            np.testing.assert_allclose(core.costs_jacobian(COSTS), [[4.786, 0.556, 0.50139]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+test_doe.py
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+import numpy as np
+
+from generatorse import SCIG_core, EESG_core, constraints, doe
+from test._stubs import SCIG, COSTS, LIMITS
+
+
+class Test_samples(unittest.TestCase):
+
+    def test_lhs(self):
+
+        x = doe.unit_samples('lhs', 50, 4, seed=0)
+        self.assertEqual(x.shape, (50, 4))
+        for column in x.T:
+            self.assertEqual(sorted(np.floor(column*50).astype(int)), list(range(50)))
+
+    def test_full_factorial(self):
+
+        x = doe.samples(SCIG_core.DESIGN_VARIABLES, None, 'full_factorial', levels=[2, 3, 1, 1, 1, 2])
+        self.assertEqual(x.shape, (12, 6))
+        np.testing.assert_allclose(sorted(set(x[:, 1])), [0.4, 1.2, 2.0])
+        np.testing.assert_allclose(x[:, 2], 0.07)
+
+    def test_bounds(self):
+
+        for method in ('lhs', 'sobol'):
+            x = doe.samples(EESG_core.DESIGN_VARIABLES, 64, method, seed=1)
+            for k, (name, low, high) in enumerate(EESG_core.DESIGN_VARIABLES):
+                self.assertTrue(np.all((x[:, k] >= low) & (x[:, k] <= high)), msg=name)
+        self.assertRaises(ValueError, doe.samples, EESG_core.DESIGN_VARIABLES, 8, 'grid')
+
+
+class Test_sweep(unittest.TestCase):
+
+    def test_chunks(self):
+
+        record = doe.sweep(SCIG_core, SCIG, 25, cost_inputs=COSTS, limits=LIMITS, chunk_size=7, seed=4)
+        self.assertEqual(record['margins'].shape, (25, len(SCIG_core.CONSTRAINTS)))
+        self.assertEqual(record['cm'].shape, (25, 3))
+        for name in SCIG_core.OUTPUTS:
+            self.assertEqual(len(record[name]), 25, msg=name)
+
+        designs = doe.samples(SCIG_core.DESIGN_VARIABLES, 25, seed=4)
+        for k in (0, 13, 24):
+            inputs = dict(SCIG, **dict((var[0], x) for var, x in zip(SCIG_core.DESIGN_VARIABLES, designs[k])))
+            outputs = SCIG_core.evaluate(inputs)
+            self.assertEqual(record['Mass'][k], outputs['Mass'])
+            self.assertEqual(record['Costs'][k], SCIG_core.costs(dict(COSTS, **outputs))['Costs'])
+            margins = constraints.margins(SCIG_core.CONSTRAINTS, dict(inputs, **outputs), LIMITS)
+            np.testing.assert_array_equal(record['margins'][k], margins)
+            self.assertEqual(record['feasible'][k], np.all(margins >= 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+test_fleet.py
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+from generatorse import DFIG_core, fleet, warmstart
+from test._stubs import DFIG, Outputs, Opt_stub
+
+
+START = dict(('DFIG_' + name, DFIG[name]) for name, low, high in DFIG_core.DESIGN_VARIABLES)
+
+SPECS = [(P*1e6, P*1e6/(1200*2*np.pi/60), 1200.) for P in (2., 15., 3., 5., 10., 7., 4.)]
+
+
+class DFIG_Opt(Opt_stub):
+
+    """ Stands in for DFIG_Opt: the "optimizer" moves r_s halfway to 0.25 m per sqrt(MW). """
+
+    generator_core = DFIG_core
+    generator_name = 'DFIG'
+    rating_variables = {'P_rated': 'DFIG_P_rated', 'N': 'DFIG_N_rated'}
+
+    def run(self):
+        self.DFIG_r_s += 0.5*(0.25*(self.DFIG_P_rated/1e6)**0.5 - self.DFIG_r_s)
+        inputs = self.design(DFIG, machine_rating=self.DFIG_P_rated, n_nom=self.DFIG_N_rated)
+        self.DFIG = Outputs(dict(inputs, **DFIG_core.evaluate(inputs)))
+        self.DFIG_Cost = Outputs({'Costs': self.DFIG.Mass})
+
+
+class Unpicklable(object):
+
+    """ An input that cannot be sent to a worker process. """
+
+    def __reduce__(self):
+        raise TypeError('not picklable')
+
+
+class Test_fleet(unittest.TestCase):
+
+    def test_plan(self):
+
+        parents = fleet.plan(SPECS, 2)
+        # sorted by power: 2, 3, 4, 5 | 7, 10, 15 MW, each block run from 4 and 10 MW
+        self.assertEqual(parents, [2, 4, 6, 6, -1, 4, -1])
+        self.assertEqual(fleet.plan(SPECS, 1).count(-1), 1)
+        self.assertEqual(fleet.plan(SPECS[:2], 8), [-1, -1])
+
+    def test_fleet(self):
+
+        serial = fleet.fleet(DFIG_Opt, SPECS, START, processes=1, chains=3)
+        parallel = fleet.fleet(DFIG_Opt, SPECS, START, processes=2, chains=3)
+        np.testing.assert_array_equal(serial['r_s'], parallel['r_s'])
+        np.testing.assert_array_equal(serial['objective'], parallel['objective'])
+        self.assertEqual(serial['margins'].shape, (len(SPECS), len(DFIG_core.CONSTRAINTS)))
+        self.assertEqual(serial['error'], [None]*len(SPECS))
+        self.assertEqual(list(serial['seed']), fleet.plan(SPECS, 3))
+
+        # each run starts from the optimum of its neighbour
+        for k, parent in enumerate(serial['seed']):
+            start = 0.61 if parent < 0 else serial['r_s'][parent]
+            self.assertAlmostEqual(serial['r_s'][k], 0.5*start + 0.125*(SPECS[k][0]/1e6)**0.5)
+
+    def test_failed_jobs(self):
+
+        # jobs that raise in the pool are recorded as failures, and their neighbours still run
+        inputs = dict(START, DFIG_note=Unpicklable())
+        record = fleet.fleet(DFIG_Opt, SPECS, inputs, processes=2, chains=2)
+        self.assertEqual(len(record['error']), len(SPECS))
+        for error in record['error']:
+            self.assertTrue(error.startswith('TypeError'), msg=error)
+        self.assertTrue(np.all(np.isnan(record['objective'])))
+        self.assertFalse(record['feasible'].any())
+
+    def test_database(self):
+
+        directory = tempfile.mkdtemp()
+        try:
+            database = warmstart.Database(os.path.join(directory, 'optima.json'))
+            first = fleet.fleet(DFIG_Opt, SPECS, START, processes=1, database=database)
+            self.assertEqual(len(database.select('DFIG', feasible=False)), len(SPECS))
+            database.entries = [entry for entry in database.entries if entry['P_rated'] == 5e6]
+            for entry in database.entries:
+                entry['feasible'] = True
+            second = fleet.fleet(DFIG_Opt, SPECS[3:4], START, processes=1, database=database)
+            self.assertAlmostEqual(second['r_s'][0], 0.5*first['r_s'][3] + 0.125*5**0.5)
+
+            path = os.path.join(directory, 'fleet.csv')
+            fleet.save(first, DFIG_Opt, path)
+            with open(path) as f:
+                lines = f.read().splitlines()
+        finally:
+            shutil.rmtree(directory)
+        self.assertEqual(len(lines), len(SPECS) + 1)
+        header = lines[0].split(',')
+        self.assertEqual(header[:3], ['P_rated', 'T_rated', 'N'])
+        self.assertEqual(len(header), 7 + len(DFIG_core.DESIGN_VARIABLES) + len(DFIG_core.CONSTRAINTS) + 1)
+        self.assertEqual(float(lines[2].split(',')[header.index('r_s')]), first['r_s'][1])
+
+    def test_database_rating(self):
+
+        # DFIG has no torque input: the optima are keyed on the torque warmstart.rating derives,
+        # whatever the spec holds
+        specs = [(P*1e6, 0.0, 1200.) for P in (3., 5.)]
+        database = warmstart.Database()
+        first = fleet.fleet(DFIG_Opt, specs, START, processes=1, database=database)
+        for entry in database.entries:
+            entry['feasible'] = True
+        opt = DFIG_Opt()
+        opt.DFIG_P_rated, opt.DFIG_N_rated = 5e6, 1200.
+        self.assertEqual(database.nearest('DFIG', warmstart.rating(opt))[1][0], 0.0)
+        self.assertEqual(database.start(opt)['r_s'], first['r_s'][1])
+        second = fleet.fleet(DFIG_Opt, specs[1:], START, processes=1, database=database)
+        self.assertAlmostEqual(second['r_s'][0], 0.5*first['r_s'][1] + 0.125*5**0.5)
+        self.assertEqual(len(database), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+test_genetic.py
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+import numpy as np
+
+from generatorse import DFIG_core, constraints, genetic
+from test._stubs import DFIG, COSTS, LIMITS, Opt_stub, Outputs
+
+
+def genomes(n, seed):
+    random = np.random.RandomState(seed)
+    low = np.array([var[1] for var in DFIG_core.DESIGN_VARIABLES], dtype=float)
+    high = np.array([var[2] for var in DFIG_core.DESIGN_VARIABLES], dtype=float)
+    return low + random.random_sample((n, len(low)))*(high - low)
+
+
+class Test_PopulationEvaluator(unittest.TestCase):
+
+    def test_matches_scalar(self):
+
+        model = genetic.PopulationModel(DFIG_core, DFIG, COSTS, limits=LIMITS)
+        population = genomes(5, 0)
+        objective, margins = model.evaluate(population)
+        for k, genome in enumerate(population):
+            inputs = dict(DFIG, **dict((var[0], x) for var, x in zip(DFIG_core.DESIGN_VARIABLES, genome)))
+            outputs = DFIG_core.evaluate(inputs)
+            self.assertEqual(objective[k], DFIG_core.costs(dict(COSTS, **outputs))['Costs'])
+            np.testing.assert_array_equal(margins[k],
+                constraints.margins(DFIG_core.CONSTRAINTS, dict(inputs, **outputs), LIMITS))
+
+    def test_duplicates(self):
+
+        population = genomes(6, 1)
+        population = np.vstack([population, population[:2]])
+        model = genetic.PopulationModel(DFIG_core, DFIG, COSTS, limits=LIMITS)
+        with genetic.PopulationEvaluator(model, processes=2) as evaluator:
+            objective, margins = evaluator.evaluate(population)
+            self.assertEqual((evaluator.evaluations, evaluator.hits), (6, 2))
+            evaluator.evaluate(population[3:])
+            self.assertEqual((evaluator.evaluations, evaluator.hits), (6, 7))
+        np.testing.assert_array_equal(objective, model.evaluate(population)[0])
+        np.testing.assert_array_equal(objective[-2:], objective[:2])
+
+    def test_order(self):
+
+        objective = np.array([3., 1., 2., np.nan])
+        margins = np.array([[0.1], [-0.2], [0.0], [0.5]])
+        self.assertEqual(list(genetic.order(objective, margins)), [2, 0, 1, 3])
+
+
+class Test_genetic(unittest.TestCase):
+
+    def test_DFIG(self):
+
+        serial = genetic.genetic(DFIG_core, DFIG, COSTS, limits=LIMITS, population_size=20, generations=10,
+            seed=2, processes=1)
+        parallel = genetic.genetic(DFIG_core, DFIG, COSTS, limits=LIMITS, population_size=20, generations=10,
+            seed=2, processes=2)
+        self.assertEqual(serial['objective'], parallel['objective'])
+        self.assertEqual(serial['evaluations'], parallel['evaluations'])
+        self.assertTrue(serial['feasible'])
+        self.assertEqual(serial['history'][-1], serial['objective'])
+        self.assertLess(serial['evaluations'], 20*11)
+        for name, low, high in DFIG_core.DESIGN_VARIABLES:
+            self.assertTrue(low <= serial['design'][name] <= high)
+
+
+class Workflow(object):
+
+    def __init__(self):
+        self.runs = 0
+
+    def run(self):
+        self.runs += 1
+
+
+class DFIG_Opt(Opt_stub):
+
+    """ Stands in for DFIG.DFIG_Opt built with Optimiser='Genetic'. """
+
+    generator_core = DFIG_core
+    generator_name = 'DFIG'
+
+    def __init__(self, Optimiser='', Objective_function='', print_results=''):
+        super(DFIG_Opt, self).__init__(Optimiser, Objective_function, print_results)
+        self.Eta_target = LIMITS['Eta_target']
+        self.driver = Outputs(dict(workflow=Workflow(), population_size=20, generations=10, seed=2))
+        self.DFIG = Outputs(DFIG)
+        self.DFIG_Cost = Outputs(COSTS)
+
+
+class Test_optimize_assembly(unittest.TestCase):
+
+    def test_DFIG(self):
+
+        opt = DFIG_Opt('Genetic', 'DFIG_Cost.Costs', 1)
+        best = genetic.optimize_assembly(opt, processes=1)
+        expected = genetic.genetic(DFIG_core, DFIG, COSTS, limits=LIMITS, population_size=20, generations=10,
+            seed=2, processes=1)
+        self.assertEqual(best['objective'], expected['objective'])
+        self.assertEqual(opt.driver.workflow.runs, 2)
+        for name, low, high in DFIG_core.DESIGN_VARIABLES:
+            self.assertEqual(getattr(opt, 'DFIG_' + name), expected['design'][name])
+
+    def test_objective(self):
+
+        opt = DFIG_Opt('Genetic', 'DFIG.Mass', 1)
+        self.assertEqual(genetic.optimize_assembly(opt, processes=1)['objective'],
+            genetic.genetic(DFIG_core, DFIG, COSTS, 'Mass', LIMITS, population_size=20, generations=10,
+                seed=2, processes=1)['objective'])
+        with self.assertRaises(ValueError):
+            genetic.optimize_assembly(DFIG_Opt('Genetic', 'DFIG_Cost.Mass', 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+test_mixed.py
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+from math import pi
+import numpy as np
+
+from generatorse import PMSG_arms_core, EESG_core, mixed
+from generatorse.ops import SCALAR, RelaxedOps
+from test._stubs import PMSG_ARMS as PMSG, EESG, PM_COSTS, LIMITS
+
+
+START = dict((var[0], PMSG[var[0]]) for var in PMSG_arms_core.DESIGN_VARIABLES)
+
+INPUTS = dict((name, value) for name, value in PMSG.items() if name not in START)
+
+RANGES = {'n_r': (5, 6), 'n_s': (5, 5), 'p': (127, 130)}
+
+
+class Test_problem(unittest.TestCase):
+
+    def test_pole_pairs(self):
+
+        problem = mixed.Problem(PMSG_arms_core, INPUTS, PM_COSTS, 'Costs', LIMITS)
+        self.assertEqual(problem.integers, ('n_r', 'n_s', 'p'))
+        self.assertNotIn('tau_p', [var[0] for var in problem.continuous])
+        x, assignment = problem.values(START)
+        design = problem.design(x, dict(assignment, p=128))
+        self.assertAlmostEqual(design['tau_p'], pi*3.26/128)
+        self.assertEqual(PMSG_arms_core.evaluate(dict(INPUTS, **design))['p'], 128)
+        objective, margins = problem.evaluate(design)
+        self.assertEqual(len(margins), len(PMSG_arms_core.CONSTRAINTS) + 2)
+        self.assertTrue(margins[-2] > 0 and margins[-1] > 0)
+
+    def test_relaxed(self):
+
+        design = dict(INPUTS, **START)
+        exact = PMSG_arms_core.evaluate(design)
+        np.testing.assert_allclose(PMSG_arms_core.evaluate(design, RelaxedOps)['p'], pi*3.26/0.08)
+        self.assertEqual(PMSG_arms_core.evaluate(dict(design, n_r=5.3), SCALAR)['Mass'], exact['Mass'])
+        self.assertNotEqual(PMSG_arms_core.evaluate(dict(design, n_r=5.3), RelaxedOps)['Mass'],
+            PMSG_arms_core.evaluate(dict(design, n_r=5.0), RelaxedOps)['Mass'])
+
+        # only the integer design quantities are relaxed; the EESG brush count is still rounded
+        relaxed = EESG_core.evaluate(dict(EESG, N_f=100.3, I_f=70.), RelaxedOps)
+        self.assertEqual(relaxed['N_f'], 100.3)
+        self.assertEqual(relaxed['n_brushes'], 1)
+        np.testing.assert_allclose(relaxed['p'], pi*3.2/0.17)
+
+    def test_errors(self):
+
+        self.assertRaises(ValueError, mixed.Problem, PMSG_arms_core, INPUTS, integers=('N_f',))
+        self.assertRaises(ValueError, mixed.minimize, PMSG_arms_core, INPUTS, method='exhaustive')
+        self.assertRaises(ValueError, mixed.minimize, PMSG_arms_core, INPUTS, integers=('n_r',), ranges={'p': (1, 2)})
+
+
+@unittest.skipIf(mixed._minimize is None, 'scipy.optimize is not available')
+class Test_minimize(unittest.TestCase):
+
+    def test_search(self):
+
+        enumerated = mixed.minimize(PMSG_arms_core, INPUTS, PM_COSTS, LIMITS, ranges=RANGES, start=START,
+            method='enumerate', processes=1)
+        self.assertEqual(len(enumerated['solved']), 8)
+        self.assertEqual(enumerated['nodes'], 8)
+        self.assertTrue(enumerated['feasible'])
+        objectives = [result['objective'] for result in enumerated['solved'].values() if result['feasible']]
+        self.assertAlmostEqual(enumerated['objective'], min(objectives))
+        key = tuple(enumerated['integers'][name] for name in ('n_r', 'n_s', 'p'))
+        self.assertEqual(enumerated['solved'][key]['objective'], enumerated['objective'])
+        design = enumerated['design']
+        self.assertEqual(PMSG_arms_core.evaluate(dict(INPUTS, **design))['p'], enumerated['integers']['p'])
+
+        branched = mixed.minimize(PMSG_arms_core, INPUTS, PM_COSTS, LIMITS, ranges=RANGES, start=START,
+            method='branch', processes=2)
+        self.assertTrue(branched['feasible'])
+        self.assertLess(len(branched['solved']), 8)
+        self.assertAlmostEqual(branched['objective']/enumerated['objective'], 1.0, places=6)
+
+        # the assignments already solved are not solved again
+        reused = mixed.minimize(PMSG_arms_core, INPUTS, PM_COSTS, LIMITS, ranges=RANGES, start=START,
+            method='enumerate', processes=1, solved=branched['solved'])
+        self.assertEqual(reused['nodes'], 8 - len(branched['solved']))
+        self.assertAlmostEqual(reused['objective']/enumerated['objective'], 1.0, places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+test_multistart.py
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+import numpy as np
+
+from generatorse import PMSG_arms_core, PMSG_disc_core, EESG_core, DFIG_core, SCIG_core
+from generatorse import constraints, multistart
+from test._stubs import DFIG, Outputs, Opt_stub
+
+
+class DFIG_Opt_stub(Opt_stub):
+
+    """ Stands in for DFIG_Opt: the "optimizer" moves r_s halfway to 0.5 and evaluates the core. """
+
+    generator_core = DFIG_core
+    generator_name = 'DFIG'
+
+    def run(self):
+        if self.DFIG_I_0 > 99.:
+            raise RuntimeError('diverged')
+        self.DFIG_r_s = 0.5*(self.DFIG_r_s + 0.5)
+        inputs = self.design(DFIG)
+        self.DFIG = Outputs(DFIG_core.evaluate(inputs))
+        self.DFIG_Cost = Outputs({'Costs': self.DFIG.Mass})
+
+
+class Test_constraints(unittest.TestCase):
+
+    def test_tables(self):
+
+        for core in (PMSG_arms_core, PMSG_disc_core, EESG_core, DFIG_core, SCIG_core):
+            for name, low, high in core.DESIGN_VARIABLES:
+                self.assertIn(name, core.INPUTS)
+                self.assertLess(low, high)
+            for name in constraints.limit_names(core.CONSTRAINTS):
+                self.assertTrue(name == 'Eta_target' or name in core.INPUTS or name in core.OUTPUTS, msg=name)
+
+    def test_expression(self):
+
+        self.assertEqual(constraints.expression('PMSG', ('B_smax', '<', 'B_g'), PMSG_arms_core), 'PMSG.B_smax<PMSG.B_g')
+        self.assertEqual(constraints.expression('DFIG', ('Overall_eff', '>=', 'Eta_target'), DFIG_core),
+            'DFIG.Overall_eff>=Eta_target')
+        self.assertEqual(constraints.expression('DFIG', ('E_p', '>', 500.0), DFIG_core), 'DFIG.E_p>500.0')
+
+    def test_margins(self):
+
+        table = (('a', '<', 2), ('a', '>=', 'b'), ('c', '>', 'Eta_target'))
+        values = {'a': np.array([1.0, 3.0]), 'b': np.array([2.0, 2.0]), 'c': np.array([95., 90.])}
+        np.testing.assert_allclose(constraints.margins(table, values, {'Eta_target': 93.}),
+            [[0.5, -0.5], [-0.5, 0.5], [2/93., -3/93.]])
+        self.assertRaises(ValueError, constraints.margins, (('a', '=', 1),), values)
+
+    def test_compiled(self):
+
+        # the compiled set gives the margins of the constraints taken one by one, for a batch
+        x = np.linspace(0.0, 1.0, 9)
+        values = dict(DFIG, **dict((name, low + x*(high - low)) for name, low, high in DFIG_core.DESIGN_VARIABLES))
+        values.update(DFIG_core.evaluate_batch(values))
+        compiled = constraints.compiled(DFIG_core.CONSTRAINTS)
+        self.assertIs(compiled, constraints.compiled(list(DFIG_core.CONSTRAINTS)))
+        margins = compiled.margins(values, {'Eta_target': 93.})
+        self.assertEqual(margins.shape, (len(DFIG_core.CONSTRAINTS), 9))
+        for k, (name, relation, limit) in enumerate(DFIG_core.CONSTRAINTS):
+            limit = 93. if limit == 'Eta_target' else values[limit] if isinstance(limit, str) else limit
+            expected = (limit - values[name])/np.abs(limit) if '<' in relation else (values[name] - limit)/np.abs(limit)
+            np.testing.assert_array_equal(margins[k], expected)
+        np.testing.assert_array_equal(compiled.max_violation(values, {'Eta_target': 93.}),
+            np.maximum(np.max(-margins, axis=0), 0.0))
+
+
+class Test_multistart(unittest.TestCase):
+
+    def test_starting_points(self):
+
+        starts = multistart.starting_points(EESG_core.DESIGN_VARIABLES, 20, seed=3)
+        self.assertEqual(len(starts), 20)
+        for start in starts:
+            for name, low, high in EESG_core.DESIGN_VARIABLES:
+                self.assertTrue(low <= start[name] <= high)
+        self.assertEqual(starts, multistart.starting_points(EESG_core.DESIGN_VARIABLES, 20, seed=3))
+
+    def test_ranked(self):
+
+        starts = multistart.starting_points(DFIG_core.DESIGN_VARIABLES, 6, seed=1)
+        starts.append(dict(starts[0], I_0=100.))
+        serial = multistart.multistart(DFIG_Opt_stub, {'Eta_target': 93.}, starts=starts, processes=1)
+        parallel = multistart.multistart(DFIG_Opt_stub, {'Eta_target': 93.}, starts=starts, processes=2)
+        self.assertEqual([r['objective'] for r in serial], [r['objective'] for r in parallel])
+
+        self.assertEqual(serial[-1]['error'], 'RuntimeError: diverged')
+        ranked = [(not r['feasible'], r['objective']) for r in serial[:-1]]
+        self.assertEqual(ranked, sorted(ranked))
+        for result in serial[:-1]:
+            self.assertEqual(result['design']['r_s'], 0.5*(result['start']['r_s'] + 0.5))
+            self.assertEqual(len(result['margins']), len(DFIG_core.CONSTRAINTS))
+            self.assertEqual(result['feasible'], bool(np.all(result['margins'] >= -1e-6)))
+
+
+if __name__ == "__main__":
+    unittest.main()
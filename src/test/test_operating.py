@@ -0,0 +1,147 @@
+"""
+test_operating.py
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+import numpy as np
+
+from generatorse import DFIG_core, EESG_core, PMSG_arms_core, derivatives, operating
+from test._stubs import PMSG_ARMS as PMSG, EESG, DFIG
+
+
+class Test_PMSG_arms_map(unittest.TestCase):
+
+    def test_rated(self):
+
+        outputs = PMSG_arms_core.evaluate(PMSG)
+        speeds = np.linspace(4.0, 12.1, 28)
+        loads = np.linspace(0.0, 1.0, 11)
+        result = PMSG_arms_core.operating_map(PMSG, speeds, loads)
+        self.assertEqual(result['Losses'].shape, (28, 11))
+        np.testing.assert_allclose(result['Losses'][-1, -1], outputs['Losses'], rtol=1e-12)
+        np.testing.assert_allclose(result['gen_eff'][-1, -1], outputs['gen_eff'], rtol=1e-12)
+        np.testing.assert_array_equal(result['power'][:, -1], 5.0e6)
+        np.testing.assert_array_equal(result['gen_eff'][:, 0], 0.0)
+        np.testing.assert_array_equal(result['P_Cu'][:, 0], 0.0)
+        np.testing.assert_allclose(result['Losses'], result['P_Cu'] + result['P_Fe'] + result['P_ad'] + result['P_Ftm'])
+
+    def test_scaling(self):
+
+        result = PMSG_arms_core.operating_losses(PMSG, np.array([12.1, 6.05]), 2.5e6)
+        # half the speed at the same power doubles the current
+        np.testing.assert_allclose(result['I_s'][1], 2*result['I_s'][0])
+        np.testing.assert_allclose(result['P_Cu'][1], 4*result['P_Cu'][0])
+        np.testing.assert_allclose(result['P_Ftm'][1], 0.25*result['P_Ftm'][0])
+        self.assertTrue(0.25*result['P_Fe'][0] < result['P_Fe'][1] < 0.5*result['P_Fe'][0])
+        self.assertEqual(PMSG_arms_core.operating_losses(PMSG, 0.0, 0.0)['Losses'], 0.0)
+
+
+class Test_DFIG_envelope(unittest.TestCase):
+
+    def test_rated(self):
+
+        outputs = DFIG_core.evaluate(DFIG)
+        slips = np.linspace(-0.3, 0.3, 61)
+        result = DFIG_core.slip_envelope(DFIG, slips, np.linspace(0.0, 1.0, 5))
+        self.assertEqual(result['Losses'].shape, (61, 5))
+        rated = np.argmin(np.abs(slips + 0.2))
+        np.testing.assert_allclose(result['I_s'][rated, -1], outputs['I_s'], rtol=1e-12)
+        np.testing.assert_allclose(result['gen_eff'][rated, -1], outputs['gen_eff'], rtol=1e-12)
+        np.testing.assert_allclose(result['Overall_eff'][rated, -1], outputs['Overall_eff'], rtol=1e-12)
+        np.testing.assert_allclose(result['speed'][rated, 0], 1440.0)
+        np.testing.assert_array_equal(result['gen_eff'][:, 0], 0.0)
+        np.testing.assert_allclose(result['Losses'], result['P_Cuss'] + result['P_Cusr'] + result['P_Fes']
+            + result['P_Fer'] + result['p_b'] + result['P_add'])
+
+    def test_slip(self):
+
+        result = DFIG_core.slip_envelope(DFIG, [-0.2, 0.0, 0.2], [1.0])
+        # the rotor delivers the slip power above synchronous speed and takes it below
+        np.testing.assert_allclose(result['P_r'][:, 0], [-5e6/6, 0.0, 1.25e6])
+        np.testing.assert_allclose(result['P_e'] - result['P_r'], result['power'])
+        self.assertEqual(result['P_Fer'][1, 0], 0.0)
+        np.testing.assert_allclose(result['I_r'][2, 0]/result['I_r'][0, 0], 1.2/0.8)
+        np.testing.assert_allclose(result['I_rotor'], result['I_r']*0.2)
+
+
+class Test_EESG_field_current(unittest.TestCase):
+
+    def setUp(self):
+
+        self.speeds = np.linspace(6.05, 12.1, 6)
+        self.result = EESG_core.field_current(EESG, self.speeds, np.linspace(0.0, 1.0, 5))
+
+    def test_no_load(self):
+
+        result = self.result
+        self.assertEqual(result['I_f'].shape, (6, 5))
+        self.assertTrue(result['converged'].all())
+        # without load the excitation voltage is the terminal voltage
+        np.testing.assert_allclose(result['I_f'][:, 0], 69.0*12.1/self.speeds, rtol=1e-12)
+        np.testing.assert_array_equal(result['gen_eff'][:, 0], 0.0)
+        self.assertTrue(np.all(np.diff(result['I_f'], axis=1) > 0))
+
+    def test_voltage(self):
+
+        result = self.result
+        for i, j in ((0, 4), (5, 4), (3, 2)):
+            circuit = EESG_core.evaluate(dict(EESG, I_f=result['I_f'][i, j]), components=True)
+            self.assertAlmostEqual(circuit['E_s']*self.speeds[i]/12.1/result['E_f'][i, j], 1.0, places=7)
+            self.assertAlmostEqual(result['P_Cur'][i, j], result['I_f'][i, j]**2*circuit['R_r'], delta=1e-6)
+        np.testing.assert_allclose(result['Losses'], result['P_Cuss'] + result['P_Cur'] + result['P_Fe'] + result['p_b'])
+        higher = EESG_core.field_current(EESG, [12.1], [1.0], V_t=1.1*EESG_core.evaluate(EESG)['E_s'])
+        self.assertGreater(higher['I_f'][0, 0], result['I_f'][-1, -1])
+
+    def test_parked(self):
+
+        # a grid starting at standstill: the parked row is zero, the others as before
+        with np.errstate(all='raise'):
+            result = EESG_core.field_current(EESG, np.append(0.0, self.speeds), np.linspace(0.0, 1.0, 5))
+        for name in ('I_f', 'J_f', 'I_s', 'E_f', 'P_Cur', 'P_Fe', 'Losses', 'gen_eff'):
+            self.assertTrue(np.all(np.isfinite(result[name])), msg=name)
+            np.testing.assert_array_equal(result[name][0], 0.0, err_msg=name)
+            np.testing.assert_allclose(result[name][1:], self.result[name], rtol=1e-12, err_msg=name)
+        np.testing.assert_array_equal(result['converged'][0], [True, False, False, False, False])
+        self.assertTrue(result['converged'][1:].all())
+
+
+class Test_annual_energy(unittest.TestCase):
+
+    def test_wind(self):
+
+        v = np.arange(0.25, 40.0, 0.5)
+        probability = operating.wind_probability(v, mean=8.0)
+        self.assertAlmostEqual(probability.sum(), 1.0, places=6)
+        self.assertAlmostEqual(np.dot(probability, v), 8.0, places=2)
+
+        n, P = operating.operating_points(np.array([2.0, 5.7, 11.4, 20.0, 26.0]), 5e6, 12.1)
+        np.testing.assert_allclose(P, [0.0, 5e6/8, 5e6, 5e6, 0.0])
+        np.testing.assert_allclose(n, [0.0, 6.05, 12.1, 12.1, 0.0])
+
+    def test_energy(self):
+
+        losses = lambda n, P: PMSG_arms_core.operating_losses(PMSG, n, P)
+        energy = operating.annual_energy(losses, 5e6, 12.1, mean=9.0)
+        v = np.arange(0.5, 30.0, 0.5)
+        hours = 8760*operating.wind_probability(v, 9.0)
+        n, P = operating.operating_points(v, 5e6, 12.1)
+        self.assertAlmostEqual(energy['AEP'], np.dot(hours, P)/1e3, delta=1e-6*energy['AEP'])
+        self.assertAlmostEqual(energy['AEL'], np.dot(hours[P > 0], losses(n[P > 0], P[P > 0])['Losses'])/1e3,
+            delta=1e-6*energy['AEL'])
+        self.assertAlmostEqual(energy['AEL'], energy['E_Cu'] + energy['E_Fe'] + energy['E_ad'] + energy['E_Ftm'],
+            delta=1e-6*energy['AEL'])
+        self.assertTrue(0.0 < energy['loss_share'] < 0.1)
+        self.assertLess(energy['AEL'], operating.annual_energy(losses, 5e6, 12.1, mean=11.0)['AEL'])
+
+        # the same AEL on hour-weighted sums, with exact partials of the main dimensions
+        self.assertAlmostEqual(PMSG_arms_core.energy_loss(PMSG, mean=9.0)['AEL'], energy['AEL'],
+            delta=1e-9*energy['AEL'])
+        approx = derivatives.finite_difference(lambda values: PMSG_arms_core.energy_loss(values, mean=9.0), PMSG,
+            PMSG_arms_core.ENERGY_DERIV_INPUTS, ('AEL',))
+        np.testing.assert_allclose(PMSG_arms_core.energy_jacobian(PMSG, mean=9.0), approx, rtol=1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
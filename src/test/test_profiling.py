@@ -0,0 +1,64 @@
+"""
+test_profiling.py
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+import numpy as np
+
+from generatorse import PMSG_arms_core, benchmark, profiling
+
+
+class Test_profiling(unittest.TestCase):
+
+    def tearDown(self):
+        profiling.disable()
+        profiling.reset()
+
+    def test_disabled(self):
+
+        profiling.reset()
+        for model in benchmark.MODELS:
+            benchmark.core(model).evaluate(benchmark.CASES[model]['inputs'])
+        self.assertEqual(profiling.totals, {})
+        self.assertEqual(profiling.rows(), [])
+
+    def test_sections(self):
+
+        for model in benchmark.MODELS:
+            core = benchmark.core(model)
+            inputs = benchmark.CASES[model]['inputs']
+            expected = core.evaluate(inputs)
+            with profiling.profile() as timers:
+                for k in range(3):
+                    outputs = core.evaluate(inputs)
+            self.assertFalse(profiling.enabled)
+            for name in core.OUTPUTS:
+                np.testing.assert_array_equal(outputs[name], expected[name])
+
+            sections = [row['section'] for row in timers.rows]
+            self.assertEqual(set(row['model'] for row in timers.rows), set([model]))
+            expected_sections = [section for section in profiling.SECTIONS
+                if model.startswith('PMSG') or model == 'EESG' or section != 'structure']
+            self.assertEqual(sections, expected_sections, msg=model)
+            self.assertAlmostEqual(sum(row['share'] for row in timers.rows), 1.0)
+            # a section timed twice within a function counts one call, and one per stage of PMSG_arms
+            for row in timers.rows:
+                stages = 2 if model == 'PMSG_arms' and row['section'] in ('structure', 'mass') else 1
+                self.assertEqual(row['calls'], 3*stages, msg=(model, row['section']))
+                self.assertGreaterEqual(row['seconds'], 0.0)
+            self.assertIn(model, timers.report())
+
+    def test_stages(self):
+
+        inputs = dict(benchmark.CASES['PMSG_arms']['inputs'])
+        for stage, stage_inputs, stage_outputs in PMSG_arms_core.STAGES[:2]:
+            inputs.update(stage(inputs))
+        with profiling.profile() as timers:
+            PMSG_arms_core.stator_structure(inputs)
+        self.assertEqual([(row['section'], row['calls']) for row in timers.rows], [('structure', 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
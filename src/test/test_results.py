@@ -0,0 +1,78 @@
+"""
+test_results.py
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+from generatorse import DFIG_core, EESG_core, doe, results
+from test._stubs import DFIG, COSTS, LIMITS
+
+
+class Test_results(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_schema(self):
+
+        columns = results.schema(EESG_core)
+        names = [name for name, unit in columns]
+        self.assertEqual(len(names), len(set(names)))
+        self.assertEqual(len(names), len(results.variables(EESG_core)) + len(EESG_core.CONSTRAINTS) + 2)
+        self.assertIn(('r_s', 'm'), columns)
+        self.assertIn(('margin:B_g<=1.2', '-'), columns)
+        self.assertIn(('cm[2]', 'm'), results.schema(DFIG_core))
+
+    def check(self, format, path):
+
+        rows = results.write_sweep(path, DFIG_core, DFIG, 23, cost_inputs=COSTS, limits=LIMITS, format=format,
+            chunk_size=5, seed=6)
+        self.assertEqual(rows, 23)
+        record = doe.sweep(DFIG_core, DFIG, 23, cost_inputs=COSTS, limits=LIMITS, seed=6)
+        stored = results.read(path)
+        self.assertEqual(stored['schema']['rows'], 23)
+        self.assertEqual(stored['schema']['limits'], LIMITS)
+        self.assertEqual(stored['schema']['units'][stored['schema']['columns'].index('Mass')], 'kg')
+        for name in ('r_s', 'Mass', 'Costs', 'Overall_eff'):
+            np.testing.assert_array_equal(stored[name], record[name], err_msg=name)
+        np.testing.assert_array_equal(stored['cm[1]'], record['cm'][:, 1])
+        np.testing.assert_array_equal(stored['n_nom'], 1200.)
+        np.testing.assert_array_equal(stored['margin:J_s<=6'], record['margins'][:, 10])
+        np.testing.assert_array_equal(stored['feasible'], record['feasible'])
+
+    def test_columns(self):
+
+        path = os.path.join(self.directory, 'sweep')
+        self.check('columns', path)
+        stored = results.read(path, ['Mass'])
+        self.assertEqual(sorted(stored), ['Mass', 'schema'])
+        self.assertEqual(len(os.listdir(path)), len(results.schema(DFIG_core)) + 1)
+
+    def test_csv(self):
+
+        self.check('csv', os.path.join(self.directory, 'sweep.csv'))
+
+    def test_buffer(self):
+
+        path = os.path.join(self.directory, 'sweep')
+        writer = results.ResultWriter(path, DFIG_core, DFIG, chunk_size=10)
+        writer.write(doe.evaluate(DFIG_core, DFIG, doe.samples(DFIG_core.DESIGN_VARIABLES, 4, seed=1), limits=LIMITS))
+        self.assertEqual(writer.rows, 0)
+        writer.write(doe.evaluate(DFIG_core, DFIG, doe.samples(DFIG_core.DESIGN_VARIABLES, 8, seed=2), limits=LIMITS))
+        self.assertEqual(writer.rows, 12)
+        writer.close()
+        self.assertTrue(np.all(np.isnan(results.read(path)['Costs'])))    # no cost inputs were given
+        self.assertRaises(ValueError, results.ResultWriter, path, DFIG_core, format='xlsx')
+
+
+if __name__ == "__main__":
+    unittest.main()
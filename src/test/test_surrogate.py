@@ -0,0 +1,100 @@
+"""
+test_surrogate.py
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+import numpy as np
+
+from generatorse import PMSG_arms_core, doe, surrogate
+from test._stubs import PMSG_ARMS as PMSG, PM_COSTS, LIMITS, Outputs, Opt_stub
+
+
+class PMSG_arms_Opt_stub(Opt_stub):
+
+    """ Stands in for PMSG_arms_Opt, evaluating the core at the starting design. """
+
+    generator_core = PMSG_arms_core
+    generator_name = 'PMSG'
+
+    def run(self):
+        inputs = self.design(PMSG)
+        self.PMSG = Outputs(dict(inputs, **PMSG_arms_core.evaluate(inputs)))
+        costs = dict(PM_COSTS, **dict((name, getattr(self.PMSG, name)) for name in PMSG_arms_core.COST_INPUTS
+            if name not in PM_COSTS))
+        self.PMSG_Cost = Outputs(PMSG_arms_core.costs(costs))
+
+
+class Test_models(unittest.TestCase):
+
+    def test_fit(self):
+
+        random = np.random.RandomState(0)
+        x = random.random_sample((40, 3))
+        y = np.column_stack([1.0 + x[:, 0] - 2.0*x[:, 1]*x[:, 2] + x[:, 2]**2, np.sin(3.0*x[:, 0])])
+        polynomial = surrogate.model('polynomial', degree=2).fit(x, y[:, :1])
+        x_new = random.random_sample((10, 3))
+        np.testing.assert_allclose(polynomial.predict(x_new)[:, 0],
+            1.0 + x_new[:, 0] - 2.0*x_new[:, 1]*x_new[:, 2] + x_new[:, 2]**2)
+
+        for kind, tolerance in (('rbf', 1e-8), ('kriging', 1e-3)):
+            fitted = surrogate.model(kind).fit(x, y)
+            np.testing.assert_allclose(fitted.predict(x), y, atol=tolerance, err_msg=kind)
+        self.assertTrue(np.all(fitted.mse(x) < 1e-6))
+        self.assertTrue(np.all(fitted.mse(x_new + 1.0) > fitted.mse(x_new)))
+        self.assertRaises(ValueError, surrogate.model, 'neural')
+
+
+class Test_surrogate(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.surrogate = surrogate.train(PMSG_arms_core, PMSG, 150, 'rbf', PM_COSTS, LIMITS, seed=1)
+
+    def test_predict(self):
+
+        self.assertEqual(self.surrogate.names, surrogate.OUTPUTS)
+        test = doe.sweep(PMSG_arms_core, PMSG, 60, cost_inputs=PM_COSTS, limits=LIMITS, seed=2)
+        scores = self.surrogate.score(test)
+        self.assertGreater(scores['Costs'], 0.8)
+        self.assertEqual(len(scores['margins']), len(PMSG_arms_core.CONSTRAINTS))
+
+        predicted = self.surrogate.predict(doe.samples(PMSG_arms_core.DESIGN_VARIABLES, 7, seed=3), chunk_size=3)
+        self.assertEqual(predicted['margins'].shape, (7, len(PMSG_arms_core.CONSTRAINTS)))
+        self.assertTrue(np.all(predicted['Mass'] > 0.0))
+        self.assertTrue(np.all(np.abs(predicted['margins']) <= 1.0 + 1e-9))
+
+    def test_screen(self):
+
+        verified = surrogate.screen(self.surrogate, PMSG, PM_COSTS, LIMITS, n_candidates=500, n_verify=6, seed=4)
+        self.assertEqual(len(verified['Costs']), 6)
+        design = dict(PMSG, **dict((var[0], verified[var[0]][0]) for var in PMSG_arms_core.DESIGN_VARIABLES))
+        self.assertEqual(verified['Mass'][0], PMSG_arms_core.evaluate(design)['Mass'])
+        ranked = [(not feasible, cost) for feasible, cost in zip(verified['feasible'], verified['Costs'])]
+        if not verified['feasible'].any():
+            ranked = list(np.sum(np.maximum(-verified['margins'], 0.0), axis=1))
+        self.assertEqual(ranked, sorted(ranked))
+
+        starts = surrogate.starts(verified, PMSG_arms_core, 2)
+        results = surrogate.multistart.multistart(PMSG_arms_Opt_stub, {}, starts=starts, processes=1)
+        self.assertEqual(sorted(result['objective'] for result in results), sorted(verified['Costs'][:2]))
+        self.assertTrue(all(result['error'] is None for result in results))
+
+        # without cost inputs there is no Costs to rank on
+        uncosted = surrogate.train(PMSG_arms_core, PMSG, 20, 'rbf', limits=LIMITS, seed=1)
+        self.assertNotIn('Costs', uncosted.names)
+        self.assertRaises(ValueError, surrogate.screen, uncosted, PMSG, limits=LIMITS, n_candidates=50)
+        self.assertEqual(len(surrogate.screen(uncosted, PMSG, limits=LIMITS, n_candidates=50, n_verify=3,
+            objective='Mass', seed=4)['Mass']), 3)
+
+    def test_optimize(self):
+
+        results = surrogate.optimize(PMSG_arms_Opt_stub, {}, PMSG, PM_COSTS, LIMITS, n_train=40, n_candidates=200,
+            n_verify=4, n_starts=2, kind='polynomial', processes=1, seed=5, degree=1)
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(result['error'] is None for result in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+test_torque_slip.py
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+import unittest
+from math import pi
+import numpy as np
+
+from generatorse import SCIG_core
+from test._stubs import SCIG
+
+
+class Test_SCIG_torque_slip(unittest.TestCase):
+
+    def setUp(self):
+
+        self.circuit = SCIG_core.evaluate(SCIG, components=True)
+        self.slips = np.linspace(-0.5, 0.5, 5001)
+        self.result = SCIG_core.torque_slip(SCIG, self.slips)
+
+    def test_circuit(self):
+
+        outputs = SCIG_core.evaluate(SCIG)
+        for name in ('E_p', 'L_s', 'L_sm', 'R_R'):
+            self.assertEqual(self.circuit[name], outputs[name])
+        self.assertAlmostEqual(self.circuit['R_s'], 1.2*outputs['R_s'])
+
+    def test_balance(self):
+
+        result = self.result
+        self.assertEqual(result['T_e'].shape, (5001,))
+        # terminal power of the circuit against the shaft power less the copper losses
+        terminal = -3*self.circuit['E_p']*result['I_s']*result['cos_phi']
+        np.testing.assert_allclose(terminal, result['P_shaft'] - result['P_Cuss'] - result['P_Cusr'],
+            rtol=1e-9, atol=1e-6*SCIG['machine_rating'])
+        np.testing.assert_allclose(result['T_e']*2*pi*1200/60*(1 - result['slip']), -result['P_shaft'],
+            rtol=1e-9, atol=1e-6)
+        np.testing.assert_allclose(result['P_elec'] + result['Losses'], result['P_shaft'])
+        self.assertTrue(np.all(result['gen_eff'][self.slips >= 0] == 0.0))
+        self.assertTrue(np.all(result['gen_eff'] < 100.0))
+
+    def test_no_load(self):
+
+        result = SCIG_core.torque_slip(SCIG, [0.0])
+        circuit = self.circuit
+        om_e = 2*pi*60
+        self.assertEqual(result['T_e'][0], 0.0)
+        self.assertEqual(result['I_r'][0], 0.0)
+        self.assertAlmostEqual(result['I_s'][0], circuit['E_p']/abs(circuit['R_s']
+            + 1j*om_e*(circuit['L_s'] + circuit['L_sm'])), delta=1e-9)
+
+    def test_breakdown(self):
+
+        circuit = self.circuit
+        om_e = 2*pi*60
+        Z_s = circuit['R_s'] + 1j*om_e*circuit['L_s']
+        Z_m = 1j*om_e*circuit['L_sm']
+        V_th = abs(circuit['E_p']*Z_m/(Z_s + Z_m))
+        Z_th = Z_s*Z_m/(Z_s + Z_m)
+        X = Z_th.imag + om_e*circuit['L_rsigma']
+        # largest generating torque of the Thevenin equivalent
+        T_max = 3*V_th**2/(2*om_e/3*(np.sqrt(Z_th.real**2 + X**2) - Z_th.real))
+        self.assertAlmostEqual(-self.result['T_e'].min()/T_max, 1.0, places=4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+test_trace.py
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+from generatorse import DFIG_core, constraints, trace
+from test._stubs import DFIG, COSTS, Opt_stub
+
+
+class DFIG_stub(object):
+
+    def execute(self):
+        outputs = DFIG_core.evaluate(dict((name, getattr(self, name)) for name in DFIG_core.INPUTS))
+        self.__dict__.update(outputs)
+
+    def provideJ(self):
+        return None
+
+
+class DFIG_Cost_stub(object):
+
+    def execute(self):
+        self.Costs = DFIG_core.costs(dict((name, getattr(self, name)) for name in DFIG_core.COST_INPUTS))['Costs']
+
+
+class CONMINdriver(object):
+    pass
+
+
+class DFIG_Opt_stub(Opt_stub):
+
+    """ Stands in for DFIG_Opt: the "driver" takes a gradient and two line search steps
+    shrinking r_s at each of three iterations. """
+
+    generator_core = DFIG_core
+    generator_name = 'DFIG'
+
+    def __init__(self, Optimiser='', Objective_function='', print_results=''):
+        super(DFIG_Opt_stub, self).__init__(Optimiser, Objective_function, print_results)
+        self.Eta_target = 93.0
+        self.driver = CONMINdriver()
+        self.DFIG = DFIG_stub()
+        self.DFIG.__dict__.update(DFIG)
+        self.DFIG_Cost = DFIG_Cost_stub()
+        self.DFIG_Cost.__dict__.update(COSTS)
+
+    def workflow(self):
+        self.DFIG.execute()
+        for name in ('Copper', 'Iron', 'Structural_mass'):
+            setattr(self.DFIG_Cost, name, getattr(self.DFIG, name))
+        self.DFIG_Cost.execute()
+
+    def run(self):
+        self.workflow()
+        for iteration in range(3):
+            self.DFIG.provideJ()
+            for step in range(2):
+                self.DFIG.r_s *= 0.99
+                self.workflow()
+
+
+class Test_trace(unittest.TestCase):
+
+    def test_trace(self):
+
+        opt = DFIG_Opt_stub('CONMINdriver', 'DFIG_Cost.Costs')
+        with trace.Trace(opt) as history:
+            opt.run()
+        costs = opt.DFIG_Cost.Costs
+        values = dict((name, getattr(opt.DFIG, name)) for name in constraints.limit_names(DFIG_core.CONSTRAINTS)
+            if name != 'Eta_target')
+        opt.run()
+        self.assertEqual((history.evaluations, history.gradients), (7, 3))
+
+        table = history.table()
+        np.testing.assert_array_equal(table['evaluations'], np.arange(1, 8))
+        np.testing.assert_array_equal(table['gradients'], [0, 1, 1, 2, 2, 3, 3])
+        self.assertEqual(table['design'].shape, (7, len(DFIG_core.DESIGN_VARIABLES)))
+        np.testing.assert_allclose(table['design'][:, 0], 0.61*0.99**np.arange(7))
+        self.assertEqual(table['objective'][-1], costs)
+        self.assertEqual(table['max_violation'][-1],
+            constraints.compiled(DFIG_core.CONSTRAINTS).max_violation(values, {'Eta_target': 93.}))
+
+        summary = history.summary()
+        self.assertEqual(summary['optimiser'], 'CONMINdriver')
+        self.assertEqual((summary['evaluations'], summary['gradients'], summary['passes']), (7, 3, 7))
+
+    def test_instance(self):
+
+        opt, other = DFIG_Opt_stub('CONMINdriver', 'DFIG_Cost.Costs'), DFIG_Opt_stub('CONMINdriver', 'DFIG_Cost.Costs')
+        with self.assertRaises(RuntimeError):
+            with trace.Trace(opt) as history:
+                other.run()
+                opt.workflow()
+                raise RuntimeError('driver failed')
+        self.assertEqual((history.evaluations, history.gradients, len(history.rows)), (1, 0, 1))
+        for component in (opt.DFIG, opt.DFIG_Cost):
+            self.assertNotIn('execute', component.__dict__)
+            self.assertNotIn('provideJ', component.__dict__)
+        opt.run()
+        self.assertEqual(history.evaluations, 1)
+
+    def test_save_compare(self):
+
+        directory = tempfile.mkdtemp()
+        try:
+            pattern = os.path.join(directory, 'DFIG_%s.npz')
+            summaries = trace.compare(DFIG_Opt_stub, {'Eta_target': 90.}, optimisers=('CONMINdriver', 'SLSQPdriver'),
+                path=pattern)
+            self.assertEqual([summary['optimiser'] for summary in summaries], ['CONMINdriver', 'SLSQPdriver'])
+            table = trace.load(pattern % 'SLSQPdriver')
+        finally:
+            shutil.rmtree(directory)
+        self.assertEqual(table['model'], 'DFIG')
+        self.assertEqual(table['objective_name'], 'DFIG_Cost.Costs')
+        self.assertEqual(table['names'], tuple(var[0] for var in DFIG_core.DESIGN_VARIABLES))
+        self.assertEqual(table['objective'][-1], summaries[1]['objective'])
+        self.assertIsNone(summaries[1]['error'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+test_warmstart.py
+
+Copyright (c) NREL. All rights reserved.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+from generatorse import EESG_core, warmstart
+from test._stubs import EESG, Outputs, Opt_stub
+
+
+class EESG_Opt(Opt_stub):
+
+    """ Stands in for EESG_Opt: the "optimizer" scales r_s with the square root of the
+    rated torque and evaluates the core. """
+
+    generator_core = EESG_core
+    generator_name = 'EESG'
+    rating_variables = {'P_rated': 'P_rated', 'N': 'N_rated', 'T_rated': 'T_rated'}
+
+    def __init__(self, Optimiser='', Objective_function='EESG.Mass', print_results=''):
+        super(EESG_Opt, self).__init__(Optimiser, Objective_function, print_results)
+        for name, low, high in EESG_core.DESIGN_VARIABLES:
+            setattr(self, 'EESG_' + name, EESG[name])
+
+    def run(self):
+        self.EESG_r_s = 3.2*(self.T_rated/4.143289e6)**0.5
+        inputs = self.design(EESG, machine_rating=self.P_rated, n_nom=self.N_rated, Torque=self.T_rated)
+        self.EESG = Outputs(dict(inputs, **EESG_core.evaluate(inputs)))
+
+
+def opt(P_rated, N_rated):
+    opt = EESG_Opt()
+    opt.P_rated, opt.N_rated, opt.T_rated = P_rated, N_rated, P_rated/(N_rated*2*np.pi/60)/0.95
+    return opt
+
+
+class Test_warmstart(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'optima.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_add(self):
+
+        database = warmstart.Database()
+        rating = {'P_rated': 5e6, 'N': 12.1, 'T_rated': 4.1e6}
+        self.assertTrue(database.add('EESG', rating, {'r_s': 3.0}, 100., feasible=False))
+        self.assertTrue(database.add('EESG', rating, {'r_s': 3.1}, 120., feasible=True))
+        self.assertFalse(database.add('EESG', rating, {'r_s': 3.2}, 90., feasible=False))
+        self.assertTrue(database.add('EESG', rating, {'r_s': 3.3}, 110., feasible=True))
+        self.assertTrue(database.add('PMSG_arms', rating, {'r_s': 3.4}, 80.))
+        self.assertEqual(len(database), 2)
+        self.assertEqual(database.lookup('EESG', rating), {'r_s': 3.3})
+        self.assertIsNone(database.lookup('DFIG', rating))
+        self.assertRaises(ValueError, database.lookup, 'EESG', rating, 'linear')
+
+    def test_lookup(self):
+
+        database = warmstart.Database()
+        for P, r_s in ((3e6, 2.0), (5e6, 3.0), (10e6, 5.0)):
+            database.add('EESG', {'P_rated': P, 'N': 12.1, 'T_rated': P/1.2}, {'r_s': r_s, 'l_s': 1.0})
+        rating = {'P_rated': 6e6, 'N': 12.1, 'T_rated': 5e6}
+        self.assertEqual(database.lookup('EESG', rating, 'nearest')['r_s'], 3.0)
+        interpolated = database.lookup('EESG', rating, neighbours=2)
+        self.assertTrue(3.0 < interpolated['r_s'] < 5.0)
+        self.assertEqual(interpolated['l_s'], 1.0)
+        clipped = database.lookup('EESG', rating, design_variables=(('r_s', 0.5, 3.1),))
+        self.assertEqual(clipped['r_s'], 3.1)
+
+    def test_optimize(self):
+
+        self.assertIsNone(warmstart.optimize(opt(5e6, 12.1), self.path))
+        warmstart.optimize(opt(10e6, 9.6), self.path)
+        database = warmstart.Database(self.path)
+        self.assertEqual(len(database), 2)
+        self.assertEqual(database.entries[0]['objective_name'], 'EESG.Mass')
+
+        new = opt(7e6, 10.5)
+        start = database.start(new, 'nearest', feasible=False)
+        self.assertEqual(start, database.entries[1]['design'])
+        self.assertEqual(new.EESG_r_s, start['r_s'])
+        self.assertEqual(warmstart.machine_type(EESG_Opt), 'EESG')
+        self.assertAlmostEqual(warmstart.rating(new)['T_rated'], new.T_rated)
+
+
+if __name__ == "__main__":
+    unittest.main()